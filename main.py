@@ -1,11 +1,31 @@
 import sys
 import os
 import gc
+import multiprocessing
 # OVERCLOCK Watt-Bit Sandbox]
 
-import matplotlib
-matplotlib.use('Qt5Agg')
-matplotlib.rcParams['interactive'] = False
+if __name__ == "__main__":
+    # Scenario comparisons and sensitivity runs use worker processes; frozen builds start those here
+    multiprocessing.freeze_support()
+    
+    # Headless batch runs (python main.py --headless scenario.json ...),
+    # sensitivity analyses, design searches, weather ensembles and price
+    # back-tests skip the GUI imports entirely, so they work without audio or a display
+    if "--headless" in sys.argv[1:]:
+        from src.simulation.headless import main as headless_main
+        sys.exit(headless_main([arg for arg in sys.argv[1:] if arg != "--headless"]))
+    if "--sensitivity" in sys.argv[1:]:
+        from src.simulation.sensitivity import main as sensitivity_main
+        sys.exit(sensitivity_main([arg for arg in sys.argv[1:] if arg != "--sensitivity"]))
+    if "--optimize" in sys.argv[1:]:
+        from src.simulation.optimizer import main as optimizer_main
+        sys.exit(optimizer_main([arg for arg in sys.argv[1:] if arg != "--optimize"]))
+    if "--ensemble" in sys.argv[1:]:
+        from src.simulation.weather_ensemble import main as ensemble_main
+        sys.exit(ensemble_main([arg for arg in sys.argv[1:] if arg != "--ensemble"]))
+    if "--backtest" in sys.argv[1:]:
+        from src.simulation.price_backtest import main as backtest_main
+        sys.exit(backtest_main([arg for arg in sys.argv[1:] if arg != "--backtest"]))
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
@@ -49,9 +69,10 @@ class AppManager(QObject):
         # Disconnect signal handlers first to prevent callbacks during cleanup
         self._disconnect_signals()
         
-        # Clean up matplotlib resources
+        # Clean up matplotlib resources (only if the historian chart ever loaded it)
         try:
-            matplotlib.pyplot.close('all')
+            if 'matplotlib.pyplot' in sys.modules:
+                sys.modules['matplotlib.pyplot'].close('all')
         except Exception:
             pass
         
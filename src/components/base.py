@@ -5,12 +5,98 @@ Orientation   = Qt.Orientation
 # ----------------------------------------------------------------
 
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsItem, QPushButton, QGraphicsProxyWidget
+from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsItem, QPushButton, QGraphicsProxyWidget, QStyleOptionGraphicsItem
 from PyQt6.QtCore import Qt, QRectF
 from PyQt6.QtGui import QBrush, QColor, QPen, QRadialGradient, QFont, QPainterPath, QPolygonF, QLinearGradient
+from src.utils.pixmap_cache import draw_scaled_pixmap
 import math
 
+# Number of discrete levels a fill indicator can show. Per-step values are
+# quantized to these levels so a component only repaints when its indicator
+# visibly moves.
+INDICATOR_LEVELS = 100
+
+# Extra room around the component for shadows drawn outside its rect
+STATIC_LAYER_MARGIN = 40
+
+# Level-of-detail tiers, picked from how large a component is on screen
+LOD_GLYPH = 0   # Flat coloured glyph instead of the image and shadow
+LOD_SIMPLE = 1  # Image and shadow, but no text box, hover text, jewel or indicators
+LOD_FULL = 2    # Everything
+
+# Smallest on-screen size (px, shorter side of the component) for each tier
+LOD_SIMPLE_MIN_PX = 30
+LOD_FULL_MIN_PX = 60
+
+
+def quantize_level(fraction):
+    """
+    Clamp an indicator fraction to 0-1 and snap it to INDICATOR_LEVELS steps
+
+    Args:
+        fraction: Indicator fraction (may be None)
+
+    Returns:
+        Quantized fraction, or None if fraction is None
+    """
+    if fraction is None:
+        return None
+    return round(min(1.0, max(0.0, fraction)) * INDICATOR_LEVELS) / INDICATOR_LEVELS
+
+
+def detail_tier(painter, rect):
+    """
+    Pick the level-of-detail tier for drawing rect with the painter's current transform
+
+    Args:
+        painter: Active QPainter (its world transform includes the view zoom)
+        rect: Item rect in item coordinates
+
+    Returns:
+        LOD_GLYPH, LOD_SIMPLE or LOD_FULL
+    """
+    lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+    screen_size = min(rect.width(), rect.height()) * lod
+    if screen_size >= LOD_FULL_MIN_PX:
+        return LOD_FULL
+    if screen_size >= LOD_SIMPLE_MIN_PX:
+        return LOD_SIMPLE
+    return LOD_GLYPH
+
+
+class ComponentStaticLayer(QGraphicsItem):
+    """
+    Child item that draws the rarely-changing parts of a component (shadow
+    and image) behind it. It uses DeviceCoordinateCache, so Qt only renders
+    it again when the zoom level changes or it is explicitly updated; the
+    per-frame repaints of the component itself just blit the cached pixmap.
+    """
+
+    def __init__(self, component):
+        super().__init__(component)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemStacksBehindParent)
+        self.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def boundingRect(self):
+        margin = STATIC_LAYER_MARGIN
+        return self.parentItem().rect().adjusted(-margin, -margin, margin, margin)
+
+    def shape(self):
+        # Never the target of clicks or hover - those belong to the component
+        return QPainterPath()
+
+    def paint(self, painter, option, widget):
+        component = self.parentItem()
+        # Tiny on screen - the component draws a flat glyph instead
+        if detail_tier(painter, component.rect()) == LOD_GLYPH:
+            return
+        component.paint_static_layer(painter)
+
 class ComponentBase(QGraphicsRectItem):
+    # Colour of the flat glyph drawn instead of the image when zoomed far out
+    glyph_color = QColor(150, 150, 150)
+    
     def __init__(self, x, y, width=100, height=60):
         super().__init__(x, y, width, height)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
@@ -78,8 +164,20 @@ class ComponentBase(QGraphicsRectItem):
         # Status Jewel properties
         self.jewel_size = 20  # Size of the hexagonal jewel
         self.jewel_active = True  # Whether to show the jewel
+        
+        # Last display state pushed by the simulation engine (indicator level and
+        # text box contents); None until the first simulation step
+        self.display_state = None
+        self.indicator_level = None
+        
+        # Level-of-detail tier of the last paint (see detail_tier)
+        self.detail_tier = LOD_FULL
+        
+        # Shadow and image are drawn by a cached child item
+        self.static_layer = ComponentStaticLayer(self)
     
-    def paint(self, painter, option, widget):
+    def draw_shadow(self, painter):
+        """Draw the soft shadow beneath the component"""
         # Save painter state
         painter.save()
         
@@ -110,10 +208,120 @@ class ComponentBase(QGraphicsRectItem):
         
         # Restore painter to draw the component
         painter.restore()
+    
+    def get_image(self):
+        """Return the pixmap drawn by the static layer (None for no image)"""
+        return getattr(self, 'image', None)
+    
+    def get_image_rect(self):
+        """Return the rect the component image is drawn into"""
+        rect = self.boundingRect()
+        
+        # Square image using 80% of the height, centered horizontally
+        image_size = min(rect.width(), rect.height() * 0.8)
+        x_offset = (rect.width() - image_size) / 2
         
-        # Draw the regular component
+        return QRectF(
+            rect.x() + x_offset,
+            rect.y() + (rect.height() * 0.05),  # Add a small top margin
+            image_size,
+            image_size
+        )
+    
+    def paint_static_layer(self, painter):
+        """
+        Draw the parts of the component that rarely change - the shadow and
+        the image. Called by the cached static layer, not on every repaint.
+        """
+        self.draw_shadow(painter)
+        
+        image = self.get_image()
+        if image is not None:
+            draw_scaled_pixmap(painter, self.get_image_rect(), image)
+    
+    def refresh_static_layer(self):
+        """Re-render the cached shadow/image (e.g. after the image changes)"""
+        self.static_layer.update()
+    
+    def get_indicator_fraction(self):
+        """
+        Fraction (0-1) shown by the component's fill indicator, or None if it
+        has no indicator. Overridden by components with an indicator.
+        """
+        return None
+    
+    def get_display_level(self):
+        """
+        Indicator level to paint: the quantized value last pushed by the
+        simulation engine, or the current value before the first push.
+        """
+        if self.display_state is None:
+            return quantize_level(self.get_indicator_fraction()) or 0.0
+        return self.indicator_level or 0.0
+    
+    def set_display_values(self, indicator_fraction=None):
+        """
+        Receive this step's display values from the simulation engine and
+        request a repaint only if something that's drawn actually changed.
+        
+        Args:
+            indicator_fraction: Indicator fraction (0-1) computed by the engine;
+                                asked from the component if not given
+        
+        Returns:
+            True if the component was scheduled for repaint
+        """
+        if indicator_fraction is None:
+            indicator_fraction = self.get_indicator_fraction()
+        level = quantize_level(indicator_fraction)
+        
+        state = (level, self.get_capacity_and_mode_text(), self.get_cost_or_revenue_text())
+        if state == self.display_state:
+            return False
+        
+        self.display_state = state
+        self.indicator_level = level
+        # Repaint only - subclasses override update() to run milestone checks
+        QGraphicsRectItem.update(self)
+        return True
+    
+    def shows_details(self):
+        """Whether the last paint was large enough on screen for text and indicators"""
+        return self.detail_tier == LOD_FULL
+    
+    def get_jewel_rect(self):
+        """Return the rect the status jewel is drawn into (top right corner)"""
+        rect = self.boundingRect()
+        return QRectF(rect.right() - self.jewel_size - 5, rect.top() + 5, self.jewel_size, self.jewel_size)
+    
+    def shows_jewel(self):
+        """Whether the last paint drew the animated status jewel"""
+        return self.jewel_active and self.shows_details()
+    
+    def update_jewel(self):
+        """Repaint just the status jewel, including its border pen"""
+        # Repaint only - subclasses override update() to run milestone checks
+        QGraphicsRectItem.update(self, self.get_jewel_rect().adjusted(-2, -2, 2, 2))
+    
+    def draw_glyph(self, painter):
+        """Draw the flat stand-in for the image used when zoomed far out"""
+        painter.save()
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(self.glyph_color))
+        image_rect = self.get_image_rect()
+        radius = image_rect.width() * 0.1
+        painter.drawRoundedRect(image_rect, radius, radius)
+        painter.restore()
+    
+    def paint(self, painter, option, widget):
+        # Draw the regular component (shadow and image come from the static layer)
+        rect = self.boundingRect()
+        self.detail_tier = detail_tier(painter, rect)
         super().paint(painter, option, widget)
         
+        if self.detail_tier == LOD_GLYPH:
+            self.draw_glyph(painter)
+        
         # If selected, draw white highlight box around the component
         if self.isSelected():
             # Get the bounding rectangle with a small padding
@@ -143,6 +351,11 @@ class ComponentBase(QGraphicsRectItem):
             if self.button_proxy.isVisible():
                 self.button_proxy.setVisible(False)
         
+        # Text, hover label and jewel would be unreadable (and the zoom-compensated
+        # text box would cover its neighbours) when the component is small on screen
+        if not self.shows_details():
+            return
+        
         # Draw hover text if component is being hovered
         if self.is_hovered:
             # Get component ID string (last 6 digits)
@@ -185,8 +398,9 @@ class ComponentBase(QGraphicsRectItem):
                 bordered_widget = main_window.centralWidget()
                 
                 # Position the jewel at top right corner with a small margin
-                jewel_x = rect.right() - self.jewel_size - 5
-                jewel_y = rect.top() + 5
+                jewel_rect = self.get_jewel_rect()
+                jewel_x = jewel_rect.x()
+                jewel_y = jewel_rect.y()
                 
                 # Create a hexagon path
                 hex_path = QPainterPath()
@@ -536,10 +750,10 @@ class ComponentBase(QGraphicsRectItem):
         super().mouseReleaseEvent(event)
     
     def itemChange(self, change, value):
-        if change == QGraphicsItem.GraphicsItemChange.ItemPositionChange:
-            # Update all connected lines
+        if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
+            # Queue the connected lines - each is recomputed once per frame, not once per moved endpoint
             for connection in self.connections:
-                connection.update_position()
+                connection.request_position_update()
         elif change == QGraphicsItem.GraphicsItemChange.ItemSelectedChange:
             # Force a repaint when selection state changes
             self.update()
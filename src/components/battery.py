@@ -1,28 +1,34 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPixmap, QRadialGradient
-from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QRadialGradient
+from PyQt6.QtCore import Qt
 from .base import ComponentBase
-from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
 
 class BatteryComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor("#1B5E20")
+    
     def __init__(self, x, y):
         # Initialize with the same size as other components
         super().__init__(x, y, 300, 220)
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/battery3.png"))
+        self.image = load_pixmap("src/ui/assets/battery3.png")
         
         # Battery properties
         self.power_capacity = 1000  # kW - maximum charge/discharge rate
         self.energy_capacity = 4000  # kWh - total storage capacity
         self.current_charge = self.energy_capacity  # Start at 100% charge
-        self.operating_mode = "BTF ± Unit (Auto)"  # "Off" or "BTF ± Unit (Auto)"
+        self.operating_mode = "BTF ± Unit (Auto)"  # "Off", "BTF ± Unit (Auto)" or "Arbitrage (Optimized)"
+        self.arbitrage_schedule = None  # Planned hourly power in "Arbitrage (Optimized)" mode (planned by the engine)
+        self.arbitrage_margin = None  # Expected margin of that schedule ($, None without a grid connection to trade with)
         
         # Capital expenditure (CAPEX) property
         self.capex_per_kw = 1500  # $1,500 per kW default for battery
         
-    def paint(self, painter, option, widget):
+    def draw_shadow(self, painter):
+        """Draw the battery's narrower shadow beneath the standard one"""
         # Save painter state
         painter.save()
         
@@ -54,43 +60,31 @@ class BatteryComponent(ComponentBase):
         # Restore painter state after drawing shadow
         painter.restore()
         
+        super().draw_shadow(painter)
+    
+    def get_indicator_fraction(self):
+        """Charge level shown by the battery indicator"""
+        return self.current_charge / self.energy_capacity if self.energy_capacity > 0 else 0
+        
+    def paint(self, painter, option, widget):
         # Call the parent class paint method to handle selection highlight and the open button
         super().paint(painter, option, widget)
         
-        # Get component dimensions
-        rect = self.boundingRect()
-        
-        # Calculate image area with 1:1 aspect ratio (square)
-        # Using 80% of height for the image
-        image_height = rect.height() * 0.8
-        image_size = min(rect.width(), image_height)
-        
-        # Center the image horizontally
-        x_offset = (rect.width() - image_size) / 2
-        
-        # Create square image rect
-        image_rect = QRectF(
-            rect.x() + x_offset,
-            rect.y() + (rect.height() * 0.05),  # Add a small top margin
-            image_size,
-            image_size
-        )
+        # The indicator is skipped when the component is small on screen
+        if not self.shows_details():
+            return
         
-        # Draw the image with transparent background and 1:1 aspect ratio
-        if not self.image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                self.image,
-                QRectF(0, 0, self.image.width(), self.image.height())
-            )
+        # The image itself is drawn by the cached static layer; the indicator sits on top of it
+        image_rect = self.get_image_rect()
+        image_size = image_rect.width()
         
         # Draw battery level indicator in top right corner
         # Ensure current charge never exceeds energy capacity
         if self.current_charge > self.energy_capacity:
             self.current_charge = self.energy_capacity
             
-        # Calculate charge percentage
-        charge_percent = self.current_charge / self.energy_capacity if self.energy_capacity > 0 else 0
+        # Charge percentage last pushed by the simulation engine (quantized)
+        charge_percent = self.get_display_level()
         
         # Set indicator size relative to image size
         indicator_width = image_size * 0.3
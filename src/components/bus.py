@@ -1,18 +1,21 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPixmap, QRadialGradient
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QRadialGradient
 from PyQt6.QtCore import Qt, QRectF
 from .base import ComponentBase
-from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
 
 class BusComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor(90, 110, 130)
+    
     def __init__(self, x, y):
         # Initialize with the same size as other components
         super().__init__(x, y, 300, 220)
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the images
-        self.loaded_image = QPixmap(resource_path("src/ui/assets/busauto3.png"))
-        self.auto_image = QPixmap(resource_path("src/ui/assets/busauto3.png")) 
+        self.loaded_image = load_pixmap("src/ui/assets/busauto3.png")
+        self.auto_image = load_pixmap("src/ui/assets/busauto3.png") 
         
         self.is_on = True  # Default state is on
         self.name = "Bus"  # Default name
@@ -34,7 +37,8 @@ class BusComponent(ComponentBase):
         
         return False
         
-    def paint(self, painter, option, widget):
+    def draw_shadow(self, painter):
+        """Draw the bus shadow beneath the standard one"""
         # Save painter state
         painter.save()
         
@@ -66,9 +70,10 @@ class BusComponent(ComponentBase):
         # Restore painter state after drawing shadow
         painter.restore()
         
-        # Call the parent class paint method to handle selection highlight and the open button
-        super().paint(painter, option, widget)
-        
+        super().draw_shadow(painter)
+    
+    def get_image_rect(self):
+        """Return the rect the bus image is drawn into"""
         # Get component dimensions
         rect = self.boundingRect()
         
@@ -88,17 +93,13 @@ class BusComponent(ComponentBase):
             image_size
         )
         
+        return image_rect
+    
+    def get_image(self):
+        """Return the bus image for the current load connections"""
         # Determine which image to use based on load connections
         has_loads = self.has_load_connections()
-        current_image = self.loaded_image if has_loads else self.auto_image
-        
-        # Draw the image with transparent background and 1:1 aspect ratio
-        if not current_image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                current_image,
-                QRectF(0, 0, current_image.width(), current_image.height())
-            )
+        return self.loaded_image if has_loads else self.auto_image
     
     def serialize(self):
         return {
@@ -1,17 +1,20 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QPen, QFont, QPixmap
+from PyQt6.QtGui import QPen, QFont, QColor
 from PyQt6.QtCore import Qt, QRectF
 from .base import ComponentBase
-from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
 
 class CloudWorkloadComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor(120, 90, 200)
+    
     def __init__(self, x, y):
         # Initialize with the same size as other components
         super().__init__(x, y, 300, 220)
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/cloudworkload4.png"))
+        self.image = load_pixmap("src/ui/assets/cloudworkload4.png")
         
         # Disable shadow effect for this component only
         self.shadow_opacity = 0
@@ -38,13 +41,8 @@ class CloudWorkloadComponent(ComponentBase):
         self.accumulated_revenue = 0.00  # $ from cloud workload
         self.previous_revenue = 0.00  # Track previous revenue for milestone detection
     
-    def paint(self, painter, option, widget):
-        # Save painter state
-        painter.save()
-        
-        # Call base class paint to handle the selection highlight
-        super().paint(painter, option, widget)
-        
+    def get_image_rect(self):
+        """Return the rect the cloud workload image is drawn into"""
         # Get component dimensions
         rect = self.boundingRect()
         
@@ -64,16 +62,7 @@ class CloudWorkloadComponent(ComponentBase):
             image_size
         )
         
-        # Draw the image with transparent background and 1:1 aspect ratio
-        if not self.image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                self.image,
-                QRectF(0, 0, self.image.width(), self.image.height())
-            )
-        
-        # Restore painter state
-        painter.restore()
+        return image_rect
     
     def is_directly_connected_to_load(self, load_component):
         """Check if this cloud workload is directly connected to a specific load component
@@ -195,9 +184,10 @@ class CloudWorkloadComponent(ComponentBase):
             
             # Get the particle system
             if hasattr(parent, 'particle_system'):
-                # Create a popup for each $1000 increment (in case we earned multiple $1000 in one step)
-                for _ in range(current_thousands - previous_thousands):
-                    parent.particle_system.create_revenue_popup(center_x, center_y, 1000)
+                # Queue the $1000 increments crossed this step - the particle system merges
+                # everything queued for this component within a frame into one popup
+                parent.particle_system.queue_milestone_popup(
+                    self, center_x, center_y, current_thousands - previous_thousands)
         
         # Store current revenue for next check
         self.previous_revenue = self.accumulated_revenue
@@ -1,16 +1,22 @@
-from PyQt6.QtWidgets import QGraphicsLineItem
-from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF
-from PyQt6.QtGui import QPen, QColor, QBrush, QLinearGradient, QRadialGradient, QPainter, QPainterPath
+from PyQt6.QtWidgets import QGraphicsLineItem, QStyleOptionGraphicsItem
+from PyQt6.QtCore import Qt, QRectF, QPointF, QLineF, QTimer
+from PyQt6.QtGui import QPen, QColor, QBrush, QLinearGradient, QRadialGradient, QPainter, QPainterPath, QTransform
 import random
 import math
+from src.ui.frame_clock import FrameClock
 
 class Connection(QGraphicsLineItem):
     # Static variables for synchronized animation
     animation_time = 0
     oscillation_speed = 0.2
-    animation_timer = None
+    animation_interval = 50  # ms between animation frames
+    animation_running = False
     active_connections = []
     
+    # Connections whose endpoints moved since the last geometry flush
+    pending_geometry = set()
+    geometry_flush_scheduled = False
+    
     # Visual style configuration
     core_width = 2.5
     glow_outer_width = 10
@@ -22,6 +28,11 @@ class Connection(QGraphicsLineItem):
     # Wavy path parameters (kept small to stay within bounding rect of pen)
     sine_amplitude = 4.0   # px, must be <= glow_outer_width/2 to avoid bounding issues
     sine_frequency = 2.0   # waves along the length
+    wave_samples = 40      # points along the wavy path
+    phase_steps = 64       # precomputed wave shapes per full phase cycle
+    
+    # Below this zoom level only the core line is drawn (no glow, pulse or sparkles)
+    simple_lod = 0.3
     
     # Colors (subtle electric blue → cyan)
     color_start = QColor(80, 150, 225, 200)
@@ -30,14 +41,23 @@ class Connection(QGraphicsLineItem):
     highlight_color = QColor(255, 255, 255, 220)
     
     @classmethod
-    def update_all_connections(cls):
+    def update_all_connections(cls, frame_scale=1.0):
+        """
+        Advance the shared animation one frame (driven by the FrameClock)
+        
+        Args:
+            frame_scale: Elapsed time in nominal frames, so the flow keeps its
+                         speed when the frame clock is throttled
+        """
         # Update shared animation time
-        cls.animation_time += cls.oscillation_speed
+        cls.animation_time += cls.oscillation_speed * frame_scale
         # Update all active connections, removing any that are no longer valid
         invalid_connections = []
+        scenes = set()
         for connection in cls.active_connections:
             try:
                 connection.update_animation()
+                scenes.add(connection.scene())
             except RuntimeError:
                 invalid_connections.append(connection)
         
@@ -46,12 +66,49 @@ class Connection(QGraphicsLineItem):
             if conn in cls.active_connections:
                 cls.active_connections.remove(conn)
         
-        # Stop timer if no valid connections remain
-        if not cls.active_connections and cls.animation_timer:
-            cls.animation_timer.stop()
-            cls.animation_timer = None
+        # Repaint each scene once instead of invalidating every connection
+        for scene in scenes:
+            FrameClock.instance().invalidate_scene(scene)
+        
+        # Stop animating if no valid connections remain
+        if not cls.active_connections:
+            cls.stop_animation()
+    
+    @classmethod
+    def start_animation(cls):
+        """Subscribe the shared connection animation to the frame clock"""
+        if not cls.animation_running:
+            FrameClock.instance().subscribe(cls.update_all_connections, cls.animation_interval)
+            cls.animation_running = True
+    
+    @classmethod
+    def stop_animation(cls):
+        """Unsubscribe the shared connection animation and reset its phase"""
+        if cls.animation_running:
+            FrameClock.instance().unsubscribe(cls.update_all_connections)
+            cls.animation_running = False
             cls.animation_time = 0
     
+    @classmethod
+    def flush_geometry_updates(cls):
+        """Recompute the geometry of every connection whose endpoints moved, once each"""
+        cls.geometry_flush_scheduled = False
+        pending, cls.pending_geometry = cls.pending_geometry, set()
+        for connection in pending:
+            connection.update_position()
+    
+    def request_position_update(self):
+        """
+        Schedule a geometry update after an endpoint moved. Moves are coalesced:
+        however many endpoints move while the current events are processed
+        (e.g. dragging a whole selection), the line is recomputed once, right
+        before the next repaint.
+        """
+        Connection.pending_geometry.add(self)
+        if not Connection.geometry_flush_scheduled:
+            Connection.geometry_flush_scheduled = True
+            QTimer.singleShot(0, Connection.flush_geometry_updates)
+    
     def __init__(self, source, target):
         super().__init__()
         self.source = source
@@ -63,6 +120,25 @@ class Connection(QGraphicsLineItem):
         self._sine_amplitude = self.sine_amplitude * (0.8 + 0.4 * self._style_seed)  # 0.8x-1.2x
         self._sine_frequency = self.sine_frequency * (0.9 + 0.3 * (1.0 - self._style_seed))  # 0.9x-1.2x
         self._glow_intensity = 1.0 + 0.25 * (self._style_seed - 0.5)  # ~±12.5%
+        
+        # Wave shape in normalized coordinates (x = 0..1 along the line, y = px
+        # off it). sin(a + phase) = sin(a)cos(phase) + cos(a)sin(phase), so every
+        # phase is a mix of these two precomputed sample arrays.
+        self._wave_ts = [i / (self.wave_samples - 1) for i in range(self.wave_samples)]
+        self._wave_sin = []
+        self._wave_cos = []
+        for t in self._wave_ts:
+            # Smooth amplitude taper near ends to avoid harsh joins
+            taper = self._sine_amplitude * math.sin(math.pi * t)
+            angle = 2.0 * math.pi * self._sine_frequency * t
+            self._wave_sin.append(taper * math.sin(angle))
+            self._wave_cos.append(taper * math.cos(angle))
+        self._phase_offsets = {}  # phase step -> offsets per sample
+        self._phase_paths = {}    # phase step -> normalized QPainterPath
+        
+        # Normalized -> scene mapping, rebuilt only when the endpoints move
+        self._geometry_line = None
+        self._line_transform = QTransform()
 
         # Use a wide transparent pen so the bounding rect accounts for glow and thick pulse
         base_width = max(self.glow_outer_width, self.flow_width, int(self.pulse_thick_width * 2.0))
@@ -81,11 +157,8 @@ class Connection(QGraphicsLineItem):
         # Add to active connections list
         Connection.active_connections.append(self)
         
-        # Initialize the shared timer if it doesn't exist
-        if Connection.animation_timer is None:
-            Connection.animation_timer = QTimer()
-            Connection.animation_timer.timeout.connect(Connection.update_all_connections)
-            Connection.animation_timer.start(50)  # Update every 50ms
+        # Start the shared animation if it isn't running
+        Connection.start_animation()
         
         self.update_position()
         
@@ -93,54 +166,81 @@ class Connection(QGraphicsLineItem):
         self._local_phase = 0.0
 
     # --- Helper methods for animated wavy path ---
-    def _interpolate_point(self, p1: QPointF, p2: QPointF, t: float, phase: float) -> QPointF:
-        dx = p2.x() - p1.x()
-        dy = p2.y() - p1.y()
+    def _update_geometry(self, line: QLineF):
+        """
+        Rebuild the transform mapping normalized wave coordinates onto the line.
+        Only runs when the endpoints have moved since the last paint.
+        """
+        if self._geometry_line == line:
+            return
+        self._geometry_line = QLineF(line)
+        p1 = line.p1()
+        dx = line.dx()
+        dy = line.dy()
         length = math.hypot(dx, dy)
         if length <= 1e-6:
-            return QPointF(p1)
-        # Base point along the straight line
-        bx = p1.x() + dx * t
-        by = p1.y() + dy * t
-        # Perpendicular unit normal
-        nx = -dy / length
-        ny = dx / length
-        # Smooth amplitude taper near ends to avoid harsh joins
-        taper = math.sin(math.pi * t)
-        offset = self._sine_amplitude * taper * math.sin(2.0 * math.pi * self._sine_frequency * t + phase)
-        return QPointF(bx + nx * offset, by + ny * offset)
-
-    def _build_wavy_path(self, p1: QPointF, p2: QPointF, phase: float, samples: int = 40) -> QPainterPath:
-        if samples < 2:
-            samples = 2
-        path = QPainterPath()
-        # Start point
-        start_point = self._interpolate_point(p1, p2, 0.0, phase)
-        path.moveTo(start_point)
-        # Interior points
-        for i in range(1, samples):
-            t = i / (samples - 1)
-            pt = self._interpolate_point(p1, p2, t, phase)
-            path.lineTo(pt)
+            self._line_transform = QTransform.fromTranslate(p1.x(), p1.y())
+            return
+        # x runs along the line (scaled to its length), y along the unit normal
+        self._line_transform = QTransform(dx, dy, -dy / length, dx / length, p1.x(), p1.y())
+    
+    def _phase_step(self, phase: float) -> int:
+        """Quantize an animation phase to one of the precomputed wave shapes"""
+        return int(round(phase / (2.0 * math.pi) * self.phase_steps)) % self.phase_steps
+    
+    def _get_phase_offsets(self, step: int) -> list:
+        """Get the per-sample wave offsets for a phase step, computing them once"""
+        offsets = self._phase_offsets.get(step)
+        if offsets is None:
+            phase = 2.0 * math.pi * step / self.phase_steps
+            cos_phase = math.cos(phase)
+            sin_phase = math.sin(phase)
+            offsets = [s * cos_phase + c * sin_phase for s, c in zip(self._wave_sin, self._wave_cos)]
+            self._phase_offsets[step] = offsets
+        return offsets
+    
+    def _get_phase_path(self, step: int) -> QPainterPath:
+        """Get the normalized wavy path for a phase step, building it once"""
+        path = self._phase_paths.get(step)
+        if path is None:
+            offsets = self._get_phase_offsets(step)
+            path = QPainterPath()
+            path.moveTo(0.0, offsets[0])
+            for t, offset in zip(self._wave_ts[1:], offsets[1:]):
+                path.lineTo(t, offset)
+            self._phase_paths[step] = path
         return path
     
+    def _wave_offset(self, offsets: list, t: float) -> float:
+        """Linearly interpolate the wave offset at t from the sampled offsets"""
+        position = min(max(t, 0.0), 1.0) * (self.wave_samples - 1)
+        index = min(int(position), self.wave_samples - 2)
+        fraction = position - index
+        return offsets[index] + (offsets[index + 1] - offsets[index]) * fraction
+    
+    def _interpolate_point(self, t: float, step: int) -> QPointF:
+        """Scene position of the wavy path at t (0..1 along the line)"""
+        offset = self._wave_offset(self._get_phase_offsets(step), t)
+        return self._line_transform.map(QPointF(t, offset))
+
+    def _build_wavy_path(self, step: int) -> QPainterPath:
+        """Scene-space wavy path for a phase step"""
+        return self._line_transform.map(self._get_phase_path(step))
+    
     def update_animation(self):
-        """Advance animation phase and request repaint."""
+        """Advance animation phase (the scene repaint is batched by the frame clock)."""
         # Keep a local phase that can be used for secondary motions
         self._local_phase = Connection.animation_time
-        # Trigger a repaint to reflect the new animation state
-        self.update()
     
     def cleanup(self):
         """Remove this connection from both components and stop animation"""
         if self in Connection.active_connections:
             Connection.active_connections.remove(self)
+        Connection.pending_geometry.discard(self)
         
-        # If this is the last connection, stop and clear the timer
-        if not Connection.active_connections and Connection.animation_timer:
-            Connection.animation_timer.stop()
-            Connection.animation_timer = None
-            Connection.animation_time = 0
+        # If this is the last connection, stop the shared animation
+        if not Connection.active_connections:
+            Connection.stop_animation()
         
         if self.source and self in self.source.connections:
             self.source.connections.remove(self)
@@ -196,8 +296,19 @@ class Connection(QGraphicsLineItem):
 
         # Time parameters
         phase = self._local_phase
-        # Build animated wavy path following the line
-        path = self._build_wavy_path(p1, p2, phase)
+        step = self._phase_step(phase)
+        # Map the precomputed wave shape for this phase onto the line
+        self._update_geometry(line)
+        path = self._build_wavy_path(step)
+        
+        # Zoomed far out the glow and pulse are sub-pixel - just draw the core line
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < self.simple_lod:
+            core_pen = QPen(self.color_start, self.core_width / lod)
+            core_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            painter.setPen(core_pen)
+            painter.drawPath(path)
+            return
         
         # Build a gradient along the connector
         # Hue shift over time for extra interest (with per-connection base offset)
@@ -262,7 +373,7 @@ class Connection(QGraphicsLineItem):
         # Subtle moving highlight pulse traveling back-and-forth
         # Map sine phase to [0, 1]
         t = 0.5 * (1.0 + math.sin(self._local_phase * 0.8))
-        pulse_pt = self._interpolate_point(p1, p2, t, phase)
+        pulse_pt = self._interpolate_point(t, step)
         pulse_x = pulse_pt.x()
         pulse_y = pulse_pt.y()
         
@@ -287,12 +398,13 @@ class Connection(QGraphicsLineItem):
         t0 = max(0.0, t - segment_span * 0.5)
         t1 = min(1.0, t + segment_span * 0.5)
         seg_samples = 14
+        offsets = self._get_phase_offsets(step)
         pulse_path = QPainterPath()
-        start_seg = self._interpolate_point(p1, p2, t0, phase)
-        pulse_path.moveTo(start_seg)
+        pulse_path.moveTo(t0, self._wave_offset(offsets, t0))
         for i in range(1, seg_samples):
             tt = t0 + (t1 - t0) * (i / (seg_samples - 1))
-            pulse_path.lineTo(self._interpolate_point(p1, p2, tt, phase))
+            pulse_path.lineTo(tt, self._wave_offset(offsets, tt))
+        pulse_path = self._line_transform.map(pulse_path)
         # Width oscillates slightly
         width_boost = 1.2 + 0.6 * (0.5 + 0.5 * math.sin(self._local_phase * 1.4))
         pulse_pen = QPen(QColor(255, 255, 255, 90), self.pulse_thick_width * width_boost)
@@ -323,7 +435,7 @@ class Connection(QGraphicsLineItem):
             (phase * 0.39 + 0.66) % 1.0,
         ]
         for i, tt in enumerate(sparkle_ts):
-            s_pt = self._interpolate_point(p1, p2, tt, phase)
+            s_pt = self._interpolate_point(tt, step)
             s_r = 2.0 + (i % 2)  # 2 or 3 px
             s_alpha = 110 if i == 0 else 80
             s_grad = QRadialGradient(s_pt.x(), s_pt.y(), s_r)
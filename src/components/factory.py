@@ -1,22 +1,26 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QBrush, QColor, QPixmap, QRadialGradient
+from PyQt6.QtGui import QBrush, QColor, QRadialGradient
 from PyQt6.QtCore import Qt, QRectF
 from .base import ComponentBase
-from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
 
 class FactoryComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor(120, 120, 120)
+    
     def __init__(self, x, y):
         # Initialize with the same size as other components
         super().__init__(x, y, 300, 220)
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/factory.png"))
+        self.image = load_pixmap("src/ui/assets/factory.png")
         
         # Decorative component with no functional properties
         self.name = "Factory"
     
-    def paint(self, painter, option, widget):
+    def draw_shadow(self, painter):
+        """Draw the factory shadow beneath the standard one"""
         # Save painter state
         painter.save()
         
@@ -48,11 +52,10 @@ class FactoryComponent(ComponentBase):
         # Restore painter state after drawing shadow
         painter.restore()
         
-        # Now call the base class to handle the selection highlight
-        painter.save()
-        super().paint(painter, option, widget)
-        painter.restore()
-        
+        super().draw_shadow(painter)
+    
+    def get_image_rect(self):
+        """Return the rect the factory image is drawn into"""
         # Get component dimensions for the factory image
         rect = self.boundingRect()
         
@@ -84,13 +87,7 @@ class FactoryComponent(ComponentBase):
             image_height
         )
         
-        # Draw the image with transparent background
-        if not self.image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                self.image,
-                QRectF(0, 0, self.image.width(), self.image.height())
-            )
+        return image_rect
     
     def mousePressEvent(self, event):
         # Call the base class mousePressEvent for selection functionality
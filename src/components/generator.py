@@ -1,17 +1,21 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QPen, QFont, QPixmap
-from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtGui import QPen, QFont, QColor
+from PyQt6.QtCore import Qt, QPointF
 from .base import ComponentBase
-from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
+from src.simulation.random_state import simulation_random
 
 class GeneratorComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor(200, 110, 40)
+    
     def __init__(self, x, y):
         # Initialize with a larger size to accommodate bigger image
         super().__init__(x, y, 300, 220)  # Increase component size
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/generator2.png"))
+        self.image = load_pixmap("src/ui/assets/generator2.png")
         
         self.capacity = 1000  # kW
         self.operating_mode = "BTF Droop (Auto)"  # Static (Auto), BTF Unit Commit (Auto), or BTF Droop (Auto)
@@ -54,32 +58,9 @@ class GeneratorComponent(ComponentBase):
         super().paint(painter, option, widget)
         painter.restore()
         
-        # Get component dimensions
+        # Get component dimensions (the image itself is drawn by the cached static layer)
         rect = self.boundingRect()
-        
-        # Calculate image area with 1:1 aspect ratio (square)
-        # Using 80% of height for the larger image
-        image_height = rect.height() * 0.8
-        image_size = min(rect.width(), image_height)
-        
-        # Center the image horizontally
-        x_offset = (rect.width() - image_size) / 2
-        
-        # Create square image rect
-        image_rect = QRectF(
-            rect.x() + x_offset,
-            rect.y() + (rect.height() * 0.05),  # Add a small top margin
-            image_size,
-            image_size
-        )
-        
-        # Draw the image with transparent background and 1:1 aspect ratio
-        if not self.image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                self.image,
-                QRectF(0, 0, self.image.width(), self.image.height())
-            )
+        image_size = self.get_image_rect().width()
         
         # Calculate and store the smoke emission point (top-center of the image)
         self.smoke_point = QPointF(
@@ -165,8 +146,6 @@ class GeneratorComponent(ComponentBase):
         
     def _update_maintenance_status(self):
         """Update the maintenance status of the generator based on current state and random factors."""
-        import random
-        
         # If the generator is already in maintenance, decrease the remaining time
         if self.is_in_maintenance:
             self.maintenance_time_remaining -= 1
@@ -188,12 +167,12 @@ class GeneratorComponent(ComponentBase):
             hourly_probability = self.frequency_per_10000_hours / 10000.0
             
             # Generate random number and check against probability
-            if random.random() < hourly_probability:
+            if simulation_random.random() < hourly_probability:
                 # Start a maintenance event
                 self.is_in_maintenance = True
                 
                 # Calculate random maintenance duration within allowed range
-                self.maintenance_time_remaining = random.randint(
+                self.maintenance_time_remaining = simulation_random.randint(
                     self.minimum_downtime, 
                     self.maximum_downtime
                 )
@@ -256,9 +235,10 @@ class GeneratorComponent(ComponentBase):
             
             # Get the particle system
             if hasattr(parent, 'particle_system'):
-                # Create a popup for each $1000 increment (in case we spent multiple $1000 in one step)
-                for _ in range(current_thousands - previous_thousands):
-                    parent.particle_system.create_cost_popup(center_x, center_y, 1000)
+                # Queue the $1000 increments crossed this step - the particle system merges
+                # everything queued for this component within a frame into one popup
+                parent.particle_system.queue_milestone_popup(
+                    self, center_x, center_y, current_thousands - previous_thousands, is_cost=True)
         
         # Store current cost for next check
         self.previous_cost = self.accumulated_cost
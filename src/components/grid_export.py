@@ -1,18 +1,22 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPixmap
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont
 from PyQt6.QtCore import Qt, QRectF
 from .base import ComponentBase
 import os
 from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
 
 class GridExportComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor("#DC143C")
+    
     def __init__(self, x, y):
         # Initialize with the same size as other components
         super().__init__(x, y, 300, 220)
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/grid_export3.png"))
+        self.image = load_pixmap("src/ui/assets/grid_export3.png")
         
         self.capacity = 1500  # kW - maximum export capacity
         self.operating_mode = "Last Resort Unit (Auto)"  # Only Auto mode for now
@@ -27,13 +31,8 @@ class GridExportComponent(ComponentBase):
         self.custom_profile = None  # Will hold custom profile data
         self.profile_name = None  # Will store the name of the loaded profile
     
-    def paint(self, painter, option, widget):
-        # Save painter state
-        painter.save()
-        
-        # Call base class paint to handle the selection highlight
-        super().paint(painter, option, widget)
-        
+    def get_image_rect(self):
+        """Return the rect the grid export image is drawn into"""
         # Get component dimensions
         rect = self.boundingRect()
         
@@ -53,19 +52,29 @@ class GridExportComponent(ComponentBase):
             image_size
         )
         
-        # Draw the image with transparent background and 1:1 aspect ratio
-        if not self.image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                self.image,
-                QRectF(0, 0, self.image.width(), self.image.height())
-            )
-            
-            # Calculate export percentage
-            if self.capacity > 0:
-                export_percentage = min(1.0, self.last_export / self.capacity)
-            else:
-                export_percentage = 0
+        return image_rect
+    
+    def get_indicator_fraction(self):
+        """Export level shown by the grid export indicator"""
+        if self.capacity > 0:
+            return min(1.0, self.last_export / self.capacity)
+        return 0
+    
+    def paint(self, painter, option, widget):
+        # Save painter state
+        painter.save()
+        
+        # Call base class paint to handle the selection highlight
+        super().paint(painter, option, widget)
+        
+        # The image itself is drawn by the cached static layer; the indicator sits on top of it
+        image_rect = self.get_image_rect()
+        image_size = image_rect.width()
+        
+        # The indicator is skipped when the component is small on screen
+        if not self.image.isNull() and self.shows_details():
+            # Export percentage last pushed by the simulation engine (quantized)
+            export_percentage = self.get_display_level()
             
             # Draw vertical export indicator in top right corner
             # Set indicator size relative to image size
@@ -222,9 +231,10 @@ class GridExportComponent(ComponentBase):
             
             # Get the particle system
             if hasattr(parent, 'particle_system'):
-                # Create a popup for each $1000 increment (in case we earned multiple $1000 in one step)
-                for _ in range(current_thousands - previous_thousands):
-                    parent.particle_system.create_revenue_popup(center_x, center_y, 1000)
+                # Queue the $1000 increments crossed this step - the particle system merges
+                # everything queued for this component within a frame into one popup
+                parent.particle_system.queue_milestone_popup(
+                    self, center_x, center_y, current_thousands - previous_thousands)
         
         # Store current revenue for next check
         self.previous_revenue = self.accumulated_revenue
@@ -1,22 +1,26 @@
 # TODO_PYQT6: verify width()/isType() semantics
 import numpy as np
-import random
 import csv
 import os
-from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPixmap
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont
 from PyQt6.QtCore import Qt, QRectF
 from .base import ComponentBase
 from .bus import BusComponent
 from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
+from src.simulation.random_state import simulation_random
 
 class LoadComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor("#DAA520")
+    
     def __init__(self, x, y):
         # Initialize with the same size as the generator component
         super().__init__(x, y, 300, 220)
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/load2.png"))
+        self.image = load_pixmap("src/ui/assets/load2.png")
         
         self.demand = 2000  # kW
         self.price_per_kwh = 0.00  # Default price per kWh in dollars
@@ -37,6 +41,23 @@ class LoadComponent(ComponentBase):
         # Capital expenditure (CAPEX) property
         self.capex_per_kw = 17000  # $17,000 per kW default for load
     
+    def paint_static_layer(self, painter):
+        """Draw the shadow and image only while graphics are enabled"""
+        if self.graphics_enabled:
+            super().paint_static_layer(painter)
+    
+    def get_indicator_fraction(self):
+        """Load factor (current demand / rated demand) shown by the indicator"""
+        # Get current time step and calculate load factor (percent of demand)
+        current_time = 0
+        if self.scene() and hasattr(self.scene(), 'parent'):
+            parent = self.scene().parent()
+            if hasattr(parent, 'simulation_engine') and hasattr(parent.simulation_engine, 'current_time_step'):
+                current_time = parent.simulation_engine.current_time_step
+        
+        current_demand = self.calculate_demand(current_time)
+        return current_demand / self.demand if self.demand > 0 else 0
+    
     def paint(self, painter, option, widget):
         # Get component dimensions
         rect = self.boundingRect()
@@ -47,40 +68,16 @@ class LoadComponent(ComponentBase):
             super().paint(painter, option, widget)
             painter.restore()
             
-            # Draw the image only if graphics are enabled
-            # Calculate image area with 1:1 aspect ratio (square)
-            # Using 80% of height for the larger image
-            image_height = rect.height() * 0.8
-            image_size = min(rect.width(), image_height)
+            # The indicator is skipped when the component is small on screen
+            if not self.shows_details():
+                return
             
-            # Center the image horizontally
-            x_offset = (rect.width() - image_size) / 2
-            
-            # Create square image rect
-            image_rect = QRectF(
-                rect.x() + x_offset,
-                rect.y() + (rect.height() * 0.05),  # Add a small top margin
-                image_size,
-                image_size
-            )
-            
-            # Draw the image with transparent background and 1:1 aspect ratio
-            if not self.image.isNull():
-                painter.drawPixmap(
-                    image_rect,
-                    self.image,
-                    QRectF(0, 0, self.image.width(), self.image.height())
-                )
-                
-            # Get current time step and calculate load factor (percent of demand)
-            current_time = 0
-            if self.scene() and hasattr(self.scene(), 'parent'):
-                parent = self.scene().parent()
-                if hasattr(parent, 'simulation_engine') and hasattr(parent.simulation_engine, 'current_time_step'):
-                    current_time = parent.simulation_engine.current_time_step
+            # The image itself is drawn by the cached static layer; the indicator sits on top of it
+            image_rect = self.get_image_rect()
+            image_size = image_rect.width()
             
-            current_demand = self.calculate_demand(current_time)
-            load_factor = current_demand / self.demand if self.demand > 0 else 0
+            # Load factor last pushed by the simulation engine (quantized)
+            load_factor = self.get_display_level()
             
             # Draw vertical load factor indicator in top right corner
             # Set indicator size relative to image size (smaller than before)
@@ -187,9 +184,10 @@ class LoadComponent(ComponentBase):
             
             # Get the particle system
             if hasattr(parent, 'particle_system'):
-                # Create a popup for each $1000 increment (in case we earned multiple $1000 in one step)
-                for _ in range(current_thousands - previous_thousands):
-                    parent.particle_system.create_revenue_popup(center_x, center_y, 1000)
+                # Queue the $1000 increments crossed this step - the particle system merges
+                # everything queued for this component within a frame into one popup
+                parent.particle_system.queue_milestone_popup(
+                    self, center_x, center_y, current_thousands - previous_thousands)
         
         # Store current revenue for next check
         self.previous_revenue = self.accumulated_revenue
@@ -207,7 +205,7 @@ class LoadComponent(ComponentBase):
         """Generate a random 8760 profile with ramp rate limiting"""
         if self.random_profile is None:
             # Initialize with random value between 0.3 and 1.0
-            self.random_profile = [random.uniform(0.3, 1.0)]
+            self.random_profile = [simulation_random.uniform(0.3, 1.0)]
             
             # Generate the rest of the values respecting max ramp rate
             for i in range(1, 8760):
@@ -217,7 +215,7 @@ class LoadComponent(ComponentBase):
                 # Random value within allowed range
                 min_value = max(0.1, prev_value - max_change)
                 max_value = min(1.0, prev_value + max_change)
-                new_value = random.uniform(min_value, max_value)
+                new_value = simulation_random.uniform(min_value, max_value)
                 self.random_profile.append(new_value)
         
         return self.random_profile
@@ -233,11 +231,11 @@ class LoadComponent(ComponentBase):
             # 80-90% annual load factor
             # 5-10% max inter-hourly ramp
             # Day/night cycle with day bias
-            base_load_factor = random.uniform(0.8, 0.9)
-            max_ramp = random.uniform(0.05, 0.1)
+            base_load_factor = simulation_random.uniform(0.8, 0.9)
+            max_ramp = simulation_random.uniform(0.05, 0.1)
             
             # Initialize with day time value around the base load factor
-            current_value = random.uniform(base_load_factor - 0.05, base_load_factor + 0.05)
+            current_value = simulation_random.uniform(base_load_factor - 0.05, base_load_factor + 0.05)
             profile.append(current_value)
             
             for hour in range(1, 8760):
@@ -246,10 +244,10 @@ class LoadComponent(ComponentBase):
                 # Add day/night cycle pattern
                 if 8 <= time_of_day <= 20:  # Daytime (8am-8pm)
                     # During the day, bias load higher
-                    target = random.uniform(base_load_factor, min(1.0, base_load_factor + 0.1))
+                    target = simulation_random.uniform(base_load_factor, min(1.0, base_load_factor + 0.1))
                 else:  # Nighttime
                     # During the night, bias load lower
-                    target = random.uniform(max(0.7, base_load_factor - 0.1), base_load_factor)
+                    target = simulation_random.uniform(max(0.7, base_load_factor - 0.1), base_load_factor)
                 
                 # Apply ramp rate limitation
                 max_change = max_ramp
@@ -270,7 +268,7 @@ class LoadComponent(ComponentBase):
             max_ramp = 0.75
             
             # Initialize with a value around the base load factor
-            current_value = random.uniform(base_load_factor - 0.1, base_load_factor + 0.1)
+            current_value = simulation_random.uniform(base_load_factor - 0.1, base_load_factor + 0.1)
             profile.append(current_value)
             
             for hour in range(1, 8760):
@@ -279,10 +277,10 @@ class LoadComponent(ComponentBase):
                 # Add day/night cycle pattern
                 if 8 <= time_of_day <= 20:  # Daytime (8am-8pm)
                     # During the day, bias load higher for GPU workloads
-                    target = random.uniform(0.6, 0.8)  # Higher range during day
+                    target = simulation_random.uniform(0.6, 0.8)  # Higher range during day
                 else:  # Nighttime
                     # During the night, bias load lower
-                    target = random.uniform(0.3, 0.5)  # Lower range at night
+                    target = simulation_random.uniform(0.3, 0.5)  # Lower range at night
                 
                 # Apply ramp rate limitation
                 max_change = max_ramp
@@ -299,16 +297,16 @@ class LoadComponent(ComponentBase):
             # 90-100% load factor
             # Max 2% hourly change
             # No day/night cycle
-            base_load_factor = random.uniform(0.9, 1.0)
+            base_load_factor = simulation_random.uniform(0.9, 1.0)
             max_ramp = 0.02
             
             # Initialize with high value
-            current_value = random.uniform(0.95, 1.0)
+            current_value = simulation_random.uniform(0.95, 1.0)
             profile.append(current_value)
             
             for _ in range(1, 8760):
                 # Very small random changes to maintain high utilization
-                target = random.uniform(0.9, 1.0)
+                target = simulation_random.uniform(0.9, 1.0)
                 
                 # Apply tight ramp rate limitation
                 max_change = max_ramp
@@ -1,18 +1,22 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPixmap
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont
 from PyQt6.QtCore import Qt, QRectF
 from .base import ComponentBase
 import os
 from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
 
 class SolarPanelComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor(40, 80, 160)
+    
     def __init__(self, x, y):
         # Initialize with a larger size to accommodate bigger image
         super().__init__(x, y, 300, 220)  # Same size as other components
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/solarpanel2.png"))
+        self.image = load_pixmap("src/ui/assets/solarpanel2.png")
         
         # Solar panel properties
         self.capacity = 1000  # kW - default capacity
@@ -25,12 +29,8 @@ class SolarPanelComponent(ComponentBase):
         # Capital expenditure (CAPEX) property
         self.capex_per_kw = 1000  # $1,000 per kW default for solar panel
     
-    def paint(self, painter, option, widget):
-        # Call base class paint to handle the selection highlight
-        painter.save()
-        super().paint(painter, option, widget)
-        painter.restore()
-        
+    def get_image_rect(self):
+        """Return the rect the solar panel image is drawn into"""
         # Get component dimensions
         rect = self.boundingRect()
         
@@ -50,19 +50,28 @@ class SolarPanelComponent(ComponentBase):
             image_size
         )
         
-        # Draw the image with transparent background and 1:1 aspect ratio
-        if not self.image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                self.image,
-                QRectF(0, 0, self.image.width(), self.image.height())
-            )
-            
-            # Calculate output percentage
-            if self.capacity > 0:
-                output_percentage = self.last_output / self.capacity
-            else:
-                output_percentage = 0
+        return image_rect
+    
+    def get_indicator_fraction(self):
+        """Output level shown by the solar panel indicator"""
+        if self.capacity > 0:
+            return self.last_output / self.capacity
+        return 0
+    
+    def paint(self, painter, option, widget):
+        # Call base class paint to handle the selection highlight
+        painter.save()
+        super().paint(painter, option, widget)
+        painter.restore()
+        
+        # The image itself is drawn by the cached static layer; the indicator sits on top of it
+        image_rect = self.get_image_rect()
+        image_size = image_rect.width()
+        
+        # The indicator is skipped when the component is small on screen
+        if not self.image.isNull() and self.shows_details():
+            # Output percentage last pushed by the simulation engine (quantized)
+            output_percentage = self.get_display_level()
             
             # Draw vertical output indicator in top right corner
             # Set indicator size relative to image size
@@ -1,22 +1,26 @@
 # TODO_PYQT6: verify width()/isType() semantics
-from PyQt6.QtGui import QBrush, QColor, QPixmap, QRadialGradient
+from PyQt6.QtGui import QBrush, QColor, QRadialGradient
 from PyQt6.QtCore import Qt, QRectF
 from .base import ComponentBase
-from src.utils.resource import resource_path
+from src.utils.pixmap_cache import load_pixmap
 
 class TreeComponent(ComponentBase):
+    # Flat glyph colour when zoomed far out
+    glyph_color = QColor(40, 100, 40)
+    
     def __init__(self, x, y):
         # Initialize with the same size as other components
         super().__init__(x, y, 300, 220)
         # Make brush transparent (no background)
         self.setBrush(Qt.GlobalColor.transparent)
         # Load the image
-        self.image = QPixmap(resource_path("src/ui/assets/tree.png"))
+        self.image = load_pixmap("src/ui/assets/tree.png")
         
         # Decorative component with no functional properties
         self.name = "Tree"
     
-    def paint(self, painter, option, widget):
+    def draw_shadow(self, painter):
+        """Draw the tree shadow beneath the standard one"""
         # Save painter state
         painter.save()
         
@@ -48,9 +52,10 @@ class TreeComponent(ComponentBase):
         # Restore painter state after drawing shadow
         painter.restore()
         
-        # Call the parent class paint method to handle selection highlight and the open button
-        super().paint(painter, option, widget)
-        
+        super().draw_shadow(painter)
+    
+    def get_image_rect(self):
+        """Return the rect the tree image is drawn into"""
         # Get component dimensions for the tree image
         rect = self.boundingRect()
         
@@ -70,13 +75,7 @@ class TreeComponent(ComponentBase):
             image_size
         )
         
-        # Draw the image with transparent background and 1:1 aspect ratio
-        if not self.image.isNull():
-            painter.drawPixmap(
-                image_rect,
-                self.image,
-                QRectF(0, 0, self.image.width(), self.image.height())
-            )
+        return image_rect
     
     def mousePressEvent(self, event):
         # Call the base class mousePressEvent for selection functionality
@@ -68,6 +68,7 @@ class ModelManager:
         # Reset simulation components
         self.main_window.components = []
         self.main_window.connections = []
+        self.main_window.network_topology.invalidate()
         self.main_window.simulation_engine.current_time_step = 0
         
         # Reset energy tracking
@@ -120,6 +121,30 @@ class ModelManager:
         if not filename.endswith('.json'):
             filename += '.json'
             
+        data = self.scenario_data()
+            
+        # Save to file
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=4)
+            
+        box = create_styled_message_box(
+            self.main_window,
+            QMessageBox.Icon.Information,
+            "Save Complete",
+            "Scenario saved successfully.",
+            QMessageBox.StandardButton.Ok,
+            QMessageBox.StandardButton.Ok,
+        )
+        box.exec()
+
+    def scenario_data(self):
+        """
+        Build the scenario dictionary for the current scene - what save_scenario
+        writes to disk, and what the headless workers (e.g. sensitivity runs) load
+        
+        Returns:
+            Dictionary with 'components', 'connections' and 'decorations'
+        """
         # Create data structure
         data = {
             "components": [],
@@ -131,8 +156,9 @@ class ModelManager:
         component_index_map = {}
         index = 0
         
-        # Save components and build index map
-        for item in self.main_window.scene.items():
+        # Save components and build index map (decorations baked into the
+        # background aren't scene items, so add them explicitly)
+        for item in self.main_window.scene.items() + self.main_window.scene.baked_decorations():
             if isinstance(item, GeneratorComponent):
                 component_index_map[item] = index
                 index += 1
@@ -161,6 +187,7 @@ class ModelManager:
                     "y": item.y(),
                     "demand": item.demand,
                     "profile_type": item.profile_type,
+                    "price_per_kwh": item.price_per_kwh,
                     "graphics_enabled": item.graphics_enabled,
                     "capex_per_kw": item.capex_per_kw
                 })
@@ -222,6 +249,9 @@ class ModelManager:
                     "x": item.x(),
                     "y": item.y(),
                     "operating_mode": item.operating_mode,
+                    "dedicated_power_per_resource": item.dedicated_power_per_resource,
+                    "dedicated_power_use_efficiency": item.dedicated_power_use_efficiency,
+                    "dedicated_price_per_resource": item.dedicated_price_per_resource,
                     "accumulated_revenue": item.accumulated_revenue
                 })
             elif isinstance(item, SolarPanelComponent):
@@ -267,19 +297,7 @@ class ModelManager:
                 "target": target_index
             })
             
-        # Save to file
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
-            
-        box = create_styled_message_box(
-            self.main_window,
-            QMessageBox.Icon.Information,
-            "Save Complete",
-            "Scenario saved successfully.",
-            QMessageBox.StandardButton.Ok,
-            QMessageBox.StandardButton.Ok,
-        )
-        box.exec()
+        return data
 
     def load_scenario(self):
         """Load a scenario from a file"""
@@ -290,274 +308,298 @@ class ModelManager:
             
         self.load_scenario_from_file(filename)
 
-    def load_scenario_from_file(self, filename):
-        """Load a scenario from a specific file path without showing a dialog"""
-        # Clear existing scenario
-        self.new_scenario()
+    def populate_scenario(self, data):
+        """
+        Build the components and connections of a saved scenario into the current
+        (cleared) scene. Shared by the interactive load and the headless batch runner.
         
-        try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-                
-            # Load components
-            component_map = []  # Map saved indexes to new component objects
+        Args:
+            data: Scenario dictionary as written by save_scenario
+        """
+        # Load components
+        component_map = []  # Map saved indexes to new component objects
+        
+        # First pass: create all components in same order as saved
+        for i, component_data in enumerate(data.get("components", [])):
+            x = component_data["x"]
+            y = component_data["y"]
+            component_type = component_data["type"]
             
-            # First pass: create all components in same order as saved
-            for i, component_data in enumerate(data.get("components", [])):
-                x = component_data["x"]
-                y = component_data["y"]
-                component_type = component_data["type"]
-                
-                if component_type == "Generator":
-                    component = GeneratorComponent(x, y)
-                    component.capacity = component_data.get("capacity", 100)
-                    # Handle both new and old attribute names for backward compatibility
-                    if "operating_mode" in component_data:
-                        component.operating_mode = component_data["operating_mode"]
-                    elif "mode" in component_data:
-                        component.operating_mode = component_data["mode"]
-                    else:
-                        component.operating_mode = "BTF Droop (Auto)"  # Default value
-                        
-                    # Set auto_charging parameter if available, otherwise default to True
-                    if "auto_charging" in component_data:
-                        component.auto_charging = component_data["auto_charging"]
-                    else:
-                        component.auto_charging = True  # Default value
-                    
-                    # Set efficiency parameter if available, otherwise default to 0.40 (40%)
-                    if "efficiency" in component_data:
-                        component.efficiency = component_data["efficiency"]
-                    else:
-                        component.efficiency = 0.40  # Default value
-                        
-                    # Set cost_per_gj parameter if available, otherwise default to 2.00
-                    if "cost_per_gj" in component_data:
-                        component.cost_per_gj = component_data["cost_per_gj"]
-                    else:
-                        component.cost_per_gj = 2.00  # Default value
-                        
-                    # Set accumulated_cost if available, otherwise default to 0.00
-                    if "accumulated_cost" in component_data:
-                        component.accumulated_cost = component_data["accumulated_cost"]
-                    else:
-                        component.accumulated_cost = 0.00
-                    
-                    # Set capex_per_kw if available, otherwise keep default value
-                    if "capex_per_kw" in component_data:
-                        component.capex_per_kw = component_data["capex_per_kw"]
-                    
-                    # Set maintenance parameters if available
-                    if "frequency_per_10000_hours" in component_data:
-                        component.frequency_per_10000_hours = component_data["frequency_per_10000_hours"]
-                    if "minimum_downtime" in component_data:
-                        component.minimum_downtime = component_data["minimum_downtime"]
-                    if "maximum_downtime" in component_data:
-                        component.maximum_downtime = component_data["maximum_downtime"]
-                    if "cooldown_time" in component_data:
-                        component.cooldown_time = component_data["cooldown_time"]
-                    
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
-                    
-                elif component_type == "Load":
-                    component = LoadComponent(x, y)
-                    component.demand = component_data.get("demand", 500)
-                    # Handle both new (profile_type) and old (profile) attribute names
-                    if "profile_type" in component_data:
-                        component.profile_type = component_data["profile_type"]
-                    elif "profile" in component_data:
-                        component.profile_type = component_data["profile"]
-                    else:
-                        component.profile_type = "Static"  # Default value
-                        
-                    if "graphics_enabled" in component_data:
-                        component.graphics_enabled = component_data["graphics_enabled"]
-                    
-                    # Set capex_per_kw if available, otherwise keep default value
-                    if "capex_per_kw" in component_data:
-                        component.capex_per_kw = component_data["capex_per_kw"]
-                    
-                    # Handle Powerlandia profile if needed
-                    if component.profile_type == "Powerlandia 8760-60CF":
-                        component.load_powerlandia_profile()
-                        
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
-                    
-                elif component_type == "Bus":
-                    component = BusComponent(x, y)
-                    component.is_on = component_data.get("is_on", True)
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
-                    
-                elif component_type == "GridImport":
-                    component = GridImportComponent(x, y)
-                    component.capacity = component_data.get("capacity", 500)
-                    # Load auto_charge_batteries with default True for backward compatibility
-                    component.auto_charge_batteries = component_data.get("auto_charge_batteries", True)
-                    component.cost_per_kwh = component_data.get("cost_per_kwh", 0.0)
-                    component.accumulated_cost = component_data.get("accumulated_cost", 0.0)
-                    component.market_prices_mode = component_data.get("market_prices_mode", "None")
-                    component.custom_profile = component_data.get("custom_profile", None)
-                    component.profile_name = component_data.get("profile_name", "")
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
+            if component_type == "Generator":
+                component = GeneratorComponent(x, y)
+                component.capacity = component_data.get("capacity", 100)
+                # Handle both new and old attribute names for backward compatibility
+                if "operating_mode" in component_data:
+                    component.operating_mode = component_data["operating_mode"]
+                elif "mode" in component_data:
+                    component.operating_mode = component_data["mode"]
+                else:
+                    component.operating_mode = "BTF Droop (Auto)"  # Default value
                     
-                elif component_type == "GridExport":
-                    component = GridExportComponent(x, y)
-                    component.capacity = component_data.get("capacity", 500)
-                    component.bulk_ppa_price = component_data.get("bulk_ppa_price", 0.0)
-                    component.accumulated_revenue = component_data.get("accumulated_revenue", 0.0)
-                    component.market_prices_mode = component_data.get("market_prices_mode", "None")
-                    component.custom_profile = component_data.get("custom_profile", None)
-                    component.profile_name = component_data.get("profile_name", "")
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
+                # Set auto_charging parameter if available, otherwise default to True
+                if "auto_charging" in component_data:
+                    component.auto_charging = component_data["auto_charging"]
+                else:
+                    component.auto_charging = True  # Default value
+                
+                # Set efficiency parameter if available, otherwise default to 0.40 (40%)
+                if "efficiency" in component_data:
+                    component.efficiency = component_data["efficiency"]
+                else:
+                    component.efficiency = 0.40  # Default value
                     
-                elif component_type == "Battery":
-                    component = BatteryComponent(x, y)
-                    # Handle both new and old attribute names for backward compatibility
-                    if "power_capacity" in component_data:
-                        component.power_capacity = component_data["power_capacity"]
-                    elif "capacity" in component_data:
-                        component.power_capacity = component_data["capacity"]
-                    else:
-                        component.power_capacity = 500  # Default value
+                # Set cost_per_gj parameter if available, otherwise default to 2.00
+                if "cost_per_gj" in component_data:
+                    component.cost_per_gj = component_data["cost_per_gj"]
+                else:
+                    component.cost_per_gj = 2.00  # Default value
                     
-                    if "energy_capacity" in component_data:
-                        component.energy_capacity = component_data["energy_capacity"]
-                    else:
-                        component.energy_capacity = 2000  # Default value
-                        
-                    if "current_charge" in component_data:
-                        component.current_charge = component_data["current_charge"]
-                    elif "initial_charge" in component_data:
-                        # Convert from percentage to absolute value if needed
-                        initial_charge_pct = component_data["initial_charge"]
-                        component.current_charge = (initial_charge_pct / 100) * component.energy_capacity
-                    else:
-                        component.current_charge = component.energy_capacity * 0.5  # Default 50% charge
-                        
-                    if "operating_mode" in component_data:
-                        component.operating_mode = component_data["operating_mode"]
-                    else:
-                        component.operating_mode = "BTF ± Unit (Auto)"  # Default mode
-                     
-                    # Set capex_per_kw if available, otherwise keep default value
-                    if "capex_per_kw" in component_data:
-                        component.capex_per_kw = component_data["capex_per_kw"]
-                        
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
+                # Set accumulated_cost if available, otherwise default to 0.00
+                if "accumulated_cost" in component_data:
+                    component.accumulated_cost = component_data["accumulated_cost"]
+                else:
+                    component.accumulated_cost = 0.00
+                
+                # Set capex_per_kw if available, otherwise keep default value
+                if "capex_per_kw" in component_data:
+                    component.capex_per_kw = component_data["capex_per_kw"]
                 
-                elif component_type == "CloudWorkload":
-                    component = CloudWorkloadComponent(x, y)
-                    component.operating_mode = component_data.get("operating_mode", "No Customer")
-                    component.accumulated_revenue = component_data.get("accumulated_revenue", 0.0)
-                    # Load dedicated capacity parameters if they exist
-                    if "dedicated_power_per_resource" in component_data:
-                        component.dedicated_power_per_resource = component_data.get("dedicated_power_per_resource", 1.20)
-                    if "dedicated_power_use_efficiency" in component_data:
-                        component.dedicated_power_use_efficiency = component_data.get("dedicated_power_use_efficiency", 1.15)
-                    if "dedicated_price_per_resource" in component_data:
-                        component.dedicated_price_per_resource = component_data.get("dedicated_price_per_resource", 3.25)
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
+                # Set maintenance parameters if available
+                if "frequency_per_10000_hours" in component_data:
+                    component.frequency_per_10000_hours = component_data["frequency_per_10000_hours"]
+                if "minimum_downtime" in component_data:
+                    component.minimum_downtime = component_data["minimum_downtime"]
+                if "maximum_downtime" in component_data:
+                    component.maximum_downtime = component_data["maximum_downtime"]
+                if "cooldown_time" in component_data:
+                    component.cooldown_time = component_data["cooldown_time"]
+                
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+                
+            elif component_type == "Load":
+                component = LoadComponent(x, y)
+                component.demand = component_data.get("demand", 500)
+                # Handle both new (profile_type) and old (profile) attribute names
+                if "profile_type" in component_data:
+                    component.profile_type = component_data["profile_type"]
+                elif "profile" in component_data:
+                    component.profile_type = component_data["profile"]
+                else:
+                    component.profile_type = "Static"  # Default value
                     
-                elif component_type == "SolarPanel":
-                    component = SolarPanelComponent(x, y)
-                    component.capacity = component_data.get("capacity", 500)
-                    component.operating_mode = component_data.get("operating_mode", "Disabled")
+                # Set price_per_kwh if available, otherwise keep default value
+                if "price_per_kwh" in component_data:
+                    component.price_per_kwh = component_data["price_per_kwh"]
                     
-                    # Set capex_per_kw if available, otherwise keep default value
-                    if "capex_per_kw" in component_data:
-                        component.capex_per_kw = component_data["capex_per_kw"]
+                if "graphics_enabled" in component_data:
+                    component.graphics_enabled = component_data["graphics_enabled"]
+                
+                # Set capex_per_kw if available, otherwise keep default value
+                if "capex_per_kw" in component_data:
+                    component.capex_per_kw = component_data["capex_per_kw"]
+                
+                # Handle Powerlandia profile if needed
+                if component.profile_type == "Powerlandia 8760-60CF":
+                    component.load_powerlandia_profile()
                     
-                    # Load custom profile data if available
-                    if "custom_profile" in component_data and "profile_name" in component_data:
-                        component.custom_profile = component_data["custom_profile"]
-                        component.profile_name = component_data["profile_name"]
-                    # Load capacity factors if in active mode
-                    if component.operating_mode == "Powerlandia 8760-1":
-                        component.load_capacity_factors()
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+                
+            elif component_type == "Bus":
+                component = BusComponent(x, y)
+                component.is_on = component_data.get("is_on", True)
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+                
+            elif component_type == "GridImport":
+                component = GridImportComponent(x, y)
+                component.capacity = component_data.get("capacity", 500)
+                # Load auto_charge_batteries with default True for backward compatibility
+                component.auto_charge_batteries = component_data.get("auto_charge_batteries", True)
+                component.cost_per_kwh = component_data.get("cost_per_kwh", 0.0)
+                component.accumulated_cost = component_data.get("accumulated_cost", 0.0)
+                component.market_prices_mode = component_data.get("market_prices_mode", "None")
+                component.custom_profile = component_data.get("custom_profile", None)
+                component.profile_name = component_data.get("profile_name", "")
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+                
+            elif component_type == "GridExport":
+                component = GridExportComponent(x, y)
+                component.capacity = component_data.get("capacity", 500)
+                component.bulk_ppa_price = component_data.get("bulk_ppa_price", 0.0)
+                component.accumulated_revenue = component_data.get("accumulated_revenue", 0.0)
+                component.market_prices_mode = component_data.get("market_prices_mode", "None")
+                component.custom_profile = component_data.get("custom_profile", None)
+                component.profile_name = component_data.get("profile_name", "")
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+                
+            elif component_type == "Battery":
+                component = BatteryComponent(x, y)
+                # Handle both new and old attribute names for backward compatibility
+                if "power_capacity" in component_data:
+                    component.power_capacity = component_data["power_capacity"]
+                elif "capacity" in component_data:
+                    component.power_capacity = component_data["capacity"]
+                else:
+                    component.power_capacity = 500  # Default value
                 
-                elif component_type == "WindTurbine":
-                    component = WindTurbineComponent(x, y)
-                    component.capacity = component_data.get("capacity", 500)
-                    component.operating_mode = component_data.get("operating_mode", "Disabled")
+                if "energy_capacity" in component_data:
+                    component.energy_capacity = component_data["energy_capacity"]
+                else:
+                    component.energy_capacity = 2000  # Default value
                     
-                    # Set capex_per_kw if available, otherwise keep default value
-                    if "capex_per_kw" in component_data:
-                        component.capex_per_kw = component_data["capex_per_kw"]
+                if "current_charge" in component_data:
+                    component.current_charge = component_data["current_charge"]
+                elif "initial_charge" in component_data:
+                    # Convert from percentage to absolute value if needed
+                    initial_charge_pct = component_data["initial_charge"]
+                    component.current_charge = (initial_charge_pct / 100) * component.energy_capacity
+                else:
+                    component.current_charge = component.energy_capacity * 0.5  # Default 50% charge
                     
-                    # Load custom profile data if available
-                    if "custom_profile" in component_data and "profile_name" in component_data:
-                        component.custom_profile = component_data["custom_profile"]
-                        component.profile_name = component_data["profile_name"]
-                    # Load capacity factors if in active mode
-                    if component.operating_mode == "Powerlandia 8760-1":
-                        component.load_capacity_factors()
-                    self.main_window.scene.addItem(component)
-                    self.main_window.components.append(component)
-                    component_map.append(component)
+                if "operating_mode" in component_data:
+                    component.operating_mode = component_data["operating_mode"]
+                else:
+                    component.operating_mode = "BTF ± Unit (Auto)"  # Default mode
+                 
+                # Set capex_per_kw if available, otherwise keep default value
+                if "capex_per_kw" in component_data:
+                    component.capex_per_kw = component_data["capex_per_kw"]
                     
-            # Load decorations (trees, bushes, etc.)
-            for decoration_data in data.get("decorations", []):
-                x = decoration_data["x"]
-                y = decoration_data["y"]
-                decoration_type = decoration_data["type"]
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+            
+            elif component_type == "CloudWorkload":
+                component = CloudWorkloadComponent(x, y)
+                component.operating_mode = component_data.get("operating_mode", "No Customer")
+                component.accumulated_revenue = component_data.get("accumulated_revenue", 0.0)
+                # Load dedicated capacity parameters if they exist
+                if "dedicated_power_per_resource" in component_data:
+                    component.dedicated_power_per_resource = component_data.get("dedicated_power_per_resource", 1.20)
+                if "dedicated_power_use_efficiency" in component_data:
+                    component.dedicated_power_use_efficiency = component_data.get("dedicated_power_use_efficiency", 1.15)
+                if "dedicated_price_per_resource" in component_data:
+                    component.dedicated_price_per_resource = component_data.get("dedicated_price_per_resource", 3.25)
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
                 
-                if decoration_type == "TreeComponent":
-                    component = TreeComponent(x, y)
-                    self.main_window.scene.addItem(component)
-                elif decoration_type == "BushComponent":
-                    component = BushComponent(x, y)
-                    self.main_window.scene.addItem(component)
-                elif decoration_type == "PondComponent":
-                    component = PondComponent(x, y)
-                    self.main_window.scene.addItem(component)
-                elif decoration_type == "House1Component":
-                    component = House1Component(x, y)
-                    self.main_window.scene.addItem(component)
-                elif decoration_type == "House2Component":
-                    component = House2Component(x, y)
-                    self.main_window.scene.addItem(component)
-                elif decoration_type == "FactoryComponent":
-                    component = FactoryComponent(x, y)
-                    self.main_window.scene.addItem(component)
-                elif decoration_type == "TraditionalDataCenterComponent":
-                    component = TraditionalDataCenterComponent(x, y)
-                    self.main_window.scene.addItem(component)
-                elif decoration_type == "DistributionPoleComponent":
-                    component = DistributionPoleComponent(x, y)
-                    self.main_window.scene.addItem(component)
-                    
-            # Second pass: restore connections using the exact same indices from the file
-            for connection_data in data.get("connections", []):
-                source_index = connection_data["source"]
-                target_index = connection_data["target"]
+            elif component_type == "SolarPanel":
+                component = SolarPanelComponent(x, y)
+                component.capacity = component_data.get("capacity", 500)
+                component.operating_mode = component_data.get("operating_mode", "Disabled")
                 
-                if 0 <= source_index < len(component_map) and 0 <= target_index < len(component_map):
-                    source = component_map[source_index]
-                    target = component_map[target_index]
-                    
-                    # Create the connection
-                    connection = Connection(source, target)
-                    self.main_window.connections.append(connection)
-                    self.main_window.scene.addItem(connection)
-                else:
-                    print(f"Warning: Invalid connection indices {source_index} -> {target_index}")
+                # Set capex_per_kw if available, otherwise keep default value
+                if "capex_per_kw" in component_data:
+                    component.capex_per_kw = component_data["capex_per_kw"]
+                
+                # Load custom profile data if available
+                if "custom_profile" in component_data and "profile_name" in component_data:
+                    component.custom_profile = component_data["custom_profile"]
+                    component.profile_name = component_data["profile_name"]
+                # Load capacity factors if in active mode
+                if component.operating_mode == "Powerlandia 8760-1":
+                    component.load_capacity_factors()
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+            
+            elif component_type == "WindTurbine":
+                component = WindTurbineComponent(x, y)
+                component.capacity = component_data.get("capacity", 500)
+                component.operating_mode = component_data.get("operating_mode", "Disabled")
+                
+                # Set capex_per_kw if available, otherwise keep default value
+                if "capex_per_kw" in component_data:
+                    component.capex_per_kw = component_data["capex_per_kw"]
+                
+                # Load custom profile data if available
+                if "custom_profile" in component_data and "profile_name" in component_data:
+                    component.custom_profile = component_data["custom_profile"]
+                    component.profile_name = component_data["profile_name"]
+                # Load capacity factors if in active mode
+                if component.operating_mode == "Powerlandia 8760-1":
+                    component.load_capacity_factors()
+                self.main_window.scene.addItem(component)
+                self.main_window.components.append(component)
+                component_map.append(component)
+                
+        # Load decorations (trees, bushes, etc.)
+        for decoration_data in data.get("decorations", []):
+            x = decoration_data["x"]
+            y = decoration_data["y"]
+            decoration_type = decoration_data["type"]
+            
+            if decoration_type == "TreeComponent":
+                component = TreeComponent(x, y)
+                self.main_window.scene.addItem(component)
+            elif decoration_type == "BushComponent":
+                component = BushComponent(x, y)
+                self.main_window.scene.addItem(component)
+            elif decoration_type == "PondComponent":
+                component = PondComponent(x, y)
+                self.main_window.scene.addItem(component)
+            elif decoration_type == "House1Component":
+                component = House1Component(x, y)
+                self.main_window.scene.addItem(component)
+            elif decoration_type == "House2Component":
+                component = House2Component(x, y)
+                self.main_window.scene.addItem(component)
+            elif decoration_type == "FactoryComponent":
+                component = FactoryComponent(x, y)
+                self.main_window.scene.addItem(component)
+            elif decoration_type == "TraditionalDataCenterComponent":
+                component = TraditionalDataCenterComponent(x, y)
+                self.main_window.scene.addItem(component)
+            elif decoration_type == "DistributionPoleComponent":
+                component = DistributionPoleComponent(x, y)
+                self.main_window.scene.addItem(component)
+        
+        # Keep decorations baked into the background if that mode is on
+        if self.main_window.scene.decorations_baked:
+            self.main_window.scene.set_decorations_baked(True)
+                
+        # Second pass: restore connections using the exact same indices from the file
+        for connection_data in data.get("connections", []):
+            source_index = connection_data["source"]
+            target_index = connection_data["target"]
+            
+            if 0 <= source_index < len(component_map) and 0 <= target_index < len(component_map):
+                source = component_map[source_index]
+                target = component_map[target_index]
+                
+                # Create the connection
+                connection = Connection(source, target)
+                self.main_window.connections.append(connection)
+                self.main_window.scene.addItem(connection)
+            else:
+                print(f"Warning: Invalid connection indices {source_index} -> {target_index}")
+        
+        # Rebuild the connectivity tracking for the loaded network
+        self.main_window.network_topology.invalidate()
+    
+    def load_scenario_from_file(self, filename):
+        """Load a scenario from a specific file path without showing a dialog"""
+        # Clear existing scenario
+        self.new_scenario()
+        
+        try:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+            
+            # Seed before the first update generates any random load profiles,
+            # so reopening a scenario reproduces them (and its cached run)
+            self.main_window.simulation_engine.seed_random_state()
+            self.populate_scenario(data)
             
             # Update scenario state
             self.main_window.validate_bus_states()  # Ensure buses without load connections are ON
@@ -569,6 +611,10 @@ class ModelManager:
             if hasattr(self.main_window, 'simulation_controller'):
                 self.main_window.simulation_controller.reset_simulation(skip_flash=False)
             
+            # Show the finished year straight away if this scenario has been run before
+            if hasattr(self.main_window, 'autocomplete_manager'):
+                self.main_window.autocomplete_manager.restore_cached_run()
+            
         except Exception as e:
             box = create_styled_message_box(
                 self.main_window,
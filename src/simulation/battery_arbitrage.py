@@ -0,0 +1,104 @@
+"""
+Perfect-foresight battery arbitrage planning for OVERCLOCK
+
+Batteries in "Arbitrage (Optimized)" mode don't react to the island's balance
+hour by hour like "BTF ± Unit (Auto)". Instead they follow a charge/discharge
+schedule planned up front for the rest of the year against the hourly prices
+of the island's grid connections: the price paid to charge (grid import price,
+or the export price given up when charging from surplus) and the price earned
+by discharging (export price, or the import price avoided).
+
+The schedule comes from a backward dynamic program over a discretized
+state-of-charge grid. Every hour is one vectorized NumPy step over all charge
+levels and all reachable moves at once, so a full 8760-hour plan takes a
+fraction of a second.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Number of state-of-charge levels the battery is planned on (0% to 100%)
+STATE_OF_CHARGE_LEVELS = 101
+
+# Upper bound on the levels - raised above the default only for batteries with a long duration
+MAX_STATE_OF_CHARGE_LEVELS = 2001
+
+# Tiny wear cost per kWh moved ($/kWh), so the plan idles rather than cycle for no gain
+CYCLE_COST = 1e-6
+
+
+def plan_schedule(charge_prices, discharge_prices, energy_capacity, power_capacity, initial_charge,
+                  levels=STATE_OF_CHARGE_LEVELS):
+    """
+    Plan the most profitable charge/discharge schedule with perfect price foresight
+
+    Args:
+        charge_prices: Hourly price paid per kWh charged ($/kWh)
+        discharge_prices: Hourly price earned per kWh discharged ($/kWh)
+        energy_capacity: Battery energy capacity (kWh)
+        power_capacity: Battery charge/discharge rate limit (kW)
+        initial_charge: Stored energy at the first hour (kWh)
+        levels: Number of state-of-charge levels to plan on
+
+    Returns:
+        NumPy array with the planned battery power of every hour (kW, positive
+        while discharging and negative while charging)
+    """
+    charge_prices = np.asarray(charge_prices, dtype=float)
+    discharge_prices = np.asarray(discharge_prices, dtype=float)
+    hours = len(charge_prices)
+    schedule = np.zeros(hours)
+    if hours == 0 or energy_capacity <= 0 or power_capacity <= 0:
+        return schedule
+
+    # Enough levels that a full-power hour moves at least one level
+    levels = int(min(MAX_STATE_OF_CHARGE_LEVELS, max(levels, np.ceil(energy_capacity / power_capacity) + 1)))
+    step = energy_capacity / (levels - 1)  # kWh per level
+    reach = max(1, min(levels - 1, int(power_capacity / step + 1e-9)))  # Levels movable in one hour
+
+    # Every move in levels (positive charges) and the energy it puts into the battery
+    moves = np.arange(-reach, reach + 1)
+    energy = moves * step
+    charging = moves > 0
+    wear = CYCLE_COST * np.abs(energy)
+
+    # Backward pass: value[level] is the best revenue from the next hour to the end of the horizon.
+    # Moves leaving the grid see -inf through the padding, so they're never picked.
+    value = np.zeros(levels)
+    padded = np.full(levels + 2 * reach, -np.inf)
+    windows = sliding_window_view(padded, 2 * reach + 1)  # windows[level, move] = value after that move
+    policy = np.empty((hours, levels), dtype=np.int32)
+    rows = np.arange(levels)
+    for hour in range(hours - 1, -1, -1):
+        padded[reach:reach + levels] = value
+        rewards = np.where(charging, -energy * charge_prices[hour], -energy * discharge_prices[hour]) - wear
+        totals = windows + rewards
+        best = np.argmax(totals, axis=1)
+        policy[hour] = best
+        value = totals[rows, best]
+
+    # Forward pass from the current charge, following the best move of every hour
+    level = int(np.clip(round(initial_charge / step), 0, levels - 1))
+    for hour in range(hours):
+        move = moves[policy[hour, level]]
+        schedule[hour] = -move * step
+        level += move
+    return schedule
+
+
+def plan_revenue(schedule, charge_prices, discharge_prices):
+    """
+    Revenue of a schedule at the prices it was planned against
+
+    Args:
+        schedule: Planned battery power per hour (kW, positive while discharging)
+        charge_prices: Hourly price paid per kWh charged ($/kWh)
+        discharge_prices: Hourly price earned per kWh discharged ($/kWh)
+
+    Returns:
+        float: Discharge revenue minus charging cost ($)
+    """
+    schedule = np.asarray(schedule, dtype=float)
+    discharged = np.clip(schedule, 0, None)
+    charged = np.clip(-schedule, 0, None)
+    return float(discharged @ np.asarray(discharge_prices, dtype=float) - charged @ np.asarray(charge_prices, dtype=float))
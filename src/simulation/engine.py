@@ -1,3 +1,4 @@
+import numpy as np
 from PyQt6.QtCore import QObject
 from src.components.generator import GeneratorComponent
 from src.components.load import LoadComponent
@@ -8,6 +9,31 @@ from src.components.grid_export import GridExportComponent
 from src.components.cloud_workload import CloudWorkloadComponent
 from src.components.solar_panel import SolarPanelComponent
 from src.components.wind_turbine import WindTurbineComponent
+from src.simulation.random_state import simulation_random, seed_simulation_random
+from src.simulation.battery_arbitrage import plan_schedule, plan_revenue
+from src.simulation.historian_rollups import HOURS_PER_YEAR
+
+# Version of the simulation model. Bump it whenever a change alters simulation
+# results, so cached runs from older versions are no longer used.
+ENGINE_VERSION = 1
+
+# Seed for load profiles and generator outages, so repeated runs of a scenario match
+DEFAULT_RANDOM_SEED = 0
+
+# Slots of every historian series (hours 0-8760), preallocated as NumPy arrays so
+# day x hour reshapes and statistics work on the stored data without copying it
+HISTORIAN_SLOTS = HOURS_PER_YEAR + 1
+
+# Per-run component state saved with cached runs (whichever of these a component has)
+RUN_STATE_ATTRIBUTES = (
+    'accumulated_revenue', 'previous_revenue', 'accumulated_cost', 'previous_cost',
+    'current_charge', 'last_output', 'last_import', 'last_export',
+    'is_in_maintenance', 'maintenance_time_remaining', 'cooldown_time_remaining', 'total_operating_hours'
+)
+
+# Component types taking part in the simulation (decorations are skipped)
+SIMULATED_TYPES = (GeneratorComponent, LoadComponent, BusComponent, BatteryComponent, GridImportComponent,
+                   GridExportComponent, CloudWorkloadComponent, SolarPanelComponent, WindTurbineComponent)
 
 class SimulationEngine(QObject):
     """
@@ -29,6 +55,7 @@ class SimulationEngine(QObject):
         self.last_time_step = 0
         self.total_energy_imported = 0
         self.total_energy_exported = 0
+        self.random_seed = DEFAULT_RANDOM_SEED
         
         # Add a stability tolerance to ignore tiny imbalances from rounding errors
         self.stability_tolerance = 0.1  # kW - imbalances smaller than this will not trigger instability
@@ -41,29 +68,137 @@ class SimulationEngine(QObject):
         
         # Create Historian data object to record simulation history
         self.historian = {
-            'total_generation': [0.0] * 8761,  # Initialize with 8761 entries (0-8760 hours)
-            'total_load': [0.0] * 8761,  # Add total_load tracking to historian
-            'grid_import': [0.0] * 8761,  # Add grid_import tracking to historian
-            'grid_export': [0.0] * 8761,   # Add grid_export tracking to historian
-            'cumulative_revenue': [0.0] * 8761,  # Add cumulative revenue tracking to historian
-            'cumulative_cost': [0.0] * 8761,  # Add cumulative cost tracking to historian
-            'battery_charge': [0.0] * 8761,  # Add battery charge tracking to historian
-            'system_instability': [0.0] * 8761,  # Add system instability tracking to historian
-            'satisfied_load': [0.0] * 8761   # Add satisfied load tracking to historian
+            'total_generation': np.zeros(HISTORIAN_SLOTS),  # Initialize with 8761 entries (0-8760 hours)
+            'total_load': np.zeros(HISTORIAN_SLOTS),  # Add total_load tracking to historian
+            'grid_import': np.zeros(HISTORIAN_SLOTS),  # Add grid_import tracking to historian
+            'grid_export': np.zeros(HISTORIAN_SLOTS),   # Add grid_export tracking to historian
+            'cumulative_revenue': np.zeros(HISTORIAN_SLOTS),  # Add cumulative revenue tracking to historian
+            'cumulative_cost': np.zeros(HISTORIAN_SLOTS),  # Add cumulative cost tracking to historian
+            'battery_charge': np.zeros(HISTORIAN_SLOTS),  # Add battery charge tracking to historian
+            'system_instability': np.zeros(HISTORIAN_SLOTS),  # Add system instability tracking to historian
+            'satisfied_load': np.zeros(HISTORIAN_SLOTS)   # Add satisfied load tracking to historian
         }
         
         # The component-specific historian entries will be added dynamically
         # as components are encountered during simulation
         
+        # Island lookup, rebuilt whenever the network topology changes
+        self._islands_source = None
+        self._island_index = {}
+        
     def reset_historian(self):
         """Reset all data arrays within the historian object."""
         for key in self.historian:
-            # Assuming all historian data are lists of numbers initialized to 0.0
-            if isinstance(self.historian[key], list):
-                # Re-initialize the list with zeros
-                self.historian[key] = [0.0] * len(self.historian[key])
+            # Zero the preallocated array in place
+            self.historian[key].fill(0.0)
         print("Historian data reset.")
         
+    def reset_component_state(self):
+        """Reset the per-run state of every component (accumulated revenue and cost, generator maintenance, battery charge)"""
+        # Reset accumulated revenue in all load components
+        for item in self.main_window.scene.items():
+            if isinstance(item, LoadComponent):
+                item.accumulated_revenue = 0.0
+                item.update()  # Refresh the visual display
+            # Reset accumulated revenue for Cloud Workload components as well
+            elif isinstance(item, CloudWorkloadComponent):
+                item.accumulated_revenue = 0.0
+                item.update()  # Refresh the visual display
+            # Reset accumulated revenue for Grid Export components
+            elif isinstance(item, GridExportComponent):
+                item.accumulated_revenue = 0.0
+                item.previous_revenue = 0.0
+                item.update()  # Refresh the visual display
+            # Reset accumulated cost for Grid Import components
+            elif isinstance(item, GridImportComponent):
+                item.accumulated_cost = 0.0
+                item.previous_cost = 0.0
+                item.update()  # Refresh the visual display
+            # Reset accumulated cost for Generator components
+            elif isinstance(item, GeneratorComponent):
+                item.accumulated_cost = 0.0
+                item.previous_cost = 0.0
+                # Reset maintenance state
+                item.is_in_maintenance = False
+                item.maintenance_time_remaining = 0
+                item.cooldown_time_remaining = 0
+                item.total_operating_hours = 0
+                item.update()  # Refresh the visual display
+            # Reset all batteries to 100% charge
+            elif isinstance(item, BatteryComponent):
+                item.current_charge = item.energy_capacity  # Set to 100% charge
+                item.arbitrage_schedule = None  # Replanned from the new charge on the first step
+                item.update()  # Refresh the visual display
+        
+    def seed_random_state(self):
+        """Seed the simulation random source (load profiles, generator outages) with random_seed"""
+        seed_simulation_random(self.random_seed)
+    
+    def capture_run_state(self, components):
+        """
+        Snapshot everything a run has produced so far, for the result cache.
+        Per-component historian series are keyed by the component's position in
+        components instead of its object id, so they can be restored onto the
+        components of a freshly loaded copy of the scenario.
+        
+        Args:
+            components: The scenario's simulated components in canonical order
+        
+        Returns:
+            Dictionary of NumPy arrays, plain lists and numbers (picklable)
+        """
+        positions = {str(id(component))[-6:]: index for index, component in enumerate(components)}
+        historian = {}
+        component_historian = []
+        for key, values in self.historian.items():
+            prefix, _, component_id = key.rpartition('_')
+            if prefix and component_id in positions:
+                component_historian.append((prefix, positions[component_id], np.array(values, dtype=float)))
+            else:
+                historian[key] = np.array(values, dtype=float)
+        
+        return {
+            'historian': historian,
+            'component_historian': component_historian,
+            'gross_revenue_data': list(self.gross_revenue_data),
+            'gross_cost_data': list(self.gross_cost_data),
+            'total_energy_imported': self.total_energy_imported,
+            'total_energy_exported': self.total_energy_exported,
+            'current_time_step': self.current_time_step,
+            'last_time_step': self.last_time_step,
+            'component_state': [
+                {name: getattr(component, name) for name in RUN_STATE_ATTRIBUTES if hasattr(component, name)}
+                for component in components
+            ],
+            'random_state': simulation_random.getstate()
+        }
+    
+    def restore_run_state(self, state, components):
+        """
+        Put the engine and components back into a state saved by capture_run_state
+        
+        Args:
+            state: Dictionary returned by capture_run_state
+            components: The scenario's simulated components in the same canonical order
+        """
+        self.historian.clear()
+        for key, values in state['historian'].items():
+            self.historian[key] = np.array(values, dtype=float)
+        for prefix, index, values in state['component_historian']:
+            self.historian[f"{prefix}_{str(id(components[index]))[-6:]}"] = np.array(values, dtype=float)
+        
+        self.gross_revenue_data = list(state['gross_revenue_data'])
+        self.gross_cost_data = list(state['gross_cost_data'])
+        self.total_energy_imported = state['total_energy_imported']
+        self.total_energy_exported = state['total_energy_exported']
+        self.current_time_step = state['current_time_step']
+        self.last_time_step = state['last_time_step']
+        
+        for component, attributes in zip(components, state['component_state']):
+            for name, value in attributes.items():
+                setattr(component, name, value)
+        simulation_random.setstate(state['random_state'])
+        
     def remove_component_historian_keys(self, component):
         """
         Remove historian keys associated with a deleted component.
@@ -144,359 +279,610 @@ class SimulationEngine(QObject):
         
         return True
         
-    def update_simulation(self, skip_ui_updates=False):
-        # Guard against recursive calls
-        if self.updating_simulation:
-            return
-            
-        self.updating_simulation = True
+    def island_items(self, items):
+        """
+        Split the simulated components into electrically separate islands
         
-        try:
-            current_time = self.current_time_step
-            
-            # Skip updates during scrubbing
-            if self.is_scrubbing:
-                return
-            
-            # Validate bus states before simulation
-            self.main_window.validate_bus_states()
-            
-            # Reset stability flag for this update
-            self.system_stable = True
-            
-            # Initialize load_satisfaction_ratio with default value
-            load_satisfaction_ratio = 1.0
-            
-            # Reset all grid component indicators to zero at the beginning of each step
-            for item in self.main_window.scene.items():
-                if isinstance(item, GridImportComponent):
-                    item.last_import = 0
-                elif isinstance(item, GridExportComponent):
-                    item.last_export = 0
+        Args:
+            items: Simulated components in scene order
             
-            # Initialize calculation variables exactly as before
-            total_load = 0
-            local_generation = 0
-            battery_power = 0
-            grid_import = 0
-            grid_export = 0
-            total_capacity = 0
-            active_batteries = []
-            total_battery_charge = 0
-            
-            # First pass: calculate total load, generator capacity, and find batteries
-            for item in self.main_window.scene.items():
-                if isinstance(item, LoadComponent):
-                    total_load += item.calculate_demand(current_time)
-                elif isinstance(item, GeneratorComponent):
-                    total_capacity += item.capacity
-                elif isinstance(item, SolarPanelComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
-                    total_capacity += item.capacity
-                elif isinstance(item, WindTurbineComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
-                    total_capacity += item.capacity
-                elif isinstance(item, BatteryComponent):
-                    total_battery_charge += item.current_charge / 1000.0
-                    if item.operating_mode == "BTF ± Unit (Auto)":
-                        active_batteries.append(item)
-            
-            # Second pass: calculate local generation first (priority)
-            remaining_load = total_load
-            
-            # Track individual component outputs in this time step
-            component_outputs = {}
+        Returns:
+            List of component lists (largest island first), each keeping the scene order
+        """
+        topology = getattr(self.main_window, 'network_topology', None)
+        if topology is None:
+            return [items]
+        
+        # The island lists only change when the topology is rebuilt or updated
+        islands = topology.islands()
+        if islands is not self._islands_source:
+            self._islands_source = islands
+            self._island_index = {component: index for index, island in enumerate(islands) for component in island}
+        
+        grouped = [[] for _ in range(max(1, len(islands)))]
+        for item in items:
+            # Anything the topology doesn't track joins the main island
+            grouped[self._island_index.get(item, 0)].append(item)
+        return [island for island in grouped if island]
+    
+    def dispatch_island(self, items, current_time):
+        """
+        Dispatch generation, batteries and grid connections against the load of one island
+        
+        Args:
+            items: Simulated components of the island, in scene order
+            current_time: Time step being simulated
             
-            # Start with Solar Panel and Wind Turbine generation - highest priority
-            for item in self.main_window.scene.items():
-                if isinstance(item, SolarPanelComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
-                    output = item.calculate_output(remaining_load)
-                    local_generation += output
-                    remaining_load = max(0, remaining_load - output)
-                    
-                    # Track individual component output
-                    component_outputs[item] = output
-                    
-                elif isinstance(item, WindTurbineComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
-                    output = item.calculate_output(remaining_load)
-                    local_generation += output
-                    remaining_load = max(0, remaining_load - output)
-                    
-                    # Track individual component output
-                    component_outputs[item] = output
-            
-            # Then get generation from all Static (Auto) generators
-            for item in self.main_window.scene.items():
-                if isinstance(item, GeneratorComponent) and item.operating_mode == "Static (Auto)":
-                    output = item.calculate_output(remaining_load)
-                    local_generation += output
-                    remaining_load = max(0, remaining_load - output)
-                    
-                    # Track individual component output
-                    component_outputs[item] = output
-            
-            # Next get generation from BTF Unit Commit (Auto) generators
-            # Get all BTF Unit Commitment generators and sort by cost_per_gj in ascending order (lowest cost first)
-            unit_commitment_generators = [item for item in self.main_window.scene.items() 
-                                         if isinstance(item, GeneratorComponent) and 
-                                         item.operating_mode == "BTF Unit Commit (Auto)"]
-            
-            # Sort generators by cost_per_gj (lowest cost first)
-            unit_commitment_generators.sort(key=lambda x: x.cost_per_gj)
-            
-            # Process generators in order of increasing cost
-            for item in unit_commitment_generators:
-                # Only pass the remaining load to each generator
-                # This ensures generators don't all try to satisfy the full load
+        Returns:
+            Dictionary with the island's power flows, per-component outputs and stability
+        """
+        stable = True
+        
+        # Initialize calculation variables exactly as before
+        total_load = 0
+        local_generation = 0
+        battery_power = 0
+        grid_import = 0
+        grid_export = 0
+        total_capacity = 0
+        active_batteries = []
+        scheduled_batteries = []
+        total_battery_charge = 0
+        
+        # First pass: calculate total load, generator capacity, and find batteries
+        for item in items:
+            if isinstance(item, LoadComponent):
+                total_load += item.calculate_demand(current_time)
+            elif isinstance(item, GeneratorComponent):
+                total_capacity += item.capacity
+            elif isinstance(item, SolarPanelComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
+                total_capacity += item.capacity
+            elif isinstance(item, WindTurbineComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
+                total_capacity += item.capacity
+            elif isinstance(item, BatteryComponent):
+                total_battery_charge += item.current_charge / 1000.0
+                if item.operating_mode == "BTF ± Unit (Auto)":
+                    active_batteries.append(item)
+                elif item.operating_mode == "Arbitrage (Optimized)":
+                    scheduled_batteries.append(item)
+        
+        # Second pass: calculate local generation first (priority)
+        remaining_load = total_load
+        
+        # Track individual component outputs in this time step
+        component_outputs = {}
+        
+        # Start with Solar Panel and Wind Turbine generation - highest priority
+        for item in items:
+            if isinstance(item, SolarPanelComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
                 output = item.calculate_output(remaining_load)
                 local_generation += output
                 remaining_load = max(0, remaining_load - output)
                 
                 # Track individual component output
                 component_outputs[item] = output
-            
-            # Last, get generation from BTF Droop (Auto) generators, sharing load equally
-            droop_generators = [item for item in self.main_window.scene.items() 
-                              if isinstance(item, GeneratorComponent) and 
-                              item.operating_mode == "BTF Droop (Auto)"]
-            
-            if droop_generators:
-                # First, update the maintenance status for all droop generators
-                for gen in droop_generators:
-                    if hasattr(gen, '_update_maintenance_status'):
-                        gen._update_maintenance_status()
                 
-                # Filter out generators that are in maintenance
-                available_droop_generators = [gen for gen in droop_generators 
-                                            if not (hasattr(gen, 'is_in_maintenance') and gen.is_in_maintenance)]
+            elif isinstance(item, WindTurbineComponent) and (item.operating_mode == "Powerlandia 8760-1" or item.operating_mode == "Custom"):
+                output = item.calculate_output(remaining_load)
+                local_generation += output
+                remaining_load = max(0, remaining_load - output)
                 
-                # Process generators in maintenance to set outputs to 0
-                for gen in droop_generators:
-                    if hasattr(gen, 'is_in_maintenance') and gen.is_in_maintenance:
-                        gen.last_output = 0
-                        component_outputs[gen] = 0
+                # Track individual component output
+                component_outputs[item] = output
+        
+        # Arbitrage batteries discharge in the hours their schedule says to, ahead of the generators and
+        # grid imports they displace. Discharge beyond the load is exported, up to the free export capacity.
+        scheduled_discharge = 0
+        if scheduled_batteries:
+            export_capacity = sum(item.capacity for item in items if isinstance(item, GridExportComponent))
+            for battery in scheduled_batteries:
+                planned_power = self.scheduled_battery_power(battery, items, current_time)
+                if planned_power <= 0:
+                    continue
+                
+                # Export capacity not already taken by surplus generation or other batteries
+                surplus = (local_generation + scheduled_discharge) - total_load
+                discharge_room = remaining_load + max(0, export_capacity - max(0, surplus))
+                discharged = battery.discharge(min(planned_power, discharge_room), 1.0)
+                
+                battery_power += discharged
+                scheduled_discharge += discharged
+                remaining_load = max(0, remaining_load - discharged)
+        
+        # Then get generation from all Static (Auto) generators
+        for item in items:
+            if isinstance(item, GeneratorComponent) and item.operating_mode == "Static (Auto)":
+                output = item.calculate_output(remaining_load)
+                local_generation += output
+                remaining_load = max(0, remaining_load - output)
+                
+                # Track individual component output
+                component_outputs[item] = output
+        
+        # Next get generation from BTF Unit Commit (Auto) generators
+        # Get all BTF Unit Commitment generators and sort by cost_per_gj in ascending order (lowest cost first)
+        unit_commitment_generators = [item for item in items 
+                                     if isinstance(item, GeneratorComponent) and 
+                                     item.operating_mode == "BTF Unit Commit (Auto)"]
+        
+        # Sort generators by cost_per_gj (lowest cost first)
+        unit_commitment_generators.sort(key=lambda x: x.cost_per_gj)
+        
+        # Process generators in order of increasing cost
+        for item in unit_commitment_generators:
+            # Only pass the remaining load to each generator
+            # This ensures generators don't all try to satisfy the full load
+            output = item.calculate_output(remaining_load)
+            local_generation += output
+            remaining_load = max(0, remaining_load - output)
+            
+            # Track individual component output
+            component_outputs[item] = output
+        
+        # Last, get generation from BTF Droop (Auto) generators, sharing load equally
+        droop_generators = [item for item in items 
+                          if isinstance(item, GeneratorComponent) and 
+                          item.operating_mode == "BTF Droop (Auto)"]
+        
+        if droop_generators:
+            # First, update the maintenance status for all droop generators
+            for gen in droop_generators:
+                if hasattr(gen, '_update_maintenance_status'):
+                    gen._update_maintenance_status()
+            
+            # Filter out generators that are in maintenance
+            available_droop_generators = [gen for gen in droop_generators 
+                                        if not (hasattr(gen, 'is_in_maintenance') and gen.is_in_maintenance)]
+            
+            # Process generators in maintenance to set outputs to 0
+            for gen in droop_generators:
+                if hasattr(gen, 'is_in_maintenance') and gen.is_in_maintenance:
+                    gen.last_output = 0
+                    component_outputs[gen] = 0
+            
+            if remaining_load > 0 and available_droop_generators:
+                # Calculate total capacity of available droop generators (excluding those in maintenance)
+                total_droop_capacity = sum(gen.capacity for gen in available_droop_generators)
                 
-                if remaining_load > 0 and available_droop_generators:
-                    # Calculate total capacity of available droop generators (excluding those in maintenance)
-                    total_droop_capacity = sum(gen.capacity for gen in available_droop_generators)
+                if total_droop_capacity > 0:
+                    # Determine equal percentage for all available droop generators
+                    # Cap at 100% - we don't want to exceed their capacity
+                    droop_percentage = min(1.0, remaining_load / total_droop_capacity)
                     
-                    if total_droop_capacity > 0:
-                        # Determine equal percentage for all available droop generators
-                        # Cap at 100% - we don't want to exceed their capacity
-                        droop_percentage = min(1.0, remaining_load / total_droop_capacity)
-                        
-                        # Apply the same percentage to all available droop generators
-                        for gen in available_droop_generators:
-                            # Calculate target output based on equal percentage
-                            target_output = gen.capacity * droop_percentage
-                            
-                            # Apply ramp rate limiting if needed
-                            if gen.ramp_rate_enabled and gen.last_output > 0:
-                                max_change = gen.capacity * gen.ramp_rate_limit
-                                if target_output > gen.last_output:
-                                    # Ramping up
-                                    actual_output = min(target_output, gen.last_output + max_change)
-                                else:
-                                    # Ramping down
-                                    actual_output = max(target_output, gen.last_output - max_change)
-                            else:
-                                actual_output = target_output
-                            
-                            # Update last_output for the generator
-                            gen.last_output = actual_output
-                            
-                            # Add to local generation and reduce remaining load
-                            local_generation += actual_output
-                            remaining_load = max(0, remaining_load - actual_output)
-                            
-                            # Track individual component output
-                            component_outputs[gen] = actual_output
-                            
-                            # Update operating hours for this droop generator if it's producing power
-                            if actual_output > 0:
-                                gen.total_operating_hours += 1
-                else:
-                    # No remaining load or no available generators, set all droop generators to 0 output
+                    # Apply the same percentage to all available droop generators
                     for gen in available_droop_generators:
-                        # If ramp rate limiting is enabled, respect it when ramping down
+                        # Calculate target output based on equal percentage
+                        target_output = gen.capacity * droop_percentage
+                        
+                        # Apply ramp rate limiting if needed
                         if gen.ramp_rate_enabled and gen.last_output > 0:
                             max_change = gen.capacity * gen.ramp_rate_limit
-                            gen.last_output = max(0, gen.last_output - max_change)
+                            if target_output > gen.last_output:
+                                # Ramping up
+                                actual_output = min(target_output, gen.last_output + max_change)
+                            else:
+                                # Ramping down
+                                actual_output = max(target_output, gen.last_output - max_change)
                         else:
-                            gen.last_output = 0
+                            actual_output = target_output
                         
-                        # Track individual component output (even if zero)
-                        component_outputs[gen] = gen.last_output
-            
-            # Track individual load component demands
-            component_demands = {}
-            
-            # Calculate demand for each load component
-            for item in self.main_window.scene.items():
-                if isinstance(item, LoadComponent):
-                    demand = item.calculate_demand(current_time)
-                    component_demands[item] = demand
-            
-            # Third pass: if there's still remaining load, use battery discharge (second priority)
-            if remaining_load > 0 and active_batteries:
-                time_step = 1.0  # Calculate time step in hours (assume 1 hour per time step)
-                
-                for battery in active_batteries:
-                    if not battery.has_energy():
-                        continue
+                        # Update last_output for the generator
+                        gen.last_output = actual_output
                         
-                    energy_needed = remaining_load * time_step
-                    discharged = battery.discharge(energy_needed, time_step)
-                    power_discharged = discharged / time_step
+                        # Add to local generation and reduce remaining load
+                        local_generation += actual_output
+                        remaining_load = max(0, remaining_load - actual_output)
+                        
+                        # Track individual component output
+                        component_outputs[gen] = actual_output
+                        
+                        # Update operating hours for this droop generator if it's producing power
+                        if actual_output > 0:
+                            gen.total_operating_hours += 1
+            else:
+                # No remaining load or no available generators, set all droop generators to 0 output
+                for gen in available_droop_generators:
+                    # If ramp rate limiting is enabled, respect it when ramping down
+                    if gen.ramp_rate_enabled and gen.last_output > 0:
+                        max_change = gen.capacity * gen.ramp_rate_limit
+                        gen.last_output = max(0, gen.last_output - max_change)
+                    else:
+                        gen.last_output = 0
                     
-                    battery_power += power_discharged
-                    remaining_load = max(0, remaining_load - power_discharged)
-                    battery.update()
+                    # Track individual component output (even if zero)
+                    component_outputs[gen] = gen.last_output
+        
+        # Track individual load component demands
+        component_demands = {}
+        
+        # Calculate demand for each load component
+        for item in items:
+            if isinstance(item, LoadComponent):
+                demand = item.calculate_demand(current_time)
+                component_demands[item] = demand
+        
+        # Third pass: if there's still remaining load, use battery discharge (second priority)
+        if remaining_load > 0 and active_batteries:
+            time_step = 1.0  # Calculate time step in hours (assume 1 hour per time step)
+            
+            for battery in active_batteries:
+                if not battery.has_energy():
+                    continue
                     
-                    if remaining_load <= 0:
-                        break
+                energy_needed = remaining_load * time_step
+                discharged = battery.discharge(energy_needed, time_step)
+                power_discharged = discharged / time_step
+                
+                battery_power += power_discharged
+                remaining_load = max(0, remaining_load - power_discharged)
+                
+                if remaining_load <= 0:
+                    break
+        
+        # Fourth pass: if there's still remaining load, use grid import (third priority)
+        # Initialize component_imports dictionary
+        component_imports = {}
+        
+        if remaining_load > 0:
+            # Get all GridImportComponent instances and sort by cost_per_kwh in ascending order
+            grid_import_components = [item for item in items 
+                                      if isinstance(item, GridImportComponent)]
             
-            # Fourth pass: if there's still remaining load, use grid import (third priority)
-            # Initialize component_imports dictionary
-            component_imports = {}
+            # Sort by cost_per_kwh in ascending order (lowest cost first)
+            grid_import_components.sort(key=lambda x: x.cost_per_kwh)
             
-            if remaining_load > 0:
-                # Get all GridImportComponent instances and sort by cost_per_kwh in ascending order
-                grid_import_components = [item for item in self.main_window.scene.items() 
-                                          if isinstance(item, GridImportComponent)]
+            for item in grid_import_components:
+                import_amount = item.calculate_output(remaining_load)
+                grid_import += import_amount
+                remaining_load = max(0, remaining_load - import_amount)
                 
-                # Sort by cost_per_kwh in ascending order (lowest cost first)
-                grid_import_components.sort(key=lambda x: x.cost_per_kwh)
+                # Store this component's import amount
+                component_imports[item] = import_amount
+            
+            # Only mark as unstable if remaining load exceeds the tolerance
+            if remaining_load > self.stability_tolerance:
+                stable = False
+        
+        # Calculate load satisfaction ratio based on actual remaining load,
+        # regardless of system stability status
+        if remaining_load > self.stability_tolerance and total_load > 0:
+            # Calculate what percentage of the total load was actually met
+            met_load = total_load - remaining_load
+            load_satisfaction_ratio = met_load / total_load
+        else:
+            # If remaining load is within tolerance or total_load is zero, all load is satisfied
+            load_satisfaction_ratio = 1.0
+        
+        # Arbitrage batteries charge in the hours their schedule says to - from surplus first, then from
+        # generators with auto-charging enabled, then from grid imports that allow battery charging
+        scheduled_charge = 0
+        if scheduled_batteries:
+            used_generator_capacity = 0
+            for battery in scheduled_batteries:
+                planned_charge = -self.scheduled_battery_power(battery, items, current_time)
+                if planned_charge <= 0:
+                    continue
                 
-                for item in grid_import_components:
-                    import_amount = item.calculate_output(remaining_load)
-                    grid_import += import_amount
-                    remaining_load = max(0, remaining_load - import_amount)
-                    
-                    # Store this component's import amount
-                    component_imports[item] = import_amount
+                # Surplus left after the load and the batteries charged before this one
+                available_surplus = (local_generation + grid_import + scheduled_discharge) - total_load - scheduled_charge
+                charged = battery.charge(min(planned_charge, max(0, available_surplus)), 1.0)
+                planned_charge -= charged
+                scheduled_charge += charged
+                battery_power -= charged
                 
-                # Only mark as unstable if remaining load exceeds the tolerance
-                if remaining_load > self.stability_tolerance:
-                    self.system_stable = False
-            
-            # Calculate load satisfaction ratio based on actual remaining load,
-            # regardless of system stability status
-            if remaining_load > self.stability_tolerance and total_load > 0:
-                # Calculate what percentage of the total load was actually met
-                met_load = total_load - remaining_load
-                load_satisfaction_ratio = met_load / total_load
-            else:
-                # If remaining load is within tolerance or total_load is zero, all load is satisfied
-                load_satisfaction_ratio = 1.0
+                # Spin up generators with auto-charging enabled
+                if planned_charge > 0:
+                    unused_gen_capacity = sum(item.capacity - item.last_output for item in items
+                                              if isinstance(item, GeneratorComponent) and item.auto_charging and not item.is_in_maintenance)
+                    charged = battery.charge(min(planned_charge, max(0, unused_gen_capacity - used_generator_capacity)), 1.0)
+                    used_generator_capacity += charged
+                    local_generation += charged
+                    planned_charge -= charged
+                    scheduled_charge += charged
+                    battery_power -= charged
+                
+                # Import the rest, shared between the import components by capacity like the seventh pass
+                if planned_charge > 0:
+                    grid_import_components = [item for item in items 
+                                             if isinstance(item, GridImportComponent) and item.auto_charge_batteries]
+                    max_import_capacity = sum(item.capacity for item in grid_import_components)
+                    if max_import_capacity > 0:
+                        charged = battery.charge(min(planned_charge, max(0, max_import_capacity - grid_import)), 1.0)
+                        grid_import += charged
+                        scheduled_charge += charged
+                        battery_power -= charged
+                        
+                        # Update component imports for cost calculation
+                        for item in grid_import_components:
+                            component_share = item.capacity / max_import_capacity
+                            component_imports[item] = component_imports.get(item, 0) + (charged * component_share)
+        
+        # Fifth pass: check for surplus power to charge batteries -- this should include solar and renewables as they are added too
+        surplus_power = (local_generation + grid_import + scheduled_discharge - scheduled_charge) - total_load
+        
+        if surplus_power > 0 and active_batteries:
+            time_step = 1.0
+            remaining_surplus = surplus_power
             
-            # Fifth pass: check for surplus power to charge batteries -- this should include solar and renewables as they are added too
-            surplus_power = (local_generation + grid_import) - total_load
+            for battery in active_batteries:
+                if not battery.has_capacity():
+                    continue
+                    
+                energy_available = remaining_surplus * time_step
+                charged = battery.charge(energy_available, time_step)
+                power_charged = charged / time_step
+                
+                battery_power -= power_charged
+                remaining_surplus = max(0, remaining_surplus - power_charged)
+                
+                if remaining_surplus <= 0:
+                    break
+                
+            surplus_power = remaining_surplus
+        
+        # Sixth Pass: If batteries still have capacity, try to use local generation to charge them -- the batteries WILL spin up generators with auto-charging enabled to get power
+        if active_batteries and any(battery.has_capacity() for battery in active_batteries):
+            unused_gen_capacity = 0
+            for item in items:
+                if isinstance(item, GeneratorComponent) and item.auto_charging and not item.is_in_maintenance:
+                    unused_gen_capacity += (item.capacity - item.last_output)
             
-            if surplus_power > 0 and active_batteries:
+            if unused_gen_capacity > 0:
                 time_step = 1.0
-                remaining_surplus = surplus_power
+                remaining_capacity = unused_gen_capacity
                 
                 for battery in active_batteries:
                     if not battery.has_capacity():
                         continue
                         
-                    energy_available = remaining_surplus * time_step
+                    energy_available = remaining_capacity * time_step
                     charged = battery.charge(energy_available, time_step)
                     power_charged = charged / time_step
                     
+                    local_generation += power_charged
                     battery_power -= power_charged
-                    remaining_surplus = max(0, remaining_surplus - power_charged)
-                    battery.update()
-                    
-                    if remaining_surplus <= 0:
-                        break
+                    remaining_capacity = max(0, remaining_capacity - power_charged)
                     
-                surplus_power = remaining_surplus
+        
+        # Seventh Pass: If batteries still have capacity and we have grid import, use it to charge batteries
+        if active_batteries and any(battery.has_capacity() for battery in active_batteries):
+            # Get grid import components that allow battery charging
+            grid_import_components = [item for item in items 
+                                     if isinstance(item, GridImportComponent) and item.auto_charge_batteries]
+            
+            have_grid_import = len(grid_import_components) > 0
             
-            # Sixth Pass: If batteries still have capacity, try to use local generation to charge them -- the batteries WILL spin up generators with auto-charging enabled to get power
-            if active_batteries and any(battery.has_capacity() for battery in active_batteries):
-                unused_gen_capacity = 0
-                for item in self.main_window.scene.items():
-                    if isinstance(item, GeneratorComponent) and item.auto_charging and not item.is_in_maintenance:
-                        unused_gen_capacity += (item.capacity - item.last_output)
+            if have_grid_import:
+                max_import_capacity = 0
+                for item in grid_import_components:
+                    max_import_capacity += item.capacity
+                
+                remaining_import_capacity = max(0, max_import_capacity - grid_import)
                 
-                if unused_gen_capacity > 0:
+                if remaining_import_capacity > 0:
                     time_step = 1.0
-                    remaining_capacity = unused_gen_capacity
                     
                     for battery in active_batteries:
                         if not battery.has_capacity():
                             continue
                             
-                        energy_available = remaining_capacity * time_step
+                        energy_available = remaining_import_capacity * time_step
                         charged = battery.charge(energy_available, time_step)
                         power_charged = charged / time_step
                         
-                        local_generation += power_charged
+                        additional_grid_import = power_charged
+                        grid_import += additional_grid_import
                         battery_power -= power_charged
-                        remaining_capacity = max(0, remaining_capacity - power_charged)
+                        remaining_import_capacity = max(0, remaining_import_capacity - power_charged)
                         
-                        battery.update()
-            
-            # Seventh Pass: If batteries still have capacity and we have grid import, use it to charge batteries
-            if active_batteries and any(battery.has_capacity() for battery in active_batteries):
-                # Get grid import components that allow battery charging
-                grid_import_components = [item for item in self.main_window.scene.items() 
-                                         if isinstance(item, GridImportComponent) and item.auto_charge_batteries]
-                
-                have_grid_import = len(grid_import_components) > 0
-                
-                if have_grid_import:
-                    max_import_capacity = 0
-                    for item in grid_import_components:
-                        max_import_capacity += item.capacity
-                    
-                    remaining_import_capacity = max(0, max_import_capacity - grid_import)
-                    
-                    if remaining_import_capacity > 0:
-                        time_step = 1.0
+                        # Update component imports for cost calculation
+                        for item in grid_import_components:
+                            component_share = item.capacity / max_import_capacity
+                            component_imports[item] = component_imports.get(item, 0) + (additional_grid_import * component_share)
                         
-                        for battery in active_batteries:
-                            if not battery.has_capacity():
-                                continue
-                                
-                            energy_available = remaining_import_capacity * time_step
-                            charged = battery.charge(energy_available, time_step)
-                            power_charged = charged / time_step
-                            
-                            additional_grid_import = power_charged
-                            grid_import += additional_grid_import
-                            battery_power -= power_charged
-                            remaining_import_capacity = max(0, remaining_import_capacity - power_charged)
-                            
-                            # Update component imports for cost calculation
-                            for item in grid_import_components:
-                                component_share = item.capacity / max_import_capacity
-                                component_imports[item] = component_imports.get(item, 0) + (additional_grid_import * component_share)
-                            
-                            battery.update()
+        
+        # Eighth Pass: if there's still surplus power, use grid export
+        # Initialize component_exports dictionary regardless of surplus power
+        component_exports = {}
+        
+        if surplus_power > 0:
+            # Get all GridExportComponent instances and sort by bulk_ppa_price in descending order
+            grid_export_components = [item for item in items 
+                                      if isinstance(item, GridExportComponent)]
             
-            # Eighth Pass: if there's still surplus power, use grid export
-            # Initialize component_exports dictionary regardless of surplus power
-            component_exports = {}
+            # Sort by bulk_ppa_price in descending order (highest price first)
+            grid_export_components.sort(key=lambda x: x.bulk_ppa_price, reverse=True)
             
-            if surplus_power > 0:
-                # Get all GridExportComponent instances and sort by bulk_ppa_price in descending order
-                grid_export_components = [item for item in self.main_window.scene.items() 
-                                          if isinstance(item, GridExportComponent)]
+            for item in grid_export_components:
+                export_amount = item.calculate_export(surplus_power)
+                grid_export += export_amount
+                surplus_power = max(0, surplus_power - export_amount)
                 
-                # Sort by bulk_ppa_price in descending order (highest price first)
-                grid_export_components.sort(key=lambda x: x.bulk_ppa_price, reverse=True)
+                # Store this component's export amount
+                component_exports[item] = export_amount
+            
+            # Only mark as unstable if surplus power exceeds the tolerance
+            if surplus_power > self.stability_tolerance:
+                stable = False
+        
+        return {
+            'items': items,
+            'stable': stable,
+            'total_load': total_load,
+            'remaining_load': remaining_load,
+            'load_satisfaction_ratio': load_satisfaction_ratio,
+            'local_generation': local_generation,
+            'battery_power': battery_power,
+            'grid_import': grid_import,
+            'grid_export': grid_export,
+            'total_capacity': total_capacity,
+            'component_outputs': component_outputs,
+            'component_demands': component_demands,
+            'component_imports': component_imports,
+            'component_exports': component_exports
+        }
+    
+    def scheduled_battery_power(self, battery, items, current_time):
+        """
+        Planned power of an "Arbitrage (Optimized)" battery for one hour, planning its schedule first if needed
+        
+        Args:
+            battery: Battery in arbitrage mode
+            items: Simulated components of the battery's island
+            current_time: Time step being simulated
+            
+        Returns:
+            float: Planned battery power (kW, positive while discharging and negative while charging)
+        """
+        if getattr(battery, 'arbitrage_schedule', None) is None:
+            battery.arbitrage_schedule, battery.arbitrage_margin = self.plan_arbitrage_schedule(battery, items, current_time)
+        
+        if current_time >= len(battery.arbitrage_schedule):
+            return 0.0
+        return float(battery.arbitrage_schedule[current_time])
+    
+    def plan_arbitrage_schedule(self, battery, items, current_time):
+        """
+        Plan an arbitrage battery's schedule from the current hour to the end of the year
+        
+        The battery buys energy at the cheapest import price (if an import allows battery charging,
+        otherwise at the export price it gives up) and sells it at the best export price (or the import
+        price it avoids, without an export). Prices are read from the island's grid connections once,
+        so price edits take effect on the next reset.
+        
+        Args:
+            battery: Battery in arbitrage mode
+            items: Simulated components of the battery's island
+            current_time: First hour of the schedule
+            
+        Returns:
+            (schedule, margin): NumPy array with the planned power of every hour of the year (zero before
+            current_time), and the schedule's expected arbitrage margin in $ (None if the island has no grid
+            connection to trade with, so the battery stays idle)
+        """
+        hours = range(current_time, HOURS_PER_YEAR)
+        schedule = np.zeros(HOURS_PER_YEAR)
+        
+        imports = [item for item in items if isinstance(item, GridImportComponent)]
+        exports = [item for item in items if isinstance(item, GridExportComponent)]
+        if not imports and not exports:
+            return schedule, None
+        
+        # Hourly prices of every connection, cheapest import and best export per hour
+        import_prices = None
+        charging_import_prices = None
+        export_prices = None
+        if imports:
+            prices = np.array([[item.cost_per_kwh + item.get_current_market_price(hour) for hour in hours] for item in imports])
+            import_prices = prices.min(axis=0)
+            chargeable = np.array([item.auto_charge_batteries for item in imports])
+            if chargeable.any():
+                charging_import_prices = prices[chargeable].min(axis=0)
+        if exports:
+            export_prices = np.array([[item.bulk_ppa_price + item.get_current_market_price(hour) for hour in hours] for item in exports]).max(axis=0)
+        
+        discharge_prices = export_prices if export_prices is not None else import_prices
+        charge_prices = charging_import_prices if charging_import_prices is not None else discharge_prices
+        
+        schedule[current_time:] = plan_schedule(charge_prices, discharge_prices, battery.energy_capacity,
+                                                battery.power_capacity, battery.current_charge)
+        return schedule, plan_revenue(schedule[current_time:], charge_prices, discharge_prices)
+    
+    def island_anchor(self, items):
+        """
+        Component an island's historian series are named after: its first component in the
+        main window's list. The name stays the same while the island grows, shrinks or changes
+        its size rank, and only changes if that component is deleted or the island is split off.
+        
+        Args:
+            items: Simulated components of the island
+            
+        Returns:
+            The anchor component
+        """
+        if self._islands_source:
+            return self._islands_source[self._island_index.get(items[0], 0)][0]
+        return items[0]
+    
+    def record_island_history(self, island_results, current_time):
+        """
+        Record per-island series (Island_generation_<id>, ...) in the historian. Like
+        component series they end in the last 6 digits of a component id (the island's
+        anchor), so the result cache restores them onto a reloaded scenario.
+        
+        Args:
+            island_results: Results from dispatch_island
+            current_time: Time step being recorded
+        """
+        for result in island_results:
+            island_id = str(id(self.island_anchor(result['items'])))[-6:]
+            values = {
+                'generation': result['total_generation'],
+                'load': result['adjusted_total_load'],
+                'grid_import': result['grid_import'],
+                'grid_export': result['grid_export'],
+                'satisfied_load': result['satisfied_load'],
+                'instability': abs(result['power_surplus'])
+            }
+            for name, value in values.items():
+                historian_key = f"Island_{name}_{island_id}"
                 
-                for item in grid_export_components:
-                    export_amount = item.calculate_export(surplus_power)
-                    grid_export += export_amount
-                    surplus_power = max(0, surplus_power - export_amount)
-                    
-                    # Store this component's export amount
-                    component_exports[item] = export_amount
+                # Initialize this island's data array if it doesn't exist
+                if historian_key not in self.historian:
+                    self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                 
-                # Only mark as unstable if surplus power exceeds the tolerance
-                if surplus_power > self.stability_tolerance:
+                self.historian[historian_key][current_time] = value
+    
+    def update_simulation(self, skip_ui_updates=False):
+        # Guard against recursive calls
+        if self.updating_simulation:
+            return
+            
+        self.updating_simulation = True
+        
+        try:
+            current_time = self.current_time_step
+            
+            # Skip updates during scrubbing
+            if self.is_scrubbing:
+                return
+            
+            # Validate bus states before simulation
+            self.main_window.validate_bus_states()
+            
+            # Reset stability flag for this update
+            self.system_stable = True
+            
+            # Collect the simulated components once per step, in scene order
+            items = [item for item in self.main_window.scene.items() if isinstance(item, SIMULATED_TYPES)]
+            
+            # Reset all grid component indicators to zero at the beginning of each step
+            for item in items:
+                if isinstance(item, GridImportComponent):
+                    item.last_import = 0
+                elif isinstance(item, GridExportComponent):
+                    item.last_export = 0
+            
+            # Dispatch each electrically separate island on its own - generation,
+            # batteries and grid connections only serve loads they're connected to
+            islands = self.island_items(items)
+            island_results = [self.dispatch_island(island, current_time) for island in islands]
+            
+            # Combine the islands into the system-wide values
+            battery_power = sum(result['battery_power'] for result in island_results)
+            grid_import = sum(result['grid_import'] for result in island_results)
+            grid_export = sum(result['grid_export'] for result in island_results)
+            total_capacity = sum(result['total_capacity'] for result in island_results)
+            component_outputs = {}
+            component_demands = {}
+            component_imports = {}
+            component_exports = {}
+            for result in island_results:
+                component_outputs.update(result['component_outputs'])
+                component_demands.update(result['component_demands'])
+                component_imports.update(result['component_imports'])
+                component_exports.update(result['component_exports'])
+                if not result['stable']:
                     self.system_stable = False
             
             # Update energy accounting if not in scrub mode 
@@ -510,56 +896,55 @@ class SimulationEngine(QObject):
                     current_hourly_revenue = 0.0
                     current_hourly_cost = 0.0
                     
-                    # Calculate the actual percentage of load satisfied
-                    # If there's remaining_load > tolerance, then some load wasn't satisfied
-                    if not self.system_stable and remaining_load > self.stability_tolerance:
-                        # Calculate what percentage of the total load was actually met
-                        met_load = total_load - remaining_load
-                        load_satisfaction_ratio = met_load / total_load if total_load > 0 else 0.0
-                    
-                    # Calculate revenue from loads
-                    load_components = []
-                    for item in self.main_window.scene.items():
-                        if isinstance(item, LoadComponent):
-                            # Get energy consumption in kWh for this time step
-                            energy_demanded = item.calculate_demand(current_time) * steps_moved
+                    # Loads and cloud workloads earn per island, since each island
+                    # satisfies its own share of load
+                    for island, result in zip(islands, island_results):
+                        # The actual percentage of this island's load that was satisfied
+                        load_satisfaction_ratio = result['load_satisfaction_ratio']
+                        
+                        # Calculate revenue from loads
+                        load_components = []
+                        for item in island:
+                            if isinstance(item, LoadComponent):
+                                # Get energy consumption in kWh for this time step
+                                energy_demanded = item.calculate_demand(current_time) * steps_moved
+                                
+                                # Apply the load satisfaction ratio to determine actual energy consumed
+                                energy_consumed = energy_demanded * load_satisfaction_ratio
+                                
+                                # Calculate revenue based on price per kWh
+                                revenue = energy_consumed * item.price_per_kwh
+                                # Add to accumulated revenue
+                                item.accumulated_revenue += revenue
+                                # Add to current hour's gross revenue
+                                current_hourly_revenue += revenue
+                                
+                                # Store for cloud workload calculations
+                                if item.profile_type == "Data Center":
+                                    load_components.append((item, energy_consumed))
+                        
+                        # Calculate revenue from cloud workloads (only from data centers on the same island)
+                        cloud_workload_components = [item for item in island 
+                                                    if isinstance(item, CloudWorkloadComponent) and 
+                                                    (item.operating_mode == "Multi-Cloud Spot" or
+                                                     item.operating_mode == "Dedicated Capacity")]
+                        
+                        for cloud_workload in cloud_workload_components:
+                            cloud_revenue = 0.0
                             
-                            # Apply the load satisfaction ratio to determine actual energy consumed
-                            energy_consumed = energy_demanded * load_satisfaction_ratio
+                            # Calculate revenue for each relevant load
+                            for load_component, energy_consumed in load_components:
+                                # Calculate revenue based on load type and energy consumed
+                                load_revenue = cloud_workload.calculate_cloud_revenue(load_component, energy_consumed)
+                                cloud_revenue += load_revenue
                             
-                            # Calculate revenue based on price per kWh
-                            revenue = energy_consumed * item.price_per_kwh
-                            # Add to accumulated revenue
-                            item.accumulated_revenue += revenue
+                            # Add to accumulated revenue for this cloud workload
+                            cloud_workload.accumulated_revenue += cloud_revenue
                             # Add to current hour's gross revenue
-                            current_hourly_revenue += revenue
-                            
-                            # Store for cloud workload calculations
-                            if item.profile_type == "Data Center":
-                                load_components.append((item, energy_consumed))
-                    
-                    # Calculate revenue from cloud workloads
-                    cloud_workload_components = [item for item in self.main_window.scene.items() 
-                                                if isinstance(item, CloudWorkloadComponent) and 
-                                                (item.operating_mode == "Multi-Cloud Spot" or
-                                                 item.operating_mode == "Dedicated Capacity")]
-                    
-                    for cloud_workload in cloud_workload_components:
-                        cloud_revenue = 0.0
-                        
-                        # Calculate revenue for each relevant load
-                        for load_component, energy_consumed in load_components:
-                            # Calculate revenue based on load type and energy consumed
-                            load_revenue = cloud_workload.calculate_cloud_revenue(load_component, energy_consumed)
-                            cloud_revenue += load_revenue
-                        
-                        # Add to accumulated revenue for this cloud workload
-                        cloud_workload.accumulated_revenue += cloud_revenue
-                        # Add to current hour's gross revenue
-                        current_hourly_revenue += cloud_revenue
+                            current_hourly_revenue += cloud_revenue
                     
                     # Calculate revenue from exports
-                    for item in self.main_window.scene.items():
+                    for item in items:
                         if isinstance(item, GridExportComponent) and (item.bulk_ppa_price > 0 or item.market_prices_mode != "None"):
                             # Get this component's specific export amount rather than the total grid_export
                             component_export = component_exports.get(item, 0)
@@ -585,7 +970,7 @@ class SimulationEngine(QObject):
                             current_hourly_revenue += export_revenue
                     
                     # Calculate cost of gas for generators
-                    for item in self.main_window.scene.items():
+                    for item in items:
                         if isinstance(item, GeneratorComponent) and item.last_output > 0:
                             # Calculate energy generated in kWh
                             energy_generated = item.last_output * steps_moved
@@ -603,7 +988,7 @@ class SimulationEngine(QObject):
                             current_hourly_cost += gas_cost
                     
                     # Calculate cost from imports
-                    for item in self.main_window.scene.items():
+                    for item in items:
                         if isinstance(item, GridImportComponent) and (item.cost_per_kwh > 0 or item.market_prices_mode != "None"):
                             # Get this component's specific import amount
                             component_import = component_imports.get(item, 0)
@@ -648,24 +1033,31 @@ class SimulationEngine(QObject):
                 
                 self.last_time_step = current_time
             
-            # Calculate final values
-            unused_capacity = total_capacity - local_generation
-            
-            # Recalculate total battery charge
-            total_battery_charge = 0
-            for item in self.main_window.scene.items():
-                if isinstance(item, BatteryComponent):
-                    total_battery_charge += item.current_charge / 1000.0 # Convert to MWh
-            
-            # Calculate total generation including battery discharge
-            total_generation = local_generation + max(0, battery_power)
-            
-            # Include battery charging in total_load
-            battery_charging = min(0, battery_power)  # Will be negative or zero
-            adjusted_total_load = total_load - battery_charging  # Subtract negative value = add to consumption
+            # Calculate final values per island (batteries charge on one island while
+            # discharging on another, so the balance is only meaningful per island)
+            for result in island_results:
+                # Recalculate battery charge
+                result['total_battery_charge'] = sum(
+                    item.current_charge / 1000.0 for item in result['items'] if isinstance(item, BatteryComponent)
+                )  # Convert to MWh
+                
+                # Calculate generation including battery discharge
+                result['total_generation'] = result['local_generation'] + max(0, result['battery_power'])
+                
+                # Include battery charging in the load
+                battery_charging = min(0, result['battery_power'])  # Will be negative or zero
+                result['adjusted_total_load'] = result['total_load'] - battery_charging  # Subtract negative value = add to consumption
+                
+                # Calculate power surplus/deficit
+                result['power_surplus'] = (result['total_generation'] + result['grid_import'] - result['grid_export']) - result['adjusted_total_load']
+                
+                # Load actually served
+                result['satisfied_load'] = result['total_load'] * result['load_satisfaction_ratio']
             
-            # Calculate power surplus/deficit
-            power_surplus = (total_generation + grid_import - grid_export) - adjusted_total_load
+            total_battery_charge = sum(result['total_battery_charge'] for result in island_results)
+            total_generation = sum(result['total_generation'] for result in island_results)
+            adjusted_total_load = sum(result['adjusted_total_load'] for result in island_results)
+            power_surplus = sum(result['power_surplus'] for result in island_results)
             
             # Record total generation in Historian
             if 0 <= current_time < len(self.historian['total_generation']):
@@ -674,9 +1066,14 @@ class SimulationEngine(QObject):
                 self.historian['grid_import'][current_time] = grid_import  # Record grid import in historian
                 self.historian['grid_export'][current_time] = grid_export  # Record grid export in historian
                 self.historian['battery_charge'][current_time] = total_battery_charge * 1000  # Record total battery charge in kWh  
-                self.historian['system_instability'][current_time] = abs(power_surplus)  # Record absolute value of power surplus/deficit
-                # Record satisfied load based on calculated load_satisfaction_ratio
-                self.historian['satisfied_load'][current_time] = total_load * load_satisfaction_ratio  # Record satisfied load in historian
+                # Record absolute value of power surplus/deficit (a surplus on one island doesn't cover another's deficit)
+                self.historian['system_instability'][current_time] = sum(abs(result['power_surplus']) for result in island_results)
+                # Record satisfied load based on each island's load satisfaction ratio
+                self.historian['satisfied_load'][current_time] = sum(result['satisfied_load'] for result in island_results)
+                
+                # Separate islands also get their own series
+                if len(island_results) > 1:
+                    self.record_island_history(island_results, current_time)
                 
                 # Record individual component data in the historian
                 # For generation components
@@ -698,7 +1095,7 @@ class SimulationEngine(QObject):
                     
                     # Initialize this component's data array if it doesn't exist
                     if historian_key not in self.historian:
-                        self.historian[historian_key] = [0.0] * 8761
+                        self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                     
                     # Record this component's output for the current time
                     self.historian[historian_key][current_time] = output
@@ -711,14 +1108,14 @@ class SimulationEngine(QObject):
                     
                     # Initialize this component's data array if it doesn't exist
                     if historian_key not in self.historian:
-                        self.historian[historian_key] = [0.0] * 8761
+                        self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                     
                     # Record this component's demand for the current time
                     self.historian[historian_key][current_time] = demand
                 
                 # Record individual component revenue data in the historian
                 # For load components with revenue
-                for item in self.main_window.scene.items():
+                for item in items:
                     if isinstance(item, LoadComponent) and hasattr(item, 'accumulated_revenue'):
                         # Create a unique key for this load component's revenue
                         component_id = str(id(item))[-6:]  # Use last 6 digits of the ID
@@ -726,13 +1123,13 @@ class SimulationEngine(QObject):
                         
                         # Initialize this component's data array if it doesn't exist
                         if historian_key not in self.historian:
-                            self.historian[historian_key] = [0.0] * 8761
+                            self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                         
                         # Record this component's cumulative revenue for the current time
                         self.historian[historian_key][current_time] = item.accumulated_revenue
                 
                 # For grid export components with revenue
-                for item in self.main_window.scene.items():
+                for item in items:
                     if isinstance(item, GridExportComponent) and hasattr(item, 'accumulated_revenue'):
                         # Create a unique key for this export component's revenue
                         component_id = str(id(item))[-6:]  # Use last 6 digits of the ID
@@ -740,13 +1137,13 @@ class SimulationEngine(QObject):
                         
                         # Initialize this component's data array if it doesn't exist
                         if historian_key not in self.historian:
-                            self.historian[historian_key] = [0.0] * 8761
+                            self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                         
                         # Record this component's cumulative revenue for the current time
                         self.historian[historian_key][current_time] = item.accumulated_revenue
                 
                 # For cloud workload components with revenue
-                for item in self.main_window.scene.items():
+                for item in items:
                     if isinstance(item, CloudWorkloadComponent) and hasattr(item, 'accumulated_revenue'):
                         # Create a unique key for this cloud workload component's revenue
                         component_id = str(id(item))[-6:]  # Use last 6 digits of the ID
@@ -754,14 +1151,14 @@ class SimulationEngine(QObject):
                         
                         # Initialize this component's data array if it doesn't exist
                         if historian_key not in self.historian:
-                            self.historian[historian_key] = [0.0] * 8761
+                            self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                         
                         # Record this component's cumulative revenue for the current time
                         self.historian[historian_key][current_time] = item.accumulated_revenue
                 
                 # Record individual component cost data in the historian
                 # For generator components with cost
-                for item in self.main_window.scene.items():
+                for item in items:
                     if isinstance(item, GeneratorComponent) and hasattr(item, 'accumulated_cost'):
                         # Create a unique key for this generator component's cost
                         component_id = str(id(item))[-6:]  # Use last 6 digits of the ID
@@ -769,13 +1166,13 @@ class SimulationEngine(QObject):
                         
                         # Initialize this component's data array if it doesn't exist
                         if historian_key not in self.historian:
-                            self.historian[historian_key] = [0.0] * 8761
+                            self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                         
                         # Record this component's cumulative cost for the current time
                         self.historian[historian_key][current_time] = item.accumulated_cost
                 
                 # For grid import components with cost
-                for item in self.main_window.scene.items():
+                for item in items:
                     if isinstance(item, GridImportComponent) and hasattr(item, 'accumulated_cost'):
                         # Create a unique key for this import component's cost
                         component_id = str(id(item))[-6:]  # Use last 6 digits of the ID
@@ -783,7 +1180,7 @@ class SimulationEngine(QObject):
                         
                         # Initialize this component's data array if it doesn't exist
                         if historian_key not in self.historian:
-                            self.historian[historian_key] = [0.0] * 8761
+                            self.historian[historian_key] = np.zeros(HISTORIAN_SLOTS)
                         
                         # Record this component's cumulative cost for the current time
                         self.historian[historian_key][current_time] = item.accumulated_cost
@@ -808,22 +1205,28 @@ class SimulationEngine(QObject):
                     power_surplus=power_surplus  # Pass power surplus to analytics panel
                 )
             
-            # Update all load components to refresh their visual display with current demand percentage (conditionally)
+            # Push this step's display values to the components (conditionally). Each
+            # component repaints only if its quantized indicator level or text changed.
             if not skip_ui_updates:
-                for item in self.main_window.scene.items():
+                for item in items:
                     if isinstance(item, LoadComponent):
-                        item.update()
+                        demand = component_demands.get(item, 0)
+                        item.set_display_values(demand / item.demand if item.demand > 0 else 0)
+                        item.check_revenue_milestone()
                     elif isinstance(item, GeneratorComponent):
-                        item.update()
+                        item.set_display_values()
+                        item.check_cost_milestone()
                         # Trigger smoke emission from generators, but only when simulation is running
                         if self.simulation_running and hasattr(item, 'emit_smoke'):
                             item.emit_smoke()
-                    elif isinstance(item, CloudWorkloadComponent):
-                        item.update()
-                    elif isinstance(item, GridExportComponent):
-                        item.update()
+                    elif isinstance(item, (CloudWorkloadComponent, GridExportComponent)):
+                        item.set_display_values()
+                        item.check_revenue_milestone()
                     elif isinstance(item, GridImportComponent):
-                        item.update()
+                        item.set_display_values()
+                        item.check_cost_milestone()
+                    elif isinstance(item, (BatteryComponent, SolarPanelComponent, WindTurbineComponent, BusComponent)):
+                        item.set_display_values()
             
             # Update historian chart if in historian view (conditionally)
             if not skip_ui_updates and hasattr(self.main_window, 'is_model_view') and not self.main_window.is_model_view:
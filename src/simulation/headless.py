@@ -0,0 +1,389 @@
+"""
+Headless batch runner for OVERCLOCK
+
+Runs saved scenario files (as written by ModelManager.save_scenario) through the
+simulation engine for the full year without the title screens, main window or
+audio, and writes the historian series plus summary KPIs to an output directory.
+
+Usage:
+    python main.py --headless site_a.json site_b.json --output results --jobs 4
+    python -m src.simulation.headless site_a.json site_b.json --output results --jobs 4
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.simulation.engine import SimulationEngine, DEFAULT_RANDOM_SEED
+from src.simulation.network_topology import NetworkTopology
+from src.simulation.historian_rollups import HOURS_PER_YEAR  # Time steps 0-8760 are run, like autocomplete
+from src.components.bus import BusComponent
+from src.utils.irr_calculator import calculate_extended_irr
+
+# Keep a reference so the application outlives each run
+_application = None
+
+
+def _ensure_application():
+    """
+    Create the Qt application the components need (they are QGraphicsItems).
+    No window is ever shown, so the offscreen platform is used unless the
+    caller picked one.
+    """
+    global _application
+    from PyQt6.QtWidgets import QApplication
+    if QApplication.instance() is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _application = QApplication([sys.argv[0]])
+    return QApplication.instance()
+
+
+class _HeadlessTimeSlider:
+    """Stands in for the main window's time slider (the engine reads its range)"""
+
+    def __init__(self, maximum):
+        self._maximum = maximum
+        self._value = 0
+
+    def maximum(self):
+        return self._maximum
+
+    def value(self):
+        return self._value
+
+    def setValue(self, value):
+        self._value = value
+
+
+class HeadlessHost:
+    """
+    Minimal stand-in for PowerSystemSimulator: it holds the scene, the
+    component and connection lists, the network topology and the simulation
+    engine, which is everything the engine and the scenario loader use.
+    """
+
+    def __init__(self):
+        # Imported here so the module can be loaded without Qt widgets until a run starts
+        from src.ui.custom_scene import CustomScene
+
+        self.components = []
+        self.connections = []
+        self.network_topology = NetworkTopology(self)
+        self.scene = CustomScene()
+        # Components reach the engine (current time step) through the scene's parent
+        self.scene.parent = lambda: self
+        self.time_slider = _HeadlessTimeSlider(HOURS_PER_YEAR)
+        self.simulation_engine = SimulationEngine(self)
+        self.is_autocompleting = False
+        self.creating_connection = False
+        self.particle_system = None
+
+    def validate_bus_states(self):
+        """Ensure all bus components without load connections are set to ON"""
+        for component in self.components:
+            if isinstance(component, BusComponent):
+                if not component.has_load_connections() and not component.is_on:
+                    component.is_on = True
+
+    def check_network_connectivity(self):
+        """Same rule as the main window: every component must be connected to the network"""
+        return bool(self.components) and not self.network_topology.has_unconnected_components()
+
+    def calculate_total_capex(self):
+        """Calculate the total CAPEX of all components in the system"""
+        from src.ui.capex_manager import CapexManager
+        return CapexManager(self).calculate_total_capex()
+
+
+def run_scenario(data, seed=DEFAULT_RANDOM_SEED, configure=None):
+    """
+    Simulate a scenario for the full year
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        seed: Seed for random load profiles and generator outages (same default
+              as the interactive simulation; None for an unseeded run)
+        configure: Optional callable(host) applied once the scenario is built and
+                   before the run starts (e.g. to perturb component parameters)
+
+    Returns:
+        Dictionary with 'historian', 'gross_revenue', 'gross_cost' and 'kpis'
+
+    Raises:
+        ValueError: If the scenario has no components or unconnected components
+    """
+    from src.models.model_manager import ModelManager
+
+    _ensure_application()
+
+    host = HeadlessHost()
+    engine = host.simulation_engine
+    engine.random_seed = seed
+    engine.seed_random_state()
+    ModelManager(host).populate_scenario(data)
+    if not host.check_network_connectivity():
+        raise ValueError("All components must be connected to the network to run the simulation")
+    if configure is not None:
+        configure(host)
+
+    # Same starting conditions as the interactive reset before an autocomplete
+    host.validate_bus_states()
+    engine.reset_component_state()
+
+    # Same stepping as autocomplete: every hour, then one final update at the end time
+    for hour in range(HOURS_PER_YEAR):
+        engine.current_time_step = hour
+        engine.update_simulation(skip_ui_updates=True)
+    engine.current_time_step = HOURS_PER_YEAR
+    engine.update_simulation(skip_ui_updates=True)
+
+    return {
+        'historian': engine.historian,
+        'gross_revenue': engine.gross_revenue_data,
+        'gross_cost': engine.gross_cost_data,
+        'kpis': compute_kpis(host)
+    }
+
+
+def compute_kpis(host):
+    """
+    Summarize a finished run
+
+    Args:
+        host: HeadlessHost whose engine has simulated the full year
+
+    Returns:
+        Dictionary of KPI name -> value (IRRs as decimals, None if they can't be calculated)
+    """
+    engine = host.simulation_engine
+    historian = engine.historian
+    total_capex = host.calculate_total_capex()
+    irr = calculate_extended_irr(total_capex, engine.gross_revenue_data, engine.gross_cost_data, engine.current_time_step)
+
+    # Raw demand is the sum of the individual load series
+    load_keys = [key for key in historian if key.startswith('Load_')]
+    total_demand = float(sum(np.sum(historian[key]) for key in load_keys))
+    satisfied = float(np.sum(historian['satisfied_load']))
+    total_revenue = float(np.sum(engine.gross_revenue_data))
+    total_cost = float(np.sum(engine.gross_cost_data))
+
+    return {
+        'capex': total_capex,
+        'irr_12_month': irr[12],
+        'irr_18_month': irr[18],
+        'irr_36_month': irr[36],
+        'total_revenue': total_revenue,
+        'total_cost': total_cost,
+        'net_revenue': total_revenue - total_cost,
+        'energy_demand_kwh': total_demand,
+        'unserved_energy_kwh': max(0.0, total_demand - satisfied),
+        'grid_import_kwh': float(engine.total_energy_imported),
+        'grid_export_kwh': float(engine.total_energy_exported),
+        'unstable_hours': int(np.count_nonzero(np.asarray(historian['system_instability']) > engine.stability_tolerance)),
+        'islands': len(host.network_topology.islands())
+    }
+
+
+def write_results(result, output_dir):
+    """
+    Write one run's historian and KPIs
+
+    Args:
+        result: Dictionary returned by run_scenario
+        output_dir: Directory for this scenario (created if needed)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    # One row per hour, one column per historian series
+    historian = result['historian']
+    keys = list(historian.keys())
+    with open(os.path.join(output_dir, 'historian.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['hour'] + keys + ['gross_revenue', 'gross_cost'])
+        columns = [historian[key] for key in keys] + [result['gross_revenue'], result['gross_cost']]
+        for hour in range(HOURS_PER_YEAR + 1):
+            writer.writerow([hour] + [column[hour] for column in columns])
+
+    with open(os.path.join(output_dir, 'summary.json'), 'w') as f:
+        json.dump(result['kpis'], f, indent=2)
+
+
+def run_scenario_file(path, output_dir, seed=DEFAULT_RANDOM_SEED):
+    """
+    Load, simulate and write one scenario file (the unit of work for --jobs)
+
+    Args:
+        path: Scenario JSON file
+        output_dir: Directory for this scenario's results
+        seed: Random seed
+
+    Returns:
+        Dictionary with the scenario path, its KPIs and an error message (None on success)
+    """
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        result = run_scenario(data, seed)
+        write_results(result, output_dir)
+        return {'scenario': path, 'kpis': result['kpis'], 'error': None}
+    except Exception as e:
+        return {'scenario': path, 'kpis': None, 'error': str(e)}
+
+
+def is_component_series(key):
+    """Check whether a historian key belongs to one component (e.g. Load_123456)"""
+    return key.rpartition('_')[2].isdigit()
+
+
+def run_scenario_for_comparison(path, seed=DEFAULT_RANDOM_SEED):
+    """
+    Load and simulate one scenario file for the historian's compare view (the
+    unit of work for its worker processes)
+
+    Args:
+        path: Scenario JSON file
+        seed: Random seed
+
+    Returns:
+        Dictionary with the scenario path and name, its system-level historian
+        series (per-component series are keyed by object ids, which mean
+        nothing outside the worker), its KPIs and an error message (None on success)
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        result = run_scenario(data, seed)
+        historian = {
+            key: np.asarray(values, dtype=float)
+            for key, values in result['historian'].items()
+            if not is_component_series(key)
+        }
+        return {'scenario': path, 'name': name, 'historian': historian, 'kpis': result['kpis'], 'error': None}
+    except Exception as e:
+        return {'scenario': path, 'name': name, 'historian': None, 'kpis': None, 'error': str(e)}
+
+
+def _output_dirs(paths, output_root):
+    """Give every scenario its own result directory, named after the file"""
+    dirs = []
+    used = set()
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        candidate = name
+        suffix = 2
+        while candidate in used:
+            candidate = f"{name}_{suffix}"
+            suffix += 1
+        used.add(candidate)
+        dirs.append(os.path.join(output_root, candidate))
+    return dirs
+
+
+def _pool_context():
+    """
+    Prefer forked workers: a spawned worker re-imports main.py and with it the
+    GUI modules, which may not even be importable on a build server.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def run_batch(paths, output_root, jobs=1, seed=DEFAULT_RANDOM_SEED):
+    """
+    Run several scenario files, in parallel worker processes if jobs > 1
+
+    Args:
+        paths: Scenario JSON files
+        output_root: Directory receiving one sub-directory per scenario plus summary.csv
+        jobs: Number of worker processes
+        seed: Random seed applied to every scenario
+
+    Returns:
+        List of run_scenario_file results, in the order of paths
+    """
+    os.makedirs(output_root, exist_ok=True)
+    dirs = _output_dirs(paths, output_root)
+
+    if jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths)), mp_context=_pool_context()) as pool:
+            futures = [pool.submit(run_scenario_file, path, out, seed) for path, out in zip(paths, dirs)]
+            results = []
+            for future in futures:
+                results.append(future.result())
+                _report(results[-1])
+    else:
+        results = []
+        for path, out in zip(paths, dirs):
+            results.append(run_scenario_file(path, out, seed))
+            _report(results[-1])
+
+    _write_summary(results, os.path.join(output_root, 'summary.csv'))
+    return results
+
+
+def _report(result):
+    """Print one line per finished scenario"""
+    if result['error']:
+        print(f"FAILED {result['scenario']}: {result['error']}")
+        return
+    kpis = result['kpis']
+    irr_12 = f"{kpis['irr_12_month'] * 100:.1f}%" if kpis['irr_12_month'] is not None else "--"
+    print(f"Done   {result['scenario']}: IRR {irr_12} | CAPEX ${kpis['capex']:,.0f} | "
+          f"Net ${kpis['net_revenue']:,.0f} | Unserved {kpis['unserved_energy_kwh']:,.0f} kWh")
+
+
+def _write_summary(results, path):
+    """Write one CSV row of KPIs per scenario"""
+    kpi_names = []
+    for result in results:
+        if result['kpis']:
+            kpi_names = list(result['kpis'].keys())
+            break
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['scenario', 'error'] + kpi_names)
+        for result in results:
+            kpis = result['kpis'] or {}
+            writer.writerow([result['scenario'], result['error'] or ''] + [kpis.get(name, '') for name in kpi_names])
+
+
+def main(argv=None):
+    """
+    Command-line entry point
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code (1 if any scenario failed)
+    """
+    parser = argparse.ArgumentParser(
+        prog="overclock --headless",
+        description="Simulate saved OVERCLOCK scenarios for a full year without the UI."
+    )
+    parser.add_argument('scenarios', nargs='+', help="Scenario JSON files saved from OVERCLOCK")
+    parser.add_argument('-o', '--output', default='headless_results', help="Output directory (default: headless_results)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of worker processes (default: 1)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_RANDOM_SEED,
+                        help=f"Random seed for load profiles and generator outages (default: {DEFAULT_RANDOM_SEED})")
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    results = run_batch(args.scenarios, args.output, jobs=args.jobs, seed=args.seed)
+    failed = sum(1 for result in results if result['error'])
+    print(f"{len(results) - failed}/{len(results)} scenarios completed. Results written to {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
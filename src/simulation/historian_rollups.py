@@ -0,0 +1,208 @@
+import numpy as np
+
+# Hours covered by one simulated year (the historian holds 8761 slots, hour 0-8760)
+HOURS_PER_YEAR = 8760
+HOURS_PER_DAY = 24
+HOURS_PER_WEEK = 168
+
+# Days per month for a non-leap simulation year
+DAYS_PER_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+# Aggregation periods offered by the historian view
+PERIODS = ['Hourly', 'Daily', 'Weekly', 'Monthly']
+
+# Statistics computed for every rolled-up period
+STATISTICS = ['Mean', 'Sum', 'Min', 'Max']
+
+
+def _month_starts(num_points):
+    """
+    Build the hour index at which each month begins, repeating the
+    calendar for every simulated year covered by num_points.
+
+    Args:
+        num_points: Number of hourly samples in the series
+
+    Returns:
+        NumPy array of month start indices (all < num_points)
+    """
+    month_offsets = np.concatenate(([0], np.cumsum(DAYS_PER_MONTH[:-1]))) * HOURS_PER_DAY
+    years = max(1, -(-num_points // HOURS_PER_YEAR))  # Ceiling division
+    starts = (np.arange(years)[:, None] * HOURS_PER_YEAR + month_offsets[None, :]).ravel()
+    return starts[starts < num_points]
+
+
+def _reduce_fixed(values, width):
+    """
+    Reduce a series in fixed-width blocks using a reshape for all full blocks.
+    A trailing partial block (e.g. the extra hour 8760) is reduced separately.
+
+    Args:
+        values: 1-D float array
+        width: Block width in hours
+
+    Returns:
+        Tuple of (starts, sums, counts, mins, maxs) arrays
+    """
+    full_blocks = len(values) // width
+    full_length = full_blocks * width
+
+    # Zero-copy view of the full blocks as a (blocks, width) matrix
+    blocks = values[:full_length].reshape(full_blocks, width)
+    sums = blocks.sum(axis=1)
+    mins = blocks.min(axis=1) if full_blocks else np.empty(0)
+    maxs = blocks.max(axis=1) if full_blocks else np.empty(0)
+    counts = np.full(full_blocks, width, dtype=float)
+
+    # Handle the remainder that doesn't fill a whole block
+    remainder = values[full_length:]
+    if len(remainder):
+        sums = np.append(sums, remainder.sum())
+        mins = np.append(mins, remainder.min())
+        maxs = np.append(maxs, remainder.max())
+        counts = np.append(counts, len(remainder))
+
+    starts = np.arange(len(sums)) * width
+    return starts, sums, counts, mins, maxs
+
+
+def _reduce_boundaries(values, starts):
+    """
+    Reduce a series between arbitrary start indices (used for calendar months).
+
+    Args:
+        values: 1-D float array
+        starts: Sorted array of block start indices beginning with 0
+
+    Returns:
+        Tuple of (starts, sums, counts, mins, maxs) arrays
+    """
+    sums = np.add.reduceat(values, starts)
+    mins = np.minimum.reduceat(values, starts)
+    maxs = np.maximum.reduceat(values, starts)
+    counts = np.diff(np.append(starts, len(values))).astype(float)
+    return starts, sums, counts, mins, maxs
+
+
+def compute_rollups(values, period):
+    """
+    Compute sum, mean, min and max of a series for each period.
+
+    Args:
+        values: Sequence of hourly values
+        period: One of 'Daily', 'Weekly' or 'Monthly'
+
+    Returns:
+        Dictionary with 'x' (period midpoints in hours) and one array per
+        statistic name in STATISTICS. Empty arrays if there is no data.
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        empty = np.empty(0)
+        return {'x': empty, 'Mean': empty, 'Sum': empty, 'Min': empty, 'Max': empty}
+
+    if period == 'Daily':
+        starts, sums, counts, mins, maxs = _reduce_fixed(values, HOURS_PER_DAY)
+    elif period == 'Weekly':
+        starts, sums, counts, mins, maxs = _reduce_fixed(values, HOURS_PER_WEEK)
+    elif period == 'Monthly':
+        starts, sums, counts, mins, maxs = _reduce_boundaries(values, _month_starts(len(values)))
+    else:
+        raise ValueError(f"Unknown rollup period: {period}")
+
+    return {
+        'x': starts + counts / 2.0,  # Plot each period at its midpoint
+        'Mean': sums / counts,
+        'Sum': sums,
+        'Min': mins,
+        'Max': maxs
+    }
+
+
+class HistorianRollupCache:
+    """
+    Caches per-series rollups for the current run so that switching
+    aggregation periods in the historian is instant.
+
+    Entries are keyed by (data_key, period, num_points); a change in the
+    number of simulated hours naturally produces new entries, and the
+    whole cache is dropped when the simulation is reset.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def invalidate(self):
+        """Drop all cached rollups (called when the historian is reset)"""
+        self._cache.clear()
+
+    def get(self, data_key, values, period, num_points):
+        """
+        Get (computing if needed) the rollups for one series.
+
+        Args:
+            data_key: Historian key of the series
+            values: Full historian list for the series
+            period: One of 'Daily', 'Weekly' or 'Monthly'
+            num_points: Number of leading samples that hold valid data
+
+        Returns:
+            Rollup dictionary as returned by compute_rollups
+        """
+        cache_key = (data_key, period, num_points)
+        rollup = self._cache.get(cache_key)
+        if rollup is None:
+            # Entries for an older num_points of this series/period are stale
+            stale = [k for k in self._cache if k[0] == data_key and k[1] == period]
+            for k in stale:
+                del self._cache[k]
+            rollup = compute_rollups(values[:num_points], period)
+            self._cache[cache_key] = rollup
+        return rollup
+
+    def precompute(self, historian, num_points_for_key):
+        """
+        Compute rollups for every series and period in one pass, typically
+        right after a run finishes.
+
+        Args:
+            historian: Historian dictionary of hourly lists
+            num_points_for_key: Callable returning the number of valid samples for a key
+        """
+        for data_key, values in historian.items():
+            num_points = num_points_for_key(data_key)
+            for period in PERIODS[1:]:
+                self.get(data_key, values, period, num_points)
+
+
+def to_day_hour_matrix(values, num_points, days=None):
+    """
+    Reshape an hourly series into an hour-of-day x day-of-year matrix
+    suitable for drawing as a single heatmap image.
+
+    Hours that haven't been simulated yet are filled with NaN so they
+    render as blank cells. When the series is already a NumPy array and
+    covers whole days, the result is a view of the original data.
+
+    Args:
+        values: Sequence of hourly values
+        num_points: Number of leading samples that hold valid data
+        days: Number of day columns (defaults to one simulated year)
+
+    Returns:
+        NumPy array of shape (24, days)
+    """
+    if days is None:
+        days = HOURS_PER_YEAR // HOURS_PER_DAY
+    total_hours = days * HOURS_PER_DAY
+
+    values = np.asarray(values, dtype=float)
+    num_points = min(num_points, len(values), total_hours)
+
+    if num_points == total_hours:
+        # Whole days available - reshape and transpose are both views
+        return values[:total_hours].reshape(days, HOURS_PER_DAY).T
+
+    matrix = np.full(total_hours, np.nan)
+    matrix[:num_points] = values[:num_points]
+    return matrix.reshape(days, HOURS_PER_DAY).T
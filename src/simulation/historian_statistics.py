@@ -0,0 +1,179 @@
+import os
+import numpy as np
+from src.utils.resource import resource_path
+
+# Percentiles reported for every series
+PERCENTILES = [50, 90, 99]
+
+# Pseudo historian key for the bundled Powerlandia pool price series
+POOL_PRICE_KEY = 'pool_price'
+
+_pool_prices = None
+
+
+def load_pool_prices():
+    """
+    Load the bundled Powerlandia 8760 pool price series (once per process)
+
+    Returns:
+        NumPy array of hourly prices, empty if the file can't be read
+    """
+    global _pool_prices
+    if _pool_prices is None:
+        csv_path = resource_path("src/data/Powerlandia-PoolPrices-Year1.csv")
+        try:
+            if os.path.exists(csv_path):
+                _pool_prices = np.loadtxt(csv_path, dtype=float, encoding='utf-8-sig', ndmin=1)
+            else:
+                print(f"File not found: {csv_path}")
+                _pool_prices = np.empty(0)
+        except Exception as e:
+            print(f"Error loading pool prices: {e}")
+            _pool_prices = np.empty(0)
+    return _pool_prices
+
+
+def compute_percentiles(values, percentiles=PERCENTILES):
+    """
+    Compute percentiles with np.partition, avoiding a full sort.
+    Uses the same linear interpolation as np.percentile.
+
+    Args:
+        values: 1-D float array
+        percentiles: Percentiles to compute (0-100)
+
+    Returns:
+        Dictionary mapping each percentile to its value
+    """
+    if len(values) == 0:
+        return {p: 0.0 for p in percentiles}
+
+    positions = np.asarray(percentiles, dtype=float) / 100.0 * (len(values) - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+
+    # Only the order statistics we need end up in their sorted positions
+    partitioned = np.partition(values, np.unique(np.concatenate((lower, upper))))
+    weights = positions - lower
+    results = partitioned[lower] * (1 - weights) + partitioned[upper] * weights
+    return {p: float(v) for p, v in zip(percentiles, results)}
+
+
+def compute_series_statistics(values, bins=50):
+    """
+    Compute the duration curve, histogram and summary statistics of a series
+
+    Args:
+        values: Sequence of hourly values
+        bins: Number of histogram bins
+
+    Returns:
+        Dictionary with 'duration_curve' (values sorted high to low),
+        'histogram' (counts, bin_edges), 'percentiles', 'mean', 'min' and 'max'
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return {
+            'duration_curve': np.empty(0),
+            'histogram': (np.zeros(bins), np.linspace(0, 1, bins + 1)),
+            'percentiles': compute_percentiles(values),
+            'mean': 0.0, 'min': 0.0, 'max': 0.0
+        }
+
+    return {
+        'duration_curve': np.sort(values)[::-1],
+        'histogram': np.histogram(values, bins=bins),
+        'percentiles': compute_percentiles(values),
+        'mean': float(values.mean()),
+        'min': float(values.min()),
+        'max': float(values.max())
+    }
+
+
+def compute_run_metrics(historian, num_points, generator_capacities, stability_tolerance):
+    """
+    Compute headline metrics for a run from the historian arrays
+
+    Args:
+        historian: Historian dictionary of hourly lists
+        num_points: Number of simulated hours
+        generator_capacities: Dictionary of generator historian key -> capacity (kW)
+        stability_tolerance: Imbalance (kW) below which the system counts as stable
+
+    Returns:
+        Dictionary with 'instability_hours', 'peak_import', 'peak_load',
+        'total_import', 'total_export' and 'capacity_factors' (key -> 0-1)
+    """
+    def series(key):
+        return np.asarray(historian.get(key, [])[:num_points], dtype=float)
+
+    instability = series('system_instability')
+    grid_import = series('grid_import')
+    grid_export = series('grid_export')
+    total_load = series('total_load')
+
+    capacity_factors = {}
+    for key, capacity in generator_capacities.items():
+        if key in historian and capacity > 0 and num_points > 0:
+            capacity_factors[key] = float(series(key).sum() / (capacity * num_points))
+
+    return {
+        'instability_hours': int(np.count_nonzero(instability > stability_tolerance)),
+        'peak_import': float(grid_import.max()) if len(grid_import) else 0.0,
+        'peak_load': float(total_load.max()) if len(total_load) else 0.0,
+        'total_import': float(grid_import.sum()),
+        'total_export': float(grid_export.sum()),
+        'capacity_factors': capacity_factors
+    }
+
+
+class HistorianStatisticsCache:
+    """
+    Caches per-series statistics and run metrics for the current run so
+    the statistics view and post-run summaries don't recompute them.
+    """
+
+    def __init__(self):
+        self._series = {}
+        self._metrics = None
+
+    def invalidate(self):
+        """Drop all cached statistics (called when the historian is reset)"""
+        self._series.clear()
+        self._metrics = None
+
+    def get_series(self, data_key, values, num_points):
+        """
+        Get (computing if needed) the statistics of one series
+
+        Args:
+            data_key: Historian key of the series (or POOL_PRICE_KEY)
+            values: Full list/array for the series
+            num_points: Number of leading samples that hold valid data
+
+        Returns:
+            Statistics dictionary as returned by compute_series_statistics
+        """
+        cached = self._series.get(data_key)
+        if cached is None or cached[0] != num_points:
+            cached = (num_points, compute_series_statistics(values[:num_points]))
+            self._series[data_key] = cached
+        return cached[1]
+
+    def get_metrics(self, historian, num_points, generator_capacities, stability_tolerance):
+        """
+        Get (computing if needed) the run metrics
+
+        Args:
+            historian: Historian dictionary of hourly lists
+            num_points: Number of simulated hours
+            generator_capacities: Dictionary of generator historian key -> capacity (kW)
+            stability_tolerance: Imbalance (kW) below which the system counts as stable
+
+        Returns:
+            Metrics dictionary as returned by compute_run_metrics
+        """
+        if self._metrics is None or self._metrics[0] != num_points:
+            metrics = compute_run_metrics(historian, num_points, generator_capacities, stability_tolerance)
+            self._metrics = (num_points, metrics)
+        return self._metrics[1]
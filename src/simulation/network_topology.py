@@ -0,0 +1,202 @@
+class NetworkTopology:
+    """
+    Tracks which components are electrically connected.
+
+    Every component's number of connections is kept up to date on each
+    add, delete, connect and disconnect, together with the count of
+    components that have none. The connectivity check behind every run is
+    answered from that count in O(1), deletions included.
+
+    Islands are tracked with a disjoint-set (union-find) structure. New
+    components and connections are merged in as they are created, which costs
+    next to nothing. Disjoint sets can't be split, so deleting a component or
+    connection only marks the islands stale; they are rebuilt from the
+    connection graph the next time they are queried.
+
+    The main window's components and connections lists are the source of
+    truth. Code that replaces them wholesale (scenario load, autoconnect)
+    calls invalidate(), and everything is rebuilt on the next query.
+    """
+
+    def __init__(self, main_window):
+        self.main_window = main_window
+        self.degree = {}  # Component -> number of connections it has
+        self.unconnected_count = 0  # Components with no connection
+        self.parent = {}  # Component -> parent component in its set
+        self.size = {}  # Root component -> number of components in its set
+        self.island_count = 0
+        self.stale = True  # Everything must be rebuilt from the main window's lists
+        self.islands_stale = False  # Only the disjoint sets must be rebuilt
+        self._islands = None  # Cached island lists, built on demand
+
+    # --- Updates -------------------------------------------------------------
+
+    def component_added(self, component):
+        """Register a new (unconnected) component as its own island"""
+        if self.stale or component in self.degree:
+            return
+        self.degree[component] = 0
+        self.unconnected_count += 1
+        self.parent[component] = component
+        self.size[component] = 1
+        self.island_count += 1
+        self._islands = None
+
+    def component_removed(self, component):
+        """A component was deleted (after its connections) - islands may have split"""
+        if self.stale or component not in self.degree:
+            return
+        if self.degree.pop(component) > 0:
+            # Its connections weren't reported as removed - start over
+            self.invalidate()
+            return
+        self.unconnected_count -= 1
+        self.islands_stale = True
+        self._islands = None
+
+    def connection_added(self, connection):
+        """Merge the islands on both ends of a new connection"""
+        if self.stale:
+            return
+        source, target = connection.source, connection.target
+        if source not in self.degree or target not in self.degree:
+            # Connection to something we don't track (shouldn't happen) - start over
+            self.invalidate()
+            return
+        for component in (source, target):
+            if self.degree[component] == 0:
+                self.unconnected_count -= 1
+            self.degree[component] += 1
+        if not self.islands_stale:
+            self._union(source, target)
+
+    def connection_removed(self, connection):
+        """A connection was deleted - its islands may have split"""
+        if self.stale:
+            return
+        source, target = connection.source, connection.target
+        if source not in self.degree or target not in self.degree:
+            self.invalidate()
+            return
+        for component in (source, target):
+            self.degree[component] -= 1
+            if self.degree[component] == 0:
+                self.unconnected_count += 1
+        self.islands_stale = True
+        self._islands = None
+
+    def invalidate(self):
+        """Mark everything stale so the next query rebuilds it from the main window's lists"""
+        self.stale = True
+        self._islands = None
+
+    # --- Queries -------------------------------------------------------------
+
+    def has_unconnected_components(self):
+        """Return True if some component has no connection (when there is more than one component)"""
+        if self.stale:
+            self.rebuild()
+        return len(self.degree) > 1 and self.unconnected_count > 0
+
+    def is_connected(self):
+        """Return True if there are components and they all form one network"""
+        self._ensure_islands()
+        return bool(self.parent) and self.island_count == 1
+
+    def islands(self):
+        """
+        Group the components into electrically separate islands
+
+        Returns:
+            List of component lists, largest island first. Within an island
+            components keep their order from the main window's list.
+        """
+        self._ensure_islands()
+        if self._islands is None:
+            groups = {}
+            for component in self.main_window.components:
+                groups.setdefault(self._find(component), []).append(component)
+            self._islands = sorted(groups.values(), key=len, reverse=True)
+        return self._islands
+
+    def island_of(self, component):
+        """
+        Get the index of the island a component belongs to
+
+        Args:
+            component: A component from the main window's list
+
+        Returns:
+            int: Index into islands() (0 = largest), or None if the component isn't tracked
+        """
+        self._ensure_islands()
+        if component not in self.parent:
+            return None
+        root = self._find(component)
+        for index, island in enumerate(self.islands()):
+            if self._find(island[0]) is root:
+                return index
+        return None
+
+    def disconnected_components(self):
+        """Components outside the largest island"""
+        return [component for island in self.islands()[1:] for component in island]
+
+    def unconnected_components(self):
+        """Components with no connection to any other component (when there is more than one)"""
+        if not self.has_unconnected_components():
+            return []
+        return [component for component in self.main_window.components if self.degree.get(component) == 0]
+
+    # --- Internals -----------------------------------------------------------
+
+    def _ensure_islands(self):
+        """Rebuild whatever is stale before the islands are queried"""
+        if self.stale:
+            self.rebuild()
+        elif self.islands_stale:
+            self._rebuild_islands()
+
+    def rebuild(self):
+        """Rebuild the connection counts and disjoint sets from the current components and connections"""
+        self.degree = {component: 0 for component in self.main_window.components}
+        for connection in self.main_window.connections:
+            for component in (connection.source, connection.target):
+                if component in self.degree:
+                    self.degree[component] += 1
+        self.unconnected_count = sum(1 for count in self.degree.values() if count == 0)
+        self.stale = False
+        self._rebuild_islands()
+
+    def _rebuild_islands(self):
+        """Rebuild the disjoint sets from the tracked components and the current connections"""
+        self.parent = {component: component for component in self.degree}
+        self.size = {component: 1 for component in self.degree}
+        self.island_count = len(self.parent)
+        self._islands = None
+        for connection in self.main_window.connections:
+            source, target = connection.source, connection.target
+            if source in self.parent and target in self.parent:
+                self._union(source, target)
+        self.islands_stale = False
+
+    def _find(self, component):
+        """Find the root of a component's set, halving the path as we go"""
+        parent = self.parent
+        while parent[component] is not component:
+            parent[component] = parent[parent[component]]
+            component = parent[component]
+        return component
+
+    def _union(self, a, b):
+        """Merge the sets holding a and b (union by size)"""
+        root_a = self._find(a)
+        root_b = self._find(b)
+        if root_a is root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size.pop(root_b)
+        self.island_count -= 1
+        self._islands = None
@@ -0,0 +1,473 @@
+"""
+Multi-objective design-space exploration for OVERCLOCK
+
+Searches the capacities of a scenario's generators, solar panels, wind turbines
+and batteries for designs that trade off three objectives:
+
+    - CAPEX (lower is better)
+    - 36-month IRR (higher is better)
+    - Unstable hours, i.e. hours with system_instability above the engine's
+      stability tolerance (fewer is better)
+
+Every capacity is searched between zero (the component is effectively left
+out, so the component mix varies too) and a multiple of its value in the
+scenario. The search is evolutionary: the first generation samples the space
+at random around the scenario's own design, and later generations recombine
+and mutate members of the Pareto archive (the designs no other design beats
+on all three objectives). Designs are simulated in parallel headless workers.
+
+Every finished design is appended to designs.jsonl as soon as it completes,
+and the Pareto front (pareto.csv plus a loadable scenario file per design) is
+rewritten after every generation. Running the same command again with the
+same output directory resumes where the previous run stopped; raise
+--designs to keep searching.
+
+Usage:
+    python main.py --optimize site.json --designs 2000 --population 32 --jobs 8 -o overnight
+"""
+
+import argparse
+import copy
+import csv
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from src.simulation.engine import DEFAULT_RANDOM_SEED
+from src.simulation.headless import run_scenario, _pool_context
+from src.simulation.result_cache import scenario_data_fingerprint
+
+# Searchable capacity fields by saved component type
+DESIGN_FIELDS = {
+    'Generator': ('capacity',),
+    'SolarPanel': ('capacity',),
+    'WindTurbine': ('capacity',),
+    'Battery': ('power_capacity', 'energy_capacity'),
+}
+
+# Objectives: (KPI key, direction) - all are turned into minimization internally
+OBJECTIVES = [
+    ('capex', 1),
+    ('irr_36_month', -1),
+    ('unstable_hours', 1),
+]
+
+# Capacities are rounded to this step (kW or kWh) so nearly identical designs aren't simulated twice
+CAPACITY_STEP = 10
+
+# Search defaults
+DEFAULT_DESIGNS = 200
+DEFAULT_POPULATION = 16
+DEFAULT_MAX_SCALE = 2.0
+
+# Share of each generation sampled at random instead of bred from the archive
+RANDOM_FRACTION = 0.2
+# Chance that a mutated capacity drops to zero (leaves the component out)
+DROP_PROBABILITY = 0.1
+# Mutation step as a fraction of a gene's range
+MUTATION_SCALE = 0.2
+
+# Files in the output directory
+RUN_FILE = 'run.json'
+DESIGNS_FILE = 'designs.jsonl'
+PARETO_FILE = 'pareto.csv'
+PARETO_DIR = 'pareto'
+
+# Result cache kind for the optimizer's scenario key
+OPTIMIZER_KIND = 'optimizer'
+
+
+def design_genes(data, max_scale):
+    """
+    List the searchable capacities of a scenario
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        max_scale: Upper bound as a multiple of each capacity in the scenario
+
+    Returns:
+        List of (name, component index, field, upper bound) - components with a
+        zero capacity aren't searched, since there is nothing to scale
+    """
+    genes = []
+    for index, component in enumerate(data.get('components', [])):
+        for field in DESIGN_FIELDS.get(component.get('type'), ()):
+            value = component.get(field, 0) or 0
+            if value > 0:
+                genes.append((f"{component['type']}_{index}.{field}", index, field, _round_capacity(value * max_scale)))
+    return genes
+
+
+def _round_capacity(value):
+    return float(round(value / CAPACITY_STEP) * CAPACITY_STEP)
+
+
+def apply_design(data, genes, design):
+    """
+    Build the scenario for a design
+
+    Args:
+        data: Base scenario dictionary (not modified)
+        genes: design_genes list
+        design: Capacity per gene
+
+    Returns:
+        New scenario dictionary with the design's capacities
+    """
+    designed = copy.deepcopy(data)
+    for (_, index, field, _), value in zip(genes, design):
+        designed['components'][index][field] = value
+    return designed
+
+
+def evaluate_design(data, genes, design, seed=DEFAULT_RANDOM_SEED):
+    """
+    Simulate one design (the unit of work for the worker processes)
+
+    Args:
+        data: Base scenario dictionary
+        genes: design_genes list
+        design: Capacity per gene
+        seed: Random seed - the same for every design, so they only differ in their capacities
+
+    Returns:
+        Dictionary with the design, its KPIs and an error message (None on success)
+    """
+    try:
+        result = run_scenario(apply_design(data, genes, design), seed)
+        return {'design': list(design), 'kpis': result['kpis'], 'error': None}
+    except Exception as e:
+        return {'design': list(design), 'kpis': None, 'error': str(e)}
+
+
+def objective_matrix(records):
+    """
+    Objective values of evaluated designs, arranged for minimization
+
+    Args:
+        records: Evaluated design records with KPIs
+
+    Returns:
+        (designs x objectives) array; an undefined IRR counts as the worst possible
+    """
+    values = np.empty((len(records), len(OBJECTIVES)))
+    for row, record in enumerate(records):
+        for column, (key, direction) in enumerate(OBJECTIVES):
+            value = record['kpis'].get(key)
+            values[row, column] = np.inf if value is None else direction * value
+    return values
+
+
+def pareto_front(records):
+    """
+    Find the designs no other design beats on every objective
+
+    Args:
+        records: Evaluated design records with KPIs
+
+    Returns:
+        The non-dominated records, cheapest first
+    """
+    if not records:
+        return []
+    values = objective_matrix(records)
+    keep = np.ones(len(records), dtype=bool)
+    for row in range(len(records)):
+        # Designs at least as good on every objective and better on one
+        dominating = (values <= values[row]).all(axis=1) & (values < values[row]).any(axis=1)
+        keep[row] = not dominating.any()
+    front = [record for record, kept in zip(records, keep) if kept]
+    front.sort(key=lambda record: record['kpis']['capex'])
+    return front
+
+
+def random_design(genes, rng):
+    """Sample a design uniformly from the search space"""
+    return [_round_capacity(rng.uniform(0, upper)) for _, _, _, upper in genes]
+
+
+def breed_design(first, second, genes, rng):
+    """
+    Recombine two archive designs and mutate the child
+
+    Args:
+        first, second: Parent designs
+        genes: design_genes list
+        rng: random.Random of the search
+
+    Returns:
+        Child design
+    """
+    child = [rng.choice(pair) for pair in zip(first, second)]
+    # Mutate one gene on average, and always at least one
+    mutated = [index for index in range(len(genes)) if rng.random() < 1 / len(genes)] or [rng.randrange(len(genes))]
+    for index in mutated:
+        upper = genes[index][3]
+        if rng.random() < DROP_PROBABILITY:
+            child[index] = 0.0
+        else:
+            value = child[index] + rng.gauss(0, MUTATION_SCALE * upper)
+            child[index] = _round_capacity(min(max(value, 0.0), upper))
+    return child
+
+
+def next_generation(front, genes, population, evaluated, rng):
+    """
+    Choose the designs to simulate next
+
+    Args:
+        front: Current Pareto archive
+        genes: design_genes list
+        population: Number of designs to return
+        evaluated: Set of design tuples already simulated (not repeated)
+        rng: random.Random of the search
+
+    Returns:
+        List of new designs (may be shorter than population once the space is exhausted)
+    """
+    designs = []
+    attempts = 0
+    while len(designs) < population and attempts < population * 20:
+        attempts += 1
+        if len(front) < 2 or rng.random() < RANDOM_FRACTION:
+            design = random_design(genes, rng)
+        else:
+            first, second = rng.sample(front, 2)
+            design = breed_design(first['design'], second['design'], genes, rng)
+        key = tuple(design)
+        if key in evaluated:
+            continue
+        evaluated.add(key)
+        designs.append(design)
+    return designs
+
+
+def load_progress(output_dir, run_info):
+    """
+    Read the designs a previous run of the same search already evaluated
+
+    Args:
+        output_dir: Output directory of the search
+        run_info: Identity of this search (scenario key, seed, genes)
+
+    Returns:
+        List of design records (empty for a new search)
+
+    Raises:
+        ValueError: If the directory holds a different search
+    """
+    run_path = os.path.join(output_dir, RUN_FILE)
+    if not os.path.exists(run_path):
+        return []
+    with open(run_path, 'r') as f:
+        previous = json.load(f)
+    if previous != run_info:
+        raise ValueError(f"{output_dir} holds a different optimization (scenario, seed or --max-scale changed); choose another output directory")
+
+    records = []
+    designs_path = os.path.join(output_dir, DESIGNS_FILE)
+    if os.path.exists(designs_path):
+        with open(designs_path, 'rb+') as f:
+            content = f.read()
+            # The resumed run appends after the last newline - a record written without one is
+            # finished off, a line cut short when the previous run was stopped is dropped
+            tail = content[content.rfind(b'\n') + 1:]
+            if tail:
+                try:
+                    json.loads(tail)
+                    f.write(b'\n')
+                except ValueError:
+                    f.truncate(len(content) - len(tail))
+                    content = content[:len(content) - len(tail)]
+        for line in content.decode('utf-8').splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A corrupt line from an older interrupted run
+                continue
+    return records
+
+
+def write_front(front, data, genes, output_dir):
+    """
+    Rewrite pareto.csv and the Pareto design scenario files
+
+    Args:
+        front: pareto_front result
+        data: Base scenario dictionary
+        genes: design_genes list
+        output_dir: Output directory of the search
+    """
+    temp_path = os.path.join(output_dir, PARETO_FILE + '.tmp')
+    with open(temp_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['design', 'generation', 'capex', 'irr_36_month', 'unstable_hours', 'irr_12_month', 'net_revenue',
+                         'unserved_energy_kwh'] + [name for name, _, _, _ in genes])
+        for record in front:
+            kpis = record['kpis']
+            writer.writerow([record['id'], record['generation']] +
+                            [kpis.get(key, '') for key in ('capex', 'irr_36_month', 'unstable_hours', 'irr_12_month',
+                                                            'net_revenue', 'unserved_energy_kwh')] +
+                            record['design'])
+    os.replace(temp_path, os.path.join(output_dir, PARETO_FILE))
+
+    # One loadable scenario per Pareto design; designs that dropped off the front are removed
+    pareto_dir = os.path.join(output_dir, PARETO_DIR)
+    os.makedirs(pareto_dir, exist_ok=True)
+    names = {f"design_{record['id']}.json" for record in front}
+    for name in os.listdir(pareto_dir):
+        if name.endswith('.json') and name not in names:
+            os.remove(os.path.join(pareto_dir, name))
+    for record in front:
+        path = os.path.join(pareto_dir, f"design_{record['id']}.json")
+        if not os.path.exists(path):
+            with open(path, 'w') as f:
+                json.dump(apply_design(data, genes, record['design']), f, indent=4)
+
+
+def optimize(data, output_dir, designs=DEFAULT_DESIGNS, population=DEFAULT_POPULATION, jobs=1,
+             max_scale=DEFAULT_MAX_SCALE, seed=DEFAULT_RANDOM_SEED):
+    """
+    Run (or resume) a design-space search
+
+    Args:
+        data: Base scenario dictionary as written by save_scenario
+        output_dir: Directory for run.json, designs.jsonl, pareto.csv and pareto/
+        designs: Total number of designs to evaluate, including those of earlier runs
+        population: Designs per generation
+        jobs: Number of worker processes
+        max_scale: Upper bound of every capacity as a multiple of its scenario value
+        seed: Simulation random seed (also seeds the search)
+
+    Returns:
+        The final Pareto front
+
+    Raises:
+        ValueError: If the scenario has nothing to search or the directory holds another search
+    """
+    genes = design_genes(data, max_scale)
+    if not genes:
+        raise ValueError("The scenario has no generator, solar, wind or battery capacity to search")
+
+    run_info = {
+        'scenario_key': scenario_data_fingerprint(data, seed, OPTIMIZER_KIND),
+        'seed': seed,
+        'max_scale': max_scale,
+        'genes': [list(gene) for gene in genes]
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    records = load_progress(output_dir, run_info)
+    with open(os.path.join(output_dir, RUN_FILE), 'w') as f:
+        json.dump(run_info, f, indent=2)
+    if records:
+        print(f"Resuming: {len(records)} designs already evaluated")
+
+    evaluated = {tuple(record['design']) for record in records}
+    successful = [record for record in records if not record['error']]
+    front = pareto_front(successful)
+    generation = max((record['generation'] for record in records), default=-1) + 1
+
+    designs_path = os.path.join(output_dir, DESIGNS_FILE)
+    pool = ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context()) if jobs > 1 else None
+    try:
+        with open(designs_path, 'a') as log:
+            while len(records) < designs:
+                # The search RNG is derived from the progress so a resumed run continues deterministically
+                rng = random.Random(f"{seed}-{len(records)}")
+                batch_size = min(population, designs - len(records))
+                if not records:
+                    # Start from the scenario's own design
+                    base = [_round_capacity(data['components'][index][field]) for _, index, field, _ in genes]
+                    evaluated.add(tuple(base))
+                    batch = [base] + next_generation(front, genes, batch_size - 1, evaluated, rng)
+                else:
+                    batch = next_generation(front, genes, batch_size, evaluated, rng)
+                if not batch:
+                    print("Search space exhausted")
+                    break
+
+                if pool is not None:
+                    futures = [pool.submit(evaluate_design, data, genes, design, seed) for design in batch]
+                    finished = (future.result() for future in as_completed(futures))
+                else:
+                    finished = (evaluate_design(data, genes, design, seed) for design in batch)
+
+                for result in finished:
+                    record = dict(result, id=len(records), generation=generation)
+                    records.append(record)
+                    if not record['error']:
+                        successful.append(record)
+                    # Written as soon as the design finishes, so a stopped run loses at most the designs in flight
+                    log.write(json.dumps(record) + '\n')
+                    log.flush()
+
+                front = pareto_front(successful)
+                write_front(front, data, genes, output_dir)
+                failed = sum(1 for record in records if record['error'])
+                print(f"Generation {generation}: {len(records)}/{designs} designs, "
+                      f"{len(front)} on the Pareto front" + (f", {failed} failed" if failed else ""))
+                generation += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return front
+
+
+def main(argv=None):
+    """
+    Command-line entry point
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code (1 if the search couldn't run)
+    """
+    parser = argparse.ArgumentParser(
+        prog="overclock --optimize",
+        description="Search capacities of a saved OVERCLOCK scenario for the Pareto front of CAPEX, 36-month IRR and unstable hours."
+    )
+    parser.add_argument('scenario', help="Scenario JSON file saved from OVERCLOCK")
+    parser.add_argument('-o', '--output', default='optimizer_results',
+                        help="Output directory; an existing search in it is resumed (default: optimizer_results)")
+    parser.add_argument('-n', '--designs', type=int, default=DEFAULT_DESIGNS,
+                        help=f"Total designs to evaluate, including earlier runs (default: {DEFAULT_DESIGNS})")
+    parser.add_argument('--population', type=int, default=DEFAULT_POPULATION,
+                        help=f"Designs per generation (default: {DEFAULT_POPULATION})")
+    parser.add_argument('--max-scale', type=float, default=DEFAULT_MAX_SCALE,
+                        help=f"Largest capacity as a multiple of the scenario's (default: {DEFAULT_MAX_SCALE})")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of worker processes (default: 1)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_RANDOM_SEED,
+                        help=f"Random seed for the simulations and the search (default: {DEFAULT_RANDOM_SEED})")
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.population < 1:
+        parser.error("--population must be at least 1")
+    if args.max_scale <= 0:
+        parser.error("--max-scale must be positive")
+
+    with open(args.scenario, 'r') as f:
+        data = json.load(f)
+    try:
+        front = optimize(data, args.output, args.designs, args.population, args.jobs, args.max_scale, args.seed)
+    except ValueError as e:
+        print(f"FAILED {args.scenario}: {e}")
+        return 1
+
+    for record in front:
+        kpis = record['kpis']
+        irr = f"{kpis['irr_36_month'] * 100:.1f}%" if kpis['irr_36_month'] is not None else "--"
+        print(f"Design {record['id']:>5}: CAPEX ${kpis['capex']:,.0f} | IRR 36 Mo. {irr} | Unstable {kpis['unstable_hours']} h")
+    print(f"{len(front)} Pareto designs written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Historical price back-test for OVERCLOCK
+
+Replays a scenario against every year of the bundled Alberta pool price
+history (ABHistoricalPrices20102021.csv, hourly, 2010-2021) instead of the
+single Powerlandia price year. Grid import and export components with market
+prices enabled are the market-exposed ones: their price series is replaced
+by the historical year (fixed PPA and import prices still apply on top),
+everything else stays as saved. Years are simulated in parallel headless
+workers with the same random seed, so they differ only in their prices.
+
+Prices are prepared once as a (years x 8760) matrix in $/kWh, so per-year
+price statistics are whole-array operations and each worker only receives
+its own row.
+
+Usage:
+    python main.py --backtest site.json --jobs 12 -o backtest
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.simulation.engine import DEFAULT_RANDOM_SEED
+from src.simulation.headless import HOURS_PER_YEAR, run_scenario, _pool_context
+from src.simulation.year_runs import report_year, run_command_line
+from src.utils.resource import resource_path
+
+# Hourly pool prices in $/MWh, starting January 1st 2010
+HISTORICAL_PRICES_FILE = "src/data/ABHistoricalPrices20102021.csv"
+FIRST_YEAR = 2010
+
+# The simulation prices energy in $/kWh
+PRICE_SCALE = 1 / 1000
+
+# Years whose data stops early (a trailing run of zero prices longer than this) are left out
+MAX_MISSING_HOURS = 24 * 30
+
+# Metrics reported per year: (key, label, display scale, unit)
+BACKTEST_METRICS = [
+    ('mean_price', 'Mean price', 1000, ' $/MWh'),
+    ('market_export_revenue', 'Export revenue', 1e-6, ' $M'),
+    ('market_import_cost', 'Import cost', 1e-6, ' $M'),
+    ('total_revenue', 'Total revenue', 1e-6, ' $M'),
+    ('total_cost', 'Total cost', 1e-6, ' $M'),
+    ('net_revenue', 'Net revenue', 1e-6, ' $M'),
+    ('irr_12_month', 'IRR 12 Mo.', 100, '%'),
+    ('irr_36_month', 'IRR 36 Mo.', 100, '%'),
+]
+
+_price_years = None
+
+
+def load_price_years():
+    """
+    Load the price history as complete 8760-hour years (once per process)
+
+    Returns:
+        (years, prices): Calendar year of every row, and a (years x 8760)
+        array of prices in $/kWh
+    """
+    global _price_years
+    if _price_years is None:
+        csv_path = resource_path(HISTORICAL_PRICES_FILE)
+        with open(csv_path, 'r', encoding='utf-8-sig') as f:
+            series = np.array(f.read().replace(',', ' ').split(), dtype=float)
+        count = len(series) // HOURS_PER_YEAR
+        prices = series[:count * HOURS_PER_YEAR].reshape(count, HOURS_PER_YEAR) * PRICE_SCALE
+
+        # Hours after the last non-zero price of every year, all years at once
+        nonzero = prices != 0
+        trailing_missing = np.where(nonzero.any(axis=1), np.argmax(nonzero[:, ::-1], axis=1), HOURS_PER_YEAR)
+        complete = trailing_missing <= MAX_MISSING_HOURS
+        _price_years = (np.arange(FIRST_YEAR, FIRST_YEAR + count)[complete], prices[complete])
+    return _price_years
+
+
+def price_statistics(prices):
+    """
+    Summarize every price year in one pass
+
+    Args:
+        prices: (years x 8760) array in $/kWh
+
+    Returns:
+        List of dictionaries (one per year) with the mean, 95th percentile and
+        maximum price and the number of hours at or below zero
+    """
+    means = prices.mean(axis=1)
+    p95 = np.percentile(prices, 95, axis=1)
+    maxima = prices.max(axis=1)
+    non_positive = np.count_nonzero(prices <= 0, axis=1)
+    return [
+        {'mean_price': float(mean), 'p95_price': float(high), 'max_price': float(peak), 'non_positive_price_hours': int(hours)}
+        for mean, high, peak, hours in zip(means, p95, maxima, non_positive)
+    ]
+
+
+def market_exposed(data):
+    """Check whether any grid import or export component in a scenario uses market prices"""
+    return any(
+        component.get('type') in ('GridImport', 'GridExport') and component.get('market_prices_mode', 'None') != 'None'
+        for component in data.get('components', [])
+    )
+
+
+def apply_price_year(components, prices):
+    """
+    Replace the market prices of every market-exposed grid component
+
+    Args:
+        components: Live components of the scenario
+        prices: One year of hourly prices in $/kWh
+
+    Returns:
+        The market-exposed components
+    """
+    # Imported here like the other component-specific code of the headless runner
+    from src.components.grid_import import GridImportComponent
+    from src.components.grid_export import GridExportComponent
+
+    exposed = []
+    profile = prices.tolist()
+    for component in components:
+        if isinstance(component, (GridImportComponent, GridExportComponent)) and component.market_prices_mode != "None":
+            # The custom mode reads the profile hour by hour, whatever series the scenario used
+            component.market_prices_mode = "Custom"
+            component.custom_profile = profile
+            exposed.append(component)
+    return exposed
+
+
+def run_price_year(data, year, prices, seed=DEFAULT_RANDOM_SEED):
+    """
+    Simulate a scenario with one year of historical prices (the unit of work for the worker processes)
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        year: Calendar year of the prices
+        prices: The year's hourly prices in $/kWh
+        seed: Random seed (the same for every year)
+
+    Returns:
+        Dictionary with the year, its metrics (KPIs plus the revenue and cost of
+        the market-exposed components) and an error message (None on success)
+    """
+    exposed = []
+    try:
+        result = run_scenario(data, seed, configure=lambda host: exposed.extend(apply_price_year(host.components, prices)))
+        metrics = dict(result['kpis'])
+        metrics['market_export_revenue'] = float(sum(getattr(component, 'accumulated_revenue', 0.0) for component in exposed))
+        metrics['market_import_cost'] = float(sum(getattr(component, 'accumulated_cost', 0.0) for component in exposed))
+        return {'year': year, 'metrics': metrics, 'error': None}
+    except Exception as e:
+        return {'year': year, 'metrics': None, 'error': str(e)}
+
+
+def run_backtest(data, jobs=1, seed=DEFAULT_RANDOM_SEED):
+    """
+    Run a scenario against every complete historical price year, in parallel worker processes if jobs > 1
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        jobs: Number of worker processes
+        seed: Random seed shared by all years
+
+    Returns:
+        List of run_price_year results in year order, with the year's price statistics added to the metrics
+
+    Raises:
+        ValueError: If no grid component is exposed to market prices
+    """
+    if not market_exposed(data):
+        raise ValueError("No grid import or export component uses market prices, so the price year has no effect")
+    years, prices = load_price_years()
+
+    statistics = price_statistics(prices)
+    results = []
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(years)), mp_context=_pool_context()) as pool:
+            futures = [pool.submit(run_price_year, data, int(year), row, seed) for year, row in zip(years, prices)]
+            for future, year_statistics in zip(futures, statistics):
+                results.append(_add_statistics(future.result(), year_statistics))
+                _report(results[-1])
+    else:
+        for year, row, year_statistics in zip(years, prices, statistics):
+            results.append(_add_statistics(run_price_year(data, int(year), row, seed), year_statistics))
+            _report(results[-1])
+    return results
+
+
+def _add_statistics(result, statistics):
+    """Add the year's price statistics to a successful result's metrics"""
+    if result['metrics'] is not None:
+        result['metrics'].update(statistics)
+    return result
+
+
+def _report(result):
+    """Print one line per finished price year"""
+    report_year(str(result['year']), result, BACKTEST_METRICS, ('mean_price', 'net_revenue', 'irr_36_month'))
+
+
+def main(argv=None):
+    """
+    Command-line entry point
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code (1 if the back-test couldn't run or every year failed)
+    """
+    return run_command_line(
+        argv, prog="overclock --backtest",
+        description="Replay a saved OVERCLOCK scenario's market-exposed grid import/export against 2010-2021 Alberta pool prices.",
+        default_output='backtest_results', run=run_backtest, metrics=BACKTEST_METRICS,
+        spread_file='distribution.json', noun="price year"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+import random
+
+# Random source for everything that affects simulation results (random and data
+# center load profiles, generator outages). UI effects keep using the module
+# level random functions, so animations running alongside a simulation can't
+# change its outcome and a seeded run is repeatable.
+simulation_random = random.Random()
+
+
+def seed_simulation_random(seed):
+    """
+    Seed the simulation random source
+
+    Args:
+        seed: Seed value (None seeds from system entropy)
+    """
+    simulation_random.seed(seed)
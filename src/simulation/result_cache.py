@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import pickle
+
+from src.simulation.engine import ENGINE_VERSION, SIMULATED_TYPES
+
+# Where finished runs are kept between sessions
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".overclock", "result_cache")
+
+# Disk budget for cached runs - a full-year run is a few MB
+CACHE_LIMIT_MB = 256
+
+# Component fields that don't change a run's results: position and labels,
+# per-run state the reset clears, and CAPEX (the IRR is recalculated from the
+# live CAPEX whenever a run is displayed)
+NON_SIMULATION_FIELDS = {
+    'x', 'y', 'name', 'graphics_enabled', 'capex_per_kw',
+    'accumulated_revenue', 'previous_revenue', 'accumulated_cost', 'previous_cost',
+    'current_charge', 'last_import', 'last_export'
+}
+
+
+def scenario_fingerprint(components, connections, seed):
+    """
+    Hash the simulation-relevant content of a scenario
+
+    Components are put in a canonical order (by content, then position) so the
+    hash doesn't depend on the order they were created or loaded in.
+
+    Args:
+        components: The main window's component list
+        connections: The main window's connection list
+        seed: Random seed the run uses
+
+    Returns:
+        (key, ordered_components): Hex digest identifying the run, and the
+        simulated components in the canonical order the cached state uses
+    """
+    entries = []
+    for component in components:
+        if not isinstance(component, SIMULATED_TYPES):
+            continue
+        content = {name: value for name, value in component.serialize().items() if name not in NON_SIMULATION_FIELDS}
+        entries.append((json.dumps(content, sort_keys=True, default=str), component.x(), component.y(), component))
+    entries.sort(key=lambda entry: entry[:3])
+
+    ordered_components = [entry[3] for entry in entries]
+    positions = {component: index for index, component in enumerate(ordered_components)}
+    links = sorted(
+        (positions[connection.source], positions[connection.target])
+        for connection in connections
+        if connection.source in positions and connection.target in positions
+    )
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        'engine_version': ENGINE_VERSION,
+        'seed': seed,
+        'components': [entry[0] for entry in entries],
+        'connections': links
+    }).encode('utf-8'))
+    return digest.hexdigest(), ordered_components
+
+
+def scenario_data_fingerprint(data, seed, kind):
+    """
+    Hash a saved scenario dictionary (for runs made by the headless workers)
+
+    Unlike scenario_fingerprint this keeps CAPEX, because the stored KPIs
+    include it, and it keeps the saved component order.
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        seed: Random seed the run uses
+        kind: Kind of run stored under the key (e.g. a sensitivity baseline),
+              so different kinds of results never share an entry
+
+    Returns:
+        Hex digest identifying the run
+    """
+    ignored = NON_SIMULATION_FIELDS - {'capex_per_kw'}
+    components = [
+        {name: value for name, value in component.items() if name not in ignored}
+        for component in data.get('components', [])
+    ]
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        'engine_version': ENGINE_VERSION,
+        'kind': kind,
+        'seed': seed,
+        'components': components,
+        'connections': data.get('connections', [])
+    }, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed store of finished simulation runs.
+
+    Each run is one file named after its scenario fingerprint. Reading an
+    entry touches its modification time, and when the files outgrow the size
+    limit the least recently used ones are deleted first.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Return the application-wide result cache, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, limit_mb=CACHE_LIMIT_MB):
+        self.directory = directory
+        self.limit_bytes = limit_mb * 1024 * 1024
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        """
+        Look up a run
+
+        Args:
+            key: Scenario fingerprint
+
+        Returns:
+            The stored run state, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            os.utime(path)  # Mark as recently used
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Unreadable (e.g. truncated) entries are dropped and recomputed
+            print(f"Discarding unreadable cached run {key}: {e}")
+            self._remove(path)
+            return None
+
+    def put(self, key, entry):
+        """
+        Store a run, then evict old runs if the cache is over its limit
+
+        Args:
+            key: Scenario fingerprint
+            entry: Run state (picklable)
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so readers never see half an entry
+            temp_path = self._path(key) + ".tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+            self._evict()
+        except OSError as e:
+            print(f"Error writing cached run: {e}")
+
+    def clear(self):
+        """Delete every cached run"""
+        for path, _, _ in self._entries():
+            self._remove(path)
+
+    def _entries(self):
+        """List (path, size, last used) for every cached run"""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if not name.endswith('.pkl'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, info.st_size, info.st_mtime))
+        return entries
+
+    def _evict(self):
+        """Delete least recently used runs until the cache fits its limit"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        # Always keep the newest entry, even if it alone is over the limit
+        while total > self.limit_bytes and len(entries) > 1:
+            path, size, _ = entries.pop(0)
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,420 @@
+"""
+Sensitivity (tornado) analysis for OVERCLOCK
+
+Perturbs selected component parameters of a scenario by ±x%, one parameter at
+a time, simulates every perturbation in parallel headless workers and ranks the
+parameters by how far they move the IRR and the net revenue.
+
+The unperturbed baseline run is kept in the result cache, so repeated analyses
+of the same scenario (e.g. with a different percentage or parameter selection)
+only simulate the perturbations. CAPEX perturbations don't change the
+simulation at all and are recalculated from the baseline run.
+
+Usage:
+    python main.py --sensitivity site_a.json --percent 10 --jobs 4 --output sensitivity
+    python -m src.simulation.sensitivity site_a.json --parameters cost_per_gj battery_size
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.simulation.engine import DEFAULT_RANDOM_SEED
+from src.simulation.headless import HOURS_PER_YEAR, run_scenario, _pool_context
+from src.simulation.result_cache import ResultCache, scenario_data_fingerprint
+from src.utils.irr_calculator import calculate_extended_irr
+
+# Perturbable parameters: name -> (label, saved component types, attributes scaled together).
+# A type of None means every component that has the attributes.
+SENSITIVITY_PARAMETERS = {
+    'cost_per_gj': ('Gas cost', ('Generator',), ('cost_per_gj',)),
+    'efficiency': ('Generator efficiency', ('Generator',), ('efficiency',)),
+    'price_per_kwh': ('Load price', ('Load',), ('price_per_kwh',)),
+    'cloud_prices': ('Cloud prices', ('CloudWorkload',),
+                     ('traditional_cloud_price', 'gpu_intensive_price', 'crypto_asic_price', 'dedicated_price_per_resource')),
+    'capex_per_kw': ('CAPEX', None, ('capex_per_kw',)),
+    'battery_size': ('Battery size', ('Battery',), ('power_capacity', 'energy_capacity')),
+}
+
+# Parameters that only change CAPEX - recalculated from the baseline run instead of simulated
+CAPEX_ONLY_PARAMETERS = {'capex_per_kw'}
+
+# Upper bounds for parameters that are fractions
+PARAMETER_LIMITS = {'efficiency': 1.0}
+
+# Default perturbation (±%)
+DEFAULT_PERCENT = 10
+
+# Metrics drawn as tornado charts: (KPI key, label, display scale, unit)
+TORNADO_METRICS = [
+    ('irr_36_month', 'IRR 36 Mo.', 100, '%'),
+    ('net_revenue', 'Net revenue', 1e-6, ' $M'),
+]
+
+# Bar colors for the low (-x%) and high (+x%) cases
+LOW_COLOR = '#F06292'
+HIGH_COLOR = '#4FC3F7'
+
+# Result cache entries for baselines are kept apart from the interactive runs
+BASELINE_CACHE_KIND = 'sensitivity-baseline'
+
+
+def perturbation_cases(data, parameters, percent):
+    """
+    List the perturbations to evaluate
+
+    Parameters without a matching component in the scenario are left out.
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        parameters: Names from SENSITIVITY_PARAMETERS
+        percent: Perturbation size in percent
+
+    Returns:
+        List of (parameter, case, factor) with case 'low' or 'high'
+    """
+    saved_types = {component.get('type') for component in data.get('components', [])}
+    cases = []
+    for parameter in parameters:
+        _, types, _ = SENSITIVITY_PARAMETERS[parameter]
+        if types is not None and not saved_types.intersection(types):
+            continue
+        cases.append((parameter, 'low', 1 - percent / 100))
+        cases.append((parameter, 'high', 1 + percent / 100))
+    return cases
+
+
+def apply_perturbation(components, parameter, factor):
+    """
+    Scale a parameter on every component it applies to
+
+    Args:
+        components: Live components of the scenario
+        parameter: Name from SENSITIVITY_PARAMETERS
+        factor: Multiplier (e.g. 0.9 or 1.1)
+    """
+    _, types, attributes = SENSITIVITY_PARAMETERS[parameter]
+    limit = PARAMETER_LIMITS.get(parameter)
+    for component in components:
+        # Saved type names are the class names without the 'Component' suffix
+        if types is not None and type(component).__name__[:-len('Component')] not in types:
+            continue
+        for attribute in attributes:
+            if not hasattr(component, attribute):
+                continue
+            value = getattr(component, attribute) * factor
+            if limit is not None:
+                value = min(value, limit)
+            setattr(component, attribute, value)
+
+
+def run_baseline(data, seed=DEFAULT_RANDOM_SEED):
+    """
+    Simulate the unperturbed scenario (a unit of work for the worker processes)
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        seed: Random seed
+
+    Returns:
+        Dictionary with the KPIs, the hourly gross revenue and cost arrays (used to
+        recalculate the IRR for CAPEX perturbations) and an error message (None on success)
+    """
+    try:
+        result = run_scenario(data, seed)
+        return {
+            'kpis': result['kpis'],
+            'gross_revenue': np.asarray(result['gross_revenue'], dtype=float),
+            'gross_cost': np.asarray(result['gross_cost'], dtype=float),
+            'error': None
+        }
+    except Exception as e:
+        return {'kpis': None, 'gross_revenue': None, 'gross_cost': None, 'error': str(e)}
+
+
+def run_perturbation(data, parameter, case, factor, seed=DEFAULT_RANDOM_SEED):
+    """
+    Simulate the scenario with one parameter scaled (a unit of work for the worker processes)
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        parameter: Name from SENSITIVITY_PARAMETERS
+        case: 'low' or 'high'
+        factor: Multiplier applied to the parameter
+        seed: Random seed (the same as the baseline, so only the parameter differs)
+
+    Returns:
+        Dictionary with the parameter, case, KPIs and an error message (None on success)
+    """
+    try:
+        result = run_scenario(data, seed, configure=lambda host: apply_perturbation(host.components, parameter, factor))
+        return {'parameter': parameter, 'case': case, 'kpis': result['kpis'], 'error': None}
+    except Exception as e:
+        return {'parameter': parameter, 'case': case, 'kpis': None, 'error': str(e)}
+
+
+def baseline_cache_key(data, seed):
+    """Result cache key of a scenario's baseline run"""
+    return scenario_data_fingerprint(data, seed, BASELINE_CACHE_KIND)
+
+
+def load_cached_baseline(data, seed, cache=None):
+    """
+    Look up a previously simulated baseline
+
+    Returns:
+        The run_baseline result, or None if the scenario hasn't been analyzed before
+    """
+    cache = cache or ResultCache.instance()
+    return cache.get(baseline_cache_key(data, seed))
+
+
+def store_baseline(data, seed, baseline, cache=None):
+    """Keep a successful baseline run for later analyses of the same scenario"""
+    if baseline['error']:
+        return
+    cache = cache or ResultCache.instance()
+    cache.put(baseline_cache_key(data, seed), baseline)
+
+
+def capex_outcome(baseline, factor):
+    """
+    KPIs of the baseline with CAPEX scaled - revenue and cost don't change, only the IRR
+
+    Args:
+        baseline: run_baseline result
+        factor: CAPEX multiplier
+
+    Returns:
+        KPI dictionary
+    """
+    capex = baseline['kpis']['capex'] * factor
+    irr = calculate_extended_irr(capex, baseline['gross_revenue'], baseline['gross_cost'], HOURS_PER_YEAR)
+    return dict(baseline['kpis'], capex=capex, irr_12_month=irr[12], irr_18_month=irr[18], irr_36_month=irr[36])
+
+
+def summarize(baseline, results, cases):
+    """
+    Turn finished perturbation runs into tornado rows
+
+    Args:
+        baseline: run_baseline result
+        results: run_perturbation results (failed runs are shown as missing bars)
+        cases: perturbation_cases list the results belong to
+
+    Returns:
+        List of row dictionaries, most influential parameter first. Each row has the
+        parameter name and label, the low/high factors and KPIs, and 'deltas':
+        KPI key -> (low delta, high delta) for the TORNADO_METRICS (NaN if unavailable)
+    """
+    outcomes = {(result['parameter'], result['case']): result['kpis'] for result in results if not result['error']}
+    for parameter, case, factor in cases:
+        if parameter in CAPEX_ONLY_PARAMETERS:
+            outcomes[(parameter, case)] = capex_outcome(baseline, factor)
+
+    def value(kpis, key):
+        if kpis is None or kpis.get(key) is None:
+            return np.nan
+        return float(kpis[key])
+
+    rows = []
+    factors = {(parameter, case): factor for parameter, case, factor in cases}
+    for parameter in dict.fromkeys(parameter for parameter, _, _ in cases):
+        low = outcomes.get((parameter, 'low'))
+        high = outcomes.get((parameter, 'high'))
+        deltas = {}
+        for key, _, _, _ in TORNADO_METRICS:
+            base = value(baseline['kpis'], key)
+            deltas[key] = (value(low, key) - base, value(high, key) - base)
+        rows.append({
+            'parameter': parameter,
+            'label': SENSITIVITY_PARAMETERS[parameter][0],
+            'low_factor': factors[(parameter, 'low')],
+            'high_factor': factors[(parameter, 'high')],
+            'low': low,
+            'high': high,
+            'deltas': deltas
+        })
+
+    # Rank by the swing of the first metric, then the second (e.g. when the IRR is undefined)
+    def swing(row):
+        return tuple(-np.nan_to_num(abs(row['deltas'][key][1] - row['deltas'][key][0]))
+                     for key, _, _, _ in TORNADO_METRICS)
+    rows.sort(key=swing)
+    return rows
+
+
+def draw_tornado(ax, rows, metric, percent):
+    """
+    Draw one tornado chart in the historian's dark style
+
+    Args:
+        ax: Matplotlib axes (cleared first)
+        rows: summarize result
+        metric: Entry of TORNADO_METRICS
+        percent: Perturbation size, for the legend
+    """
+    key, label, scale, unit = metric
+    ax.clear()
+    ax.set_facecolor('#0A0E22')
+    ax.tick_params(colors='#B5BEDF')
+    ax.grid(True, axis='x', color='#2A334F', linestyle='-')
+    for spine in ax.spines.values():
+        spine.set_color('#29304D')
+
+    positions = np.arange(len(rows))
+    deltas = np.array([row['deltas'][key] for row in rows], dtype=float).reshape(-1, 2) * scale
+    ax.barh(positions, np.nan_to_num(deltas[:, 0]), color=LOW_COLOR, alpha=0.85, label=f"-{percent:g}%")
+    ax.barh(positions, np.nan_to_num(deltas[:, 1]), color=HIGH_COLOR, alpha=0.85, label=f"+{percent:g}%")
+    ax.axvline(0, color='#B5BEDF', linewidth=1)
+    ax.set_yticks(positions, [row['label'] for row in rows], color='#E1E6F9')
+    ax.invert_yaxis()  # Most influential parameter on top
+    ax.set_title(f"Δ {label}", color='#E1E6F9', fontsize=10)
+    ax.set_xlabel(f"Change vs baseline ({unit.strip()})", color='#B5BEDF')
+
+    # Symmetric range so low and high bars can be compared at a glance
+    spread = float(np.nanmax(np.abs(deltas))) if np.isfinite(deltas).any() else 0.0
+    spread = spread * 1.15 if spread > 0 else 1
+    ax.set_xlim(-spread, spread)
+    if rows:
+        ax.legend(loc='lower right', fontsize=8, facecolor='#11182F', edgecolor='#29304D', labelcolor='#E1E6F9')
+
+
+def run_sensitivity(data, parameters, percent=DEFAULT_PERCENT, jobs=1, seed=DEFAULT_RANDOM_SEED):
+    """
+    Run a complete sensitivity analysis, in parallel worker processes if jobs > 1
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        parameters: Names from SENSITIVITY_PARAMETERS
+        percent: Perturbation size in percent
+        jobs: Number of worker processes
+        seed: Random seed shared by the baseline and every perturbation
+
+    Returns:
+        (baseline, rows): run_baseline result and summarize rows
+
+    Raises:
+        ValueError: If the baseline scenario can't be simulated
+    """
+    cases = perturbation_cases(data, parameters, percent)
+    simulated = [case for case in cases if case[0] not in CAPEX_ONLY_PARAMETERS]
+    baseline = load_cached_baseline(data, seed)
+    if baseline is not None:
+        print("Reusing cached baseline run")
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context()) as pool:
+            baseline_future = pool.submit(run_baseline, data, seed) if baseline is None else None
+            futures = [pool.submit(run_perturbation, data, parameter, case, factor, seed)
+                       for parameter, case, factor in simulated]
+            if baseline_future is not None:
+                baseline = baseline_future.result()
+            results = [future.result() for future in futures]
+    else:
+        if baseline is None:
+            baseline = run_baseline(data, seed)
+        results = [run_perturbation(data, parameter, case, factor, seed) for parameter, case, factor in simulated]
+
+    if baseline['error']:
+        raise ValueError(baseline['error'])
+    store_baseline(data, seed, baseline)
+
+    for result in results:
+        if result['error']:
+            print(f"FAILED {result['parameter']} ({result['case']}): {result['error']}")
+    return baseline, summarize(baseline, results, cases)
+
+
+def write_results(baseline, rows, percent, output_dir):
+    """
+    Write the tornado table and chart
+
+    Args:
+        baseline: run_baseline result
+        rows: summarize result
+        percent: Perturbation size in percent
+        output_dir: Directory for sensitivity.csv, baseline.json and tornado.png (created if needed)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    with open(os.path.join(output_dir, 'baseline.json'), 'w') as f:
+        json.dump(baseline['kpis'], f, indent=2)
+
+    # One row per parameter and case
+    kpi_names = list(baseline['kpis'].keys())
+    with open(os.path.join(output_dir, 'sensitivity.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['parameter', 'case', 'factor'] + [f"delta_{key}" for key, _, _, _ in TORNADO_METRICS] + kpi_names)
+        for row in rows:
+            for index, case in enumerate(('low', 'high')):
+                kpis = row[case] or {}
+                deltas = [row['deltas'][key][index] for key, _, _, _ in TORNADO_METRICS]
+                writer.writerow([row['parameter'], case, row[f"{case}_factor"]] + deltas + [kpis.get(name, '') for name in kpi_names])
+
+    # Rendered off-screen, independent of the GUI's backend
+    from matplotlib.figure import Figure
+    figure = Figure(figsize=(12, 1.5 + 0.5 * max(len(rows), 1)), facecolor='#0A0E22')
+    axes = figure.subplots(1, len(TORNADO_METRICS))
+    for ax, metric in zip(axes, TORNADO_METRICS):
+        draw_tornado(ax, rows, metric, percent)
+    figure.tight_layout()
+    figure.savefig(os.path.join(output_dir, 'tornado.png'), facecolor=figure.get_facecolor())
+
+
+def main(argv=None):
+    """
+    Command-line entry point
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code (1 if the baseline couldn't be simulated)
+    """
+    parser = argparse.ArgumentParser(
+        prog="overclock --sensitivity",
+        description="Rank component parameters of a saved OVERCLOCK scenario by their effect on IRR and net revenue."
+    )
+    parser.add_argument('scenario', help="Scenario JSON file saved from OVERCLOCK")
+    parser.add_argument('-p', '--parameters', nargs='+', choices=list(SENSITIVITY_PARAMETERS),
+                        default=list(SENSITIVITY_PARAMETERS), help="Parameters to perturb (default: all)")
+    parser.add_argument('--percent', type=float, default=DEFAULT_PERCENT,
+                        help=f"Perturbation size in percent (default: {DEFAULT_PERCENT})")
+    parser.add_argument('-o', '--output', default='sensitivity_results', help="Output directory (default: sensitivity_results)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of worker processes (default: 1)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_RANDOM_SEED,
+                        help=f"Random seed for load profiles and generator outages (default: {DEFAULT_RANDOM_SEED})")
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if not 0 < args.percent < 100:
+        parser.error("--percent must be between 0 and 100")
+
+    with open(args.scenario, 'r') as f:
+        data = json.load(f)
+    try:
+        baseline, rows = run_sensitivity(data, args.parameters, args.percent, args.jobs, args.seed)
+    except ValueError as e:
+        print(f"FAILED {args.scenario}: {e}")
+        return 1
+
+    write_results(baseline, rows, args.percent, args.output)
+    for row in rows:
+        text = []
+        for key, label, scale, unit in TORNADO_METRICS:
+            low, high = row['deltas'][key]
+            text.append(f"{label} {low * scale:+,.2f}{unit} / {high * scale:+,.2f}{unit}")
+        print(f"{row['label']:<22}" + " | ".join(text))
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Weather-year ensemble runs for OVERCLOCK
+
+Runs a scenario once per historical weather year from the bundled 10-year
+solar and wind datasets instead of the single Powerlandia year, in parallel
+headless workers, and reports how generation, unserved energy and IRR spread
+across the years. Solar panels and wind turbines in "Powerlandia 8760-1" mode
+follow the weather year; custom profiles and everything else are unchanged,
+and every year uses the same random seed, so the years differ only in their
+weather.
+
+Usage:
+    python main.py --ensemble site.json --jobs 10 -o ensemble
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.simulation.engine import DEFAULT_RANDOM_SEED
+from src.simulation.headless import HOURS_PER_YEAR, run_scenario, _pool_context
+from src.simulation.year_runs import report_year, run_command_line
+from src.utils.resource import resource_path
+
+# Multi-year capacity factor files (hourly, one value per line)
+SOLAR_YEARS_FILE = "src/data/NRELMidwestSolar10Year.csv"
+WIND_YEARS_FILE = "src/data/WindNormal10Year.csv"
+
+# Operating mode that reads the bundled capacity factors
+WEATHER_MODE = "Powerlandia 8760-1"
+
+# Metrics reported per year: (key, label, display scale, unit)
+ENSEMBLE_METRICS = [
+    ('solar_generation_kwh', 'Solar generation', 1e-3, ' MWh'),
+    ('wind_generation_kwh', 'Wind generation', 1e-3, ' MWh'),
+    ('total_generation_kwh', 'Total generation', 1e-3, ' MWh'),
+    ('unserved_energy_kwh', 'Unserved energy', 1e-3, ' MWh'),
+    ('unstable_hours', 'Unstable hours', 1, ' h'),
+    ('net_revenue', 'Net revenue', 1e-6, ' $M'),
+    ('irr_12_month', 'IRR 12 Mo.', 100, '%'),
+    ('irr_36_month', 'IRR 36 Mo.', 100, '%'),
+]
+
+_weather_years = None
+
+
+def _load_hourly_file(relative_path):
+    """Read a one-value-per-line file (trailing commas allowed) into a NumPy array"""
+    csv_path = resource_path(relative_path)
+    with open(csv_path, 'r', encoding='utf-8-sig') as f:
+        return np.array(f.read().replace(',', ' ').split(), dtype=float)
+
+
+def load_weather_years():
+    """
+    Load the solar and wind capacity factors as 8760-hour weather years (once per process)
+
+    Only years both files cover completely are used.
+
+    Returns:
+        Dictionary with 'solar' and 'wind' arrays of shape (years, 8760); wind
+        values are on the same 0-10 scale as the single-year wind file
+    """
+    global _weather_years
+    if _weather_years is None:
+        solar = _load_hourly_file(SOLAR_YEARS_FILE)
+        wind = _load_hourly_file(WIND_YEARS_FILE)
+        years = min(len(solar), len(wind)) // HOURS_PER_YEAR
+        _weather_years = {
+            'solar': solar[:years * HOURS_PER_YEAR].reshape(years, HOURS_PER_YEAR),
+            'wind': wind[:years * HOURS_PER_YEAR].reshape(years, HOURS_PER_YEAR)
+        }
+    return _weather_years
+
+
+def weather_dependent(data):
+    """Check whether any solar panel or wind turbine in a scenario follows the bundled weather data"""
+    return any(
+        component.get('type') in ('SolarPanel', 'WindTurbine') and component.get('operating_mode') == WEATHER_MODE
+        for component in data.get('components', [])
+    )
+
+
+def apply_weather_year(components, year):
+    """
+    Point every weather-driven solar panel and wind turbine at one weather year
+
+    Args:
+        components: Live components of the scenario
+        year: Index of the weather year
+    """
+    # Imported here like the other component-specific code of the headless runner
+    from src.components.solar_panel import SolarPanelComponent
+    from src.components.wind_turbine import WindTurbineComponent
+
+    weather = load_weather_years()
+    for component in components:
+        if getattr(component, 'operating_mode', None) != WEATHER_MODE:
+            continue
+        if isinstance(component, SolarPanelComponent):
+            component.capacity_factors = weather['solar'][year].tolist()
+        elif isinstance(component, WindTurbineComponent):
+            component.capacity_factors = weather['wind'][year].tolist()
+
+
+def run_weather_year(data, year, seed=DEFAULT_RANDOM_SEED):
+    """
+    Simulate a scenario with one weather year (the unit of work for the worker processes)
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        year: Index of the weather year
+        seed: Random seed (the same for every year)
+
+    Returns:
+        Dictionary with the year, its metrics (KPIs plus solar, wind and total
+        generation) and an error message (None on success)
+    """
+    try:
+        result = run_scenario(data, seed, configure=lambda host: apply_weather_year(host.components, year))
+        historian = result['historian']
+        metrics = dict(result['kpis'])
+        metrics['solar_generation_kwh'] = float(sum(np.sum(values) for key, values in historian.items() if key.startswith('Solar_')))
+        metrics['wind_generation_kwh'] = float(sum(np.sum(values) for key, values in historian.items() if key.startswith('Wind_')))
+        metrics['total_generation_kwh'] = float(np.sum(historian['total_generation']))
+        return {'year': year, 'metrics': metrics, 'error': None}
+    except Exception as e:
+        return {'year': year, 'metrics': None, 'error': str(e)}
+
+
+def run_ensemble(data, jobs=1, seed=DEFAULT_RANDOM_SEED, years=None):
+    """
+    Run a scenario for every weather year, in parallel worker processes if jobs > 1
+
+    Args:
+        data: Scenario dictionary as written by save_scenario
+        jobs: Number of worker processes
+        seed: Random seed shared by all years
+        years: Year indexes to run (default: all)
+
+    Returns:
+        List of run_weather_year results, in year order
+
+    Raises:
+        ValueError: If no solar panel or wind turbine uses the bundled weather data
+    """
+    if not weather_dependent(data):
+        raise ValueError(f"No solar panel or wind turbine is in '{WEATHER_MODE}' mode, so the weather year has no effect")
+    if years is None:
+        years = range(len(load_weather_years()['solar']))
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(years)), mp_context=_pool_context()) as pool:
+            futures = [pool.submit(run_weather_year, data, year, seed) for year in years]
+            results = []
+            for future in futures:
+                results.append(future.result())
+                _report(results[-1])
+    else:
+        results = []
+        for year in years:
+            results.append(run_weather_year(data, year, seed))
+            _report(results[-1])
+    return results
+
+
+def _report(result):
+    """Print one line per finished weather year"""
+    report_year(f"Year {result['year'] + 1:>2}", result, ENSEMBLE_METRICS,
+                ('total_generation_kwh', 'unserved_energy_kwh', 'irr_36_month'))
+
+
+def main(argv=None):
+    """
+    Command-line entry point
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code (1 if the ensemble couldn't run or every year failed)
+    """
+    return run_command_line(
+        argv, prog="overclock --ensemble",
+        description="Run a saved OVERCLOCK scenario once per historical solar/wind weather year and report the spread.",
+        default_output='ensemble_results', run=run_ensemble, metrics=ENSEMBLE_METRICS,
+        spread_file='spread.json', noun="weather year", year_label=lambda year: year + 1
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Shared helpers for OVERCLOCK batch tools that rerun a scenario once per year
+
+The weather-year ensemble and the historical price back-test both simulate a
+scenario once per year of some input data, report every year as it finishes,
+summarize the spread of their metrics across the years and write the results
+as a per-year CSV plus a JSON file of spread statistics. The tools only supply
+what varies: how a year is run, the metrics and the output file names.
+
+Metrics are given as (key, label, display scale, unit) tuples.
+"""
+
+import argparse
+import csv
+import json
+import os
+import warnings
+
+import numpy as np
+
+from src.simulation.engine import DEFAULT_RANDOM_SEED
+
+# Spread statistics across years: (label, function of a years-by-metrics array)
+SPREAD_STATISTICS = [
+    ('min', lambda values: np.nanmin(values, axis=0)),
+    ('p10', lambda values: np.nanpercentile(values, 10, axis=0)),
+    ('median', lambda values: np.nanmedian(values, axis=0)),
+    ('mean', lambda values: np.nanmean(values, axis=0)),
+    ('p90', lambda values: np.nanpercentile(values, 90, axis=0)),
+    ('max', lambda values: np.nanmax(values, axis=0)),
+    ('std', lambda values: np.nanstd(values, axis=0)),
+]
+
+# Name of the per-year results file
+YEARS_FILE = 'years.csv'
+
+
+def summarize(results, metrics):
+    """
+    Compute the spread of every metric across the years
+
+    Args:
+        results: Successful run results, each with a 'metrics' dictionary
+        metrics: Metrics to summarize, as (key, label, scale, unit)
+
+    Returns:
+        Dictionary of statistic name -> {metric key: value}
+    """
+    values = np.array([
+        [np.nan if result['metrics'].get(key) is None else result['metrics'][key] for key, _, _, _ in metrics]
+        for result in results
+    ], dtype=float)
+    spread = {}
+    for name, statistic in SPREAD_STATISTICS:
+        # All-NaN columns (e.g. an IRR no year can calculate) stay NaN without a warning
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            row = statistic(values)
+        spread[name] = {key: float(value) for (key, _, _, _), value in zip(metrics, row)}
+    return spread
+
+
+def format_metric(value, scale, unit):
+    """Format a metric for the console tables ('--' if it's undefined)"""
+    if value is None or np.isnan(value):
+        return '--'
+    return f"{value * scale:,.1f}{unit}"
+
+
+def report_year(name, result, metrics, keys):
+    """
+    Print one line for a finished year
+
+    Args:
+        name: How the year is shown (e.g. "Year  3" or "2015")
+        result: The year's run result with 'metrics' and 'error'
+        metrics: Metric definitions, as (key, label, scale, unit)
+        keys: Keys of the metrics to show
+    """
+    if result['error']:
+        print(f"FAILED {name}: {result['error']}")
+        return
+    print(f"{name}: " + " | ".join(
+        f"{label} {format_metric(result['metrics'].get(key), scale, unit)}"
+        for key, label, scale, unit in metrics if key in keys
+    ))
+
+
+def write_results(results, spread, output_dir, metrics, spread_file, year_label=lambda year: year):
+    """
+    Write the per-year metrics (years.csv) and their spread
+
+    Args:
+        results: Run results with 'year', 'metrics' and 'error'
+        spread: summarize result
+        output_dir: Output directory (created if needed)
+        metrics: Metrics written first, as (key, label, scale, unit); any other metric follows
+        spread_file: Name of the JSON file for the spread
+        year_label: Turns a result's year into the value of the year column
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    keys = [key for key, _, _, _ in metrics]
+    extra = []
+    for result in results:
+        if result['metrics']:
+            extra = [key for key in result['metrics'] if key not in keys]
+            break
+    with open(os.path.join(output_dir, YEARS_FILE), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['year', 'error'] + keys + extra)
+        for result in results:
+            values = result['metrics'] or {}
+            writer.writerow([year_label(result['year']), result['error'] or ''] + [values.get(key, '') for key in keys + extra])
+
+    with open(os.path.join(output_dir, spread_file), 'w') as f:
+        json.dump(spread, f, indent=2)
+
+
+def print_spread(spread, metrics):
+    """Print the spread statistics as a metrics-by-statistics table"""
+    print(f"\n{'':<18}" + "".join(f"{name:>15}" for name, _ in SPREAD_STATISTICS))
+    for key, label, scale, unit in metrics:
+        print(f"{label:<18}" + "".join(f"{format_metric(spread[name][key], scale, unit):>15}" for name, _ in SPREAD_STATISTICS))
+
+
+def run_command_line(argv, prog, description, default_output, run, metrics, spread_file, noun, year_label=lambda year: year):
+    """
+    Command-line entry point shared by the per-year tools
+
+    Args:
+        argv: Arguments without the program name (None: sys.argv[1:])
+        prog: Program name shown in the help
+        description: Help description
+        default_output: Default output directory
+        run: Function (data, jobs, seed) returning the per-year results; raises ValueError if the scenario can't be run
+        metrics: Metrics to summarize, as (key, label, scale, unit)
+        spread_file: Name of the JSON file for the spread
+        noun: What a year is called in the messages (e.g. "weather year")
+        year_label: Turns a result's year into the value of the year column
+
+    Returns:
+        int: Exit code (1 if the tool couldn't run or every year failed)
+    """
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument('scenario', help="Scenario JSON file saved from OVERCLOCK")
+    parser.add_argument('-o', '--output', default=default_output, help=f"Output directory (default: {default_output})")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of worker processes (default: 1)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_RANDOM_SEED,
+                        help=f"Random seed for load profiles and generator outages (default: {DEFAULT_RANDOM_SEED})")
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    with open(args.scenario, 'r') as f:
+        data = json.load(f)
+    try:
+        results = run(data, args.jobs, args.seed)
+    except ValueError as e:
+        print(f"FAILED {args.scenario}: {e}")
+        return 1
+
+    successful = [result for result in results if not result['error']]
+    if not successful:
+        print(f"Every {noun} failed")
+        return 1
+    spread = summarize(successful, metrics)
+    write_results(results, spread, args.output, metrics, spread_file, year_label)
+
+    print_spread(spread, metrics)
+    print(f"{len(successful)}/{len(results)} {noun}s completed. Results written to {args.output}")
+    return 0
@@ -1,9 +1,6 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLabel, 
                             QProgressBar, QGroupBox, QHBoxLayout)
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.patheffects as path_effects
-import matplotlib.ticker as ticker
+from .time_series_chart import TimeSeriesChart
 
 class AnalyticsPanel(QWidget):
     def __init__(self, parent=None):
@@ -18,20 +15,18 @@ class AnalyticsPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)  # Remove spacing between main elements
         
-        # Create matplotlib figure and canvas for time series
+        # Create native chart for the power time series
         chart_group = QGroupBox()
         chart_group.setStyleSheet("QGroupBox { background-color: #0A0E22; border: 0px solid #29304D; border-radius: 5px; }")
         chart_layout = QVBoxLayout()
         chart_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create figure with adjusted size and margins for power chart
-        self.figure = plt.figure(figsize=(6, 4))
-        self.figure.patch.set_facecolor('#0A0E22')  # Dark navy-blue background
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor('#0A0E22')  # Low-glow twilight tone for plot area
-        # Adjust subplot parameters to give specified padding
-        self.figure.subplots_adjust(left=0.15, right=0.98, bottom=0.12, top=0.97)
-        self.canvas = FigureCanvas(self.figure)
+        # Margins match the previous figure padding (left, right, bottom, top)
+        self.chart = TimeSeriesChart(x_label='Time Step (hour)', y_label='Power (MW)', margins=(0.15, 0.02, 0.12, 0.03))
+        self.chart.show_zero_line = True  # Zero line for surplus/deficit reference
+        
+        # Format y-axis ticks to show values in MW with one significant figure
+        self.chart.set_y_formatter(lambda x: f"{x/1000:.1f}")
         
         # Initialize empty data lists
         self.time_data = []
@@ -43,62 +38,21 @@ class AnalyticsPanel(QWidget):
         self.surplus_data = []
         self.unused_capacity_data = []
         
-        # Set up the plot
-        self.ax.set_xlabel('Time Step (hour)', color='#B5BEDF')
-        self.ax.set_ylabel('Power (MW)', color='#B5BEDF')
-        self.ax.tick_params(colors='#B5BEDF')  # Soft powdery blue-lavender for tick labels
-        self.ax.grid(True, color='#2A334F', linestyle='-')  # Major gridlines
-        self.ax.grid(True, which='minor', color='#2A334F', linestyle='--', alpha=0.5)  # Minor gridlines
-        
-        # Set spines (borders) color
-        for spine in self.ax.spines.values():
-            spine.set_color('#29304D')
-        
-        # Create empty lines with labels - matching progress bar colors
-        self.generation_line, = self.ax.plot([], [], '-', color='#66BB6A', linewidth=2, label='Generation', alpha=0.9,
-                                            path_effects=[path_effects.SimpleLineShadow(shadow_color='#66BB6A', alpha=0.2, offset=(0,0), linewidth=7),
-                                                        path_effects.Normal()])
-                                                        
-        self.battery_line, = self.ax.plot([], [], '-', color='#42A5F5', linewidth=2, label='Batteries', alpha=0.9,
-                                         path_effects=[path_effects.SimpleLineShadow(shadow_color='#42A5F5', alpha=0.2, offset=(0,0), linewidth=7),
-                                                     path_effects.Normal()])  # Blue for battery
-                                                     
-        self.grid_line, = self.ax.plot([], [], '-', color='#AB47BC', linewidth=2, label='Import', alpha=0.9,
-                                      path_effects=[path_effects.SimpleLineShadow(shadow_color='#AB47BC', alpha=0.2, offset=(0,0), linewidth=7),
-                                                  path_effects.Normal()])
-                                                  
-        self.grid_export_line, = self.ax.plot([], [], '-', color='#FF7043', linewidth=2, label='Export', alpha=0.9,
-                                             path_effects=[path_effects.SimpleLineShadow(shadow_color='#FFCA28', alpha=0.2, offset=(0,0), linewidth=7),
-                                                         path_effects.Normal()])
-                                                         
-        self.load_line, = self.ax.plot([], [], '-', color='#FFCA28', linewidth=2, label='Load', alpha=0.9,
-                                      path_effects=[path_effects.SimpleLineShadow(shadow_color='#FF7043', alpha=0.2, offset=(0,0), linewidth=7),
-                                                  path_effects.Normal()])
-                                                  
-        self.surplus_line, = self.ax.plot([], [], ':', color='#BA68C8', linewidth=2, label='Instability', alpha=0.9,
-                                         path_effects=[path_effects.SimpleLineShadow(shadow_color='#BA68C8', alpha=0.2, offset=(0,0), linewidth=7),
-                                                     path_effects.Normal()])
-                                                     
-        self.unused_capacity_line, = self.ax.plot([], [], ':', color='#7986CB', linewidth=2, label='Capacity', alpha=0.7,
-                                                 path_effects=[path_effects.SimpleLineShadow(shadow_color='#7986CB', alpha=0.2, offset=(0,0), linewidth=7),
-                                                             path_effects.Normal()])
-        
-        # Update legend with dark mode styling
-        legend = self.ax.legend(framealpha=0.8)
-        legend.get_frame().set_facecolor('#1C223F')  # Secondary background
-        for text in legend.get_texts():
-            text.set_color('#E1E6F9')  # Legend text font color
-            text.set_fontsize(9)  # Reduce font size for legend text
-        
-        # Add zero line for surplus/deficit reference
-        self.ax.axhline(y=0, color='#29304D', linestyle='-', alpha=0.7)
+        # Create empty series with labels - matching progress bar colors
+        self.chart.add_series('generation', 'Generation', '#66BB6A')
+        self.chart.add_series('battery', 'Batteries', '#42A5F5')  # Blue for battery
+        self.chart.add_series('grid_import', 'Import', '#AB47BC')
+        self.chart.add_series('grid_export', 'Export', '#FF7043')
+        self.chart.add_series('load', 'Load', '#FFCA28')
+        self.chart.add_series('surplus', 'Instability', '#BA68C8', style='dot')
+        self.chart.add_series('unused_capacity', 'Capacity', '#7986CB', style='dot')
         
         # Set initial view limits (modified for 8760-hour view)
-        self.ax.set_xlim(0, 168)  # Show first 168 hours by default
-        self.ax.set_ylim(-1000, 1000)
+        self.chart.set_x_range(0, 168)  # Show first 168 hours by default
+        self.chart.set_y_range(-1000, 1000)
         
-        # Add matplotlib canvas to layout
-        chart_layout.addWidget(self.canvas)
+        # Add chart to layout
+        chart_layout.addWidget(self.chart)
         
         chart_group.setLayout(chart_layout)
         layout.addWidget(chart_group)
@@ -355,56 +309,24 @@ class AnalyticsPanel(QWidget):
         revenue_layout = QVBoxLayout()
         revenue_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create figure with adjusted size and margins for revenue chart
-        self.revenue_figure = plt.figure(figsize=(6, 3))
-        self.revenue_figure.patch.set_facecolor('#0A0E22')  # Dark navy-blue background
-        self.revenue_ax = self.revenue_figure.add_subplot(111)
-        self.revenue_ax.set_facecolor('#0A0E22')  # Low-glow twilight tone for plot area
-        # Adjust subplot parameters to give specified padding
-        self.revenue_figure.subplots_adjust(left=0.15, right=0.98, bottom=0.18, top=0.95)
-        self.revenue_canvas = FigureCanvas(self.revenue_figure)
+        # Create native chart for cumulative revenue and cost
+        self.revenue_chart = TimeSeriesChart(x_label='Time Step (hour)', y_label='Amount ($)', margins=(0.15, 0.02, 0.18, 0.05))
         
         # Initialize revenue and cost data
         self.gross_revenue_data = [0.0] * 8761  # Initialize with 0s (hours 0-8760)
         self.gross_cost_data = [0.0] * 8761  # Initialize with 0s (hours 0-8760)
         
-        # Set up the plot
-        self.revenue_ax.set_xlabel('Time Step (hour)', color='#B5BEDF')
-        self.revenue_ax.set_ylabel('Amount ($)', color='#B5BEDF')
-        self.revenue_ax.tick_params(colors='#B5BEDF')  # Soft powdery blue-lavender for tick labels
-        self.revenue_ax.grid(True, color='#2A334F', linestyle='-')  # Major gridlines
-        self.revenue_ax.grid(True, which='minor', color='#2A334F', linestyle='--', alpha=0.5)  # Minor gridlines
-        
-        # Set spines (borders) color
-        for spine in self.revenue_ax.spines.values():
-            spine.set_color('#29304D')
-        
-        # Remove scientific notation from top of axis
-        self.revenue_ax.ticklabel_format(useOffset=False)
-        
-        # Create empty line for gross revenue
-        self.gross_revenue_line, = self.revenue_ax.plot([], [], '-', color='#4FC3F7', linewidth=2, label='Revenue', alpha=0.9,
-                                                      path_effects=[path_effects.SimpleLineShadow(shadow_color='#4FC3F7', alpha=0.2, offset=(0,0), linewidth=7),
-                                                                  path_effects.Normal()])
-        
-        # Create empty line for gross cost
-        self.gross_cost_line, = self.revenue_ax.plot([], [], '-', color='#D32F2F', linewidth=2, label='OpEx', alpha=0.9,
-                                                   path_effects=[path_effects.SimpleLineShadow(shadow_color='#D32F2F', alpha=0.2, offset=(0,0), linewidth=7),
-                                                               path_effects.Normal()])
-        
-        # Update legend with dark mode styling
-        revenue_legend = self.revenue_ax.legend(framealpha=0.8)
-        revenue_legend.get_frame().set_facecolor('#1C223F')  # Secondary background
-        for text in revenue_legend.get_texts():
-            text.set_color('#E1E6F9')  # Legend text font color
-            text.set_fontsize(9)  # Reduce font size for legend text
+        # Create empty series for gross revenue and cost
+        self.revenue_chart.add_series('revenue', 'Revenue', '#4FC3F7')
+        self.revenue_chart.add_series('cost', 'OpEx', '#D32F2F')
         
         # Set fixed horizontal scale for all 8760 hours
-        self.revenue_ax.set_xlim(0, 8760)
-        self.revenue_ax.set_ylim(0, 100)  # Initial y scale, will auto-adjust
+        self.revenue_chart.set_x_range(0, 8760)
+        self.revenue_chart.set_y_range(0, 100)  # Initial y scale, will auto-adjust
+        self.update_revenue_axis_formatting(100)
         
-        # Add matplotlib canvas to layout
-        revenue_layout.addWidget(self.revenue_canvas)
+        # Add chart to layout
+        revenue_layout.addWidget(self.revenue_chart)
         
         revenue_group.setLayout(revenue_layout)
         layout.addWidget(revenue_group)
@@ -636,19 +558,19 @@ class AnalyticsPanel(QWidget):
             self.unused_capacity_data = [self.unused_capacity_data[i] for i in sorted_indices]
         
         # Update line data
-        self.generation_line.set_data(self.time_data, self.generation_data)
-        self.battery_line.set_data(self.time_data, self.battery_data)
-        self.grid_line.set_data(self.time_data, self.grid_import_data)
-        self.grid_export_line.set_data(self.time_data, self.grid_export_data)
-        self.load_line.set_data(self.time_data, self.load_data)
-        self.surplus_line.set_data(self.time_data, self.surplus_data)
-        self.unused_capacity_line.set_data(self.time_data, self.unused_capacity_data)
+        self.chart.set_series_data('generation', self.time_data, self.generation_data)
+        self.chart.set_series_data('battery', self.time_data, self.battery_data)
+        self.chart.set_series_data('grid_import', self.time_data, self.grid_import_data)
+        self.chart.set_series_data('grid_export', self.time_data, self.grid_export_data)
+        self.chart.set_series_data('load', self.time_data, self.load_data)
+        self.chart.set_series_data('surplus', self.time_data, self.surplus_data)
+        self.chart.set_series_data('unused_capacity', self.time_data, self.unused_capacity_data)
         
         # Update view limits if needed
         if self.time_data:
             # Show last 168 hours (1 week) or less if not enough data
             window_size = 168
-            self.ax.set_xlim(max(0, current_time - window_size), max(168, current_time + 1))
+            self.chart.set_x_range(max(0, current_time - window_size), max(168, current_time + 1))
             max_val = max(
                 max(self.generation_data) if self.generation_data else 0,
                 max(self.grid_import_data) if self.grid_import_data else 0,
@@ -658,14 +580,7 @@ class AnalyticsPanel(QWidget):
                 1000
             )
             min_val = min(min(self.surplus_data) if self.surplus_data else 0, -1000)
-            self.ax.set_ylim(min_val * 1.1, max_val * 1.1)
-            
-            # Format y-axis ticks to show values in MW with one significant figure
-            def format_mw(x, pos):
-                # Convert kW to MW and format with one significant figure
-                return f"{x/1000:.1f}"
-            
-            self.ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_mw))
+            self.chart.set_y_range(min_val * 1.1, max_val * 1.1)
         
         # Update the revenue chart if gross_revenue_data is provided
         if gross_revenue_data is not None:
@@ -686,7 +601,7 @@ class AnalyticsPanel(QWidget):
                 cumulative_revenue.append(total)
             
             # Update line data with cumulative revenue instead of hourly revenue
-            self.gross_revenue_line.set_data(x_values, cumulative_revenue)
+            self.revenue_chart.set_series_data('revenue', x_values, cumulative_revenue)
             
             # Update the cost chart if gross_cost_data is provided
             if gross_cost_data is not None:
@@ -703,7 +618,7 @@ class AnalyticsPanel(QWidget):
                     cumulative_cost.append(total_cost)
                 
                 # Update line data with cumulative cost
-                self.gross_cost_line.set_data(x_values, cumulative_cost)
+                self.revenue_chart.set_series_data('cost', x_values, cumulative_cost)
                 
                 # Auto-adjust y scale based on maximum of cumulative values
                 max_revenue = max(cumulative_revenue) if cumulative_revenue else 100
@@ -711,28 +626,20 @@ class AnalyticsPanel(QWidget):
                 y_max = max(max_revenue, max_cost)
                 
                 if y_max > 0:
-                    self.revenue_ax.set_ylim(0, y_max * 1.1)  # 10% headroom
+                    self.revenue_chart.set_y_range(0, y_max * 1.1)  # 10% headroom
                     self.update_revenue_axis_formatting(y_max * 1.1)
             else:
                 # Auto-adjust y scale based on cumulative revenue only
                 max_revenue = max(cumulative_revenue) if cumulative_revenue else 100
                 if max_revenue > 0:
-                    self.revenue_ax.set_ylim(0, max_revenue * 1.1)  # 10% headroom
+                    self.revenue_chart.set_y_range(0, max_revenue * 1.1)  # 10% headroom
                     self.update_revenue_axis_formatting(max_revenue * 1.1)
             
-            # Draw the revenue canvas
-            try:
-                self.is_drawing = True
-                self.revenue_canvas.draw()
-            finally:
-                self.is_drawing = False
-        
-        # Draw the canvas with protection against recursion
-        try:
-            self.is_drawing = True
-            self.canvas.draw()
-        finally:
-            self.is_drawing = False
+            # Schedule a repaint of the revenue chart
+            self.revenue_chart.update()
+        
+        # Schedule a repaint of the power chart (painted on the next event loop pass)
+        self.chart.update()
     
     def clear_chart_history(self):
         # Protect against re-entrance
@@ -784,40 +691,22 @@ class AnalyticsPanel(QWidget):
         self.gross_revenue_data = [0.0] * 8761
         self.gross_cost_data = [0.0] * 8761
         
-        # Clear plot lines
-        self.generation_line.set_data([], [])
-        self.battery_line.set_data([], [])
-        self.grid_line.set_data([], [])
-        self.grid_export_line.set_data([], [])
-        self.load_line.set_data([], [])
-        self.surplus_line.set_data([], [])
-        self.unused_capacity_line.set_data([], [])
-        self.gross_revenue_line.set_data([], [])
-        self.gross_cost_line.set_data([], [])
+        # Clear chart series
+        self.chart.clear()
+        self.revenue_chart.clear()
         
         # Reset view limits (adjusted for 8760-hour scale)
-        self.ax.set_xlim(0, 168)  # Show first week (168 hours)
-        self.ax.set_ylim(-1000, 1000)
-        self.revenue_ax.set_xlim(0, 8760)  # Show full year
-        self.revenue_ax.set_ylim(0, 100)
+        self.chart.set_x_range(0, 168)  # Show first week (168 hours)
+        self.chart.set_y_range(-1000, 1000)
+        self.revenue_chart.set_x_range(0, 8760)  # Show full year
+        self.revenue_chart.set_y_range(0, 100)
         
         # Reset the revenue axis formatting
         self.update_revenue_axis_formatting(100)
         
-        # Apply dark mode styling to spine lines
-        for spine in self.ax.spines.values():
-            spine.set_color('#29304D')
-        
-        for spine in self.revenue_ax.spines.values():
-            spine.set_color('#29304D')
-        
-        # Redraw canvas with protection
-        try:
-            self.is_drawing = True
-            self.canvas.draw()
-            self.revenue_canvas.draw()
-        finally:
-            self.is_drawing = False
+        # Repaint both charts
+        self.chart.update()
+        self.revenue_chart.update()
     
     def update_revenue_axis_formatting(self, max_value):
         """
@@ -826,34 +715,31 @@ class AnalyticsPanel(QWidget):
         Args:
             max_value: The maximum value on the revenue axis
         """
-        # Remove the current formatter if it exists
-        self.revenue_ax.yaxis.set_major_formatter(ticker.ScalarFormatter())
-        
         if max_value >= 1_000_000_000:  # Greater than $1B
             # Format in millions with commas
-            def format_func(x, pos):
+            def format_func(x):
                 # Convert to millions and add commas
                 x_in_millions = x / 1_000_000
                 if x_in_millions >= 1000:
                     return f"{x_in_millions:,.0f}"
                 return f"{x_in_millions:.1f}"
             
-            self.revenue_ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_func))
-            self.revenue_ax.set_ylabel('Amount ($1,000,000s)', color='#B5BEDF')
+            self.revenue_chart.set_y_formatter(format_func, tier='billions')
+            self.revenue_chart.set_y_label('Amount ($1,000,000s)')
             
         elif max_value >= 1_000_000:  # Greater than $1M
             # Format in millions
-            def format_func(x, pos):
+            def format_func(x):
                 return f"{x/1_000_000:.1f}"
             
-            self.revenue_ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_func))
-            self.revenue_ax.set_ylabel('Amount ($1,000,000s)', color='#B5BEDF')
+            self.revenue_chart.set_y_formatter(format_func, tier='millions')
+            self.revenue_chart.set_y_label('Amount ($1,000,000s)')
             
         else:  # Less than $1M
             # Format in thousands
-            def format_func(x, pos):
+            def format_func(x):
                 return f"{x/1_000:.1f}"
             
-            self.revenue_ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_func))
-            self.revenue_ax.set_ylabel('Amount ($ 1,000s)', color='#B5BEDF')
+            self.revenue_chart.set_y_formatter(format_func, tier='thousands')
+            self.revenue_chart.set_y_label('Amount ($ 1,000s)')
         
\ No newline at end of file
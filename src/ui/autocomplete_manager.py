@@ -11,6 +11,8 @@ This code was extracted from the main_window.py file to improve modularity witho
 from PyQt6.QtCore import QTimer, Qt
 from src.utils.irr_calculator import calculate_irr, calculate_extended_irr
 from src.ui.terminal_widget import TerminalWidget
+from src.ui.frame_clock import FrameClock
+from src.simulation.result_cache import ResultCache, scenario_fingerprint
 
 class AutocompleteManager:
     """
@@ -24,6 +26,8 @@ class AutocompleteManager:
         self.is_autocompleting = False
         self.autocomplete_timer = None
         self.autocomplete_end_time = 0
+        self.cache_key = None  # Fingerprint of the scenario being autocompleted
+        self.cache_components = []  # Its components in the order the cached state uses
         
     def run_autocomplete(self):
         """Run the simulation from the current time to the end asynchronously"""
@@ -38,7 +42,8 @@ class AutocompleteManager:
         
         # Check network connectivity first
         if not self.main_window.check_network_connectivity():
-            TerminalWidget.log("ERROR: All components must be connected in a single network to run the simulation. Please ensure all components are connected before starting.")
+            TerminalWidget.log("ERROR: All components must be connected to the network to run the simulation. Please ensure every component is connected before starting.")
+            self.main_window.highlight_unconnected_components()
             # Trigger error flash if the central widget has that capability
             if hasattr(self.main_window, 'centralWidget') and hasattr(self.main_window.centralWidget(), 'trigger_error_flash'):
                 self.main_window.centralWidget().trigger_error_flash()
@@ -61,11 +66,19 @@ class AutocompleteManager:
         # If already at the end, do nothing
         if start_time >= self.autocomplete_end_time:
             return
+        
+        # Every run of a scenario starts from the same random state, so an
+        # unchanged scenario gives the same year and its cached run can be shown
+        self.main_window.simulation_engine.seed_random_state()
+        if self.restore_cached_run():
+            return
             
         TerminalWidget.log("Autocompleting...")
         self.is_autocompleting = True
         # Ensure main window has same autocomplete state
         self.main_window.is_autocompleting = True
+        # Throttle decorative animations while the simulation runs flat out
+        FrameClock.instance().set_busy('autocomplete', True)
         
         # Update bordered widget to use solid border during autocomplete
         if hasattr(self.main_window, 'centralWidget') and hasattr(self.main_window.centralWidget(), 'set_autocomplete_state'):
@@ -126,6 +139,7 @@ class AutocompleteManager:
             self.is_autocompleting = False
             # Ensure main window also has autocomplete flag set to false
             self.main_window.is_autocompleting = False
+            FrameClock.instance().set_busy('autocomplete', False)
             
             # Restore normal border animation
             if hasattr(self.main_window, 'centralWidget') and hasattr(self.main_window.centralWidget(), 'set_autocomplete_state'):
@@ -135,15 +149,14 @@ class AutocompleteManager:
             if hasattr(self.main_window, 'properties_manager'):
                 self.main_window.properties_manager.update_delete_button_state()
             
-            # Perform one final update to refresh UI elements and charts
-            # This call will not skip UI updates
-            self.main_window.simulation_engine.update_simulation()
-            # Explicitly update historian chart if needed
-            if not self.main_window.is_model_view:
-                self.main_window.historian_manager.update_chart()
+            # Keep the finished year so reopening or re-running the scenario is instant
+            if self.cache_key is not None:
+                ResultCache.instance().put(
+                    self.cache_key,
+                    self.main_window.simulation_engine.capture_run_state(self.cache_components)
+                )
             
-            # Calculate and display IRR
-            self._update_irr_display()
+            self._finish_run()
             
             # Define original styles for buttons with hover and pressed states
             play_btn_style = """
@@ -204,6 +217,54 @@ class AutocompleteManager:
                 self.main_window.disable_component_buttons(False)
             
             TerminalWidget.log("Autocomplete finished")
+            self._log_run_metrics()
+    
+    def restore_cached_run(self):
+        """
+        Show the cached result of the current scenario instead of simulating it.
+        Used by autocomplete and after loading a scenario.
+        
+        Returns:
+            bool: True if a cached run was found and restored
+        """
+        engine = self.main_window.simulation_engine
+        self.cache_key, self.cache_components = scenario_fingerprint(
+            self.main_window.components, self.main_window.connections, engine.random_seed
+        )
+        state = ResultCache.instance().get(self.cache_key)
+        if state is None:
+            return False
+        
+        # Restore the run as it was just before its final update, then finish it the same way
+        engine.restore_run_state(state, self.cache_components)
+        self.main_window.is_resetting = True
+        self.main_window.time_slider.setValue(engine.current_time_step)
+        self.main_window.is_resetting = False
+        self._finish_run()
+        
+        TerminalWidget.log("Restored cached results for this scenario")
+        self._log_run_metrics()
+        return True
+    
+    def _finish_run(self):
+        """Final update at the end time, then refresh the historian and IRR display"""
+        # Perform one final update to refresh UI elements and charts
+        # This call will not skip UI updates
+        self.main_window.simulation_engine.update_simulation()
+        # Precompute rollups, statistics and run metrics so historian views are instant
+        self.main_window.historian_manager.precompute_rollups()
+        # Explicitly update historian chart if needed
+        if not self.main_window.is_model_view:
+            self.main_window.historian_manager.update_chart()
+        
+        # Calculate and display IRR
+        self._update_irr_display()
+    
+    def _log_run_metrics(self):
+        """Report headline run metrics from the historian"""
+        metrics = self.main_window.historian_manager.get_run_metrics()
+        if metrics is not None:
+            TerminalWidget.log(f"Unstable hours: {metrics['instability_hours']:,} | Peak import: {metrics['peak_import'] / 1000:,.2f} MW")
             
     def _get_irr_color(self, irr_value):
         """
@@ -329,6 +390,7 @@ class AutocompleteManager:
             self.is_autocompleting = False
             # Ensure main window also has autocomplete flag set to false
             self.main_window.is_autocompleting = False
+            FrameClock.instance().set_busy('autocomplete', False)
             
             # Restore normal border animation
             if hasattr(self.main_window, 'centralWidget') and hasattr(self.main_window.centralWidget(), 'set_autocomplete_state'):
@@ -413,6 +475,7 @@ class AutocompleteManager:
         
         # Reset state
         self.is_autocompleting = False
+        FrameClock.instance().set_busy('autocomplete', False)
         self.autocomplete_end_time = 0
         
         # Clear any referenced objects
@@ -1,7 +1,8 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer, QRectF
+from PyQt6.QtCore import Qt, QRectF
 from PyQt6.QtGui import QPainter, QColor, QPainterPath, QLinearGradient, QBrush, QPen
 import math
+from ..frame_clock import FrameClock
 
 
 class AnimatedGradientContainer(QWidget):
@@ -23,10 +24,13 @@ class AnimatedGradientContainer(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.setAutoFillBackground(False)
 
-        # Repaint periodically to follow the main widget's animation_offset
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.update)
-        self._timer.start(50)
+        # Repaint periodically (on the shared frame clock) to follow the main widget's animation_offset
+        FrameClock.instance().subscribe(self._animate, 50)
+
+    def _animate(self, frame_scale=1.0):
+        """Repaint on each frame clock tick while visible"""
+        if self.isVisible():
+            self.update()
 
     def _get_bordered_widget(self):
         # Walk up to the top-level window and access its central widget
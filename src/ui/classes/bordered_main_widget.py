@@ -3,6 +3,8 @@ from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QRectF, QTimer
 from PyQt6.QtGui import QPainter, QColor, QPainterPath, QLinearGradient
 from ..terminal_widget import TerminalWidget
+from ..frame_clock import FrameClock
+from src.components.base import ComponentBase
 import math
 import random
 
@@ -31,10 +33,8 @@ class BorderedMainWidget(QWidget):
         self.border_width = 4
         self.corner_radius = 4
         
-        # Set up animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(50)  # Update every 50ms
+        # Drive the border animation from the shared frame clock
+        FrameClock.instance().subscribe(self.animate, 50)  # Update every 50ms
         
         # Make the widget's border transparent to mouse events
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
@@ -124,11 +124,11 @@ class BorderedMainWidget(QWidget):
         # Track the startup flash sequence
         self.is_startup_flash = False
         
-    def animate(self):
+    def animate(self, frame_scale=1.0):
         """Update animation and trigger redraw"""
         # Only animate if not in autocomplete mode
         if not self.is_autocompleting:
-            self.animation_offset = (self.animation_offset + self.animation_speed) % 100
+            self.animation_offset = (self.animation_offset + self.animation_speed * frame_scale) % 100
             self.update()
             
             # Update all component jewels in the scene
@@ -142,10 +142,11 @@ class BorderedMainWidget(QWidget):
             
         main_window = self.parent()
         if hasattr(main_window, 'scene') and main_window.scene:
-            # Force update on all components in the scene
+            # Repaint only the jewels drawn by the last paint (decorative components have
+            # one too) - components too small on screen or with the jewel off are left alone
             for item in main_window.scene.items():
-                if hasattr(item, 'jewel_active') and item.jewel_active:
-                    item.update()
+                if isinstance(item, ComponentBase) and item.shows_jewel():
+                    item.update_jewel()
         
     def set_autocomplete_state(self, is_autocompleting):
         """
@@ -1,7 +1,8 @@
 # TODO_PYQT6: verify width()/isType() semantics
 from PyQt6.QtWidgets import QGraphicsTextItem
-from PyQt6.QtCore import Qt, QTimer, QRect, QRectF
+from PyQt6.QtCore import Qt, QRect, QRectF
 from PyQt6.QtGui import QPainter, QPen, QColor, QPainterPath, QLinearGradient, QFontMetrics
+from ..frame_clock import FrameClock
 
 class GradientBorderText(QGraphicsTextItem):
     """A text item with animated gradient border for welcome screen"""
@@ -31,18 +32,22 @@ class GradientBorderText(QGraphicsTextItem):
         # Initialize background image
         self.bg_image = None
         
-        # Set up animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(50)  # Update every 50ms
+        # Drive the border animation from the shared frame clock
+        FrameClock.instance().subscribe(self.animate, 50)  # Update every 50ms
         
         # Set clear background
         self.setDefaultTextColor(QColor(38, 38, 38, 255))
     
-    def animate(self):
+    def animate(self, frame_scale=1.0):
         """Update animation and trigger redraw"""
-        self.animation_offset = (self.animation_offset + self.animation_speed) % 100
-        self.update()
+        # Stop animating once the text has been removed from the scene
+        if self.scene() is None:
+            FrameClock.instance().unsubscribe(self.animate)
+            return
+        
+        self.animation_offset = (self.animation_offset + self.animation_speed * frame_scale) % 100
+        if self.isVisible():
+            self.update()
     
     def paint(self, painter, option, widget=None):
         """Paint the text with animated rainbow border following the letter contours"""
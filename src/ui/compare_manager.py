@@ -0,0 +1,81 @@
+"""
+CompareManager module for OVERCLOCK
+
+This module provides the CompareManager class, which runs two or more saved scenario files side by side.
+The scenarios are simulated concurrently in worker processes by the headless runner, so the UI stays
+responsive, and the finished runs are handed to the HistorianManager's compare view.
+"""
+
+from src.ui.terminal_widget import TerminalWidget
+from src.ui.worker_pool_manager import WorkerPoolManager
+from src.ui.dialog_styles import get_open_file_names
+from src.simulation.headless import run_scenario_for_comparison
+
+
+class CompareManager(WorkerPoolManager):
+    """
+    Manages scenario comparison runs.
+    This class starts the worker processes, collects their results without blocking the UI and shows them in the historian.
+    """
+
+    busy_reason = 'compare'
+
+    def run_compare(self):
+        """Ask for two or more scenario files and compare them"""
+        if self.is_running():
+            TerminalWidget.log("A comparison is already running")
+            return
+
+        filenames, _ = get_open_file_names(self.main_window, "Compare Scenarios", "JSON Files (*.json)")
+        if not filenames:
+            return
+        if len(filenames) < 2:
+            TerminalWidget.log("ERROR: Select at least two scenario files to compare.")
+            return
+
+        self.start_compare(filenames)
+
+    def start_compare(self, filenames):
+        """
+        Simulate scenario files in worker processes
+
+        Args:
+            filenames: Scenario JSON files; the first one is the baseline the others are compared to
+        """
+        jobs = self.start_pool(len(filenames))
+        seed = self.main_window.simulation_engine.random_seed
+        self.futures = [self.executor.submit(run_scenario_for_comparison, filename, seed) for filename in filenames]
+
+        TerminalWidget.log(f"Comparing {len(filenames)} scenarios on {jobs} workers...")
+
+        self.start_polling()
+
+    def workers_finished(self):
+        """Collect the finished runs and show the comparison"""
+        results = []
+        for future in self.futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # A worker process died (e.g. out of memory)
+                results.append({'scenario': '', 'name': '', 'historian': None, 'kpis': None, 'error': str(e)})
+        self._shutdown_executor()
+
+        runs = []
+        for result in results:
+            if result['error']:
+                TerminalWidget.log(f"ERROR: {result['name'] or 'Scenario'} failed: {result['error']}")
+            else:
+                runs.append(result)
+
+        if len(runs) < 2:
+            TerminalWidget.log("ERROR: At least two scenarios must finish to compare them.")
+            return
+
+        # Show the comparison in the historian view
+        if self.main_window.is_model_view:
+            self.main_window.switch_to_historian_view()
+            self.main_window.mode_toggle_btn.setText("💾 Historian")
+            self.main_window.disable_component_buttons(True)
+        self.main_window.historian_manager.show_comparison(runs)
+        TerminalWidget.log(f"Comparison ready: {len(runs)} scenarios, baseline {runs[0]['name']}")
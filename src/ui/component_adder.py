@@ -123,6 +123,10 @@ class ComponentAdder:
             position = component.pos()
             # Do not add distribution poles to the components list as they are decorative
         
+        # Functional components start out as their own network island
+        if component is not None and not component.is_decorative_component():
+            self.main_window.network_topology.component_added(component)
+        
         # Log component addition to terminal
         if component is not None:
             # Get component type and ID
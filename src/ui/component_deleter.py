@@ -59,6 +59,7 @@ class ComponentDeleter:
             self.main_window.scene.removeItem(connection)
             if connection in self.main_window.connections:
                 self.main_window.connections.remove(connection)
+                self.main_window.network_topology.connection_removed(connection)
         
         # Remove component's historian keys
         self.main_window.simulation_engine.remove_component_historian_keys(component)
@@ -78,6 +79,9 @@ class ComponentDeleter:
             component in self.main_window.components):
             self.main_window.components.remove(component)
         
+        # The network may have split - the islands are recomputed on the next query
+        self.main_window.network_topology.component_removed(component)
+        
         # Clear the properties panel
         self.main_window.properties_dock.setVisible(False)
         
@@ -3,6 +3,7 @@ from PyQt6.QtCore import Qt
 
 # Import styles from the parent module
 from src.ui.properties_manager import COMMON_BUTTON_STYLE, INPUT_STYLE, COMBOBOX_STYLE
+from src.ui.terminal_widget import TerminalWidget
 
 def add_battery_properties(properties_manager, component, layout):
     # Power capacity field in MW
@@ -13,6 +14,8 @@ def add_battery_properties(properties_manager, component, layout):
         # Convert back to kW for internal storage
         kw_value = value * 1000
         setattr(component, 'power_capacity', kw_value)
+        # An arbitrage schedule is replanned for the new rate
+        component.arbitrage_schedule = None
         # Update CAPEX display when power capacity changes
         properties_manager.main_window.update_capex_display()
         
@@ -30,6 +33,9 @@ def add_battery_properties(properties_manager, component, layout):
         # Set the new energy capacity
         component.energy_capacity = value
         
+        # An arbitrage schedule is replanned for the new capacity
+        component.arbitrage_schedule = None
+        
         # Cap current charge at the new energy capacity if needed
         if component.current_charge > component.energy_capacity:
             component.current_charge = component.energy_capacity
@@ -42,15 +48,24 @@ def add_battery_properties(properties_manager, component, layout):
     # Operating mode selector
     mode_selector = QComboBox()
     mode_selector.setStyleSheet(COMBOBOX_STYLE)
-    mode_selector.addItems(["Off", "BTF ± Unit (Auto)"]) 
+    mode_selector.addItems(["Off", "BTF ± Unit (Auto)", "Arbitrage (Optimized)"]) 
     mode_selector.setCurrentText(component.operating_mode)
     mode_selector.setFixedWidth(150)
     
     # Connect operating mode change
     def change_mode(text):
         component.operating_mode = text
+        # Arbitrage mode plans its schedule from the current hour
+        component.arbitrage_schedule = None
         component.update()
         properties_manager.main_window.update_simulation()
+        
+        # The simulation update planned the schedule if the battery is connected
+        if text == "Arbitrage (Optimized)" and component.arbitrage_schedule is not None:
+            if component.arbitrage_margin is None:
+                TerminalWidget.log("Arbitrage battery has no grid import or export to trade with - it stays idle")
+            else:
+                TerminalWidget.log(f"Arbitrage schedule planned: ${component.arbitrage_margin:,.0f} expected margin to the end of the year")
     
     mode_selector.currentTextChanged.connect(change_mode)
     
@@ -20,6 +20,7 @@ from src.components.traditional_data_center import TraditionalDataCenterComponen
 from src.components.distribution_pole import DistributionPoleComponent
 from src.ui.terminal_widget import TerminalWidget
 from src.utils.audio_utils import play_successchime, play_failchime
+from src.utils.spatial_grid import SpatialGrid
 
 class ConnectionManager:
     def __init__(self, main_window):
@@ -240,7 +241,12 @@ class ConnectionManager:
             self.view.viewport().setCursor(cursor)  # and viewport 
 
     def autoconnect_all_components(self):
-        """Automatically connect all components in the scene to form a valid network"""
+        """
+        Automatically connect all components in the scene to form a valid network.
+        Existing connections are replaced, and each component is wired to its
+        nearest eligible partner (looked up in a spatial grid) so the layout
+        stays readable and large scenes connect instantly.
+        """
         if not self.main_window.components:
             TerminalWidget.log("Autoconnect: No components available to connect.")
             return
@@ -250,9 +256,6 @@ class ConnectionManager:
             self.main_window.autoconnect_btn.setEnabled(False)
         
         try:
-            # Save a copy of the components list
-            saved_components = self.main_window.components.copy()
-            
             # Remove all connections manually
             for connection in list(self.main_window.connections):
                 # First clean up the connection
@@ -265,185 +268,223 @@ class ConnectionManager:
             
             # Clear connections list
             self.main_window.connections.clear()
+            self.main_window.network_topology.invalidate()
                 
             # Dictionary to track which components are already connected
             connected_pairs = set()
             
-            # Strategy: Connect components in a logical pattern
-            # Priority: Bus → Generators → Loads → Grid connections
+            # Strategy: Connect each component to the closest component it should attach to
+            # Priority: Bus → everything else, otherwise Generators → Loads → Grid connections
             
             # Find components by type (exclude TreeComponent instances)
-            buses = [c for c in self.main_window.components if isinstance(c, BusComponent)]
-            generators = [c for c in self.main_window.components if isinstance(c, GeneratorComponent)]
-            loads = [c for c in self.main_window.components if isinstance(c, LoadComponent)]
-            grid_import = [c for c in self.main_window.components if isinstance(c, GridImportComponent)]
-            grid_export = [c for c in self.main_window.components if isinstance(c, GridExportComponent)]
-            cloud_workloads = [c for c in self.main_window.components if isinstance(c, CloudWorkloadComponent)]
+            components = self.main_window.components
+            buses = [c for c in components if isinstance(c, BusComponent)]
+            generators = [c for c in components if isinstance(c, GeneratorComponent)]
+            loads = [c for c in components if isinstance(c, LoadComponent)]
+            grid_import = [c for c in components if isinstance(c, GridImportComponent)]
+            grid_export = [c for c in components if isinstance(c, GridExportComponent)]
+            cloud_workloads = [c for c in components if isinstance(c, CloudWorkloadComponent)]
             
             # Identify data center loads specifically
             data_center_loads = [load for load in loads if load.profile_type == "Data Center"]
             
-            # 1. If there are buses, connect generators to buses
+            # 1. If there are buses, connect everything to its nearest bus
             if buses:
-                # Connect generators to buses (distribute evenly if multiple buses)
-                for i, generator in enumerate(generators):
-                    bus = buses[i % len(buses)]  # Distribute evenly
-                    self.create_connection_between(generator, bus, connected_pairs)
-                
-                # Connect loads to buses (distribute evenly if multiple buses)
-                for i, load in enumerate(loads):
-                    bus = buses[i % len(buses)]  # Distribute evenly
-                    self.create_connection_between(load, bus, connected_pairs)
-                
-                # Connect grid connections to buses
-                for i, grid in enumerate(grid_import + grid_export):
-                    bus = buses[i % len(buses)]  # Distribute evenly
-                    self.create_connection_between(grid, bus, connected_pairs)
-                    
-                # Connect cloud workloads to buses (they'll indirectly connect to data center loads)
-                for i, cloud in enumerate(cloud_workloads):
-                    bus = buses[i % len(buses)]  # Distribute evenly
-                    self.create_connection_between(cloud, bus, connected_pairs)
+                bus_index = self.build_spatial_index(buses)
+                for component in components:
+                    # Cloud workloads can't connect to buses - they're handled below
+                    if isinstance(component, (BusComponent, CloudWorkloadComponent)):
+                        continue
+                    self.connect_to_nearest(component, bus_index, connected_pairs)
             else:
-                # No buses - connect generators directly to loads
+                # No buses - connect generators directly to their nearest load
                 if generators and loads:
-                    # Connect generators to loads (distribute evenly)
-                    for i, generator in enumerate(generators):
-                        load = loads[i % len(loads)]
-                        self.create_connection_between(generator, load, connected_pairs)
+                    load_index = self.build_spatial_index(loads)
+                    for generator in generators:
+                        self.connect_to_nearest(generator, load_index, connected_pairs)
                 
-                # Connect grid import to loads if there are any loads
+                # Connect each load to its nearest grid import
                 if loads and grid_import:
-                    for i, load in enumerate(loads):
-                        grid = grid_import[i % len(grid_import)]
-                        self.create_connection_between(grid, load, connected_pairs)
+                    import_index = self.build_spatial_index(grid_import)
+                    for load in loads:
+                        self.connect_to_nearest(load, import_index, connected_pairs)
                 
-                # Connect generators to grid export if there are any grid exports
+                # Connect each generator to its nearest grid export
                 if generators and grid_export:
-                    for i, generator in enumerate(generators):
-                        grid = grid_export[i % len(grid_export)]
-                        self.create_connection_between(generator, grid, connected_pairs)
-                
-                # Connect grid import to grid export if both exist
-                if grid_import and grid_export:
-                    for i, g_import in enumerate(grid_import):
-                        g_export = grid_export[i % len(grid_export)]
-                        self.create_connection_between(g_import, g_export, connected_pairs)
-                        
-                # Connect cloud workloads directly to data center loads if available
-                if cloud_workloads and data_center_loads:
-                    for i, cloud in enumerate(cloud_workloads):
-                        # Try to connect to a data center load
-                        dc_load = data_center_loads[i % len(data_center_loads)]
-                        self.create_connection_between(cloud, dc_load, connected_pairs)
+                    export_index = self.build_spatial_index(grid_export)
+                    for generator in generators:
+                        self.connect_to_nearest(generator, export_index, connected_pairs)
+                    
+                    # Connect each grid import to its nearest grid export
+                    for g_import in grid_import:
+                        self.connect_to_nearest(g_import, export_index, connected_pairs)
             
-            # Special handling: Ensure all cloud workloads are connected to data center loads when possible
-            # Do this separately to prioritize these connections regardless of other network structure
+            # Cloud workloads connect to their nearest data center load
             if cloud_workloads and data_center_loads:
+                data_center_index = self.build_spatial_index(data_center_loads)
                 for cloud in cloud_workloads:
-                    # Check if cloud workload is already connected
-                    cloud_id = id(cloud)
-                    cloud_connected = False
-                    
-                    for pair in connected_pairs:
-                        if cloud_id in pair:
-                            cloud_connected = True
-                            break
-                    
-                    # If not connected, try to connect to any data center load
-                    if not cloud_connected:
-                        for dc_load in data_center_loads:
-                            if self.create_connection_between(cloud, dc_load, connected_pairs):
-                                break  # Successfully connected
-            
-            # STEP 2: Ensure all components are connected in a single network
-            # Build a graph of the current connections
-            connection_graph = {id(component): set() for component in self.main_window.components}
-            for pair in connected_pairs:
-                source_id, target_id = pair
-                connection_graph[source_id].add(target_id)
-                connection_graph[target_id].add(source_id)
+                    self.connect_to_nearest(cloud, data_center_index, connected_pairs)
             
-            # Find connected components in the graph (using BFS)
-            connected_components = self.find_connected_components(connection_graph)
+            # STEP 2: Ensure all components are connected in a single network by
+            # joining every separate island to its closest neighbour
+            self.join_network_islands(connected_pairs)
             
-            # If more than one connected component, connect them together
-            if len(connected_components) > 1:
-                # Connect each component to the next one
-                for i in range(len(connected_components) - 1):
-                    # Take one node from each component
-                    comp1_node_id = connected_components[i][0]
-                    comp2_node_id = connected_components[i + 1][0]
-                    
-                    # Find the actual component objects
-                    comp1_node = next(c for c in self.main_window.components if id(c) == comp1_node_id)
-                    comp2_node = next(c for c in self.main_window.components if id(c) == comp2_node_id)
-                    
-                    # Connect them
-                    self.create_connection_between(comp1_node, comp2_node, connected_pairs)
+            # Verify everything ended up in a single network
+            if self.main_window.network_topology.is_connected():
+                # Trigger success flash before showing the success message
+                bordered_widget = self.main_window.centralWidget()
+                if hasattr(bordered_widget, 'trigger_success_flash'):
+                    bordered_widget.trigger_success_flash()
+                
+                TerminalWidget.log(f"Autoconnect: Successfully created {len(self.main_window.connections)} connections.")
+                play_successchime()
+            else:
+                # Final fallback: connect everything in a line
+                self.connect_all_in_sequence(connected_pairs)
+        finally:
+            # Re-enable the autoconnect button
+            if hasattr(self.main_window, 'autoconnect_btn'):
+                self.main_window.autoconnect_btn.setEnabled(True)
+    
+    def autoconnect_new_components(self):
+        """
+        Connect only the components that have no connections yet (e.g. just
+        added), leaving the existing wiring untouched. Each new component is
+        attached to its nearest eligible bus, or to the nearest already
+        connected component when there are no buses.
+        """
+        components = self.main_window.components
+        new_components = [c for c in components if not c.connections]
+        if not new_components:
+            TerminalWidget.log("Autoconnect: No unconnected components.")
+            return
+        
+        # Nothing is wired yet - a full autoconnect does the same job
+        if not components or len(new_components) == len(components):
+            self.autoconnect_all_components()
+            return
+        
+        # Disable the autoconnect button to prevent double-clicks
+        if hasattr(self.main_window, 'autoconnect_btn'):
+            self.main_window.autoconnect_btn.setEnabled(False)
+        
+        try:
+            connected_pairs = set()
+            connection_count = len(self.main_window.connections)
             
-            # STEP 3: Final check - ensure any isolated components are connected
-            # Create a list of all component IDs
-            all_component_ids = [id(c) for c in self.main_window.components]
+            buses = [c for c in components if isinstance(c, BusComponent)]
+            if buses:
+                # Same rule as a full autoconnect: everything hangs off its nearest bus
+                anchor_index = self.build_spatial_index(buses)
+            else:
+                anchor_index = self.build_spatial_index([c for c in components if c.connections])
             
-            # Find any components not in any connection
-            connected_component_ids = set(sum(connected_components, []))
-            isolated_component_ids = set(all_component_ids) - connected_component_ids
+            for component in new_components:
+                if isinstance(component, BusComponent):
+                    continue  # New buses are joined to the network below
+                if isinstance(component, CloudWorkloadComponent):
+                    # Cloud workloads only go to data center loads
+                    data_center_loads = [c for c in components
+                                         if isinstance(c, LoadComponent) and c.profile_type == "Data Center"]
+                    self.connect_to_nearest(component, self.build_spatial_index(data_center_loads), connected_pairs)
+                    continue
+                self.connect_to_nearest(component, anchor_index, connected_pairs)
             
-            # Connect any isolated components to the main network
-            if isolated_component_ids and connected_component_ids:
-                # Take the first node from the largest connected component as anchor
-                largest_component = max(connected_components, key=len)
-                anchor_id = largest_component[0]
-                anchor_component = next(c for c in self.main_window.components if id(c) == anchor_id)
-                
-                # Connect each isolated component to the anchor
-                for isolated_id in isolated_component_ids:
-                    isolated_component = next(c for c in self.main_window.components if id(c) == isolated_id)
-                    self.create_connection_between(anchor_component, isolated_component, connected_pairs)
+            # Join anything new that's still separate (new buses, components with no
+            # eligible partner). Existing islands are left alone - they may be separate sites.
+            new_set = set(new_components)
+            self.join_network_islands(connected_pairs, only=lambda island: all(c in new_set for c in island))
             
-            # Verify network connectivity
+            added = len(self.main_window.connections) - connection_count
             if self.main_window.check_network_connectivity():
-                # Trigger success flash before showing the success message
                 bordered_widget = self.main_window.centralWidget()
                 if hasattr(bordered_widget, 'trigger_success_flash'):
                     bordered_widget.trigger_success_flash()
-                
-                TerminalWidget.log(f"Autoconnect: Successfully created {len(self.main_window.connections)} connections.")
+                TerminalWidget.log(f"Autoconnect: Added {added} connections for {len(new_components)} new components.")
                 play_successchime()
             else:
-                # Final fallback: connect everything in a line
-                if not self.main_window.check_network_connectivity():
-                    self.connect_all_in_sequence(connected_pairs)
+                TerminalWidget.log(f"Autoconnect: Added {added} connections, but some components are still unconnected.")
+                play_failchime()
         finally:
             # Re-enable the autoconnect button
             if hasattr(self.main_window, 'autoconnect_btn'):
                 self.main_window.autoconnect_btn.setEnabled(True)
     
-    def find_connected_components(self, graph):
-        """Find connected components in the graph (using BFS)"""
-        components = []
-        visited = set()
+    def build_spatial_index(self, components):
+        """
+        Build a spatial grid of components keyed by their centers
         
-        for node in graph:
-            if node not in visited:
-                # Start a new connected component
-                component = []
-                queue = [node]
-                visited.add(node)
-                
-                while queue:
-                    current = queue.pop(0)
-                    component.append(current)
-                    
-                    for neighbor in graph[current]:
-                        if neighbor not in visited:
-                            visited.add(neighbor)
-                            queue.append(neighbor)
-                
-                components.append(component)
+        Args:
+            components: Components to index
+            
+        Returns:
+            SpatialGrid
+        """
+        index = SpatialGrid()
+        for component in components:
+            center = component.sceneBoundingRect().center()
+            index.insert(component, center.x(), center.y())
+        return index
+    
+    def connect_to_nearest(self, component, index, connected_pairs):
+        """
+        Connect a component to the closest indexed component it may connect to
         
-        return components
+        Args:
+            component: Component to connect
+            index: SpatialGrid of candidate partners
+            connected_pairs: Set of connected id pairs, updated in place
+            
+        Returns:
+            bool: True if a connection was created
+        """
+        center = component.sceneBoundingRect().center()
+        target, _ = index.nearest(
+            center.x(), center.y(),
+            lambda candidate: candidate is not component and self.validate_cloud_workload_connection(component, candidate)[0]
+        )
+        if target is None:
+            return False
+        return self.create_connection_between(component, target, connected_pairs)
+    
+    def join_network_islands(self, connected_pairs, only=None):
+        """
+        Join separate parts of the network into one. Starting from the largest
+        part, each other part is connected through its closest eligible pair of
+        components, so the joining wires stay short.
+        
+        Args:
+            connected_pairs: Set of connected id pairs, updated in place
+            only: Optional callable(island) -> bool selecting which islands to join
+                  (default: all of them)
+        """
+        # Islands come from the union-find tracking, largest first
+        islands = list(self.main_window.network_topology.islands())
+        if len(islands) <= 1:
+            return
+        
+        # Grow the network outwards from the largest island
+        network_index = self.build_spatial_index(islands[0])
+        for members in islands[1:]:
+            if only is not None and not only(members):
+                continue
+            best = None
+            for member in members:
+                center = member.sceneBoundingRect().center()
+                target, distance = network_index.nearest(
+                    center.x(), center.y(),
+                    lambda candidate, member=member: self.validate_cloud_workload_connection(member, candidate)[0]
+                )
+                if target is not None and (best is None or distance < best[2]):
+                    best = (member, target, distance)
+            
+            if best is None or not self.create_connection_between(best[0], best[1], connected_pairs):
+                continue  # Nothing it may connect to - left for the fallback
+            
+            # The island is part of the network now
+            for member in members:
+                center = member.sceneBoundingRect().center()
+                network_index.insert(member, center.x(), center.y())
     
     def connect_all_in_sequence(self, connected_pairs):
         """Last resort fallback: connect all components in a simple line/sequence"""
@@ -487,6 +528,7 @@ class ConnectionManager:
             self.scene.addItem(connection)
             connection.setup_component_tracking()
             self.main_window.connections.append(connection)
+            self.main_window.network_topology.connection_added(connection)
             
             # Log connection to terminal
             source_type = source.component_type if hasattr(source, 'component_type') else source.__class__.__name__
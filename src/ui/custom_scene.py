@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QGraphicsScene
 from PyQt6.QtCore import QObject, pyqtSignal, QPointF
 from PyQt6.QtGui import QPen, QPixmap, QColor, QBrush
 from src.utils.resource import resource_path
+from .decoration_layer import DecorationLayer
 
 
 class CustomScene(QGraphicsScene, QObject):
@@ -21,6 +22,38 @@ class CustomScene(QGraphicsScene, QObject):
         self.background_mode = 0
         # Grey color for solid background matching other windows
         self.background_color = QColor("#1E1E1E")
+        
+        # Decorations flattened into cached background tiles (see set_decorations_baked)
+        self.decoration_layer = DecorationLayer(self)
+    
+    @property
+    def decorations_baked(self):
+        """Whether decorations are currently baked into the background"""
+        return self.decoration_layer.baked
+    
+    def set_decorations_baked(self, baked):
+        """Bake decorations into background tiles, or put them back as editable items
+        
+        Args:
+            baked (bool): True to bake, False to restore the decoration items
+        """
+        if baked:
+            self.decoration_layer.bake()
+        elif self.decoration_layer.baked:
+            self.decoration_layer.unbake()
+    
+    def baked_decorations(self):
+        """Decorations currently held by the background layer instead of the scene"""
+        return list(self.decoration_layer.decorations)
+    
+    def clear(self):
+        """Clear the scene, including any decorations baked into the background"""
+        self.decoration_layer.clear()
+        super().clear()
+    
+    def itemsBoundingRect(self):
+        """Bounding rect of all items, including baked decorations"""
+        return super().itemsBoundingRect().united(self.decoration_layer.bounding_rect())
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events on the scene background"""
@@ -67,6 +100,12 @@ class CustomScene(QGraphicsScene, QObject):
         self.update()
     
     def drawBackground(self, painter, rect):
+        # Background texture or grid first, then decorations baked into tiles on top
+        self._draw_background_pattern(painter, rect)
+        self.decoration_layer.draw(painter, rect)
+    
+    def _draw_background_pattern(self, painter, rect):
+        """Draw the background texture, or the dotted grid in solid color mode"""
         # Call the base implementation to clear the background
         super().drawBackground(painter, rect)
         
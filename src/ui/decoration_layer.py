@@ -0,0 +1,175 @@
+import math
+from collections import OrderedDict
+from PyQt6.QtWidgets import QStyleOptionGraphicsItem
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPainter, QPixmap
+from src.components.base import STATIC_LAYER_MARGIN, LOD_GLYPH, detail_tier
+from src.utils.pixmap_cache import zoom_bucket_for
+
+# Size of a background tile in scene units
+TILE_SIZE = 1024
+
+# Memory budget for rendered tiles (all zoom levels together)
+TILE_CACHE_LIMIT_KB = 64 * 1024
+
+
+class DecorationLayer:
+    """
+    Flattens decorative components (trees, bushes, ponds, houses, factories,
+    traditional data centers and distribution poles) into cached background
+    tiles drawn by CustomScene.drawBackground.
+
+    While baked, the decorations are taken out of the scene, so they no longer
+    show up in scene.items() scans or get painted item by item. Tiles are
+    rendered once per zoom bucket and only re-rendered when the set of baked
+    decorations changes.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.baked = False
+        self.decorations = []  # Baked decorations, bottom of the stack first
+        self.tiles = OrderedDict()  # (column, row, zoom bucket, pixel ratio) -> QPixmap or None, least recently used first
+        self.tile_cache_bytes = 0
+
+    def bake(self):
+        """
+        Move every decoration in the scene into the background tiles. Calling it
+        again while baked picks up decorations added since (e.g. from a load).
+        """
+        # scene.items() lists the top of the stack first; paint bottom first
+        new_decorations = [
+            item for item in reversed(self.scene.items())
+            if hasattr(item, 'is_decorative_component') and item.is_decorative_component()
+        ]
+        for item in new_decorations:
+            item.setSelected(False)
+            self.scene.removeItem(item)
+        self.decorations.extend(new_decorations)
+        self.baked = True
+        self.invalidate()
+
+    def unbake(self):
+        """Put the decorations back into the scene as regular items so they can be edited"""
+        decorations, self.decorations = self.decorations, []
+        for item in decorations:
+            self.scene.addItem(item)
+        self.baked = False
+        self.invalidate()
+
+    def clear(self):
+        """Drop the baked decorations (the scene is being cleared)"""
+        self.decorations = []
+        self.invalidate()
+
+    def invalidate(self):
+        """Throw away the rendered tiles and repaint the background"""
+        self.tiles.clear()
+        self.tile_cache_bytes = 0
+        self.scene.invalidate(QRectF(), self.scene.SceneLayer.BackgroundLayer)
+
+    def bounding_rect(self):
+        """Scene rect covered by the baked decorations (including shadows)"""
+        rect = QRectF()
+        margin = STATIC_LAYER_MARGIN
+        for item in self.decorations:
+            rect = rect.united(item.sceneBoundingRect().adjusted(-margin, -margin, margin, margin))
+        return rect
+
+    def draw(self, painter, exposed_rect):
+        """
+        Draw the tiles overlapping the exposed part of the scene
+
+        Args:
+            painter: Painter passed to drawBackground (scene coordinates)
+            exposed_rect: Exposed scene rect
+        """
+        if not self.baked or not self.decorations:
+            return
+
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        bucket = zoom_bucket_for(lod)
+        device = painter.device()
+        device_pixel_ratio = device.devicePixelRatioF() if device is not None else 1.0
+
+        first_column = math.floor(exposed_rect.left() / TILE_SIZE)
+        last_column = math.floor(exposed_rect.right() / TILE_SIZE)
+        first_row = math.floor(exposed_rect.top() / TILE_SIZE)
+        last_row = math.floor(exposed_rect.bottom() / TILE_SIZE)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                tile = self._get_tile(column, row, bucket, device_pixel_ratio)
+                if tile is None:
+                    continue
+                target = QRectF(column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                painter.drawPixmap(target, tile, QRectF(0, 0, tile.width(), tile.height()))
+        painter.restore()
+
+    def _get_tile(self, column, row, bucket, device_pixel_ratio):
+        """Get a rendered tile, rendering it on first use (None if it's empty)"""
+        key = (column, row, bucket, device_pixel_ratio)
+        if key in self.tiles:
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+
+        tile = self._render_tile(column, row, bucket, device_pixel_ratio)
+        self.tiles[key] = tile
+        if tile is not None:
+            self.tile_cache_bytes += tile.width() * tile.height() * 4
+            self._evict_tiles()
+        return tile
+
+    def _evict_tiles(self):
+        """Drop least recently used tiles until the cache fits its budget"""
+        while self.tile_cache_bytes > TILE_CACHE_LIMIT_KB * 1024 and len(self.tiles) > 1:
+            _, tile = self.tiles.popitem(last=False)
+            if tile is not None:
+                self.tile_cache_bytes -= tile.width() * tile.height() * 4
+
+    def _render_tile(self, column, row, bucket, device_pixel_ratio):
+        """
+        Rasterize the decorations overlapping one tile
+
+        Args:
+            column, row: Tile index
+            bucket: Zoom bucket the tile is rendered for
+            device_pixel_ratio: Device pixel ratio of the view
+
+        Returns:
+            QPixmap, or None if no decoration touches the tile
+        """
+        tile_rect = QRectF(column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        margin = STATIC_LAYER_MARGIN
+        items = [
+            item for item in self.decorations
+            if item.sceneBoundingRect().adjusted(-margin, -margin, margin, margin).intersects(tile_rect)
+        ]
+        if not items:
+            return None
+
+        size = max(1, math.ceil(TILE_SIZE * bucket * device_pixel_ratio))
+        tile = QPixmap(size, size)
+        tile.setDevicePixelRatio(device_pixel_ratio)
+        tile.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        # Painter coordinates are device independent pixels
+        scale = size / device_pixel_ratio / TILE_SIZE
+        painter.scale(scale, scale)
+        painter.translate(-tile_rect.left(), -tile_rect.top())
+        for item in items:
+            painter.save()
+            painter.translate(item.pos())
+            # Same level-of-detail choice the item would make on screen
+            if detail_tier(painter, item.rect()) == LOD_GLYPH:
+                item.draw_glyph(painter)
+            else:
+                item.paint_static_layer(painter)
+            painter.restore()
+        painter.end()
+        return tile
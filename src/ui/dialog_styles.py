@@ -93,6 +93,28 @@ def get_open_file_name(
     return "", name_filter
 
 
+def get_open_file_names(
+    parent,
+    title: str,
+    name_filter: str,
+) -> tuple[list[str], str]:
+    """Show a styled Open File dialog allowing several files and return (filenames, selected_filter)."""
+    dialog = QFileDialog(parent)
+    dialog.setWindowTitle(title)
+    dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+    dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+    dialog.setNameFilter(name_filter)
+    # Ensure we can style the dialog consistently across platforms
+    try:
+        dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+    except Exception:
+        pass
+    apply_standard_dialog_style(dialog)
+    if dialog.exec() == QDialog.DialogCode.Accepted:
+        return dialog.selectedFiles(), name_filter
+    return [], name_filter
+
+
 def get_save_file_name(
     parent,
     title: str,
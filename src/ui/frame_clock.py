@@ -0,0 +1,213 @@
+import time
+from PyQt6.QtCore import QObject, QTimer, QEvent
+
+# Animation quality presets: multiplier applied to every throttleable
+# animation interval (None pauses them entirely)
+QUALITY_LEVELS = {
+    'High': 1.0,
+    'Balanced': 2.0,
+    'Power Saver': None
+}
+DEFAULT_QUALITY = 'High'
+
+# Interval multiplier for throttleable animations while the app is busy
+# (autocomplete, sweeps) - nobody is watching them closely then
+BUSY_THROTTLE = 4.0
+
+# Upper bound on the frame scale handed to callbacks, so animations don't
+# jump after a stall
+MAX_FRAME_SCALE = 4.0
+
+
+class _Subscriber:
+    """One animation callback registered with the frame clock"""
+
+    def __init__(self, callback, interval, throttle):
+        self.callback = callback
+        self.interval = interval  # Nominal interval in ms
+        self.throttle = throttle  # Whether quality/busy throttling applies
+        self.last_time = time.monotonic()
+
+
+class FrameClock(QObject):
+    """
+    Single frame scheduler that drives every UI animation from one QTimer.
+
+    Animations subscribe a callback with their nominal interval. Each tick the
+    clock calls the callbacks that are due with a frame scale (elapsed time /
+    nominal interval) so they can advance at the same real-time speed when
+    throttled, then repaints every scene invalidated during the tick once.
+
+    The timer stops when nothing is subscribed or the main window is hidden
+    or minimized, so an idle app uses next to no CPU.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Return the application-wide frame clock, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.subscribers = []
+        self.quality = DEFAULT_QUALITY
+        self.busy_reasons = set()
+        self.window_visible = True
+        self.dirty_scenes = set()
+        self.ticking = False
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.tick)
+
+    def subscribe(self, callback, interval, throttle=True):
+        """
+        Register an animation callback
+
+        Args:
+            callback: Callable taking the frame scale (1.0 = one nominal interval)
+            interval: Nominal interval between calls in ms
+            throttle: Whether the quality setting and busy state may slow it down
+        """
+        if any(sub.callback == callback for sub in self.subscribers):
+            return
+        self.subscribers.append(_Subscriber(callback, interval, throttle))
+        self._update_timer()
+
+    def unsubscribe(self, callback):
+        """Remove an animation callback (no-op if it isn't subscribed)"""
+        self.subscribers = [sub for sub in self.subscribers if sub.callback != callback]
+        self._update_timer()
+
+    def is_subscribed(self, callback):
+        """Return True if the callback is currently subscribed"""
+        return any(sub.callback == callback for sub in self.subscribers)
+
+    def invalidate_scene(self, scene):
+        """
+        Request a repaint of a scene. Repeated requests within one tick are
+        batched into a single scene update at the end of the tick.
+        """
+        if scene is None:
+            return
+        if self.ticking:
+            self.dirty_scenes.add(scene)
+        else:
+            scene.update()
+
+    def set_quality(self, quality):
+        """
+        Set the animation quality
+
+        Args:
+            quality: One of the QUALITY_LEVELS keys
+        """
+        if quality not in QUALITY_LEVELS:
+            raise ValueError(f"Unknown animation quality: {quality}")
+        self.quality = quality
+        self._update_timer()
+
+    def set_busy(self, reason, busy):
+        """
+        Mark the app busy (e.g. 'autocomplete') so throttleable animations slow down
+
+        Args:
+            reason: Name of the activity; the app is busy while any reason is set
+            busy: Whether the activity is running
+        """
+        if busy:
+            self.busy_reasons.add(reason)
+        else:
+            self.busy_reasons.discard(reason)
+        self._update_timer()
+
+    def watch_window(self, window):
+        """Pause all animations while the given window is hidden or minimized"""
+        window.installEventFilter(self)
+        self._set_window_visible(window.isVisible() and not window.isMinimized())
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.Show, QEvent.Type.Hide):
+            # Show/Hide arrive before isVisible() changes, so read them from the event
+            if event.type() == QEvent.Type.Hide:
+                visible = False
+            elif event.type() == QEvent.Type.Show:
+                visible = not obj.isMinimized()
+            else:
+                visible = obj.isVisible() and not obj.isMinimized()
+            self._set_window_visible(visible)
+        return False
+
+    def _set_window_visible(self, visible):
+        if visible != self.window_visible:
+            self.window_visible = visible
+            self._update_timer()
+
+    def _effective_interval(self, subscriber):
+        """Interval in ms after throttling, or None if the subscriber is paused"""
+        if not subscriber.throttle:
+            return subscriber.interval
+        multiplier = QUALITY_LEVELS[self.quality]
+        if multiplier is None:
+            return None
+        if self.busy_reasons:
+            multiplier *= BUSY_THROTTLE
+        return subscriber.interval * multiplier
+
+    def _update_timer(self):
+        """Run the timer at the shortest active interval, or stop it"""
+        intervals = []
+        if self.window_visible:
+            intervals = [i for i in (self._effective_interval(sub) for sub in self.subscribers) if i is not None]
+
+        if not intervals:
+            self.timer.stop()
+            return
+
+        interval = int(min(intervals))
+        if not self.timer.isActive() or self.timer.interval() != interval:
+            # Don't let paused subscribers catch up a huge frame scale on resume
+            if not self.timer.isActive():
+                now = time.monotonic()
+                for sub in self.subscribers:
+                    sub.last_time = now
+            self.timer.start(interval)
+
+    def tick(self):
+        """Call every due subscriber, then repaint the scenes they invalidated"""
+        now = time.monotonic()
+        self.ticking = True
+        dead = []
+        try:
+            for sub in list(self.subscribers):
+                interval = self._effective_interval(sub)
+                if interval is None:
+                    continue
+                elapsed_ms = (now - sub.last_time) * 1000.0
+                # Allow a little timer jitter so subscribers at the base rate never skip a tick
+                if elapsed_ms < interval * 0.8:
+                    continue
+                sub.last_time = now
+                frame_scale = min(MAX_FRAME_SCALE, elapsed_ms / sub.interval)
+                try:
+                    sub.callback(frame_scale)
+                except RuntimeError:
+                    # Underlying Qt object was deleted
+                    dead.append(sub)
+        finally:
+            self.ticking = False
+
+        if dead:
+            self.subscribers = [sub for sub in self.subscribers if sub not in dead]
+            self._update_timer()
+
+        # One repaint per scene, however many items asked for one
+        dirty, self.dirty_scenes = self.dirty_scenes, set()
+        for scene in dirty:
+            try:
+                scene.update()
+            except RuntimeError:
+                pass
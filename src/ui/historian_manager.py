@@ -4,14 +4,62 @@ AlignmentFlag = Qt.AlignmentFlag   # backwards-compat alias
 Orientation   = Qt.Orientation
 # ----------------------------------------------------------------
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QGraphicsScene, QHBoxLayout, QPushButton, QLabel, QScrollArea, QFrame, QSpacerItem, QSizePolicy
-from PyQt6.QtGui import QColor, QBrush
-from PyQt6.QtCore import Qt
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.patheffects as path_effects
-import matplotlib.ticker as ticker
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QGraphicsScene, QHBoxLayout, QLabel, QSpacerItem, QSizePolicy, QComboBox, QLineEdit, QListView, QAbstractItemView
+from PyQt6.QtGui import QColor, QBrush, QStandardItemModel, QStandardItem, QPixmap, QIcon
+from PyQt6.QtCore import Qt, QSortFilterProxyModel
 import numpy as np
+from src.simulation.historian_rollups import HistorianRollupCache, PERIODS, STATISTICS, to_day_hour_matrix
+from src.simulation.historian_statistics import HistorianStatisticsCache, POOL_PRICE_KEY, PERCENTILES, load_pool_prices
+from src.simulation.sensitivity import TORNADO_METRICS, draw_tornado
+
+# Matplotlib is imported the first time the historian chart is built,
+# which keeps it out of the application startup path
+plt = None
+FigureCanvas = None
+path_effects = None
+ticker = None
+
+
+def _load_matplotlib():
+    """Import matplotlib with the Qt backend on first use"""
+    global plt, FigureCanvas, path_effects, ticker
+    if plt is None:
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        matplotlib.rcParams['interactive'] = False
+        import matplotlib.pyplot as _plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as _FigureCanvas
+        import matplotlib.patheffects as _path_effects
+        import matplotlib.ticker as _ticker
+        plt, FigureCanvas, path_effects, ticker = _plt, _FigureCanvas, _path_effects, _ticker
+
+
+# Series that always exist in the historian
+DEFAULT_PRIMARY_SERIES = ['total_generation', 'total_load', 'grid_import', 'grid_export',
+                          'battery_charge', 'system_instability', 'satisfied_load']
+DEFAULT_SECONDARY_SERIES = ['cumulative_revenue', 'cumulative_cost']
+
+# Series shown when the historian starts or is reset
+DEFAULT_VISIBLE_SERIES = ['satisfied_load', 'cumulative_revenue', 'cumulative_cost', 'system_instability']
+
+# Line colors for compared scenarios - the first is the baseline
+COMPARE_COLORS = ['#E1E6F9', '#4FC3F7', '#FFCA28', '#66BB6A', '#F06292', '#AB47BC', '#FF7043', '#8BC34A']
+
+# KPIs listed in the compare view: (summary key, label, display scale, unit, decimals)
+COMPARE_KPIS = [
+    ('irr_12_month', 'IRR 12 Mo.', 100, '%', 1),
+    ('capex', 'CAPEX', 1e-6, ' $M', 2),
+    ('total_revenue', 'Revenue', 1e-6, ' $M', 2),
+    ('net_revenue', 'Net revenue', 1e-6, ' $M', 2),
+    ('grid_import_kwh', 'Grid import', 1e-3, ' MWh', 1),
+    ('grid_export_kwh', 'Grid export', 1e-3, ' MWh', 1),
+    ('unserved_energy_kwh', 'Unserved', 1e-3, ' MWh', 1),
+    ('unstable_hours', 'Unstable hrs', 1, '', 0)
+]
+
+# Item data roles used by the series selector model
+SERIES_KEY_ROLE = Qt.ItemDataRole.UserRole + 1
+SERIES_ORDER_ROLE = Qt.ItemDataRole.UserRole + 2
 
 class HistorianManager:
     """
@@ -28,9 +76,11 @@ class HistorianManager:
         """
         self.parent = parent
         self.historian_scene = None
-        self.lines = {}  # Dictionary to store line objects by data key
-        self.line_visibility = {}  # Track visibility state of each line
-        self.toggle_buttons = {}  # Dictionary to store toggle buttons by data key
+        self.lines = {}  # Line objects by data key - only for series currently shown
+        self.series_items = {}  # Series selector items by data key
+        self.visible_series = set(DEFAULT_VISIBLE_SERIES)  # Keys of series the user has shown
+        self._series_counter = 0  # Order of appearance for selector sorting
+        self._suppress_item_changes = False  # Ignore item changes made programmatically
         self.colors = {  # Default colors for known data types - dark-mode friendly colors
             'total_generation': '#66BB6A',  # Soft green
             'total_load': '#FFCA28',  # Soft orange
@@ -46,9 +96,25 @@ class HistorianManager:
         # Define which series use secondary y-axis
         self.secondary_axis_series = ['cumulative_revenue', 'cumulative_cost']
         
-        # Track buttons to maintain ordering
-        self.primary_buttons = []
-        self.secondary_buttons = []
+        # Temporal aggregation state - rollups are cached per run
+        self.aggregation_period = 'Hourly'
+        self.aggregation_statistic = 'Mean'
+        self.rollup_cache = HistorianRollupCache()
+        
+        # Chart view mode - 'Lines', 'Heatmap' (hour-of-day x day-of-year) or 'Statistics'
+        self.view_mode = 'Lines'
+        self.statistics_cache = HistorianStatisticsCache()
+        self.selected_series_key = 'total_load'
+        
+        # Scenario comparison shown in the 'Compare' view (set by show_comparison)
+        self.comparison = None
+        self.compare_lines = []  # Line artists of the compare view, replaced on every redraw
+        
+        # Sensitivity analysis shown in the 'Sensitivity' view (set by show_sensitivity)
+        self.sensitivity = None
+        
+        # The matplotlib chart is built lazily the first time it's needed
+        self.chart_built = False
         
         self.initialize_historian_scene()
         
@@ -82,23 +148,107 @@ class HistorianManager:
         controls_label.setStyleSheet("color: #E1E6F9; font-weight: bold;")
         self.controls_layout.addWidget(controls_label)
         
-        # Create a scroll area for the buttons (in case there are many)
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll_area.setMinimumWidth(175)  # Set a minimum width
-        self.scroll_area.setStyleSheet("background-color: #0A0E22; border: none;")
+        # Search box to filter the series list
+        self.series_search = QLineEdit()
+        self.series_search.setPlaceholderText("Search series...")
+        self.series_search.setFixedWidth(175)
+        self.series_search.setStyleSheet("""
+            QLineEdit {
+                background-color: #0A0E22;
+                color: #E1E6F9;
+                border: 2px solid #29304D;
+                padding: 4px;
+                border-radius: 3px;
+            }
+        """)
+        self.series_search.textChanged.connect(self.filter_series)
+        self.controls_layout.addWidget(self.series_search)
+        
+        # Checkable list of series - a model/view list only paints the rows on
+        # screen, so large sites don't create a widget per series
+        self.series_model = QStandardItemModel()
+        self.series_model.itemChanged.connect(self.on_series_item_changed)
+        self.series_filter = QSortFilterProxyModel()
+        self.series_filter.setSourceModel(self.series_model)
+        self.series_filter.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.series_filter.setSortRole(SERIES_ORDER_ROLE)
+        
+        self.series_list = QListView()
+        self.series_list.setModel(self.series_filter)
+        self.series_list.setUniformItemSizes(True)
+        self.series_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.series_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.series_list.setMinimumWidth(175)  # Set a minimum width
+        self.series_list.setStyleSheet("""
+            QListView {
+                background-color: #0A0E22;
+                color: #E1E6F9;
+                border: none;
+                font-weight: bold;
+            }
+            QListView::item {
+                padding: 4px;
+            }
+            QListView::item:hover {
+                background-color: #1C223F;
+            }
+        """)
+        self.controls_layout.addWidget(self.series_list)
         
-        # Create a widget to hold the buttons
-        self.buttons_widget = QWidget()
-        self.buttons_widget.setStyleSheet("background-color: #0A0E22;")
-        self.buttons_layout = QVBoxLayout(self.buttons_widget)
-        self.buttons_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.buttons_layout.setContentsMargins(0, 0, 0, 0)
-        self.scroll_area.setWidget(self.buttons_widget)
+        # Add aggregation selectors (period and statistic) below the series list
+        aggregation_label = QLabel("Aggregation")
+        aggregation_label.setStyleSheet("color: #E1E6F9; font-weight: bold;")
+        self.controls_layout.addWidget(aggregation_label)
         
-        # Add the scroll area to the controls layout
-        self.controls_layout.addWidget(self.scroll_area)
+        combo_style = """
+            QComboBox {
+                background-color: #0A0E22;
+                color: #E1E6F9;
+                border: 2px solid #29304D;
+                padding: 4px;
+                border-radius: 3px;
+                font-weight: bold;
+            }
+            QComboBox QAbstractItemView {
+                background-color: #1C223F;
+                color: #E1E6F9;
+                selection-background-color: #29304D;
+            }
+        """
+        
+        self.period_selector = QComboBox()
+        self.period_selector.addItems(PERIODS)
+        self.period_selector.setFixedWidth(150)
+        self.period_selector.setStyleSheet(combo_style)
+        self.period_selector.currentTextChanged.connect(self.set_aggregation_period)
+        self.controls_layout.addWidget(self.period_selector)
+        
+        self.statistic_selector = QComboBox()
+        self.statistic_selector.addItems(STATISTICS)
+        self.statistic_selector.setFixedWidth(150)
+        self.statistic_selector.setStyleSheet(combo_style)
+        self.statistic_selector.setEnabled(False)  # Only meaningful for rolled-up periods
+        self.statistic_selector.currentTextChanged.connect(self.set_aggregation_statistic)
+        self.controls_layout.addWidget(self.statistic_selector)
+        
+        # Add view selectors (line chart, or heatmap/statistics of a single series)
+        view_label = QLabel("View")
+        view_label.setStyleSheet("color: #E1E6F9; font-weight: bold;")
+        self.controls_layout.addWidget(view_label)
+        
+        self.view_selector = QComboBox()
+        self.view_selector.addItems(['Lines', 'Heatmap', 'Statistics', 'Compare', 'Sensitivity'])
+        self.view_selector.setFixedWidth(150)
+        self.view_selector.setStyleSheet(combo_style)
+        self.view_selector.currentTextChanged.connect(self.set_view_mode)
+        self.controls_layout.addWidget(self.view_selector)
+        
+        self.series_selector = QComboBox()
+        self.series_selector.setFixedWidth(150)
+        self.series_selector.setStyleSheet(combo_style)
+        self.series_selector.setEnabled(False)  # Only used in heatmap and statistics modes
+        self.series_selector.currentIndexChanged.connect(self.set_selected_series)
+        self.controls_layout.addWidget(self.series_selector)
         
         # Add a 100px transparent vertical spacer
         spacer = QSpacerItem(20, 125, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
@@ -116,6 +266,18 @@ class HistorianManager:
         self.main_layout.setStretch(0, 0)  # Controls don't stretch
         self.main_layout.setStretch(1, 1)  # Chart stretches to fill space
         
+        # Add the main widget to the scene
+        self.chart_proxy = self.historian_scene.addWidget(self.main_widget)
+    
+    def build_chart(self):
+        """
+        Create the matplotlib figure, axes and default series lines.
+        Deferred until the chart is first needed so startup doesn't pay for it.
+        """
+        if self.chart_built:
+            return
+        _load_matplotlib()
+        
         # Create matplotlib figure for the generation chart
         self.figure = plt.figure(figsize=(12, 6))
         self.figure.patch.set_facecolor('#0A0E22')  # Dark navy-blue background
@@ -172,8 +334,99 @@ class HistorianManager:
         # Initialize the secondary axis formatting with default values
         self.update_secondary_axis_formatting(1000)
         
-        # Add the main widget to the scene
-        self.chart_proxy = self.historian_scene.addWidget(self.main_widget)
+        # Create heatmap axes in the same position as the line chart (hidden until selected)
+        # A single image artist is reused for every series and simply has its data replaced
+        self.heatmap_ax = self.figure.add_axes(self.ax.get_position())
+        self.heatmap_ax.set_facecolor('#0A0E22')
+        self.heatmap_image = self.heatmap_ax.imshow(
+            np.full((24, 365), np.nan),
+            aspect='auto',
+            origin='lower',
+            interpolation='nearest',
+            cmap='magma',
+            extent=(0, 365, 0, 24)
+        )
+        self.heatmap_colorbar = self.figure.colorbar(self.heatmap_image, ax=self.heatmap_ax, pad=0.01)
+        self.heatmap_colorbar.ax.tick_params(colors='#B5BEDF')
+        self.heatmap_colorbar.outline.set_edgecolor('#29304D')
+        self.heatmap_ax.set_xlabel('Day of Year', color='#B5BEDF')
+        self.heatmap_ax.set_ylabel('Hour of Day', color='#B5BEDF')
+        self.heatmap_ax.set_yticks([0, 6, 12, 18, 24])
+        self.heatmap_ax.tick_params(colors='#B5BEDF')
+        for spine in self.heatmap_ax.spines.values():
+            spine.set_color('#29304D')
+        self.heatmap_ax.set_visible(False)
+        self.heatmap_colorbar.ax.set_visible(False)
+
+        # Create statistics axes: duration curve on the left, histogram on the right
+        x0, y0, width, height = self.ax.get_position().bounds
+        self.duration_ax = self.figure.add_axes([x0, y0, width * 0.6, height])
+        self.histogram_ax = self.figure.add_axes([x0 + width * 0.68, y0, width * 0.32, height * 0.55])
+        for stats_ax in (self.duration_ax, self.histogram_ax):
+            stats_ax.set_facecolor('#0A0E22')
+            stats_ax.tick_params(colors='#B5BEDF')
+            stats_ax.grid(True, color='#2A334F', linestyle='-')
+            for spine in stats_ax.spines.values():
+                spine.set_color('#29304D')
+        self.duration_ax.set_xlabel('Hours Equalled or Exceeded', color='#B5BEDF')
+        self.histogram_ax.set_xlabel('Value', color='#B5BEDF')
+        self.histogram_ax.set_ylabel('Hours', color='#B5BEDF')
+
+        # Single reusable artists for the duration curve, histogram and summary text
+        self.duration_line, = self.duration_ax.plot([], [], '-', color='#4FC3F7', linewidth=1.5)
+        self.histogram_patch = self.histogram_ax.stairs(np.zeros(1), [0, 1], fill=True, color='#4FC3F7', alpha=0.7)
+        self.statistics_text = self.figure.text(
+            x0 + width * 0.68, y0 + height, '', va='top', ha='left',
+            color='#E1E6F9', fontsize=9, family='monospace'
+        )
+        self.duration_ax.set_visible(False)
+        self.histogram_ax.set_visible(False)
+        self.statistics_text.set_visible(False)
+
+        # Create compare axes: the selected series of every scenario on top, the
+        # difference to the baseline scenario below and the KPI table on the right
+        self.compare_ax = self.figure.add_axes([x0, y0 + height * 0.42, width * 0.7, height * 0.58])
+        self.compare_delta_ax = self.figure.add_axes([x0, y0, width * 0.7, height * 0.34], sharex=self.compare_ax)
+        for compare_ax in (self.compare_ax, self.compare_delta_ax):
+            compare_ax.set_facecolor('#0A0E22')
+            compare_ax.tick_params(colors='#B5BEDF')
+            compare_ax.grid(True, color='#2A334F', linestyle='-')
+            for spine in compare_ax.spines.values():
+                spine.set_color('#29304D')
+        self.compare_ax.set_xlim(0, 8760)
+        self.compare_delta_ax.set_xlabel('Time Step (hour)', color='#B5BEDF')
+        self.compare_delta_ax.axhline(0, color='#29304D', linewidth=1)
+        self.compare_text = self.figure.text(
+            x0 + width * 0.73, y0 + height, '', va='top', ha='left',
+            color='#E1E6F9', fontsize=9, family='monospace',
+            parse_math=False  # Dollar amounts aren't math text
+        )
+        self.compare_ax.set_visible(False)
+        self.compare_delta_ax.set_visible(False)
+        self.compare_text.set_visible(False)
+
+        # Create sensitivity axes: one tornado chart per metric, baseline KPIs above them
+        self.tornado_axes = [
+            self.figure.add_axes([x0 + width * (0.14 + 0.5 * index), y0, width * 0.34, height * 0.82])
+            for index in range(len(TORNADO_METRICS))
+        ]
+        self.sensitivity_text = self.figure.text(
+            x0, y0 + height, '', va='top', ha='left',
+            color='#E1E6F9', fontsize=9, family='monospace',
+            parse_math=False  # Dollar amounts aren't math text
+        )
+        for tornado_ax in self.tornado_axes:
+            tornado_ax.set_visible(False)
+        self.sensitivity_text.set_visible(False)
+        
+        self.chart_built = True
+        
+        # Create lines only for the series currently shown
+        for data_key in self.visible_series:
+            self.lines[data_key] = self.create_line_for_data(data_key)
+        
+        # Update axis visibility based on default visibility settings
+        self.update_axis_visibility()
         
         # Initially draw the empty chart
         self.canvas.draw()
@@ -261,15 +514,15 @@ class HistorianManager:
         self.colors[data_key] = hex_color
         return hex_color
     
-    def create_toggle_button(self, data_key):
+    def get_series_label(self, data_key):
         """
-        Create a button to toggle the visibility of a data series
+        Get the display label for a data series
         
         Args:
             data_key: Key for the data in the historian dictionary
             
         Returns:
-            The created button
+            Label string
         """
         # Format the label (replace underscores with spaces and capitalize words)
         label = ' '.join(word.capitalize() for word in data_key.split('_'))
@@ -283,109 +536,167 @@ class HistorianManager:
             component_type = data_key.split('_')[1]
             component_id = data_key.split('_')[-1]
             label = f"Cost {component_type} {component_id}"
+        return label
+    
+    def get_series_group(self, data_key):
+        """
+        Get the ordering group of a series in the selector: default primary
+        series first, then component primary series, then default and
+        component secondary (cumulative $) series
         
-        # Get color for this data series
-        color = self.get_color_for_data(data_key)
-        
-        # Create button with the data key as text
-        button = QPushButton(label)
-        button.setFixedWidth(150)
-        
-        # Set button appearance
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #0A0E22;
-                color: #E1E6F9;
-                border: 2px solid {color};
-                padding: 5px;
-                border-radius: 3px;
-                text-align: left;
-                font-weight: bold;
-            }}
-            QPushButton:checked {{
-                background-color: #1C223F;
-                color: #888888;
-                border: 1px solid #888888;
-            }}
-        """)
-        
-        # Make it checkable (toggle button)
-        button.setCheckable(True)
+        Args:
+            data_key: Key for the data in the historian dictionary
+            
+        Returns:
+            Group number (0-3)
+        """
+        if data_key in DEFAULT_PRIMARY_SERIES:
+            return 0
+        if data_key in DEFAULT_SECONDARY_SERIES:
+            return 2
+        return 3 if self.is_secondary_series(data_key) else 1
+    
+    def create_series_item(self, data_key):
+        """
+        Add a checkable entry for a data series to the series selector.
+        Only the lightweight model item is created; the line artist is
+        created when the series is first made visible.
         
-        # Set initial state - only specific buttons are unchecked (visible) by default
-        button.setChecked(not (data_key == 'satisfied_load' or 
-                             data_key == 'cumulative_revenue' or 
-                             data_key == 'cumulative_cost' or 
-                             data_key == 'system_instability'))
+        Args:
+            data_key: Key for the data in the historian dictionary
+            
+        Returns:
+            The created QStandardItem
+        """
+        # Color swatch so entries can be matched to their lines
+        swatch = QPixmap(12, 12)
+        swatch.fill(QColor(self.get_color_for_data(data_key)))
+        
+        item = QStandardItem(QIcon(swatch), self.get_series_label(data_key))
+        item.setEditable(False)
+        item.setCheckable(True)
+        item.setData(data_key, SERIES_KEY_ROLE)
+        
+        # Sort by group, then by order of appearance within the group
+        self._series_counter += 1
+        item.setData(self.get_series_group(data_key) * 1_000_000 + self._series_counter, SERIES_ORDER_ROLE)
+        
+        self._suppress_item_changes = True
+        item.setCheckState(Qt.CheckState.Checked if data_key in self.visible_series else Qt.CheckState.Unchecked)
+        self.series_model.appendRow(item)
+        self._suppress_item_changes = False
+        
+        self.series_items[data_key] = item
+        return item
+    
+    def remove_series_item(self, data_key):
+        """
+        Remove a data series from the selector and release its line
         
-        # Connect the clicked signal to update the chart
-        button.clicked.connect(lambda checked, k=data_key: self.toggle_line_visibility(k, checked))
+        Args:
+            data_key: Key for the data in the historian dictionary
+        """
+        item = self.series_items.pop(data_key, None)
+        if item is not None:
+            self.series_model.removeRow(item.row())
+        self.visible_series.discard(data_key)
+        self.release_line(data_key)
+    
+    def on_series_item_changed(self, item):
+        """Handle a series being checked or unchecked in the selector"""
+        if self._suppress_item_changes:
+            return
+        data_key = item.data(SERIES_KEY_ROLE)
+        if data_key is not None:
+            self.set_series_visible(data_key, item.checkState() == Qt.CheckState.Checked)
+    
+    def filter_series(self, text):
+        """Filter the series selector by a search string"""
+        self.series_filter.setFilterFixedString(text)
+    
+    def release_line(self, data_key):
+        """
+        Remove a line artist from the chart and stop tracking it
         
-        return button
+        Args:
+            data_key: Key for the data in the historian dictionary
+        """
+        line = self.lines.pop(data_key, None)
+        if line is not None:
+            line.remove()
     
-    def toggle_line_visibility(self, data_key, visible):
+    def set_series_visible(self, data_key, visible):
         """
-        Toggle the visibility of a line in the chart
+        Show or hide a data series. The line artist is created when the
+        series is shown and released when it is hidden.
         
         Args:
             data_key: Key for the data in the historian dictionary
-            visible: Whether the line should be visible
+            visible: Whether the series should be shown
         """
-        if data_key in self.lines:
-            # Update the line's visibility
-            self.lines[data_key].set_visible(not visible)
-            self.line_visibility[data_key] = not visible
-            
-            # If a line is toggled, recalculate both axis scales based on all visible lines
+        if visible:
+            self.visible_series.add(data_key)
+        else:
+            self.visible_series.discard(data_key)
+        
+        if not self.chart_built:
+            return
+        
+        if visible and data_key not in self.lines:
+            self.lines[data_key] = self.create_line_for_data(data_key)
+            # Populate the new line with the current data
             historian_data = self.parent.simulation_engine.historian
             current_time = self.parent.simulation_engine.current_time_step
-            
-            if current_time > 0:
-                # Track maximum values for both axes
-                max_val_primary = 0
-                max_val_secondary = 0
-                
-                # Calculate max values considering all visible lines
-                for key, line in self.lines.items():
-                    if key in historian_data and self.line_visibility.get(key, False):
-                        y_values = historian_data[key][:current_time]
-                        if y_values and len(y_values) > 0:
-                            series_max = max(y_values)
-                            if key in self.secondary_axis_series or key.startswith('Rev_') or key.startswith('Cost_'):
-                                if series_max > max_val_secondary:
-                                    max_val_secondary = series_max
-                            else:
-                                if series_max > max_val_primary:
-                                    max_val_primary = series_max
-                
-                # Set axis scales based on all visible lines
-                if max_val_primary > 0:
-                    self.ax.set_ylim(0, max_val_primary * 1.1)  # 10% headroom
-                
-                if max_val_secondary > 0:
-                    self.ax2.set_ylim(0, max_val_secondary * 1.1)  # 10% headroom
-                    self.update_secondary_axis_formatting(max_val_secondary * 1.1)
-            
-            # Update axis visibility
-            self.update_axis_visibility()
-            
-            # Redraw the canvas
-            self.canvas.draw()
+            if data_key in historian_data and current_time > 0:
+                num_points = self.get_num_points(data_key, current_time)
+                self.lines[data_key].set_data(*self.get_plot_data(data_key, historian_data[data_key], num_points))
+        elif not visible:
+            self.release_line(data_key)
+        
+        # Recalculate both axis scales based on the visible lines
+        if self.parent.simulation_engine.current_time_step > 0:
+            self.rescale_axes()
+        
+        # Update axis visibility
+        self.update_axis_visibility()
+        
+        # Redraw the canvas
+        self.canvas.draw()
+    
+    def rescale_axes(self):
+        """Scale both y axes to fit the currently shown lines"""
+        # Track maximum values for both axes
+        max_val_primary = 0
+        max_val_secondary = 0
+        
+        # Use the plotted data so the scale matches the current aggregation
+        for key, line in self.lines.items():
+            y_values = line.get_ydata()
+            if len(y_values) > 0:
+                series_max = max(y_values)
+                if self.is_secondary_series(key):
+                    max_val_secondary = max(max_val_secondary, series_max)
+                else:
+                    max_val_primary = max(max_val_primary, series_max)
+        
+        # Set axis scales based on all visible lines
+        if max_val_primary > 0:
+            self.ax.set_ylim(0, max_val_primary * 1.1)  # 10% headroom
+        
+        if max_val_secondary > 0:
+            self.ax2.set_ylim(0, max_val_secondary * 1.1)  # 10% headroom
+            self.update_secondary_axis_formatting(max_val_secondary * 1.1)
     
     def update_axis_visibility(self):
         """Update the visibility of the secondary y-axis based on visible lines"""
+        if not self.chart_built:
+            return
+        
         # Check if any secondary axis series are visible
-        any_secondary_visible = False
-        for key in self.lines:
-            if (key in self.secondary_axis_series or key.startswith('Rev_') or key.startswith('Cost_')) and self.line_visibility.get(key, True):
-                any_secondary_visible = True
-                break
+        any_secondary_visible = any(self.is_secondary_series(key) for key in self.lines)
         
-        # Show/hide secondary axis
+        # Show/hide secondary axis (callers redraw the canvas once they're done)
         self.ax2.yaxis.set_visible(any_secondary_visible)
-        
-        # Redraw the canvas
-        self.canvas.draw()
     
     def create_line_for_data(self, data_key):
         """
@@ -401,8 +712,7 @@ class HistorianManager:
         color = self.get_color_for_data(data_key)
         
         # Determine which axis to use
-        is_secondary = data_key in self.secondary_axis_series or data_key.startswith('Rev_') or data_key.startswith('Cost_')
-        ax = self.ax2 if is_secondary else self.ax
+        ax = self.ax2 if self.is_secondary_series(data_key) else self.ax
         
         # Create the line with appropriate styling
         line, = ax.plot(
@@ -419,15 +729,10 @@ class HistorianManager:
             ]
         )
         
-        # Initialize visibility state
-        # satisfied_load, cumulative_revenue, and cumulative_cost start visible by default
-        # Rev_* and Cost_* start hidden by default
-        initial_visible = (data_key == 'satisfied_load' or 
-                          data_key == 'cumulative_revenue' or 
-                          data_key == 'cumulative_cost' or 
-                          data_key == 'system_instability')
-        self.line_visibility[data_key] = initial_visible
-        line.set_visible(initial_visible)
+        # Rollups are drawn as one point per period, so show markers
+        if self.aggregation_period != 'Hourly':
+            line.set_marker('o')
+            line.set_markersize(3)
         
         return line
     
@@ -487,10 +792,502 @@ class HistorianManager:
             self.ax2.yaxis.set_major_formatter(ticker.FuncFormatter(format_func))
             self.ax2.set_ylabel('Amount ($ 1,000s)', color='#B5BEDF')
     
+    def is_secondary_series(self, data_key):
+        """Check whether a data series is plotted on the secondary (cumulative $) axis"""
+        return data_key in self.secondary_axis_series or data_key.startswith('Rev_') or data_key.startswith('Cost_')
+
+    def get_num_points(self, data_key, current_time):
+        """
+        Get the number of valid historian samples for a series at the given time
+
+        Args:
+            data_key: Key for the data in the historian dictionary
+            current_time: Next time step to be simulated
+
+        Returns:
+            Number of leading samples that hold calculated data
+        """
+        if self.is_secondary_series(data_key):
+            # Cumulative data index T contains value at *end* of hour T
+            return max(0, current_time - 1)
+        # Instantaneous data index T contains value *during* hour T
+        return current_time
+
+    def get_plot_data(self, data_key, data_values, num_points):
+        """
+        Get the x and y values to plot for a series, applying the selected
+        temporal aggregation (rollups come from the per-run cache)
+
+        Args:
+            data_key: Key for the data in the historian dictionary
+            data_values: Full historian list for the series
+            num_points: Number of leading samples that hold calculated data
+
+        Returns:
+            Tuple of (x_values, y_values)
+        """
+        num_points = min(len(data_values), num_points)
+
+        if self.aggregation_period == 'Hourly':
+            return list(range(num_points)), data_values[:num_points]
+
+        rollup = self.rollup_cache.get(data_key, data_values, self.aggregation_period, num_points)
+        return rollup['x'], rollup[self.aggregation_statistic]
+
+    def set_aggregation_period(self, period):
+        """
+        Switch the chart between hourly data and daily/weekly/monthly rollups
+
+        Args:
+            period: One of 'Hourly', 'Daily', 'Weekly' or 'Monthly'
+        """
+        self.build_chart()
+        self.aggregation_period = period
+        self.statistic_selector.setEnabled(period != 'Hourly')
+
+        # Rollups are drawn as one point per period, so show markers to make periods readable
+        for line in self.lines.values():
+            line.set_marker('o' if period != 'Hourly' else '')
+            line.set_markersize(3)
+
+        if self.parent.simulation_engine.current_time_step > 0:
+            self.update_chart()
+        else:
+            self.canvas.draw()
+
+    def set_aggregation_statistic(self, statistic):
+        """
+        Select which statistic (Mean, Sum, Min, Max) is shown for rolled-up periods
+
+        Args:
+            statistic: One of the names in STATISTICS
+        """
+        self.build_chart()
+        self.aggregation_statistic = statistic
+        if self.aggregation_period != 'Hourly' and self.parent.simulation_engine.current_time_step > 0:
+            self.update_chart()
+
+    def set_view_mode(self, mode):
+        """
+        Switch between the multi-series line chart, the single-series
+        heatmap and statistics views and the scenario comparison
+
+        Args:
+            mode: 'Lines', 'Heatmap', 'Statistics', 'Compare' or 'Sensitivity'
+        """
+        self.build_chart()
+        self.view_mode = mode
+        is_lines = mode == 'Lines'
+        is_heatmap = mode == 'Heatmap'
+        is_statistics = mode == 'Statistics'
+        is_compare = mode == 'Compare'
+        is_sensitivity = mode == 'Sensitivity'
+
+        # Show only the axes that belong to the selected view
+        self.ax.set_visible(is_lines)
+        self.ax2.set_visible(is_lines)
+        self.heatmap_ax.set_visible(is_heatmap)
+        self.heatmap_colorbar.ax.set_visible(is_heatmap)
+        self.duration_ax.set_visible(is_statistics)
+        self.histogram_ax.set_visible(is_statistics)
+        self.statistics_text.set_visible(is_statistics)
+        self.compare_ax.set_visible(is_compare)
+        self.compare_delta_ax.set_visible(is_compare)
+        self.compare_text.set_visible(is_compare)
+        for tornado_ax in self.tornado_axes:
+            tornado_ax.set_visible(is_sensitivity)
+        self.sensitivity_text.set_visible(is_sensitivity)
+
+        # The compare view offers the series the compared scenarios have in common
+        self.refresh_series_selector()
+
+        # Line-only controls are disabled while a single-series view is shown
+        self.series_selector.setEnabled(not is_lines and not is_sensitivity)
+        self.period_selector.setEnabled(is_lines)
+        self.statistic_selector.setEnabled(is_lines and self.aggregation_period != 'Hourly')
+        self.series_list.setEnabled(is_lines)
+        self.series_search.setEnabled(is_lines)
+
+        if is_heatmap:
+            self.update_heatmap()
+        elif is_statistics:
+            self.update_statistics_view()
+        elif is_compare:
+            self.update_comparison_view()
+        elif is_sensitivity:
+            self.update_sensitivity_view()
+        elif self.parent.simulation_engine.current_time_step > 0:
+            self.update_chart()
+            return
+        self.canvas.draw()
+
+    def set_selected_series(self, index):
+        """
+        Select which series is drawn in the heatmap and statistics views
+
+        Args:
+            index: Index of the selected item in the series selector
+        """
+        self.build_chart()
+        data_key = self.series_selector.itemData(index)
+        if data_key is None:
+            return
+        self.selected_series_key = data_key
+        if self.view_mode == 'Heatmap':
+            self.update_heatmap()
+            self.canvas.draw()
+        elif self.view_mode == 'Statistics':
+            self.update_statistics_view()
+            self.canvas.draw()
+        elif self.view_mode == 'Compare':
+            self.update_comparison_view()
+            self.canvas.draw()
+
+    def refresh_series_selector(self):
+        """Keep the series selector in sync with the available data series"""
+        if self.view_mode == 'Compare' and self.comparison is not None:
+            # Series every compared scenario recorded
+            keys = list(self.comparison['keys'])
+        else:
+            # Same order as the series list, followed by the bundled price series
+            keys = sorted(self.series_items, key=lambda k: self.series_items[k].data(SERIES_ORDER_ROLE))
+            keys.append(POOL_PRICE_KEY)
+        current_keys = [self.series_selector.itemData(i) for i in range(self.series_selector.count())]
+        if keys == current_keys:
+            return
+
+        # Rebuild items without triggering a redraw for every insertion
+        self.series_selector.blockSignals(True)
+        self.series_selector.clear()
+        for key in keys:
+            label = 'Pool Price' if key == POOL_PRICE_KEY else self.get_series_label(key)
+            self.series_selector.addItem(label, key)
+        if self.selected_series_key not in keys:
+            self.selected_series_key = 'total_load'
+        self.series_selector.setCurrentIndex(max(0, self.series_selector.findData(self.selected_series_key)))
+        self.series_selector.blockSignals(False)
+
+    def get_series_values(self, data_key):
+        """
+        Get the values and number of valid samples for a single-series view
+
+        Args:
+            data_key: Historian key, or POOL_PRICE_KEY for the bundled price series
+
+        Returns:
+            Tuple of (values, num_points); values is None if the series doesn't exist
+        """
+        if data_key == POOL_PRICE_KEY:
+            prices = load_pool_prices()
+            return prices, len(prices)
+
+        historian_data = self.parent.simulation_engine.historian
+        current_time = self.parent.simulation_engine.current_time_step
+        if data_key not in historian_data or current_time <= 0:
+            return None, 0
+        return historian_data[data_key], self.get_num_points(data_key, current_time)
+
+    def get_series_units(self, data_key):
+        """
+        Get the axis label and tick formatter matching the units of a series
+
+        Args:
+            data_key: Historian key, or POOL_PRICE_KEY
+
+        Returns:
+            Tuple of (label, formatter)
+        """
+        if data_key == POOL_PRICE_KEY:
+            return 'Price ($/kWh)', ticker.FuncFormatter(lambda x, pos: f"{x:.3f}")
+        if self.is_secondary_series(data_key):
+            return 'Amount ($ 1,000s)', ticker.FuncFormatter(lambda x, pos: f"{x/1_000:.1f}")
+        return 'Power (MW)', ticker.FuncFormatter(lambda x, pos: f"{x/1000:.1f}")
+
+    def update_heatmap(self):
+        """
+        Update the heatmap image with the selected series reshaped into a
+        24 x 365 hour-of-day by day-of-year matrix
+        """
+        data_key = self.selected_series_key
+        values, num_points = self.get_series_values(data_key)
+
+        if values is None or num_points <= 0:
+            self.heatmap_image.set_data(np.full((24, 365), np.nan))
+            return
+
+        matrix = to_day_hour_matrix(values, num_points)
+        self.heatmap_image.set_data(matrix)
+
+        # Scale colors to the simulated range of this series
+        valid = matrix[~np.isnan(matrix)]
+        if len(valid):
+            vmin, vmax = float(valid.min()), float(valid.max())
+            if vmax <= vmin:
+                vmax = vmin + 1
+            self.heatmap_image.set_clim(vmin, vmax)
+
+        # Label the color scale in the units used by the line chart
+        label, formatter = self.get_series_units(data_key)
+        self.heatmap_colorbar.set_label(label, color='#B5BEDF')
+        self.heatmap_colorbar.formatter = formatter
+        self.heatmap_colorbar.update_ticks()
+
+    def update_statistics_view(self):
+        """
+        Update the duration curve, histogram and percentile summary for the
+        selected series, using the per-run statistics cache
+        """
+        data_key = self.selected_series_key
+        values, num_points = self.get_series_values(data_key)
+
+        if values is None or num_points <= 0:
+            self.duration_line.set_data([], [])
+            self.histogram_patch.set_data(np.zeros(1), [0, 1])
+            self.statistics_text.set_text('')
+            return
+
+        stats = self.statistics_cache.get_series(data_key, values, num_points)
+        label, formatter = self.get_series_units(data_key)
+
+        # Duration curve - values sorted high to low against hours
+        curve = stats['duration_curve']
+        self.duration_line.set_data(np.arange(len(curve)), curve)
+        self.duration_ax.set_xlim(0, max(1, len(curve)))
+        low, high = min(0.0, stats['min']), stats['max']
+        self.duration_ax.set_ylim(low, high * 1.1 if high > low else low + 1)
+        self.duration_ax.set_ylabel(label, color='#B5BEDF')
+        self.duration_ax.yaxis.set_major_formatter(formatter)
+
+        # Histogram - a single step patch with its data replaced
+        counts, edges = stats['histogram']
+        self.histogram_patch.set_data(counts, edges)
+        self.histogram_ax.set_xlim(edges[0], edges[-1])
+        self.histogram_ax.set_ylim(0, max(1, counts.max()) * 1.1)
+        self.histogram_ax.set_xlabel(label, color='#B5BEDF')
+        self.histogram_ax.xaxis.set_major_formatter(formatter)
+
+        # Percentile summary, plus run metrics for historian series
+        lines = [self.series_selector.currentText() or data_key]
+        for p in PERCENTILES:
+            lines.append(f"P{p:<3}  {formatter(stats['percentiles'][p], None):>10}")
+        lines.append(f"Mean  {formatter(stats['mean'], None):>10}")
+        lines.append(f"Max   {formatter(stats['max'], None):>10}")
+
+        metrics = self.get_run_metrics()
+        if metrics is not None:
+            lines.append("")
+            lines.append(f"Unstable hours  {metrics['instability_hours']:>8,}")
+            lines.append(f"Peak import     {metrics['peak_import'] / 1000:>8.2f} MW")
+            if data_key in metrics['capacity_factors']:
+                lines.append(f"Capacity factor {metrics['capacity_factors'][data_key]:>8.1%}")
+        self.statistics_text.set_text('\n'.join(lines))
+
+    def show_comparison(self, runs):
+        """
+        Show finished scenario runs side by side in the 'Compare' view
+
+        Args:
+            runs: Results of headless.run_scenario_for_comparison, baseline first
+        """
+        names = [run['name'] for run in runs]
+        # Only series every scenario recorded can be compared (islands may differ)
+        keys = [key for key in runs[0]['historian'] if all(key in run['historian'] for run in runs[1:])]
+        keys.sort(key=lambda key: (self.get_series_group(key), key))
+        
+        # One (scenarios x hours) matrix per series, so deltas are whole-array operations
+        series = {key: np.vstack([run['historian'][key] for run in runs]) for key in keys}
+        kpis = np.array([
+            [np.nan if run['kpis'].get(key) is None else run['kpis'][key] for key, _, _, _, _ in COMPARE_KPIS]
+            for run in runs
+        ], dtype=float)
+        
+        self.comparison = {'names': names, 'keys': keys, 'series': series, 'kpis': kpis}
+        if self.selected_series_key not in series:
+            self.selected_series_key = 'cumulative_revenue' if 'cumulative_revenue' in series else keys[0]
+        
+        self.build_chart()
+        if self.view_selector.currentText() == 'Compare':
+            self.set_view_mode('Compare')
+        else:
+            # Triggers set_view_mode through the selector's signal
+            self.view_selector.setCurrentText('Compare')
+    
+    def update_comparison_view(self):
+        """
+        Redraw the compare view: the selected series of every scenario, its
+        difference to the baseline scenario and the KPI table
+        """
+        for line in self.compare_lines:
+            line.remove()
+        self.compare_lines = []
+        legend = self.compare_ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        
+        if self.comparison is None:
+            self.compare_text.set_text('No comparison loaded.\n\nUse Model > Compare to run\ntwo or more saved scenarios.')
+            return
+        
+        data_key = self.selected_series_key
+        if data_key not in self.comparison['series']:
+            return
+        names = self.comparison['names']
+        values = self.comparison['series'][data_key]
+        num_points = self.get_num_points(data_key, values.shape[1] - 1)
+        hours = np.arange(num_points)
+        values = values[:, :num_points]
+        # Difference of every scenario to the baseline in one operation
+        deltas = values[1:] - values[0]
+        
+        for index, name in enumerate(names):
+            color = COMPARE_COLORS[index % len(COMPARE_COLORS)]
+            line, = self.compare_ax.plot(hours, values[index], '-', color=color, linewidth=0.75, alpha=0.9, label=name)
+            self.compare_lines.append(line)
+            if index > 0:
+                line, = self.compare_delta_ax.plot(hours, deltas[index - 1], '-', color=color, linewidth=0.75, alpha=0.9)
+                self.compare_lines.append(line)
+        
+        # Scale both axes to the data and label them in the series' units
+        label, formatter = self.get_series_units(data_key)
+        low, high = float(min(0.0, values.min())), float(values.max())
+        self.compare_ax.set_ylim(low, high * 1.1 if high > low else low + 1)
+        spread = float(np.abs(deltas).max()) if deltas.size else 0.0
+        spread = spread * 1.1 if spread > 0 else 1
+        self.compare_delta_ax.set_ylim(-spread, spread)
+        for compare_ax, axis_label in ((self.compare_ax, label), (self.compare_delta_ax, 'Δ vs baseline')):
+            compare_ax.yaxis.set_major_formatter(formatter)
+            compare_ax.set_ylabel(axis_label, color='#B5BEDF')
+        self.compare_ax.legend(loc='upper left', fontsize=8, facecolor='#11182F', edgecolor='#29304D', labelcolor='#E1E6F9')
+        
+        # KPI table - baseline values, then each scenario's difference to it
+        kpis = self.comparison['kpis']
+        kpi_deltas = kpis[1:] - kpis[0]
+        lines = [self.get_series_label(data_key), '']
+        lines.append(f"{'Baseline':<13}{names[0][:18]}")
+        for index, name in enumerate(names[1:], start=1):
+            lines.append(f"{'Δ ' + str(index):<13}{name[:18]}")
+        lines.append('')
+        for column, (_, kpi_label, scale, unit, decimals) in enumerate(COMPARE_KPIS):
+            row = f"{kpi_label:<13}{self._format_kpi(kpis[0, column], scale, unit, decimals):>12}"
+            for delta in kpi_deltas[:, column]:
+                row += f"  {self._format_kpi(delta, scale, unit, decimals, signed=True):>11}"
+            lines.append(row)
+        
+        # Final difference of the selected series (e.g. cumulative revenue at year end)
+        if deltas.size:
+            lines.append('')
+            lines.append(f"{'End Δ':<13}{'':>12}" + ''.join(f"  {formatter(delta, None):>11}" for delta in deltas[:, -1]))
+        self.compare_text.set_text('\n'.join(lines))
+    
+    def show_sensitivity(self, rows, baseline_kpis, percent):
+        """
+        Show a finished sensitivity analysis in the 'Sensitivity' view
+
+        Args:
+            rows: Tornado rows from sensitivity.summarize, most influential first
+            baseline_kpis: KPIs of the unperturbed run
+            percent: Perturbation size in percent
+        """
+        self.sensitivity = {'rows': rows, 'baseline': baseline_kpis, 'percent': percent}
+        
+        self.build_chart()
+        if self.view_selector.currentText() == 'Sensitivity':
+            self.set_view_mode('Sensitivity')
+        else:
+            # Triggers set_view_mode through the selector's signal
+            self.view_selector.setCurrentText('Sensitivity')
+    
+    def update_sensitivity_view(self):
+        """Redraw the tornado charts and the baseline KPIs of the sensitivity view"""
+        if self.sensitivity is None:
+            for tornado_ax in self.tornado_axes:
+                tornado_ax.clear()
+                tornado_ax.set_visible(False)
+            self.sensitivity_text.set_text('No sensitivity analysis loaded.\n\nUse Model > Sensitivity to rank the\nscenario\'s parameters by their effect.')
+            return
+        
+        rows = self.sensitivity['rows']
+        percent = self.sensitivity['percent']
+        for tornado_ax, metric in zip(self.tornado_axes, TORNADO_METRICS):
+            draw_tornado(tornado_ax, rows, metric, percent)
+        
+        baseline = self.sensitivity['baseline']
+        values = []
+        for key, label, scale, unit in TORNADO_METRICS:
+            value = np.nan if baseline.get(key) is None else baseline[key]
+            values.append(f"{label} {self._format_kpi(value, scale, unit, 2)}")
+        self.sensitivity_text.set_text(f"Sensitivity ±{percent:g}%   Baseline: " + "   ".join(values))
+    
+    @staticmethod
+    def _format_kpi(value, scale, unit, decimals, signed=False):
+        """Format a KPI (or KPI difference) for the compare table"""
+        if np.isnan(value):
+            return '--'
+        sign = '+' if signed else ''
+        return f"{value * scale:{sign},.{decimals}f}{unit}"
+    
+    def get_generator_capacities(self):
+        """
+        Map generation component historian keys to their capacities
+
+        Returns:
+            Dictionary of historian key -> capacity (kW)
+        """
+        prefixes = {
+            'GeneratorComponent': 'Generator',
+            'SolarPanelComponent': 'Solar',
+            'WindTurbineComponent': 'Wind'
+        }
+        capacities = {}
+        for component in getattr(self.parent, 'components', []):
+            prefix = prefixes.get(type(component).__name__)
+            if prefix is not None:
+                # Same key format the simulation engine uses when recording outputs
+                capacities[f"{prefix}_{str(id(component))[-6:]}"] = component.capacity
+        return capacities
+
+    def get_run_metrics(self):
+        """
+        Get headline metrics for the current run (instability hours, peak
+        import, capacity factor per generator) from the statistics cache
+
+        Returns:
+            Metrics dictionary, or None if nothing has been simulated yet
+        """
+        engine = self.parent.simulation_engine
+        if engine.current_time_step <= 0:
+            return None
+        return self.statistics_cache.get_metrics(
+            engine.historian,
+            engine.current_time_step,
+            self.get_generator_capacities(),
+            getattr(engine, 'stability_tolerance', 0.1)
+        )
+
+    def precompute_rollups(self):
+        """
+        Compute rollups, statistics and run metrics for all historian series
+        so switching aggregation or views is instant after a run
+        """
+        current_time = self.parent.simulation_engine.current_time_step
+        if current_time <= 0:
+            return
+        historian_data = self.parent.simulation_engine.historian
+        self.rollup_cache.precompute(
+            historian_data,
+            lambda key: self.get_num_points(key, current_time)
+        )
+        for data_key, values in historian_data.items():
+            self.statistics_cache.get_series(data_key, values, self.get_num_points(data_key, current_time))
+        self.get_run_metrics()
+
     def update_chart(self):
         """
         Update the histogram chart with current data from the simulation engine
         """
+        # Build the chart on first use
+        self.build_chart()
+
         historian_data = self.parent.simulation_engine.historian
         current_time = self.parent.simulation_engine.current_time_step # Next step to be simulated (e.g., 6 if hour 5 just finished)
 
@@ -499,211 +1296,83 @@ class HistorianManager:
             self.clear_chart() # Ensure chart is empty if time is 0
             return
 
-        # Track maximum values for both axes
-        max_val_primary = 0
-        max_val_secondary = 0
-
-        # --- Update Existing Lines ---
-        # Iterate through a copy of keys in case dictionary changes during iteration (though unlikely here)
-        existing_lines_keys = list(self.lines.keys())
-        for data_key in existing_lines_keys:
-            if data_key not in historian_data:
-                # Data key might exist from a previous run but not current one
-                self.lines[data_key].set_data([], []) # Clear data
-                continue
-
-            data_values = historian_data[data_key]
-            is_cumulative = data_key in self.secondary_axis_series or data_key.startswith('Rev_') or data_key.startswith('Cost_')
-
-            # Determine the number of points to plot and the slice index
-            if is_cumulative:
-                # Cumulative data index T contains value at *end* of hour T.
-                # Last calculated index is current_time - 2 (e.g., index 4 if current_time=6).
-                # We need to plot points up to and including this last index.
-                # Number of points = (last index) + 1 = (current_time - 2) + 1 = current_time - 1.
-                # Slice index = number of points = current_time - 1.
-                num_points = max(0, current_time - 1)
-                slice_index = num_points
-            else:
-                # Instantaneous data index T contains value *during* hour T.
-                # Last calculated index is current_time - 1 (e.g., index 5 if current_time=6).
-                # Number of points = (last index) + 1 = (current_time - 1) + 1 = current_time.
-                # Slice index = number of points = current_time.
-                num_points = current_time
-                slice_index = num_points
-
-            # Generate x_values for the determined range
-            current_x_values = list(range(num_points))
-
-            # Slice y_values safely based on the required range end index
-            if len(data_values) >= slice_index:
-                y_values = data_values[:slice_index]
-            else:
-                # Fallback if data is shorter than expected (e.g., beginning of sim)
-                y_values = data_values[:min(len(data_values), slice_index)]
-
-            # Ensure x and y have the same length (adjust x if y was truncated)
-            if len(current_x_values) != len(y_values):
-                current_x_values = list(range(len(y_values)))
-
-            # Update the line data
-            if data_key in self.lines: # Ensure line exists
-                self.lines[data_key].set_data(current_x_values, y_values)
-
-                # Update max value calculation (only consider visible lines for scaling)
-                if y_values and self.line_visibility.get(data_key, True):
-                    series_max = max(y_values) # y_values confirmed non-empty
-                    if is_cumulative:
-                        if series_max > max_val_secondary: max_val_secondary = series_max
-                    else:
-                        if series_max > max_val_primary: max_val_primary = series_max
-
-        # --- Add New Lines (if any new keys appear in historian_data) ---
+        # --- Sync the series selector with the historian keys ---
+        # New series only get a selector entry; lines are created when shown
+        series_added = False
         for data_key in historian_data.keys():
-            if data_key not in self.lines:
-                # New data series encountered
-                data_values = historian_data[data_key]
-                is_cumulative = data_key in self.secondary_axis_series or data_key.startswith('Rev_') or data_key.startswith('Cost_')
-
-                # Determine plot range and slice index for the new line
-                if is_cumulative:
-                    num_points = max(0, current_time - 1)
-                    slice_index = num_points
-                else:
-                    num_points = current_time
-                    slice_index = num_points
+            if data_key not in self.series_items:
+                self.create_series_item(data_key)
+                series_added = True
+                if data_key in self.visible_series:
+                    self.lines[data_key] = self.create_line_for_data(data_key)
 
-                current_x_values = list(range(num_points))
+        # Drop component series whose data no longer exists (e.g. deleted components)
+        for data_key in list(self.series_items.keys()):
+            if data_key not in historian_data and data_key not in DEFAULT_PRIMARY_SERIES + DEFAULT_SECONDARY_SERIES:
+                self.remove_series_item(data_key)
 
-                if len(data_values) >= slice_index:
-                    y_values = data_values[:slice_index]
-                else:
-                    y_values = data_values[:min(len(data_values), slice_index)]
-
-                if len(current_x_values) != len(y_values):
-                    current_x_values = list(range(len(y_values)))
-
-                # Create line and button objects
-                self.lines[data_key] = self.create_line_for_data(data_key)
-                self.lines[data_key].set_data(current_x_values, y_values) # Set initial data
-
-                if data_key not in self.toggle_buttons:
-                    button = self.create_toggle_button(data_key)
-                    self.toggle_buttons[data_key] = button
-                    
-                    # Add button to layout in correct section
-                    if is_cumulative:
-                        self.secondary_buttons.append(button)
-                        
-                        # Add separator only if this is the first secondary button being added
-                        if len(self.secondary_buttons) == 1:
-                            separator = QFrame()
-                            separator.setFrameShape(QFrame.Shape.HLine)
-                            separator.setFrameShadow(QFrame.Shadow.Sunken)
-                            separator.setStyleSheet("background-color: #555555;")
-                            self.buttons_layout.addWidget(separator)
-                        
-                        # Determine if this is a default button or component-specific button
-                        is_component_specific = data_key.startswith('Rev_') or data_key.startswith('Cost_')
-                        
-                        # Default secondary buttons go before component-specific ones
-                        if not is_component_specific:
-                            # Find the position right before the first component-specific secondary button
-                            insert_index = None
-                            for i, btn in enumerate(self.secondary_buttons):
-                                btn_key = next((k for k, v in self.toggle_buttons.items() if v == btn), "")
-                                if btn_key.startswith('Rev_') or btn_key.startswith('Cost_'):
-                                    # Get the actual widget index
-                                    for j in range(self.buttons_layout.count()):
-                                        if self.buttons_layout.itemAt(j).widget() == btn:
-                                            insert_index = j
-                                            break
-                                    break
-                            
-                            if insert_index is not None:
-                                self.buttons_layout.insertWidget(insert_index, button)
-                            else:
-                                # No component-specific buttons yet, add at the end
-                                self.buttons_layout.addWidget(button)
-                        else:
-                            # Component-specific secondary buttons always go at the end
-                            self.buttons_layout.addWidget(button)
-                    else:
-                        self.primary_buttons.append(button)
-                        
-                        # Determine if this is a default button or component-specific button
-                        # Default buttons are pre-defined ones like total_generation, total_load, etc.
-                        default_primary = ['total_generation', 'total_load', 'grid_import', 'grid_export', 
-                                          'battery_charge', 'system_instability', 'satisfied_load']
-                        is_component_specific = data_key not in default_primary
-                        
-                        if not is_component_specific:
-                            # Default primary buttons go at the top of the primary section
-                            # Find the index after the last default primary button
-                            insert_index = 0
-                            for i, btn in enumerate(self.primary_buttons):
-                                if btn == button:  # Skip the current button we're adding
-                                    continue
-                                btn_key = next((k for k, v in self.toggle_buttons.items() if v == btn), "")
-                                if btn_key in default_primary:
-                                    # Get the actual widget index
-                                    for j in range(self.buttons_layout.count()):
-                                        if self.buttons_layout.itemAt(j).widget() == btn:
-                                            insert_index = j + 1  # After this default button
-                            
-                            # Insert at the calculated position
-                            self.buttons_layout.insertWidget(insert_index, button)
-                        else:
-                            # Component-specific primary buttons go after all default primary buttons
-                            # but before the separator and secondary buttons
-                            
-                            # Find the separator or first secondary button
-                            separator_index = None
-                            for i in range(self.buttons_layout.count()):
-                                widget = self.buttons_layout.itemAt(i).widget()
-                                if isinstance(widget, QFrame) or widget in self.secondary_buttons:
-                                    separator_index = i
-                                    break
-                            
-                            # If no separator found, add at the end
-                            if separator_index is None:
-                                self.buttons_layout.addWidget(button)
-                            else:
-                                # Insert before separator/secondary buttons
-                                self.buttons_layout.insertWidget(separator_index, button)
-
-                    # Update max value if this new line is visible
-                    if y_values and self.line_visibility.get(data_key, True):
-                        series_max = max(y_values)
-                        if is_cumulative:
-                            if series_max > max_val_secondary: max_val_secondary = series_max
-                        else:
-                            if series_max > max_val_primary: max_val_primary = series_max
+        # Put new entries in their group order
+        if series_added:
+            self.series_filter.sort(0)
 
+        # --- Update the shown lines ---
+        for data_key, line in self.lines.items():
+            if data_key not in historian_data:
+                line.set_data([], [])
+                continue
+
+            # Cumulative series lag instantaneous ones by one hour (see get_num_points)
+            num_points = self.get_num_points(data_key, current_time)
+            line.set_data(*self.get_plot_data(data_key, historian_data[data_key], num_points))
 
         # --- Final Steps ---
         # Auto-adjust y scales based on the max values found across all visible lines
-        if max_val_primary > 0:
-            self.ax.set_ylim(0, max_val_primary * 1.1)  # 10% headroom
-        # else: # Optional: Reset ylim if no visible primary lines
-        #     self.ax.set_ylim(0, 1000)
-
-        if max_val_secondary > 0:
-            self.ax2.set_ylim(0, max_val_secondary * 1.1)  # 10% headroom
-            self.update_secondary_axis_formatting(max_val_secondary * 1.1)
-        # else: # Optional: Reset ylim if no visible secondary lines
-        #     self.ax2.set_ylim(0, 1000)
-
+        self.rescale_axes()
 
         # Update axis visibility based on *currently* visible lines
-        self.update_axis_visibility() # This already checks visibility state and redraws
+        self.update_axis_visibility()
 
-        # Explicitly redraw the canvas (update_axis_visibility might already do this, but ensures it happens)
+        # Keep the single-series views in sync with any new series and the latest data
+        self.refresh_series_selector()
+        if self.view_mode == 'Heatmap':
+            self.update_heatmap()
+        elif self.view_mode == 'Statistics':
+            self.update_statistics_view()
+
+        # Redraw the canvas once with the new data
         self.canvas.draw()
 
     def clear_chart(self):
         """Clear the historian chart display."""
-        # Clear all plot lines
+        # Cached rollups and statistics belong to the previous run
+        self.rollup_cache.invalidate()
+        self.statistics_cache.invalidate()
+        
+        # Remove component-specific series from the selector (and their lines)
+        default_keys = DEFAULT_PRIMARY_SERIES + DEFAULT_SECONDARY_SERIES
+        for key in list(self.series_items.keys()):
+            if key not in default_keys:
+                self.remove_series_item(key)
+        
+        # Reset the default series to their default visibility
+        self.visible_series = set(DEFAULT_VISIBLE_SERIES)
+        self._suppress_item_changes = True
+        for key, item in self.series_items.items():
+            item.setCheckState(Qt.CheckState.Checked if key in self.visible_series else Qt.CheckState.Unchecked)
+        self._suppress_item_changes = False
+        self.refresh_series_selector()
+        
+        # Nothing to redraw if the chart has never been shown
+        if not self.chart_built:
+            return
+        
+        # Release hidden lines, create any missing visible ones, and clear their data
+        for key in list(self.lines.keys()):
+            if key not in self.visible_series:
+                self.release_line(key)
+        for key in self.visible_series:
+            if key not in self.lines:
+                self.lines[key] = self.create_line_for_data(key)
         for line in self.lines.values():
             line.set_data([], [])
         
@@ -715,62 +1384,9 @@ class HistorianManager:
         # Reset the secondary axis formatting
         self.update_secondary_axis_formatting(1000)
         
-        # Get list of default buttons to keep
-        default_primary = ['total_generation', 'total_load', 'grid_import', 'grid_export', 
-                          'battery_charge', 'system_instability', 'satisfied_load']
-        default_secondary = ['cumulative_revenue', 'cumulative_cost']
-        default_keys = default_primary + default_secondary
-        
-        # Identify component-specific buttons to remove
-        component_keys = []
-        for key in list(self.toggle_buttons.keys()):
-            if key not in default_keys:
-                component_keys.append(key)
-        
-        # Remove component-specific buttons and lines
-        for key in component_keys:
-            if key in self.toggle_buttons:
-                # Remove button from layout
-                button = self.toggle_buttons[key]
-                self.buttons_layout.removeWidget(button)
-                button.deleteLater()  # Schedule for deletion
-                
-                # Remove from tracking dictionaries
-                del self.toggle_buttons[key]
-                
-                # Remove from appropriate button list
-                if key in self.primary_buttons:
-                    self.primary_buttons.remove(key)
-                elif key in self.secondary_buttons:
-                    self.secondary_buttons.remove(key)
-                
-                # Remove line from chart (keep in self.lines for now to avoid keys changing during iteration)
-                if key in self.lines:
-                    self.lines[key].set_visible(False)
-        
-        # Now remove the corresponding lines from our tracking
-        for key in component_keys:
-            if key in self.lines:
-                # Hide the line but don't try to remove it from the axes
-                self.lines[key].set_visible(False)
-                # Remove from our tracking dictionaries
-                del self.lines[key]
-                if key in self.line_visibility:
-                    del self.line_visibility[key]
-        
-        # Reset all default toggle buttons to their default states
-        for key, button in self.toggle_buttons.items():
-            if (key == 'satisfied_load' or key == 'cumulative_revenue' or 
-                key == 'cumulative_cost' or key == 'system_instability'):
-                # These series start unchecked (on)
-                button.setChecked(False)
-                self.line_visibility[key] = True
-                self.lines[key].set_visible(True)
-            else:
-                # All other buttons start checked (off)
-                button.setChecked(True)
-                self.line_visibility[key] = False
-                self.lines[key].set_visible(False)
+        # Clear the single-series views
+        self.update_heatmap()
+        self.update_statistics_view()
         
         # Update axis visibility
         self.update_axis_visibility()
@@ -781,51 +1397,12 @@ class HistorianManager:
 
     def initialize_default_data_series(self):
         """
-        Initialize the default data series buttons and lines
+        Initialize the default data series selector entries
         even before simulation data is available
         """
-        # Default primary series
-        default_primary = ['total_generation', 'total_load', 'grid_import', 'grid_export', 
-                          'battery_charge', 'system_instability', 'satisfied_load']
-        
-        # Default secondary series
-        default_secondary = ['cumulative_revenue', 'cumulative_cost']
-        
-        # Create buttons and empty lines for all default series
-        for data_key in default_primary:
-            # Create line with empty data
-            self.lines[data_key] = self.create_line_for_data(data_key)
-            self.lines[data_key].set_data([], [])
-            
-            # Create button
-            if data_key not in self.toggle_buttons:
-                button = self.create_toggle_button(data_key)
-                self.toggle_buttons[data_key] = button
-                self.primary_buttons.append(button)
-                self.buttons_layout.addWidget(button)
-        
-        # Add separator before secondary buttons
-        if default_secondary:
-            separator = QFrame()
-            separator.setFrameShape(QFrame.Shape.HLine)
-            separator.setFrameShadow(QFrame.Shadow.Sunken)
-            self.buttons_layout.addWidget(separator)
-        
-        # Create secondary series
-        for data_key in default_secondary:
-            # Create line with empty data
-            self.lines[data_key] = self.create_line_for_data(data_key)
-            self.lines[data_key].set_data([], [])
-            
-            # Create button
-            if data_key not in self.toggle_buttons:
-                button = self.create_toggle_button(data_key)
-                self.toggle_buttons[data_key] = button
-                self.secondary_buttons.append(button)
-                self.buttons_layout.addWidget(button)
-        
-        # Update axis visibility based on default visibility settings
-        self.update_axis_visibility()
+        for data_key in DEFAULT_PRIMARY_SERIES + DEFAULT_SECONDARY_SERIES:
+            self.create_series_item(data_key)
+        self.series_filter.sort(0)
         
-        # Draw the canvas with the empty lines
-        self.canvas.draw() 
\ No newline at end of file
+        # Populate the series selector with the default series
+        self.refresh_series_selector()
@@ -153,9 +153,12 @@ class KeyHandler(QObject):
             elif key == Qt.Key.Key_C:
                 self.main_window.start_connection()
                 return True
-            # A for autoconnect
+            # A for autoconnect, Shift+A to only connect unconnected components
             elif key == Qt.Key.Key_A:
-                self.main_window.autoconnect_all_components()
+                if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                    self.main_window.autoconnect_new_components()
+                else:
+                    self.main_window.autoconnect_all_components()
                 return True
         
         # Event not handled by this handler
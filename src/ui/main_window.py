@@ -11,6 +11,7 @@ from .component_deleter import ComponentDeleter
 from src.ui.terminal_widget import TerminalWidget
 from src.utils.audio_utils import play_placecomponent, play_audio, stop_audio, get_audio_player
 from src.ui.dialog_styles import create_styled_message_box
+from src.utils.pixmap_cache import set_zoom_level
 
 # TODO: This file needs to be refactored to be more modular and easier to understand. A lot of the setup and initialization / UI code can be pushed to other separate files.
 
@@ -136,28 +137,24 @@ class PowerSystemSimulator(QMainWindow):
         self.view.viewport().setCursor(Qt.CursorShape.ArrowCursor)
     
     def check_network_connectivity(self):
-        """Check if all components are connected in a single network"""
-        if not self.components:
-            return False
-            
-        # Use first component as starting point
-        visited = set()
-        to_visit = [self.components[0]]
-        
-        # Perform breadth-first search through connections
-        while to_visit:
-            current = to_visit.pop(0)
-            if current not in visited:
-                visited.add(current)
-                # Add all connected components to visit
-                for conn in current.connections:
-                    if conn.source not in visited:
-                        to_visit.append(conn.source)
-                    if conn.target not in visited:
-                        to_visit.append(conn.target)
-        
-        # Check if all components were visited
-        return len(visited) == len(self.components)
+        """
+        Check that every component is connected to the network. The network may
+        consist of several separate islands (e.g. multiple sites) - the engine
+        dispatches each island on its own.
+        """
+        # Answered from a count kept up to date on every edit, deletions included
+        return bool(self.components) and not self.network_topology.has_unconnected_components()
+
+    def highlight_unconnected_components(self):
+        """Select every component that isn't connected to anything so it's easy to spot"""
+        unconnected = self.network_topology.unconnected_components()
+        if not unconnected:
+            return
+        
+        self.scene.clearSelection()
+        for component in unconnected:
+            component.setSelected(True)
+        TerminalWidget.log(f"{len(unconnected)} unconnected components are highlighted.")
 
     def start_scrubbing(self):
         """Enter scrub mode when slider is pressed"""
@@ -184,7 +181,8 @@ class PowerSystemSimulator(QMainWindow):
         # Check network connectivity before updating
         if not self.simulation_engine.simulation_running and not self.check_network_connectivity():
             # Show the same warning as when trying to play with unconnected components
-            TerminalWidget.log("ERROR: All components must be connected in a single network to run the simulation. Please ensure all components are connected before starting.")
+            TerminalWidget.log("ERROR: All components must be connected to the network to run the simulation. Please ensure every component is connected before starting.")
+            self.highlight_unconnected_components()
             # Trigger error flash if the central widget has that capability
             if hasattr(self, 'centralWidget') and hasattr(self.centralWidget(), 'trigger_error_flash'):
                 self.centralWidget().trigger_error_flash()
@@ -324,6 +322,10 @@ class PowerSystemSimulator(QMainWindow):
         """Automatically connect all components in the scene to form a valid network"""
         self.connection_manager.autoconnect_all_components()
 
+    def autoconnect_new_components(self):
+        """Connect only components that aren't connected yet, keeping existing connections"""
+        self.connection_manager.autoconnect_new_components()
+
     def keyPressEvent(self, event):
         """Handle key press events for hotkeys"""
         # Use the KeyHandler class to process the event
@@ -383,23 +385,34 @@ class PowerSystemSimulator(QMainWindow):
             # Clean up resources before exiting
             if hasattr(self, 'autocomplete_manager'):
                 self.autocomplete_manager.cleanup()
+            if hasattr(self, 'compare_manager'):
+                self.compare_manager.cleanup()
+            if hasattr(self, 'sensitivity_manager'):
+                self.sensitivity_manager.cleanup()
             event.accept()
             QApplication.quit()
         else:  # QMessageBox.StandardButton.No
             # Clean up resources before exiting
             if hasattr(self, 'autocomplete_manager'):
                 self.autocomplete_manager.cleanup()
+            if hasattr(self, 'compare_manager'):
+                self.compare_manager.cleanup()
+            if hasattr(self, 'sensitivity_manager'):
+                self.sensitivity_manager.cleanup()
             event.accept()
             QApplication.quit() 
 
     def zoom_changed(self, value):
         """Handle zoom slider value changes"""
-        # Convert slider value (40-100) to zoom factor (0.4-1.0)
+        # Convert slider value (10-100) to zoom factor (0.1-1.0)
         zoom_factor = value / 100.0
         
         # Save the current zoom level
         self.current_zoom = zoom_factor
         
+        # Switch component images to the pre-scaled variants for this zoom level
+        set_zoom_level(zoom_factor)
+        
         # Create a transform for scaling
         transform = self.view.transform()
         
@@ -701,6 +714,14 @@ class PowerSystemSimulator(QMainWindow):
         self.autocomplete_timer = self.autocomplete_manager.autocomplete_timer
         self.autocomplete_end_time = self.autocomplete_manager.autocomplete_end_time
     
+    def compare_scenarios(self):
+        """Run two or more saved scenarios side by side - delegates to the CompareManager"""
+        self.compare_manager.run_compare()
+    
+    def run_sensitivity(self):
+        """Rank the current scenario's parameters by their effect on IRR - delegates to the SensitivityManager"""
+        self.sensitivity_manager.ask_sensitivity()
+    
     def _step_autocomplete(self):
         """This method is kept for compatibility but now delegates to the AutocompleteManager"""
         # This method should never be called directly anymore as the timer connects to the manager's method
@@ -1,179 +1,411 @@
+import math
 import random
-from PyQt6.QtWidgets import QGraphicsEllipseItem, QGraphicsTextItem, QLabel, QGraphicsRectItem
-from PyQt6.QtCore import Qt, QTimer, QPoint
-from PyQt6.QtGui import QPen, QColor, QBrush, QRadialGradient, QFont
+import numpy as np
+from PyQt6.QtWidgets import QGraphicsItem, QLabel
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QColor, QRadialGradient, QFont, QPainter, QPixmap, QTextDocument
+from src.ui.frame_clock import FrameClock
+
+# Particle kinds stored in the batch arrays
+SMOKE = 0
+SPARK = 1
+POPUP = 2
+
+# Gray shades of smoke sprites are rounded to this step (one sprite per shade)
+SMOKE_GRAY_STEP = 10
+SMOKE_SPRITE_SIZE = 64
+
+# Revenue/cost milestone size in $ - components report how many they crossed
+MILESTONE_AMOUNT = 1000
+
+# Popups for bigger amounts are drawn larger, up to this scale (rounded to
+# POPUP_SCALE_STEP so labels can be reused)
+MAX_POPUP_SCALE = 1.8
+POPUP_SCALE_STEP = 0.1
+
+# Rendered popup labels kept before unused ones are dropped
+POPUP_LABEL_CACHE_LIMIT = 64
+
+
+def format_popup_amount(amount):
+    """
+    Format a popup amount compactly ($1,000 / $25K / $1.3M)
+
+    Args:
+        amount: Dollar amount (positive)
+
+    Returns:
+        str: Formatted amount with a leading $
+    """
+    if amount >= 1_000_000:
+        return f"${amount / 1_000_000:,.1f}M"
+    if amount >= 10_000:
+        return f"${amount / 1000:,.0f}K"
+    return f"${amount:,.0f}"
+
+
+def popup_scale(amount):
+    """
+    Size multiplier for a popup - grows with each 10x of the amount above one milestone
+
+    Args:
+        amount: Dollar amount (positive)
+
+    Returns:
+        float: Scale between 1.0 and MAX_POPUP_SCALE
+    """
+    if amount <= MILESTONE_AMOUNT:
+        return 1.0
+    scale = 1.0 + 0.2 * math.log10(amount / MILESTONE_AMOUNT)
+    scale = round(scale / POPUP_SCALE_STEP) * POPUP_SCALE_STEP
+    return round(min(MAX_POPUP_SCALE, scale), 2)
+
+
+class ParticleBatch(QGraphicsItem):
+    """
+    Scene particles (smoke puffs, sparks and +/- $ popups) stored in a fixed-size
+    pool of NumPy arrays. The whole batch is advanced with vectorized math and
+    drawn by this single item in one paint pass, instead of one QGraphicsItem
+    per particle.
+    """
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.capacity = capacity
+
+        # Particle state, one slot per pooled particle
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.x = np.zeros(capacity)  # Top-left corner in scene coordinates
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.gravity = np.zeros(capacity)
+        self.alpha = np.zeros(capacity)
+        self.fade_rate = np.zeros(capacity)
+        self.min_alpha = np.zeros(capacity)  # Particle dies once alpha drops to this
+        self.size = np.zeros(capacity)
+        self.size_change = np.zeros(capacity)
+        self.width = np.zeros(capacity)
+        self.height = np.zeros(capacity)
+        self.pad = np.zeros(capacity)  # Glow extending beyond the particle (sparks)
+        self.color = np.zeros((capacity, 3), dtype=np.int16)
+        self.label = np.zeros(capacity, dtype=np.int32)  # Key into popup_pixmaps
+
+        # Pre-rendered sprites shared by all particles
+        self.smoke_sprites = {}  # gray value -> QPixmap
+        self.popup_pixmaps = {}  # label id -> QPixmap
+        self.popup_labels = {}  # (text, color, scale) -> label id
+        self.next_label_id = 0
+
+        self.bounds = QRectF()
+
+        # Draw above components (particles used to be added on top of them)
+        self.setZValue(1)
+        self.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+
+    def count(self):
+        """Number of live particles"""
+        return int(np.count_nonzero(self.alive))
+
+    def _allocate(self, count):
+        """
+        Reserve free pool slots
+
+        Returns:
+            Array of slot indices, or None if the pool doesn't have room
+        """
+        free = np.flatnonzero(~self.alive)
+        if len(free) < count:
+            return None
+        slots = free[:count]
+        self.alive[slots] = True
+        # Defaults for values not every kind sets
+        self.gravity[slots] = 0.0
+        self.size_change[slots] = 0.0
+        self.pad[slots] = 0.0
+        return slots
+
+    def add_smoke(self, xs, ys, sizes, is_generator_smoke=False):
+        """
+        Add smoke particles centred on the given points
+
+        Args:
+            xs, ys: Arrays of particle centres
+            sizes: Array of initial diameters
+            is_generator_smoke: Generator smoke rises faster, lasts longer and is lighter
+        """
+        count = len(xs)
+        slots = self._allocate(count)
+        if slots is None:
+            return False
+
+        self.kind[slots] = SMOKE
+        self.x[slots] = xs - sizes / 2
+        self.y[slots] = ys - sizes / 2
+        self.size[slots] = sizes
+        self.width[slots] = sizes
+        self.height[slots] = sizes
 
-# Particle system classes for smoke puff effect
-class Particle(QGraphicsEllipseItem):
-    """Individual particle for visual effects"""
-    
-    def __init__(self, x, y, size=10, is_generator_smoke=False, parent=None):
-        super().__init__(0, 0, size, size, parent)
-        self.setPos(x - size/2, y - size/2)
-        
         # Random velocity for natural movement
-        self.dx = random.uniform(-1.5, 1.5)
+        self.dx[slots] = np.random.uniform(-1.5, 1.5, count)
         if is_generator_smoke:
-            # Generator smoke has stronger upward movement
-            self.dy = random.uniform(-3.0, -1.5)  # Stronger upward bias
+            # Generator smoke has stronger upward movement, lasts longer and starts more opaque
+            self.dy[slots] = np.random.uniform(-3.0, -1.5, count)
+            self.fade_rate[slots] = np.random.uniform(0.02, 0.05, count)
+            self.alpha[slots] = np.random.uniform(0.8, 1.0, count)
+            gray = np.random.randint(200, 251, count)
         else:
-            self.dy = random.uniform(-2.0, -0.5)  # Normal upward bias
-        
-        # Random alpha fade rate
-        if is_generator_smoke:
-            # Generator smoke lasts longer
-            self.fade_rate = random.uniform(0.02, 0.05)  # Slower fade
-            self.alpha = random.uniform(0.8, 1.0)  # Start more opaque
-        else:
-            self.fade_rate = random.uniform(0.05, 0.1)
-            self.alpha = random.uniform(0.7, 1.0)
-        
+            self.dy[slots] = np.random.uniform(-2.0, -0.5, count)
+            self.fade_rate[slots] = np.random.uniform(0.05, 0.1, count)
+            self.alpha[slots] = np.random.uniform(0.7, 1.0, count)
+            gray = np.random.randint(90, 251, count)
+        self.min_alpha[slots] = 0.1
+
         # Random growth/shrink
-        self.size_change = random.uniform(-0.1, 0.2)
-        self.current_size = size
-        
-        # Random gray value (from dark to light gray)
-        if is_generator_smoke:
-            # Darker smoke for generator
-            self.gray_value = random.randint(200, 250)
+        self.size_change[slots] = np.random.uniform(-0.1, 0.2, count)
+
+        # Random gray value, rounded so shades can share sprites
+        gray = np.round(gray / SMOKE_GRAY_STEP) * SMOKE_GRAY_STEP
+        self.color[slots] = np.minimum(gray, 255)[:, None]
+        self._grow_bounds(slots)
+        return True
+
+    def add_sparks(self, xs, ys, sizes):
+        """
+        Add square spark particles that burst upward and fall with gravity
+
+        Args:
+            xs, ys: Arrays of particle centres
+            sizes: Array of spark sizes
+        """
+        count = len(xs)
+        slots = self._allocate(count)
+        if slots is None:
+            return False
+
+        self.kind[slots] = SPARK
+        self.x[slots] = xs - sizes / 2
+        self.y[slots] = ys - sizes / 2
+        self.size[slots] = sizes
+        self.width[slots] = sizes
+        self.height[slots] = sizes
+
+        # Burst up and outward, then fall down
+        speed = np.random.uniform(4.0, 7.0, count)
+        direction = np.random.choice([-1.0, 1.0], count)
+        self.dx[slots] = speed * np.random.uniform(0.0, 0.75, count) * direction
+        self.dy[slots] = -speed * np.random.uniform(1.5, 4.0, count)
+        self.gravity[slots] = np.random.uniform(0.55, 0.72, count)
+
+        self.fade_rate[slots] = np.random.uniform(0.02, 0.07, count)
+        self.alpha[slots] = np.random.uniform(0.95, 1.0, count)
+        self.min_alpha[slots] = 0.05
+
+        # Glow square around the spark
+        glow_size = sizes * np.random.uniform(1.1, 3.5, count)
+        self.pad[slots] = (glow_size - sizes) / 2
+
+        # Random blend between amber (#FFCA28) and white (#FFFFFF)
+        amber_amount = np.random.uniform(0.5, 1.0, count)
+        self.color[slots, 0] = 255
+        self.color[slots, 1] = (202 * amber_amount + (1.0 - amber_amount) * 255).astype(int)
+        self.color[slots, 2] = (40 * amber_amount + (1.0 - amber_amount) * 255).astype(int)
+        self._grow_bounds(slots)
+        return True
+
+    def add_popup(self, x, y, text, color, scale=1.0):
+        """
+        Add a floating text popup (e.g. "+$1,000 💸")
+
+        Args:
+            x, y: Top-left position of the popup
+            text: Popup text
+            color: CSS rgb() body of the text colour, e.g. "0, 170, 0"
+            scale: Size multiplier for the label (see popup_scale)
+        """
+        slots = self._allocate(1)
+        if slots is None:
+            return False
+
+        label = self._get_popup_label(text, color, scale)
+        pixmap = self.popup_pixmaps[label]
+
+        self.kind[slots] = POPUP
+        self.label[slots] = label
+        self.x[slots] = x
+        self.y[slots] = y
+        self.width[slots] = pixmap.width() / pixmap.devicePixelRatio()
+        self.height[slots] = pixmap.height() / pixmap.devicePixelRatio()
+
+        # Random velocity for natural movement (always floating upward)
+        self.dx[slots] = random.uniform(-1.0, 1.0)
+        self.dy[slots] = random.uniform(-7.5, -4.5)
+        self.fade_rate[slots] = random.uniform(0.02, 0.04)
+        self.alpha[slots] = 1.0
+        self.min_alpha[slots] = 0.1
+        self._grow_bounds(slots)
+        return True
+
+    def _get_popup_label(self, text, color, scale=1.0):
+        """Render a popup label once at full opacity; fading is applied when drawing"""
+        key = (text, color, scale)
+        label = self.popup_labels.get(key)
+        if label is None:
+            if len(self.popup_labels) >= POPUP_LABEL_CACHE_LIMIT:
+                self._prune_popup_labels()
+            font = QFont("Arial", round(26 * scale))
+            font.setBold(True)
+            document = QTextDocument()
+            document.setDefaultFont(font)
+            document.setHtml(
+                f'<span style="background-color: rgba(80, 80, 80, 150); padding: 2px 6px; '
+                f'border-radius: 4px; color: rgba({color}, 255);">{text}</span>'
+            )
+            size = document.size()
+            pixmap = QPixmap(max(1, math.ceil(size.width())), max(1, math.ceil(size.height())))
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+            document.drawContents(painter)
+            painter.end()
+            label = self.next_label_id
+            self.next_label_id += 1
+            self.popup_pixmaps[label] = pixmap
+            self.popup_labels[key] = label
+        return label
+
+    def _prune_popup_labels(self):
+        """Drop rendered labels no live popup is using"""
+        in_use = set(self.label[self.alive & (self.kind == POPUP)].tolist())
+        for key, label in list(self.popup_labels.items()):
+            if label not in in_use:
+                del self.popup_labels[key]
+                del self.popup_pixmaps[label]
+
+    def _get_smoke_sprite(self, gray):
+        """Soft radial puff in the given gray shade, opaque at the centre"""
+        sprite = self.smoke_sprites.get(gray)
+        if sprite is None:
+            sprite = QPixmap(SMOKE_SPRITE_SIZE, SMOKE_SPRITE_SIZE)
+            sprite.fill(Qt.GlobalColor.transparent)
+            radius = SMOKE_SPRITE_SIZE / 2
+            gradient = QRadialGradient(radius, radius, radius)
+            gradient.setColorAt(0, QColor(gray, gray, gray, 255))
+            gradient.setColorAt(1, QColor(gray, gray, gray, 0))  # Transparent at edges
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(gradient)
+            painter.drawEllipse(0, 0, SMOKE_SPRITE_SIZE, SMOKE_SPRITE_SIZE)
+            painter.end()
+            self.smoke_sprites[gray] = sprite
+        return sprite
+
+    def advance_particles(self):
+        """
+        Move, fade and resize every live particle by one step and free the
+        ones that have faded out
+
+        Returns:
+            int: Number of particles still alive
+        """
+        live = self.alive
+        if not live.any():
+            return 0
+
+        self.dy[live] += self.gravity[live]
+        self.x[live] += self.dx[live]
+        self.y[live] += self.dy[live]
+        self.alpha[live] = np.maximum(self.alpha[live] - self.fade_rate[live], 0.0)
+
+        # Smoke expands or contracts (never below 0.1px)
+        smoke = live & (self.kind == SMOKE)
+        self.size[smoke] = np.maximum(self.size[smoke] + self.size_change[smoke], 0.1)
+        self.width[smoke] = self.size[smoke]
+        self.height[smoke] = self.size[smoke]
+
+        self.alive &= self.alpha > self.min_alpha
+        self._update_bounds()
+        return self.count()
+
+    def clear_particles(self):
+        """Free every particle in the pool"""
+        self.alive[:] = False
+        self._update_bounds()
+
+    def _particle_rects(self, slots):
+        """Left, top, right and bottom edges (including glow) of the given particles"""
+        pad = self.pad[slots]
+        left = self.x[slots] - pad
+        top = self.y[slots] - pad
+        right = self.x[slots] + self.width[slots] + pad
+        bottom = self.y[slots] + self.height[slots] + pad
+        return left, top, right, bottom
+
+    def _grow_bounds(self, slots):
+        """Extend the bounding rect to cover newly added particles"""
+        left, top, right, bottom = self._particle_rects(slots)
+        added = QRectF(float(left.min()), float(top.min()),
+                       float(right.max() - left.min()), float(bottom.max() - top.min()))
+        self.prepareGeometryChange()
+        self.bounds = self.bounds.united(added) if not self.bounds.isEmpty() else added
+        self.update()
+
+    def _update_bounds(self):
+        """Recompute the bounding rect from the live particles and repaint"""
+        self.prepareGeometryChange()
+        if self.alive.any():
+            left, top, right, bottom = self._particle_rects(self.alive)
+            self.bounds = QRectF(float(left.min()), float(top.min()),
+                                 float(right.max() - left.min()), float(bottom.max() - top.min()))
         else:
-            self.gray_value = random.randint(90, 250)
-        
-        # Set initial appearance
-        self.updateAppearance()
-    
-    def updateAppearance(self):
-        """Update the particle's visual appearance"""
-        # Create a radial gradient for a soft, smoke-like appearance
-        gradient = QRadialGradient(self.current_size/2, self.current_size/2, self.current_size/2)
-        
-        # Semi-transparent gray color with random shade
-        color = QColor(self.gray_value, self.gray_value, self.gray_value, int(self.alpha * 255))
-        
-        gradient.setColorAt(0, color)
-        gradient.setColorAt(1, QColor(self.gray_value, self.gray_value, self.gray_value, 0))  # Transparent at edges
-        
-        self.setBrush(QBrush(gradient))
-        # Create a transparent pen (using QPen) instead of Qt.NoPen
-        self.setPen(QPen(Qt.GlobalColor.transparent))
-    
-    def update_particle(self):
-        """Update the particle's position, size and opacity for animation"""
-        # Move the particle
-        self.setPos(self.x() + self.dx, self.y() + self.dy)
-        
-        # Fade the particle
-        self.alpha -= self.fade_rate
-        
-        # Update size (expand or contract)
-        self.current_size += self.size_change
-        if self.current_size <= 0:
-            self.current_size = 0.1  # Prevent negative size
-        
-        # Update the ellipse size
-        self.setRect(0, 0, self.current_size, self.current_size)
-        
-        # Update appearance
-        self.updateAppearance()
-        
-        # Return whether the particle is still visible
-        return self.alpha > 0.1
+            self.bounds = QRectF()
+        self.update()
 
-class RevenueParticle(QGraphicsTextItem):
-    """Text particle for displaying revenue increments"""
-    
-    def __init__(self, x, y, amount=1000, parent=None):
-        super().__init__(f"+${amount:,}", parent)
-        self.setPos(x, y)
-        
-        # Set a nice font
-        font = QFont("Arial", 26)
-        font.setBold(True)
-        self.setFont(font)
-        
-        # Random velocity for natural movement (with upward bias)
-        self.dx = random.uniform(-1.0, 1.0)
-        self.dy = random.uniform(-7.5, -4.5)  # Always float upward
-        
-        # Random fade rate
-        self.fade_rate = random.uniform(0.02, 0.04)
-        self.alpha = 1.0
-        
-        # Set initial appearance
-        self.updateAppearance()
-    
-    def updateAppearance(self):
-        """Update the particle's visual appearance"""
-        # Create HTML with a semi-transparent gray background and green text
-        bg_alpha = int(self.alpha * 150)  # More transparent background
-        text_alpha = int(self.alpha * 255)
-        
-        html = f'<span style="background-color: rgba(80, 80, 80, {bg_alpha}); padding: 2px 6px; border-radius: 4px; color: rgba(0, 170, 0, {text_alpha});">+$1,000 💸</span>'
-        
-        # Set the HTML content
-        self.setHtml(html)
-    
-    def update_particle(self):
-        """Update particle position and opacity for animation"""
-        # Move the particle
-        self.setPos(self.x() + self.dx, self.y() + self.dy)
-        
-        # Fade the particle
-        self.alpha -= self.fade_rate
-        
-        # Update appearance
-        self.updateAppearance()
-        
-        # Return whether the particle is still visible
-        return self.alpha > 0.1
+    def boundingRect(self):
+        return self.bounds
+
+    def paint(self, painter, option, widget=None):
+        """Draw every live particle in one pass"""
+        slots = np.flatnonzero(self.alive)
+        if len(slots) == 0:
+            return
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+
+        # Convert once to Python lists - much faster to index than NumPy scalars
+        kinds = self.kind[slots].tolist()
+        xs = self.x[slots].tolist()
+        ys = self.y[slots].tolist()
+        widths = self.width[slots].tolist()
+        heights = self.height[slots].tolist()
+        alphas = np.minimum(self.alpha[slots], 1.0).tolist()
+        pads = self.pad[slots].tolist()
+        colors = self.color[slots].tolist()
+        labels = self.label[slots].tolist()
+
+        for i in range(len(slots)):
+            kind = kinds[i]
+            alpha = alphas[i]
+            target = QRectF(xs[i], ys[i], widths[i], heights[i])
+            if kind == SMOKE:
+                painter.setOpacity(alpha)
+                painter.drawPixmap(target, self._get_smoke_sprite(colors[i][0]), QRectF(0, 0, SMOKE_SPRITE_SIZE, SMOKE_SPRITE_SIZE))
+            elif kind == SPARK:
+                painter.setOpacity(1.0)
+                r, g, b = colors[i]
+                # Glow square with lower alpha behind the spark
+                glow = target.adjusted(-pads[i], -pads[i], pads[i], pads[i])
+                painter.fillRect(glow, QColor(r, g, b, int(alpha * 0.5 * 255)))
+                painter.fillRect(target, QColor(r, g, b, int(alpha * 255)))
+            else:
+                painter.setOpacity(alpha)
+                pixmap = self.popup_pixmaps[labels[i]]
+                painter.drawPixmap(target, pixmap, QRectF(0, 0, pixmap.width(), pixmap.height()))
+        painter.setOpacity(1.0)
 
-class CostParticle(QGraphicsTextItem):
-    """Text particle for displaying cost increments"""
-    
-    def __init__(self, x, y, amount=1000, parent=None):
-        super().__init__(f"-${amount:,}", parent)
-        self.setPos(x, y)
-        
-        # Set a nice font
-        font = QFont("Arial", 26)
-        font.setBold(True)
-        self.setFont(font)
-        
-        # Random velocity for natural movement (with upward bias)
-        self.dx = random.uniform(-1.0, 1.0)
-        self.dy = random.uniform(-7.5, -4.5)  # Always float upward
-        
-        # Random fade rate
-        self.fade_rate = random.uniform(0.02, 0.04)
-        self.alpha = 1.0
-        
-        # Set initial appearance
-        self.updateAppearance()
-    
-    def updateAppearance(self):
-        """Update the particle's visual appearance"""
-        # Create HTML with a semi-transparent gray background and red text
-        bg_alpha = int(self.alpha * 150)  # More transparent background
-        text_alpha = int(self.alpha * 255)
-        
-        html = f'<span style="background-color: rgba(80, 80, 80, {bg_alpha}); padding: 2px 6px; border-radius: 4px; color: rgba(210, 0, 0, {text_alpha});">-$1,000 💸</span>'
-        
-        # Set the HTML content
-        self.setHtml(html)
-    
-    def update_particle(self):
-        """Update particle position and opacity for animation"""
-        # Move the particle
-        self.setPos(self.x() + self.dx, self.y() + self.dy)
-        
-        # Fade the particle
-        self.alpha -= self.fade_rate
-        
-        # Update appearance
-        self.updateAppearance()
-        
-        # Return whether the particle is still visible
-        return self.alpha > 0.1
 
 class ViewCapexParticle(QLabel):
     """Text particle for displaying CAPEX increments that appears in the view rather than the scene"""
@@ -231,248 +463,207 @@ class ViewCapexParticle(QLabel):
         # Return whether the particle is still visible
         return self.alpha > 0.1
 
-class ConnectionSparkParticle(QGraphicsRectItem):
-    """Square spark particle for connection success effect"""
-    
-    def __init__(self, x, y, size=10, parent=None):
-        super().__init__(0, 0, size, size, parent)
-        self.setPos(x - size/2, y - size/2)
-        
-        # Random velocity with burst up and outward, then fall down
-        angle = random.uniform(0, 2 * 3.14159)  # Random angle in radians
-        speed = random.uniform(4.0, 7.0)  # Random speed
-        
-        # Initial velocity has strong upward component
-        self.dx = speed * random.uniform(0.0, 0.75) * random.choice([-1, 1])
-        self.dy = -speed * random.uniform(1.5, 4.0)  # Strong initial upward velocity
-        
-        # Add gravity for falling effect
-        self.gravity = random.uniform(0.55, 0.72)
-        
-        # Random fade rate
-        self.fade_rate = random.uniform(0.02, 0.07)
-        self.alpha = random.uniform(0.95, 1.0)
-        
-        # Size stays constant but record it
-        self.size = size
-        
-        # Size of the glow (larger than the spark)
-        self.glow_size = size * random.uniform(1.1, 3.5)
-        
-        # Random colors: from amber (#FFCA28) to bright amber-white
-        # Random blend between amber (#FFCA28) and white (#FFFFFF)
-        amber_amount = random.uniform(0.5, 1.0)  # How much amber vs white
-        
-        # Amber base color: #FFCA28 (RGB: 255, 202, 40)
-        r = int(255 * amber_amount + (1.0 - amber_amount) * 255)  # Blend r component 
-        g = int(202 * amber_amount + (1.0 - amber_amount) * 255)  # Blend g component
-        b = int(40 * amber_amount + (1.0 - amber_amount) * 255)   # Blend b component
-        
-        self.color = QColor(r, g, b)
-        
-        # Create the glow rectangle
-        self.glow = QGraphicsRectItem(-(self.glow_size-self.size)/2, -(self.glow_size-self.size)/2, 
-                                      self.glow_size, self.glow_size, self)
-        
-        # Set initial appearance
-        self.updateAppearance()
-    
-    def updateAppearance(self):
-        """Update the particle's visual appearance"""
-        # Set the spark color with current alpha
-        spark_color = QColor(self.color)
-        # Clamp alpha value to valid range [0.0, 1.0]
-        safe_alpha = max(0.0, min(self.alpha, 1.0))
-        spark_color.setAlphaF(safe_alpha)
-        self.setBrush(QBrush(spark_color))
-        self.setPen(QPen(Qt.GlobalColor.transparent))
-        
-        # Set the glow with lower alpha
-        glow_color = QColor(self.color)
-        # Clamp alpha value to valid range [0.0, 1.0]
-        glow_alpha = max(0.0, min(self.alpha * 0.5, 1.0))
-        glow_color.setAlphaF(glow_alpha)
-        self.glow.setBrush(QBrush(glow_color))
-        self.glow.setPen(QPen(Qt.GlobalColor.transparent))
-    
-    def update_particle(self):
-        """Update particle position, velocity and opacity for animation"""
-        # Apply gravity to vertical velocity
-        self.dy += self.gravity
-        
-        # Move the particle
-        self.setPos(self.x() + self.dx, self.y() + self.dy)
-        
-        # Fade the particle (ensure alpha doesn't go below 0)
-        self.alpha = max(0.0, self.alpha - self.fade_rate)
-        
-        # Update appearance
-        self.updateAppearance()
-        
-        # Return whether the particle is still visible
-        return self.alpha > 0.05
-
 class ParticleSystem:
     """Manages a set of particles for visual effects"""
-    
+
     MAX_PARTICLES = 500  # Maximum number of particles allowed to prevent crashes
-    
+
     def __init__(self, scene):
         self.scene = scene
-        self.particles = []
+        self.batch = None  # Array-backed scene particles, created on first use
         self.view_particles = []  # New list for view-based particles
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_particles)
-        self.timer.setInterval(33)  # ~30 fps
+        self.frame_interval = 33  # ~30 fps, driven by the shared frame clock
         self.main_window = None  # Will be set by the main window after initialization
-    
+        # Milestones queued since the last frame: (component id, is_cost) -> [x, y, milestones]
+        self.pending_milestones = {}
+
+    def _get_batch(self):
+        """Get the particle batch item, (re)adding it if the scene was cleared"""
+        if self.batch is not None:
+            try:
+                if self.batch.scene() is self.scene:
+                    return self.batch
+            except RuntimeError:
+                # Deleted along with the rest of the scene (scene.clear())
+                pass
+        self.batch = ParticleBatch(self.MAX_PARTICLES)
+        self.scene.addItem(self.batch)
+        return self.batch
+
+    def _scene_particle_count(self):
+        """Number of live scene particles (0 if the batch was deleted with the scene)"""
+        if self.batch is None:
+            return 0
+        try:
+            if self.batch.scene() is not self.scene:
+                return 0
+        except RuntimeError:
+            return 0
+        return self.batch.count()
+
+    def _is_autocompleting(self):
+        """Particle generation is skipped during autocomplete"""
+        return bool(self.main_window and getattr(self.main_window, 'is_autocompleting', False))
+
     def _can_add_particles(self, count):
         """Check if adding more particles would exceed the maximum limit
-        
+
         Args:
             count (int): Number of particles to be added
-            
+
         Returns:
             bool: True if particles can be added, False otherwise
         """
-        total_particles = len(self.particles) + len(self.view_particles)
+        total_particles = self._scene_particle_count() + len(self.view_particles)
         return total_particles + count <= self.MAX_PARTICLES
-    
+
     def create_puff(self, x, y, num_particles=12):
         """Create a puff of smoke particles at the given coordinates"""
         # Skip particle generation during autocomplete
-        if hasattr(self, 'main_window') and self.main_window and hasattr(self.main_window, 'is_autocompleting') and self.main_window.is_autocompleting:
+        if self._is_autocompleting():
             return
-            
+
         # Check if adding these particles would exceed the limit
         if not self._can_add_particles(num_particles):
             return
-            
-        # Create particles
-        for _ in range(num_particles):
-            # Add random offset to create wider origin area
-            offset_x = random.uniform(-75, 75)  # +/- 50px horizontal spread
-            offset_y = random.uniform(-30, 30)  # +/- 30px vertical spread
-            
-            # Calculate particle position with offset
-            particle_x = x + offset_x
-            particle_y = y + offset_y
-            
-            # Create particle with random size
-            size = random.uniform(8, 20)
-            particle = Particle(particle_x, particle_y, size)
-            self.scene.addItem(particle)
-            self.particles.append(particle)
-        
-        # Start the animation timer if not already running
-        if not self.timer.isActive():
-            self.timer.start()
-    
+
+        # Random offsets create a wider origin area (+/- 75px horizontal, +/- 30px vertical)
+        xs = x + np.random.uniform(-75, 75, num_particles)
+        ys = y + np.random.uniform(-30, 30, num_particles)
+        sizes = np.random.uniform(8, 20, num_particles)
+        self._get_batch().add_smoke(xs, ys, sizes)
+
+        # Start the animation if not already running
+        self._start_animation()
+
     def create_generator_smoke(self, x, y, intensity=1.0):
         """Create smoke particles from a generator based on its output intensity
-        
+
         Args:
             x (float): X coordinate for smoke origin
             y (float): Y coordinate for smoke origin
-            intensity (float): Intensity level from 0.0 to 1.0 controlling 
+            intensity (float): Intensity level from 0.0 to 1.0 controlling
                                number of particles and size
         """
         # Skip particle generation during autocomplete
-        if hasattr(self, 'main_window') and self.main_window and hasattr(self.main_window, 'is_autocompleting') and self.main_window.is_autocompleting:
+        if self._is_autocompleting():
             return
-            
+
         # Calculate number of particles based on intensity
         # More intensity = more particles (between 2 and 15)
         base_particles = 2
         max_particles = 15
         num_particles = int(base_particles + (max_particles - base_particles) * intensity)
-        
+
         # Check if adding these particles would exceed the limit
         if not self._can_add_particles(num_particles):
             return
-            
-        # Create particles
-        for _ in range(num_particles):
-            # Tighter grouping at the origin point
-            offset_x = random.uniform(-20, 20)
-            offset_y = random.uniform(-10, 10)
-            
-            # Calculate particle position with offset
-            particle_x = x + offset_x
-            particle_y = y + offset_y
-            
-            # Size based on intensity (bigger particles for higher intensity)
-            min_size = 10
-            max_size = 40
-            size = random.uniform(min_size, min_size + (max_size - min_size) * intensity)
-            
-            # Create particle specifically for generator smoke
-            particle = Particle(particle_x, particle_y, size, is_generator_smoke=True)
-            self.scene.addItem(particle)
-            self.particles.append(particle)
-        
-        # Start the animation timer if not already running
-        if not self.timer.isActive():
-            self.timer.start()
-    
+
+        # Tighter grouping at the origin point
+        xs = x + np.random.uniform(-20, 20, num_particles)
+        ys = y + np.random.uniform(-10, 10, num_particles)
+
+        # Size based on intensity (bigger particles for higher intensity)
+        min_size = 10
+        max_size = 40
+        sizes = np.random.uniform(min_size, min_size + (max_size - min_size) * intensity, num_particles)
+        self._get_batch().add_smoke(xs, ys, sizes, is_generator_smoke=True)
+
+        # Start the animation if not already running
+        self._start_animation()
+
     def create_revenue_popup(self, x, y, amount=1000):
         """Create a revenue popup at the given coordinates"""
         # Skip particle generation during autocomplete
-        if hasattr(self, 'main_window') and self.main_window and hasattr(self.main_window, 'is_autocompleting') and self.main_window.is_autocompleting:
+        if self._is_autocompleting():
             return
-            
+
         # Check if adding this particle would exceed the limit
         if not self._can_add_particles(1):
             return
-            
-        # Create the revenue particle
-        particle = RevenueParticle(x, y, amount)
-        self.scene.addItem(particle)
-        self.particles.append(particle)
-        
-        # Start the animation timer if not already running
-        if not self.timer.isActive():
-            self.timer.start()
-    
+
+        # Green text on a translucent gray background, larger for bigger amounts
+        self._get_batch().add_popup(x, y, f"+{format_popup_amount(amount)} 💸", "0, 170, 0", popup_scale(amount))
+
+        # Start the animation if not already running
+        self._start_animation()
+
     def create_cost_popup(self, x, y, amount=1000):
         """Create a cost popup at the given coordinates"""
         # Skip particle generation during autocomplete
-        if hasattr(self, 'main_window') and self.main_window and hasattr(self.main_window, 'is_autocompleting') and self.main_window.is_autocompleting:
+        if self._is_autocompleting():
             return
-            
+
         # Check if adding this particle would exceed the limit
         if not self._can_add_particles(1):
             return
-            
-        # Create the cost particle
-        particle = CostParticle(x, y, amount)
-        self.scene.addItem(particle)
-        self.particles.append(particle)
-        
-        # Start the animation timer if not already running
-        if not self.timer.isActive():
-            self.timer.start()
-    
+
+        # Red text on a translucent gray background, larger for bigger amounts
+        self._get_batch().add_popup(x, y, f"-{format_popup_amount(amount)} 💸", "210, 0, 0", popup_scale(amount))
+
+        # Start the animation if not already running
+        self._start_animation()
+
+    def queue_milestone_popup(self, source, x, y, milestones, is_cost=False):
+        """Queue $1000 revenue/cost milestones crossed by a component
+
+        Everything a component queues before the next animation frame is merged
+        into a single popup showing the total, so fast-earning components cost
+        one popup per frame instead of one per $1000.
+
+        Args:
+            source: Component that crossed the milestones
+            x (float): X coordinate for the popup
+            y (float): Y coordinate for the popup
+            milestones (int): Number of $1000 milestones crossed
+            is_cost (bool): Whether this is a cost (red) rather than revenue (green)
+        """
+        # Skip particle generation during autocomplete
+        if self._is_autocompleting() or milestones <= 0:
+            return
+
+        key = (id(source), is_cost)
+        pending = self.pending_milestones.get(key)
+        if pending is None:
+            self.pending_milestones[key] = [x, y, milestones]
+        else:
+            # Follow the component if it moved, and add up the milestones
+            pending[0] = x
+            pending[1] = y
+            pending[2] += milestones
+
+        # The popup is created on the next frame
+        self._start_animation()
+
+    def _flush_milestone_popups(self):
+        """Turn the milestones queued since the last frame into one popup per component"""
+        pending, self.pending_milestones = self.pending_milestones, {}
+        for (_, is_cost), (x, y, milestones) in pending.items():
+            amount = milestones * MILESTONE_AMOUNT
+            if is_cost:
+                self.create_cost_popup(x, y, amount)
+            else:
+                self.create_revenue_popup(x, y, amount)
+
     def create_capex_popup(self, x, y, amount=1000000, is_positive=True):
         """Create a CAPEX popup at the given coordinates in the view (not the scene)"""
         if self.main_window is None or not hasattr(self.main_window, 'view'):
             return
-            
+
         # Check if adding this particle would exceed the limit
         if not self._can_add_particles(1):
             return
-            
+
         # Create the CAPEX particle directly in the view
         particle = ViewCapexParticle(x, y, amount, is_positive, self.main_window.view)
         self.view_particles.append(particle)
-        
-        # Start the animation timer if not already running
-        if not self.timer.isActive():
-            self.timer.start()
-    
+
+        # Start the animation if not already running
+        self._start_animation()
+
     def create_welcome_puff(self, center_x, center_y, width=500, height=200, num_particles=200):
         """Create a rectangular puff of smoke particles around the welcome text
-        
+
         Args:
             center_x (float): Center X coordinate for the rectangular area
             center_y (float): Center Y coordinate for the rectangular area
@@ -481,85 +672,67 @@ class ParticleSystem:
             num_particles (int): Number of particles to create
         """
         # Skip particle generation during autocomplete
-        if hasattr(self, 'main_window') and self.main_window and hasattr(self.main_window, 'is_autocompleting') and self.main_window.is_autocompleting:
+        if self._is_autocompleting():
             return
-            
+
         # Check if adding these particles would exceed the limit
         if not self._can_add_particles(num_particles):
             return
-            
-        # Create particles
-        for _ in range(num_particles):
-            # Add random offset within rectangular area
-            offset_x = random.uniform(-width/2, width/2)
-            offset_y = random.uniform(-height/2, height/2)
-            
-            # Calculate particle position with offset
-            particle_x = center_x + offset_x
-            particle_y = center_y + offset_y
-            
-            # Create particle with random size
-            size = random.uniform(20, 75)
-            particle = Particle(particle_x, particle_y, size)
-            self.scene.addItem(particle)
-            self.particles.append(particle)
-        
-        # Start the animation timer if not already running
-        if not self.timer.isActive():
-            self.timer.start()
-    
+
+        # Random offsets within the rectangular area
+        xs = center_x + np.random.uniform(-width/2, width/2, num_particles)
+        ys = center_y + np.random.uniform(-height/2, height/2, num_particles)
+        sizes = np.random.uniform(20, 75, num_particles)
+        self._get_batch().add_smoke(xs, ys, sizes)
+
+        # Start the animation if not already running
+        self._start_animation()
+
     def create_connection_success_sparks(self, x, y, num_particles=30):
         """Create spark particles at cursor location when connection is successful
-        
+
         Args:
             x (float): X coordinate for spark origin (cursor position)
             y (float): Y coordinate for spark origin (cursor position)
             num_particles (int): Number of spark particles to create
         """
         # Skip particle generation during autocomplete
-        if hasattr(self, 'main_window') and self.main_window and hasattr(self.main_window, 'is_autocompleting') and self.main_window.is_autocompleting:
+        if self._is_autocompleting():
             return
-            
+
         # Check if adding these particles would exceed the limit
         if not self._can_add_particles(num_particles):
             return
-            
-        # Create particles
-        for _ in range(num_particles):
-            # Small random offset for natural appearance
-            offset_x = random.uniform(-3, 3)
-            offset_y = random.uniform(-3, 3)
-            
-            # Calculate particle position with offset
-            particle_x = x + offset_x
-            particle_y = y + offset_y
-            
-            # Create spark particle with random size between 1-12
-            size = random.uniform(1, 12)
-            particle = ConnectionSparkParticle(particle_x, particle_y, size)
-            self.scene.addItem(particle)
-            self.particles.append(particle)
-        
-        # Start the animation timer if not already running
-        if not self.timer.isActive():
-            self.timer.start()
-    
-    def update_particles(self):
+
+        # Small random offset for natural appearance, sizes between 1-12
+        xs = x + np.random.uniform(-3, 3, num_particles)
+        ys = y + np.random.uniform(-3, 3, num_particles)
+        sizes = np.random.uniform(1, 12, num_particles)
+        self._get_batch().add_sparks(xs, ys, sizes)
+
+        # Start the animation if not already running
+        self._start_animation()
+
+    def _start_animation(self):
+        """Subscribe to the frame clock if the particles aren't animating yet"""
+        # Particles move a fixed step per update, so they aren't throttled
+        FrameClock.instance().subscribe(self.update_particles, self.frame_interval, throttle=False)
+
+    def _stop_animation(self):
+        """Unsubscribe from the frame clock once no particles are left"""
+        FrameClock.instance().unsubscribe(self.update_particles)
+
+    def update_particles(self, frame_scale=1.0):
         """Update all particles and remove those that are no longer visible"""
-        if not self.particles and not self.view_particles:
-            self.timer.stop()
-            return
-            
-        # Update each particle and keep only those that are still visible
-        remaining_particles = []
-        for particle in self.particles:
-            if particle.update_particle():
-                remaining_particles.append(particle)
-            else:
-                self.scene.removeItem(particle)
-        
-        self.particles = remaining_particles
-        
+        # Spawn the aggregated milestone popups queued since the last frame
+        if self.pending_milestones:
+            self._flush_milestone_popups()
+
+        # Advance the whole scene batch at once
+        remaining = 0
+        if self._scene_particle_count():
+            remaining = self.batch.advance_particles()
+
         # Update view-based particles
         remaining_view_particles = []
         for particle in self.view_particles:
@@ -567,9 +740,9 @@ class ParticleSystem:
                 remaining_view_particles.append(particle)
             else:
                 particle.deleteLater()  # Schedule for deletion
-        
+
         self.view_particles = remaining_view_particles
-        
-        # Stop the timer if all particles are gone
-        if not self.particles and not self.view_particles:
-            self.timer.stop() 
\ No newline at end of file
+
+        # Stop animating if all particles are gone
+        if not remaining and not self.view_particles:
+            self._stop_animation()
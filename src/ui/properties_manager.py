@@ -220,6 +220,7 @@ class ComponentPropertiesManager:
             }
         """)
                 component.update()  # Redraw the component
+                component.refresh_static_layer()  # Show or hide the cached image
             
             graphics_toggle.clicked.connect(toggle_graphics)
             graphics_toggle.setToolTip("Toggle visibility of the load component's image")
@@ -285,6 +286,9 @@ class ComponentPropertiesManager:
         content_widget = QWidget()
         content_widget.setLayout(content_layout)
         
+        # Show edits on the component right away, even while the simulation is paused
+        self._connect_display_refresh(content_widget, component)
+        
         # Create button widget to hold the bottom layout
         bottom_widget = QWidget()
         bottom_widget.setLayout(bottom_layout)
@@ -304,6 +308,27 @@ class ComponentPropertiesManager:
         self.properties_widget.adjustSize()
         self.main_window.properties_dock.adjustSize()
     
+    def _connect_display_refresh(self, widget, component):
+        """
+        Refresh the component's indicator and text box after every edit in the properties panel.
+        Runs after the property handlers (connected first), and only repaints if the display changed.
+        
+        Args:
+            widget: Widget holding the component's property editors
+            component: The component being edited
+        """
+        def refresh(*args):
+            component.set_display_values()
+        
+        for line_edit in widget.findChildren(QLineEdit):
+            line_edit.textChanged.connect(refresh)
+        for combo_box in widget.findChildren(QComboBox):
+            combo_box.currentTextChanged.connect(refresh)
+        for slider in widget.findChildren(QSlider):
+            slider.valueChanged.connect(refresh)
+        for button in widget.findChildren(QPushButton):
+            button.clicked.connect(refresh)
+    
     def update_delete_button_state(self):
         """
         Update the state of the delete button based on simulation status.
@@ -0,0 +1,185 @@
+"""
+SensitivityManager module for OVERCLOCK
+
+This module provides the SensitivityManager class, which runs a sensitivity (tornado) analysis of the current scenario.
+Every parameter perturbation is simulated in worker processes by the headless runner, so the UI stays responsive,
+and the ranked results are handed to the HistorianManager's sensitivity view.
+"""
+
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QCheckBox, QDoubleSpinBox, QDialogButtonBox, QLabel
+from src.ui.terminal_widget import TerminalWidget
+from src.ui.dialog_styles import apply_standard_dialog_style
+from src.ui.worker_pool_manager import WorkerPoolManager
+from src.simulation.sensitivity import (
+    SENSITIVITY_PARAMETERS, CAPEX_ONLY_PARAMETERS, DEFAULT_PERCENT, TORNADO_METRICS,
+    perturbation_cases, run_baseline, run_perturbation, load_cached_baseline, store_baseline, summarize
+)
+
+class SensitivityManager(WorkerPoolManager):
+    """
+    Manages sensitivity analysis runs.
+    This class starts the worker processes, collects their results without blocking the UI and shows the tornado chart in the historian.
+    """
+
+    busy_reason = 'sensitivity'
+
+    def __init__(self, main_window):
+        """Initialize with a reference to the main window"""
+        super().__init__(main_window)
+        self.baseline_future = None
+        # Inputs of the analysis in progress
+        self.data = None
+        self.seed = None
+        self.cases = []
+        self.baseline = None
+        self.percent = DEFAULT_PERCENT
+        # Parameters of the last analysis (None: all), preselected in the options dialog
+        self.parameters = None
+
+    def pending_futures(self):
+        """The perturbation runs and, unless it was cached, the baseline run"""
+        return self.futures + ([self.baseline_future] if self.baseline_future is not None else [])
+
+    def ask_sensitivity(self):
+        """Ask which parameters to perturb and by how much, then run the analysis"""
+        if self.is_running():
+            TerminalWidget.log("A sensitivity analysis is already running")
+            return
+
+        options = self._ask_options()
+        if options is None:
+            return
+        parameters, percent = options
+        if not parameters:
+            TerminalWidget.log("ERROR: Select at least one parameter to perturb.")
+            return
+        self.run_sensitivity(parameters, percent)
+
+    def _ask_options(self):
+        """
+        Show the sensitivity options dialog
+
+        Returns:
+            (parameters, percent) with the checked SENSITIVITY_PARAMETERS names and the perturbation size,
+            or None if the dialog was cancelled
+        """
+        dialog = QDialog(self.main_window)
+        dialog.setWindowTitle("Sensitivity Analysis")
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel("Parameters to perturb:"))
+
+        # One checkbox per parameter, all checked by default
+        checkboxes = {}
+        for name, (label, _, _) in SENSITIVITY_PARAMETERS.items():
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(self.parameters is None or name in self.parameters)
+            checkbox.setStyleSheet("color: white;")
+            layout.addWidget(checkbox)
+            checkboxes[name] = checkbox
+
+        # Perturbation size, limited like the --percent command-line option
+        percent_edit = QDoubleSpinBox()
+        percent_edit.setRange(0.5, 99.5)
+        percent_edit.setDecimals(1)
+        percent_edit.setSingleStep(5)
+        percent_edit.setValue(self.percent)
+        percent_edit.setStyleSheet("QDoubleSpinBox { background-color: rgba(37, 47, 52, 0.75); color: white; border: 1px solid #777777; border-radius: 3px; padding: 1px; }")
+        form = QFormLayout()
+        form.addRow("Perturbation (±%):", percent_edit)
+        layout.addLayout(form)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        apply_standard_dialog_style(dialog)
+
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return None
+        return [name for name, checkbox in checkboxes.items() if checkbox.isChecked()], percent_edit.value()
+
+    def run_sensitivity(self, parameters=None, percent=DEFAULT_PERCENT):
+        """
+        Perturb the current scenario's parameters by ±percent and rank them by their effect
+
+        Args:
+            parameters: Names from SENSITIVITY_PARAMETERS (default: all)
+            percent: Perturbation size in percent
+        """
+        if self.is_running():
+            TerminalWidget.log("A sensitivity analysis is already running")
+            return
+
+        if not self.main_window.check_network_connectivity():
+            TerminalWidget.log("ERROR: All components must be connected to the network to run the simulation. Please ensure every component is connected before starting.")
+            self.main_window.highlight_unconnected_components()
+            return
+
+        self.data = self.main_window.model_manager.scenario_data()
+        self.seed = self.main_window.simulation_engine.random_seed
+        self.percent = percent
+        self.parameters = parameters
+        self.cases = perturbation_cases(self.data, parameters or list(SENSITIVITY_PARAMETERS), percent)
+        if not self.cases:
+            TerminalWidget.log("ERROR: The scenario has no components with parameters to perturb.")
+            return
+
+        # A scenario that was analyzed before reuses its baseline run
+        self.baseline = load_cached_baseline(self.data, self.seed)
+        simulated = [case for case in self.cases if case[0] not in CAPEX_ONLY_PARAMETERS]
+        runs = len(simulated) + (1 if self.baseline is None else 0)
+
+        jobs = self.start_pool(runs)
+        if self.baseline is None:
+            self.baseline_future = self.executor.submit(run_baseline, self.data, self.seed)
+        self.futures = [
+            self.executor.submit(run_perturbation, self.data, parameter, case, factor, self.seed)
+            for parameter, case, factor in simulated
+        ]
+
+        cached = " (cached baseline)" if self.baseline is not None else ""
+        TerminalWidget.log(f"Sensitivity: running {runs} simulations at ±{percent:g}% on {jobs} workers{cached}...")
+
+        self.start_polling()
+
+    def workers_finished(self):
+        """Collect the finished runs and show the tornado chart"""
+        if self.baseline_future is not None:
+            try:
+                self.baseline = self.baseline_future.result()
+            except Exception as e:
+                # The worker process died (e.g. out of memory)
+                self.baseline = {'kpis': None, 'gross_revenue': None, 'gross_cost': None, 'error': str(e)}
+        results = []
+        for future in self.futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({'parameter': '', 'case': '', 'kpis': None, 'error': str(e)})
+        self._shutdown_executor()
+
+        if self.baseline['error']:
+            TerminalWidget.log(f"ERROR: Sensitivity baseline failed: {self.baseline['error']}")
+            return
+        store_baseline(self.data, self.seed, self.baseline)
+        for result in results:
+            if result['error']:
+                TerminalWidget.log(f"ERROR: Sensitivity run {result['parameter']} ({result['case']}) failed: {result['error']}")
+
+        rows = summarize(self.baseline, results, self.cases)
+
+        # Show the tornado chart in the historian view
+        if self.main_window.is_model_view:
+            self.main_window.switch_to_historian_view()
+            self.main_window.mode_toggle_btn.setText("💾 Historian")
+            self.main_window.disable_component_buttons(True)
+        self.main_window.historian_manager.show_sensitivity(rows, self.baseline['kpis'], self.percent)
+
+        key, label, scale, unit = TORNADO_METRICS[0]
+        low, high = rows[0]['deltas'][key]
+        TerminalWidget.log(f"Sensitivity ready: {rows[0]['label']} moves {label} by {low * scale:+.2f}{unit} / {high * scale:+.2f}{unit}")
+
+    def _shutdown_executor(self):
+        """Release the worker processes"""
+        self.baseline_future = None
+        super()._shutdown_executor()
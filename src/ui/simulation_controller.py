@@ -1,9 +1,3 @@
-from src.components.generator import GeneratorComponent
-from src.components.load import LoadComponent
-from src.components.battery import BatteryComponent
-from src.components.grid_import import GridImportComponent
-from src.components.grid_export import GridExportComponent
-from src.components.cloud_workload import CloudWorkloadComponent
 from src.ui.terminal_widget import TerminalWidget
 
 class SimulationController:
@@ -19,7 +13,8 @@ class SimulationController:
         """Toggle the simulation between running and paused"""
         # Check network connectivity before starting simulation
         if not self.main_window.simulation_engine.simulation_running and not self.main_window.check_network_connectivity():
-            TerminalWidget.log("ERROR: All components must be connected in a single network to run the simulation. Please ensure all components are connected before starting.")
+            TerminalWidget.log("ERROR: All components must be connected to the network to run the simulation. Please ensure every component is connected before starting.")
+            self.main_window.highlight_unconnected_components()
             # Trigger error flash if the main window has a central widget with that capability
             if hasattr(self.main_window, 'centralWidget') and hasattr(self.main_window.centralWidget(), 'trigger_error_flash'):
                 self.main_window.centralWidget().trigger_error_flash()
@@ -239,39 +234,8 @@ class SimulationController:
                 if main_layout:
                     main_layout.setContentsMargins(4, 4, 4, 4)
         
-        # Also reset accumulated revenue in all load components
-        for item in self.main_window.scene.items():
-            if isinstance(item, LoadComponent):
-                item.accumulated_revenue = 0.0
-                item.update()  # Refresh the visual display
-            # Reset accumulated revenue for Cloud Workload components as well
-            elif isinstance(item, CloudWorkloadComponent):
-                item.accumulated_revenue = 0.0
-                item.update()  # Refresh the visual display
-            # Reset accumulated revenue for Grid Export components
-            elif isinstance(item, GridExportComponent):
-                item.accumulated_revenue = 0.0
-                item.previous_revenue = 0.0
-                item.update()  # Refresh the visual display
-            # Reset accumulated cost for Grid Import components
-            elif isinstance(item, GridImportComponent):
-                item.accumulated_cost = 0.0
-                item.previous_cost = 0.0
-                item.update()  # Refresh the visual display
-            # Reset accumulated cost for Generator components
-            elif isinstance(item, GeneratorComponent):
-                item.accumulated_cost = 0.0
-                item.previous_cost = 0.0
-                # Reset maintenance state
-                item.is_in_maintenance = False
-                item.maintenance_time_remaining = 0
-                item.cooldown_time_remaining = 0
-                item.total_operating_hours = 0
-                item.update()  # Refresh the visual display
-            # Reset all batteries to 100% charge
-            elif isinstance(item, BatteryComponent):
-                item.current_charge = item.energy_capacity  # Set to 100% charge
-                item.update()  # Refresh the visual display
+        # Reset accumulated revenue/cost, generator maintenance and battery charge
+        self.main_window.simulation_engine.reset_component_state()
         
         # Update UI to match paused state
         self.main_window.simulation_engine.simulation_running = False
@@ -1,6 +1,7 @@
 from PyQt6.QtCore import QTimer, QPointF
 
 from src.simulation.engine import SimulationEngine
+from src.simulation.network_topology import NetworkTopology
 from .properties_manager import ComponentPropertiesManager
 from src.models.model_manager import ModelManager
 from .historian_manager import HistorianManager
@@ -8,6 +9,8 @@ from .particle_system import ParticleSystem
 from .component_adder import ComponentAdder
 from .connection_manager import ConnectionManager
 from .autocomplete_manager import AutocompleteManager
+from .compare_manager import CompareManager
+from .sensitivity_manager import SensitivityManager
 from .mode_toggle_manager import ModeToggleManager
 from .simulation_controller import SimulationController
 from .screenshot_manager import ScreenshotManager
@@ -29,6 +32,8 @@ class SimulatorInitializer:
         # Initialize variables
         simulator.components = []
         simulator.connections = []
+        # Union-find tracking of which components are connected
+        simulator.network_topology = NetworkTopology(simulator)
         simulator.creating_connection = False
         simulator.connection_source = None
         simulator.temp_connection = None
@@ -104,6 +109,12 @@ class SimulatorInitializer:
         # Create autocomplete manager
         simulator.autocomplete_manager = AutocompleteManager(simulator)
         
+        # Create compare manager
+        simulator.compare_manager = CompareManager(simulator)
+        
+        # Create sensitivity manager
+        simulator.sensitivity_manager = SensitivityManager(simulator)
+        
         # Create mode toggle manager
         simulator.mode_toggle_manager = ModeToggleManager(simulator)
         
@@ -0,0 +1,437 @@
+from PyQt6.QtWidgets import QWidget, QMenu, QFileDialog
+from PyQt6.QtGui import QPainter, QPen, QColor, QPixmap, QFont, QFontMetrics, QPolygonF
+from PyQt6.QtCore import Qt, QRectF, QPointF
+import numpy as np
+
+
+class TimeSeriesChart(QWidget):
+    """
+    Lightweight native time-series chart drawn with QPainter.
+
+    Replaces embedded matplotlib canvases for live panels. The parts that
+    don't depend on the visible ranges (background, axis labels, legend)
+    are rendered into cached pixmaps and only rebuilt when the size, labels
+    or series change. Grid lines and tick labels follow the ranges, which
+    slide with the simulation, so they're drawn on every paint along with
+    the series polylines. Series with more points than there are pixel
+    columns are decimated to a min/max envelope per column.
+
+    Matplotlib is still used for static export (right-click > Export Chart),
+    and is only imported when an export is requested.
+    """
+
+    # Dark theme colors shared with the rest of the analytics panel
+    BACKGROUND_COLOR = '#0A0E22'
+    GRID_COLOR = '#2A334F'
+    SPINE_COLOR = '#29304D'
+    TEXT_COLOR = '#B5BEDF'
+    LEGEND_BACKGROUND = '#1C223F'
+    LEGEND_TEXT = '#E1E6F9'
+
+    def __init__(self, parent=None, x_label='', y_label='', margins=(0.15, 0.02, 0.12, 0.03)):
+        """
+        Initialize the chart
+
+        Args:
+            parent: Parent widget
+            x_label: Label for the horizontal axis
+            y_label: Label for the vertical axis
+            margins: Plot margins as fractions of the widget size (left, right, bottom, top)
+        """
+        super().__init__(parent)
+        self.x_label = x_label
+        self.y_label = y_label
+        self.margins = margins
+
+        self.series = {}  # key -> dict(label, color, style, width, x, y)
+        self.series_order = []  # Keep legend order stable
+        self.x_range = (0.0, 1.0)
+        self.y_range = (0.0, 1.0)
+        self.y_formatter = lambda value: f"{value:g}"
+        self.y_formatter_tier = None  # Identifies the current formatter (e.g. its scale)
+        self.show_legend = True
+        self.show_zero_line = False
+
+        # Cached range-independent layers (background and axis labels, legend) - rebuilt only when marked dirty
+        self._static_cache = None
+        self._legend_cache = None
+        self._static_dirty = True
+
+        self.setMinimumHeight(120)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._show_context_menu)
+
+    def add_series(self, key, label, color, style='solid', width=2):
+        """
+        Add a data series to the chart
+
+        Args:
+            key: Unique key for the series
+            label: Legend label
+            color: Line color (hex string)
+            style: 'solid' or 'dot'
+            width: Line width in pixels
+        """
+        self.series[key] = {
+            'label': label,
+            'color': QColor(color),
+            'style': style,
+            'width': width,
+            'x': np.empty(0),
+            'y': np.empty(0)
+        }
+        self.series_order.append(key)
+        self._static_dirty = True  # Legend changed
+
+    def set_series_data(self, key, x_values, y_values):
+        """
+        Replace the data of a series
+
+        Args:
+            key: Series key
+            x_values: Sequence of x values (must be sorted ascending)
+            y_values: Sequence of y values
+        """
+        series = self.series[key]
+        series['x'] = np.asarray(x_values, dtype=float)
+        series['y'] = np.asarray(y_values, dtype=float)
+
+    def set_x_range(self, x_min, x_max):
+        """Set the visible horizontal range (grid and ticks follow on the next paint)"""
+        self.x_range = (float(x_min), float(x_max))
+
+    def set_y_range(self, y_min, y_max):
+        """Set the visible vertical range (grid and ticks follow on the next paint)"""
+        self.y_range = (float(y_min), float(y_max))
+
+    def set_y_formatter(self, formatter, tier=None):
+        """
+        Set the function used to format vertical tick labels
+
+        Args:
+            formatter: Callable taking a value and returning a string
+            tier: Identifies the formatting (e.g. its scale); a formatter of the
+                same tier as the current one is ignored, so callers can pass a
+                new closure on every update
+        """
+        if tier is not None and tier == self.y_formatter_tier:
+            return
+        self.y_formatter = formatter
+        self.y_formatter_tier = tier
+
+    def set_y_label(self, label):
+        """Set the vertical axis label"""
+        if label != self.y_label:
+            self.y_label = label
+            self._static_dirty = True
+
+    def clear(self):
+        """Remove all data from every series"""
+        for series in self.series.values():
+            series['x'] = np.empty(0)
+            series['y'] = np.empty(0)
+        self.update()
+
+    def resizeEvent(self, event):
+        """Invalidate the cached layers when the widget size changes"""
+        self._static_dirty = True
+        super().resizeEvent(event)
+
+    def plot_rect(self):
+        """
+        Get the rectangle the data is drawn into
+
+        Returns:
+            QRectF of the plot area in widget coordinates
+        """
+        left, right, bottom, top = self.margins
+        w, h = self.width(), self.height()
+        return QRectF(w * left, h * top, w * (1 - left - right), h * (1 - top - bottom))
+
+    @staticmethod
+    def nice_ticks(low, high, target=6):
+        """
+        Pick evenly spaced "round" tick values covering a range
+
+        Args:
+            low: Range start
+            high: Range end
+            target: Approximate number of ticks wanted
+
+        Returns:
+            NumPy array of tick values within [low, high]
+        """
+        span = high - low
+        if span <= 0:
+            return np.array([low])
+        raw_step = span / target
+        magnitude = 10 ** np.floor(np.log10(raw_step))
+        for multiple in (1, 2, 2.5, 5, 10):
+            step = multiple * magnitude
+            if span / step <= target:
+                break
+        first = np.ceil(low / step) * step
+        return np.arange(first, high + step * 1e-9, step)
+
+    def _map_x(self, values, rect):
+        x_min, x_max = self.x_range
+        scale = rect.width() / (x_max - x_min) if x_max > x_min else 0
+        return rect.left() + (values - x_min) * scale
+
+    def _map_y(self, values, rect):
+        y_min, y_max = self.y_range
+        scale = rect.height() / (y_max - y_min) if y_max > y_min else 0
+        return rect.bottom() - (values - y_min) * scale
+
+    def _chart_font(self):
+        """Font for ticks, labels and legend"""
+        font = QFont()
+        font.setPointSize(8)
+        return font
+
+    def _new_pixmap(self, fill):
+        """Widget-sized pixmap at the screen's pixel ratio, filled with a color"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(fill)
+        return pixmap
+
+    def _render_static(self):
+        """Render the range-independent layers: background with axis labels, and the legend"""
+        rect = self.plot_rect()
+        font = self._chart_font()
+        metrics = QFontMetrics(font)
+
+        # Background and axis labels
+        pixmap = self._new_pixmap(QColor(self.BACKGROUND_COLOR))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(font)
+        painter.setPen(QColor(self.TEXT_COLOR))
+        if self.x_label:
+            painter.drawText(
+                QPointF(rect.center().x() - metrics.horizontalAdvance(self.x_label) / 2,
+                        rect.bottom() + metrics.height() * 2 + 2),
+                self.x_label
+            )
+        if self.y_label:
+            painter.save()
+            painter.translate(metrics.height(), rect.center().y() + metrics.horizontalAdvance(self.y_label) / 2)
+            painter.rotate(-90)
+            painter.drawText(QPointF(0, 0), self.y_label)
+            painter.restore()
+        painter.end()
+        self._static_cache = pixmap
+
+        # Legend in the top-left corner of the plot area, on a transparent layer drawn above the grid
+        self._legend_cache = None
+        if self.show_legend and self.series_order:
+            pixmap = self._new_pixmap(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setFont(font)
+            row_height = metrics.height() + 2
+            legend_width = max(metrics.horizontalAdvance(self.series[k]['label']) for k in self.series_order) + 34
+            legend_rect = QRectF(rect.left() + 6, rect.top() + 6, legend_width, row_height * len(self.series_order) + 6)
+            legend_background = QColor(self.LEGEND_BACKGROUND)
+            legend_background.setAlphaF(0.8)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(legend_background)
+            painter.drawRoundedRect(legend_rect, 3, 3)
+            for row, key in enumerate(self.series_order):
+                series = self.series[key]
+                y = legend_rect.top() + 3 + row_height * row + row_height / 2
+                painter.setPen(self._series_pen(series))
+                painter.drawLine(QPointF(legend_rect.left() + 6, y), QPointF(legend_rect.left() + 24, y))
+                painter.setPen(QColor(self.LEGEND_TEXT))
+                painter.drawText(QPointF(legend_rect.left() + 28, y + metrics.ascent() / 2 - 1), series['label'])
+            painter.end()
+            self._legend_cache = pixmap
+
+        self._static_dirty = False
+
+    def _draw_grid(self, painter, rect):
+        """Draw the range-dependent grid lines, tick labels, zero line and spines"""
+        font = self._chart_font()
+        painter.setFont(font)
+        metrics = QFontMetrics(font)
+        text_color = QColor(self.TEXT_COLOR)
+        grid_pen = QPen(QColor(self.GRID_COLOR))
+        grid_pen.setWidth(1)
+
+        for tick in self.nice_ticks(*self.x_range):
+            x = float(self._map_x(tick, rect))
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
+            painter.setPen(text_color)
+            label = f"{tick:g}"
+            painter.drawText(QPointF(x - metrics.horizontalAdvance(label) / 2, rect.bottom() + metrics.height()), label)
+
+        for tick in self.nice_ticks(*self.y_range):
+            y = float(self._map_y(tick, rect))
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+            painter.setPen(text_color)
+            label = self.y_formatter(tick)
+            painter.drawText(QPointF(rect.left() - metrics.horizontalAdvance(label) - 4, y + metrics.ascent() / 2), label)
+
+        # Zero reference line
+        if self.show_zero_line and self.y_range[0] < 0 < self.y_range[1]:
+            zero_pen = QPen(QColor(self.SPINE_COLOR))
+            zero_pen.setWidth(1)
+            painter.setPen(zero_pen)
+            y = float(self._map_y(0.0, rect))
+            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+
+        # Spines
+        painter.setPen(QPen(QColor(self.SPINE_COLOR)))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(rect)
+
+    @staticmethod
+    def _polyline(px, py):
+        """
+        Build a polyline from coordinate arrays without a per-point Python loop
+
+        Args:
+            px: Widget x coordinates
+            py: Widget y coordinates
+
+        Returns:
+            QPolygonF sharing the layout of an (n, 2) float64 array, filled in one NumPy assignment
+        """
+        polygon = QPolygonF()
+        polygon.resize(len(px))
+        buffer = polygon.data()
+        buffer.setsize(len(px) * 2 * 8)  # Two doubles per QPointF
+        np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)[:] = np.column_stack((px, py))
+        return polygon
+
+    def _series_pen(self, series, glow=False):
+        """Build the pen for a series (or its soft glow underlay)"""
+        color = QColor(series['color'])
+        if glow:
+            color.setAlphaF(0.2)
+            pen = QPen(color, series['width'] + 5)
+        else:
+            color.setAlphaF(0.9)
+            pen = QPen(color, series['width'])
+            if series['style'] == 'dot':
+                pen.setStyle(Qt.PenStyle.DotLine)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        return pen
+
+    def _decimate(self, x, y, rect):
+        """
+        Reduce a series to at most two points (min and max) per pixel column
+
+        Args:
+            x: Series x values (sorted)
+            y: Series y values
+            rect: Plot rectangle
+
+        Returns:
+            Tuple of (x, y) arrays to draw
+        """
+        # Drop points outside the visible horizontal range (keep one either side)
+        x_min, x_max = self.x_range
+        start = max(0, np.searchsorted(x, x_min) - 1)
+        stop = min(len(x), np.searchsorted(x, x_max, side='right') + 1)
+        x, y = x[start:stop], y[start:stop]
+
+        columns = max(1, int(rect.width()))
+        if len(x) <= columns * 2:
+            return x, y
+
+        # Group samples by pixel column and keep the envelope of each column
+        column_index = ((x - x_min) / (x_max - x_min) * columns).astype(int) if x_max > x_min else np.zeros(len(x), dtype=int)
+        boundaries = np.flatnonzero(np.diff(column_index)) + 1
+        starts = np.concatenate(([0], boundaries))
+        column_min = np.minimum.reduceat(y, starts)
+        column_max = np.maximum.reduceat(y, starts)
+        column_x = x[starts]
+        return np.repeat(column_x, 2), np.column_stack((column_min, column_max)).ravel()
+
+    def paintEvent(self, event):
+        """Paint the cached layers, the grid for the current ranges and the (decimated) series polylines"""
+        if self._static_dirty or self._static_cache is None:
+            self._render_static()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._static_cache)
+
+        rect = self.plot_rect()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_grid(painter, rect)
+        if self._legend_cache is not None:
+            painter.drawPixmap(0, 0, self._legend_cache)
+        painter.setClipRect(rect)
+
+        for key in self.series_order:
+            series = self.series[key]
+            if len(series['x']) == 0:
+                continue
+            x, y = self._decimate(series['x'], series['y'], rect)
+            px = self._map_x(x, rect)
+            py = self._map_y(y, rect)
+
+            polyline = self._polyline(px, py)
+
+            # Soft glow underneath, then the line itself
+            painter.setPen(self._series_pen(series, glow=True))
+            painter.drawPolyline(polyline)
+            painter.setPen(self._series_pen(series))
+            painter.drawPolyline(polyline)
+
+        painter.end()
+
+    def _show_context_menu(self, position):
+        """Offer static export of the chart"""
+        menu = QMenu(self)
+        export_action = menu.addAction("Export Chart...")
+        if menu.exec(self.mapToGlobal(position)) == export_action:
+            filename, _ = QFileDialog.getSaveFileName(self, "Export Chart", "", "PNG Files (*.png);;SVG Files (*.svg);;PDF Files (*.pdf)")
+            if filename:
+                self.export_figure(filename)
+
+    def export_figure(self, filename):
+        """
+        Export the current chart contents as a static image using matplotlib
+
+        Args:
+            filename: Output path; the format is taken from the extension
+        """
+        # Imported here so matplotlib stays off the startup path
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        import matplotlib.ticker as ticker
+
+        figure = Figure(figsize=(8, 4))
+        FigureCanvasAgg(figure)
+        figure.patch.set_facecolor(self.BACKGROUND_COLOR)
+        ax = figure.add_subplot(111)
+        ax.set_facecolor(self.BACKGROUND_COLOR)
+        ax.tick_params(colors=self.TEXT_COLOR)
+        ax.grid(True, color=self.GRID_COLOR, linestyle='-')
+        for spine in ax.spines.values():
+            spine.set_color(self.SPINE_COLOR)
+        ax.set_xlabel(self.x_label, color=self.TEXT_COLOR)
+        ax.set_ylabel(self.y_label, color=self.TEXT_COLOR)
+
+        for key in self.series_order:
+            series = self.series[key]
+            ax.plot(series['x'], series['y'], ':' if series['style'] == 'dot' else '-',
+                    color=series['color'].name(), linewidth=series['width'], label=series['label'], alpha=0.9)
+
+        ax.set_xlim(*self.x_range)
+        ax.set_ylim(*self.y_range)
+        ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda value, pos: self.y_formatter(value)))
+        if self.show_legend and self.series_order:
+            legend = ax.legend(framealpha=0.8)
+            legend.get_frame().set_facecolor(self.LEGEND_BACKGROUND)
+            for text in legend.get_texts():
+                text.set_color(self.LEGEND_TEXT)
+
+        figure.savefig(filename, facecolor=figure.get_facecolor())
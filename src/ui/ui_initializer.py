@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                             QMenu, QFrame,
                             QToolButton, QSizePolicy, QGraphicsTextItem)
 from PyQt6.QtCore import Qt, QRectF, QRect, QTimer, QTime, QSize
-from PyQt6.QtGui import QPainter, QPen, QPixmap, QColor, QKeySequence, QPainterPath, QLinearGradient, QFontMetrics, QIcon, QAction
+from PyQt6.QtGui import QPainter, QPen, QPixmap, QColor, QKeySequence, QPainterPath, QLinearGradient, QFontMetrics, QIcon, QAction, QActionGroup
 import math
 
 # Import or reference modules and classes needed from main_window
@@ -23,6 +23,7 @@ from src.utils.resource import resource_path
 from .classes.gradient_border_text import GradientBorderText
 from .classes.bordered_main_widget import BorderedMainWidget
 from .classes.animated_gradient_container import AnimatedGradientContainer
+from .frame_clock import FrameClock, QUALITY_LEVELS, DEFAULT_QUALITY
 
 # Export this button style as a module-level variable for use in other files
 opaque_button_style = """
@@ -431,7 +432,7 @@ class UIInitializer:
         main_window.connection_btn.clicked.connect(main_window.start_connection)
         
         autoconnect_btn = QPushButton()
-        autoconnect_btn.setToolTip("(A)utoconnect All")
+        autoconnect_btn.setToolTip("(A)utoconnect All\nShift+A: Connect Only New Components")
         autoconnect_pixmap = QPixmap(resource_path("src/ui/assets/menu_icons/autoconnectall.png"))
         autoconnect_icon = QIcon(autoconnect_pixmap)
         autoconnect_btn.setIcon(autoconnect_icon)
@@ -908,7 +909,7 @@ class UIInitializer:
         zoom_label = QLabel("🔭")
         zoom_label.setStyleSheet("font-size: 16px;")
         main_window.zoom_slider = QSlider(Qt.Orientation.Horizontal)
-        main_window.zoom_slider.setMinimum(40)  # 0.4x zoom (changed from 20/0.2x)
+        main_window.zoom_slider.setMinimum(10)  # 0.1x zoom - components switch to simpler level-of-detail tiers when small
         main_window.zoom_slider.setMaximum(100)  # 1.0x zoom
         main_window.zoom_slider.setValue(100)    # Default to 1.0x
         main_window.zoom_slider.setFixedWidth(150)
@@ -1001,11 +1002,20 @@ class UIInitializer:
         load_action = QAction("Load", main_window)
         load_action.triggered.connect(lambda: main_window.cancel_connection_if_active(main_window.load_scenario))
         
+        compare_action = QAction("Compare...", main_window)
+        compare_action.triggered.connect(lambda: main_window.cancel_connection_if_active(main_window.compare_scenarios))
+        
+        sensitivity_action = QAction("Sensitivity", main_window)
+        sensitivity_action.triggered.connect(lambda: main_window.cancel_connection_if_active(main_window.run_sensitivity))
+        
         # Create Model menu and add actions
         model_menu = QMenu("Model", main_window)
         model_menu.addAction(new_action)
         model_menu.addAction(save_action)
         model_menu.addAction(load_action)
+        model_menu.addSeparator()
+        model_menu.addAction(compare_action)
+        model_menu.addAction(sensitivity_action)
         
         # Use QToolButton for Model menu to make text clickable
         model_button = QToolButton()
@@ -1029,6 +1039,14 @@ class UIInitializer:
         main_window.analytics_action = QAction("Show Analytics (P)anel", main_window)
         main_window.analytics_action.triggered.connect(lambda: main_window.cancel_connection_if_active(main_window.toggle_analytics_panel))
         view_menu.addAction(main_window.analytics_action)
+        
+        # Flatten decorations into cached background tiles for large layouts.
+        # Baked decorations can't be selected or moved; uncheck to edit them.
+        view_menu.addSeparator()
+        main_window.bake_decorations_action = QAction("Bake Decorations Into Background", main_window)
+        main_window.bake_decorations_action.setCheckable(True)
+        main_window.bake_decorations_action.toggled.connect(lambda checked: main_window.cancel_connection_if_active(main_window.scene.set_decorations_baked, checked))
+        view_menu.addAction(main_window.bake_decorations_action)
 
         # Use QToolButton instead of QAction for View menu to make text clickable
         view_button = QToolButton()
@@ -1051,6 +1069,19 @@ class UIInitializer:
         restore_default_action.triggered.connect(lambda: main_window.cancel_connection_if_active(lambda: main_window.resize(1600, 900)))
         window_menu.addAction(restore_default_action)
         
+        # Animation quality submenu - trades animation smoothness for CPU
+        window_menu.addSeparator()
+        quality_menu = window_menu.addMenu("Animation Quality")
+        main_window.animation_quality_group = QActionGroup(main_window)
+        main_window.animation_quality_group.setExclusive(True)
+        for quality in QUALITY_LEVELS:
+            quality_action = QAction(quality, main_window)
+            quality_action.setCheckable(True)
+            quality_action.setChecked(quality == DEFAULT_QUALITY)
+            quality_action.triggered.connect(lambda checked, q=quality: FrameClock.instance().set_quality(q))
+            main_window.animation_quality_group.addAction(quality_action)
+            quality_menu.addAction(quality_action)
+        
         # Use QToolButton for Window menu
         window_button = QToolButton()
         window_button.setText("Window")
@@ -1070,10 +1101,12 @@ class UIInitializer:
         main_window.clock_label.setStyleSheet("QLabel { color: white; font-size: 14pt; margin-right: 15px; }")
         toolbar.addWidget(main_window.clock_label)
         
-        # Set up timer to update clock every second
-        main_window.clock_timer = QTimer(main_window)
-        main_window.clock_timer.timeout.connect(lambda: UIInitializer.update_clock(main_window))
-        main_window.clock_timer.start(1000)  # Update every second
+        # Update the clock every second on the shared frame clock
+        main_window.clock_tick = lambda frame_scale: UIInitializer.update_clock(main_window)
+        FrameClock.instance().subscribe(main_window.clock_tick, 1000, throttle=False)
+        
+        # Pause all animations while the main window is hidden or minimized
+        FrameClock.instance().watch_window(main_window)
         
         # Initialize clock immediately
         UIInitializer.update_clock(main_window)
@@ -0,0 +1,94 @@
+"""
+WorkerPoolManager module for OVERCLOCK
+
+This module provides the WorkerPoolManager base class for managers that run simulations in worker processes
+(scenario comparison, sensitivity analysis). It owns the process pool and a poll timer that collects finished
+runs without blocking the UI, and marks the app busy while the workers run.
+"""
+
+import abc
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from PyQt6.QtCore import QTimer
+from src.ui.frame_clock import FrameClock
+
+# How often finished worker runs are collected (ms)
+POLL_INTERVAL_MS = 100
+
+
+class WorkerPoolManager(abc.ABC):
+    """
+    Base class for managers running simulations in worker processes.
+    Subclasses submit their runs to the pool started by start_pool and handle the results in workers_finished.
+    """
+
+    # Name of the activity for FrameClock.set_busy
+    busy_reason = 'workers'
+
+    def __init__(self, main_window):
+        """Initialize with a reference to the main window"""
+        self.main_window = main_window
+        self.executor = None
+        self.futures = []
+        self.poll_timer = None
+
+    def is_running(self):
+        """Return True while worker runs are in progress"""
+        return bool(self.pending_futures())
+
+    def pending_futures(self):
+        """Futures that must finish before the results are handled"""
+        return self.futures
+
+    def start_pool(self, runs):
+        """
+        Start the worker processes
+
+        Args:
+            runs: Number of runs that will be submitted (caps the number of workers)
+
+        Returns:
+            int: Number of worker processes
+        """
+        # Workers are spawned rather than forked - a forked copy of a running Qt GUI isn't safe to use
+        jobs = max(1, min(runs, os.cpu_count() or 1))
+        self.executor = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn'))
+        # Throttle decorative animations while the workers take the CPU
+        FrameClock.instance().set_busy(self.busy_reason, True)
+        return jobs
+
+    def start_polling(self):
+        """Collect the submitted runs once they have all finished"""
+        if not self.poll_timer:
+            self.poll_timer = QTimer(self.main_window)
+            self.poll_timer.timeout.connect(self._check_progress)
+        self.poll_timer.start(POLL_INTERVAL_MS)
+
+    def _check_progress(self):
+        """Wait (without blocking) until every worker run has finished, then hand over to workers_finished"""
+        if not all(future.done() for future in self.pending_futures()):
+            return
+
+        self.poll_timer.stop()
+        self.workers_finished()
+
+    @abc.abstractmethod
+    def workers_finished(self):
+        """Handle the finished runs (subclasses release the pool with _shutdown_executor)"""
+
+    def _shutdown_executor(self):
+        """Release the worker processes"""
+        self.futures = []
+        FrameClock.instance().set_busy(self.busy_reason, False)
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def cleanup(self):
+        """Clean up resources before shutdown - call this when the application is closing"""
+        if self.poll_timer:
+            self.poll_timer.stop()
+            self.poll_timer = None
+        self._shutdown_executor()
+        self.main_window = None
@@ -0,0 +1,126 @@
+import math
+from PyQt6.QtGui import QPixmap, QPixmapCache
+from PyQt6.QtCore import Qt, QRectF
+from src.utils.resource import resource_path
+
+# Zoom buckets - the zoom slider runs 0.1-1.0, so 0.1 steps give 10 variants per image
+ZOOM_BUCKET_STEP = 0.1
+MIN_ZOOM_BUCKET = 0.1
+
+# Room for every component image at every zoom bucket (QPixmapCache default is 10 MB)
+CACHE_LIMIT_KB = 64 * 1024
+
+# Decoded full-resolution images, shared by every component using them
+_source_pixmaps = {}
+
+# Zoom bucket of the modeling view, updated by MainWindow.zoom_changed
+_zoom_bucket = 1.0
+
+QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), CACHE_LIMIT_KB))
+
+
+def load_pixmap(relative_path):
+    """
+    Get the decoded image for an asset, decoding it only the first time.
+    QPixmap is implicitly shared, so every caller gets the same pixel data.
+
+    Args:
+        relative_path: Asset path relative to the project root
+
+    Returns:
+        QPixmap (null if the file couldn't be loaded)
+    """
+    pixmap = _source_pixmaps.get(relative_path)
+    if pixmap is None:
+        pixmap = QPixmap(resource_path(relative_path))
+        if pixmap.isNull():
+            print(f"Error loading image: {relative_path}")
+        _source_pixmaps[relative_path] = pixmap
+    return pixmap
+
+
+def zoom_bucket_for(zoom_factor):
+    """
+    Round a zoom factor up to its bucket, so images rendered for the bucket
+    are never scaled up on screen (which would look blurry).
+
+    Args:
+        zoom_factor: View scale factor (1.0 = 100%)
+
+    Returns:
+        float: Zoom bucket
+    """
+    buckets = math.ceil(round(zoom_factor / ZOOM_BUCKET_STEP, 6))
+    return max(MIN_ZOOM_BUCKET, round(buckets * ZOOM_BUCKET_STEP, 2))
+
+
+def set_zoom_level(zoom_factor):
+    """
+    Set the zoom bucket used for pre-scaled images
+
+    Args:
+        zoom_factor: Current view scale factor (1.0 = 100%)
+    """
+    global _zoom_bucket
+    _zoom_bucket = zoom_bucket_for(zoom_factor)
+
+
+def get_zoom_bucket():
+    """Return the current zoom bucket"""
+    return _zoom_bucket
+
+
+def scaled_pixmap(pixmap, width, height, device_pixel_ratio=1.0):
+    """
+    Get a pre-scaled copy of a pixmap sized for drawing into a scene rect
+    of width x height at the current zoom bucket. Variants are kept in
+    QPixmapCache so each size is only scaled once.
+
+    Args:
+        pixmap: Source pixmap (usually from load_pixmap)
+        width: Target width in scene units
+        height: Target height in scene units
+        device_pixel_ratio: Device pixel ratio of the paint device
+
+    Returns:
+        Scaled QPixmap, or the source pixmap if it's already small enough
+    """
+    scale = _zoom_bucket * device_pixel_ratio
+    target_width = max(1, math.ceil(width * scale))
+    target_height = max(1, math.ceil(height * scale))
+
+    # Never scale up - the source is already the best we have
+    if target_width >= pixmap.width() and target_height >= pixmap.height():
+        return pixmap
+
+    key = f"component:{pixmap.cacheKey()}:{target_width}x{target_height}"
+    cached = QPixmapCache.find(key)
+    if cached is None:
+        cached = pixmap.scaled(
+            target_width,
+            target_height,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        QPixmapCache.insert(key, cached)
+    return cached
+
+
+def draw_scaled_pixmap(painter, target_rect, pixmap):
+    """
+    Draw a pixmap into a scene rect using the pre-scaled variant for the
+    current zoom bucket instead of scaling the full-resolution image on
+    every paint.
+
+    Args:
+        painter: Active QPainter
+        target_rect: QRectF to draw into (scene/item coordinates)
+        pixmap: Source pixmap (usually from load_pixmap)
+    """
+    if pixmap.isNull():
+        return
+
+    device = painter.device()
+    device_pixel_ratio = device.devicePixelRatioF() if device is not None else 1.0
+    image = scaled_pixmap(pixmap, target_rect.width(), target_rect.height(), device_pixel_ratio)
+    painter.drawPixmap(target_rect, image, QRectF(0, 0, image.width(), image.height()))
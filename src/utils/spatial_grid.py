@@ -0,0 +1,101 @@
+import math
+
+# Cell size in scene units - a couple of component widths (components are 300x220)
+DEFAULT_CELL_SIZE = 600
+
+
+class SpatialGrid:
+    """
+    Uniform grid over scene positions for nearest-neighbour lookups.
+
+    Items are bucketed by the grid cell their point falls in. A nearest query
+    searches rings of cells outwards from the query point and stops as soon as
+    no unvisited ring can hold anything closer than the best match so far, so
+    a lookup only touches the neighbourhood of the point instead of every item.
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> list of (item, x, y)
+        self.count = 0
+        # Extent of the occupied cells, so searches know when to give up
+        self.min_cell = None
+        self.max_cell = None
+
+    def _cell_for(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, item, x, y):
+        """
+        Add an item at a point
+
+        Args:
+            item: Object to store
+            x, y: Scene position of the item (usually its center)
+        """
+        cell = self._cell_for(x, y)
+        self.cells.setdefault(cell, []).append((item, x, y))
+        self.count += 1
+        if self.min_cell is None:
+            self.min_cell = cell
+            self.max_cell = cell
+        else:
+            self.min_cell = (min(self.min_cell[0], cell[0]), min(self.min_cell[1], cell[1]))
+            self.max_cell = (max(self.max_cell[0], cell[0]), max(self.max_cell[1], cell[1]))
+
+    def nearest(self, x, y, accept=None):
+        """
+        Find the item closest to a point
+
+        Args:
+            x, y: Query point in scene coordinates
+            accept: Optional callable(item) -> bool; items it rejects are skipped
+
+        Returns:
+            (item, distance), or (None, None) if no acceptable item exists
+        """
+        if not self.count:
+            return None, None
+
+        column, row = self._cell_for(x, y)
+        # Number of rings needed to cover every occupied cell from the query cell
+        max_ring = max(
+            abs(column - self.min_cell[0]), abs(column - self.max_cell[0]),
+            abs(row - self.min_cell[1]), abs(row - self.max_cell[1])
+        )
+
+        best_item = None
+        best_distance_sq = None
+        for ring in range(max_ring + 1):
+            # Anything in this ring is at least (ring - 1) cells away
+            if best_distance_sq is not None:
+                ring_distance = (ring - 1) * self.cell_size
+                if ring_distance > 0 and ring_distance * ring_distance > best_distance_sq:
+                    break
+
+            for cell in self._ring_cells(column, row, ring):
+                for item, item_x, item_y in self.cells.get(cell, ()):
+                    distance_sq = (item_x - x) ** 2 + (item_y - y) ** 2
+                    if best_distance_sq is not None and distance_sq >= best_distance_sq:
+                        continue
+                    if accept is not None and not accept(item):
+                        continue
+                    best_item = item
+                    best_distance_sq = distance_sq
+
+        if best_item is None:
+            return None, None
+        return best_item, math.sqrt(best_distance_sq)
+
+    @staticmethod
+    def _ring_cells(column, row, ring):
+        """Yield the cells on the square ring at the given Chebyshev distance"""
+        if ring == 0:
+            yield (column, row)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (column + dx, row - ring)
+            yield (column + dx, row + ring)
+        for dy in range(-ring + 1, ring):
+            yield (column - ring, row + dy)
+            yield (column + ring, row + dy)
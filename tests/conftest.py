@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# Run from any directory, and without a display
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """Application instance for tests that create components (they load pixmaps)"""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,64 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.simulation.battery_arbitrage import CYCLE_COST, plan_revenue, plan_schedule
+
+
+def brute_force_revenue(charge_prices, discharge_prices, levels, step, reach, initial_level):
+    """Best revenue (less wear) over every sequence of moves on the same state-of-charge grid"""
+    best = -np.inf
+    for moves in itertools.product(range(-reach, reach + 1), repeat=len(charge_prices)):
+        level = initial_level
+        revenue = 0.0
+        for hour, move in enumerate(moves):
+            level += move
+            if not 0 <= level < levels:
+                break
+            energy = move * step
+            price = charge_prices[hour] if move > 0 else discharge_prices[hour]
+            revenue -= energy * price + CYCLE_COST * abs(energy)
+        else:
+            best = max(best, revenue)
+    return best
+
+
+@pytest.mark.parametrize('hours', [1, 2, 3, 5])
+@pytest.mark.parametrize('seed', range(5))
+def test_plan_matches_brute_force(hours, seed):
+    rng = np.random.default_rng(seed)
+    discharge_prices = rng.uniform(0.02, 0.2, hours)
+    charge_prices = discharge_prices + rng.uniform(0, 0.05, hours)
+    # 5 levels of 1 kWh, up to 2 levels per hour
+    energy_capacity, power_capacity, levels = 4.0, 2.0, 5
+    initial_charge = float(rng.integers(0, levels))
+
+    schedule = plan_schedule(charge_prices, discharge_prices, energy_capacity, power_capacity, initial_charge, levels=levels)
+    wear = CYCLE_COST * np.abs(schedule).sum()
+    expected = brute_force_revenue(charge_prices, discharge_prices, levels, 1.0, 2, int(initial_charge))
+    assert plan_revenue(schedule, charge_prices, discharge_prices) - wear == pytest.approx(expected, abs=1e-9)
+
+
+def test_schedule_respects_power_and_energy_limits():
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(0.02, 0.2, 48)
+    schedule = plan_schedule(prices, prices, 4000, 1000, 2000)
+    assert np.abs(schedule).max() <= 1000 + 1e-9
+    charge = 2000 - np.cumsum(schedule)
+    assert charge.min() >= -1e-9 and charge.max() <= 4000 + 1e-9
+
+
+def test_flat_prices_only_sell_the_stored_energy():
+    # Charging can't pay off, and energy left at the end of the horizon earns nothing
+    prices = np.full(24, 0.1)
+    schedule = plan_schedule(prices, prices, 4000, 1000, 2000)
+    assert schedule.min() >= 0
+    assert schedule.sum() == pytest.approx(2000)
+
+
+@pytest.mark.parametrize('energy_capacity, power_capacity', [(0, 1000), (4000, 0)])
+def test_no_capacity_plans_nothing(energy_capacity, power_capacity):
+    prices = np.linspace(0.01, 0.2, 24)
+    schedule = plan_schedule(prices, prices, energy_capacity, power_capacity, 0)
+    assert schedule.shape == (24,) and not schedule.any()
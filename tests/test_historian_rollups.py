@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from src.simulation.historian_rollups import (
+    DAYS_PER_MONTH, HOURS_PER_DAY, HOURS_PER_YEAR, HistorianRollupCache, compute_rollups, to_day_hour_matrix
+)
+
+
+def test_daily_rollups():
+    values = np.arange(48, dtype=float)
+    rollup = compute_rollups(values, 'Daily')
+    np.testing.assert_array_equal(rollup['x'], [12, 36])
+    np.testing.assert_array_equal(rollup['Sum'], [values[:24].sum(), values[24:].sum()])
+    np.testing.assert_array_equal(rollup['Mean'], [11.5, 35.5])
+    np.testing.assert_array_equal(rollup['Min'], [0, 24])
+    np.testing.assert_array_equal(rollup['Max'], [23, 47])
+
+
+def test_weekly_rollups_keep_the_partial_last_week():
+    values = np.ones(200)
+    rollup = compute_rollups(values, 'Weekly')
+    np.testing.assert_array_equal(rollup['Sum'], [168, 32])
+    np.testing.assert_array_equal(rollup['Mean'], [1, 1])
+    np.testing.assert_array_equal(rollup['x'], [84, 168 + 16])
+
+
+def test_monthly_rollups_follow_the_calendar():
+    values = np.ones(HOURS_PER_YEAR + 1)
+    rollup = compute_rollups(values, 'Monthly')
+    # Twelve months plus the extra hour 8760, which starts the next year
+    np.testing.assert_array_equal(rollup['Sum'], [days * HOURS_PER_DAY for days in DAYS_PER_MONTH] + [1])
+
+
+def test_empty_and_unknown_period():
+    assert len(compute_rollups([], 'Daily')['Mean']) == 0
+    with pytest.raises(ValueError):
+        compute_rollups([1.0], 'Hourly')
+
+
+def test_cache_reuses_and_replaces_entries():
+    cache = HistorianRollupCache()
+    values = np.arange(100, dtype=float)
+    first = cache.get('total_load', values, 'Daily', 48)
+    assert cache.get('total_load', values, 'Daily', 48) is first
+
+    # More simulated hours replace the stale entry
+    longer = cache.get('total_load', values, 'Daily', 72)
+    assert len(longer['Sum']) == 3
+    assert list(cache._cache) == [('total_load', 'Daily', 72)]
+
+
+def test_day_hour_matrix_is_a_view_of_a_full_year():
+    values = np.arange(HOURS_PER_YEAR + 1, dtype=float)
+    matrix = to_day_hour_matrix(values, HOURS_PER_YEAR + 1)
+    assert matrix.shape == (24, 365)
+    assert np.shares_memory(matrix, values)
+    assert matrix[5, 2] == 2 * 24 + 5
+
+
+def test_day_hour_matrix_blanks_unsimulated_hours():
+    matrix = to_day_hour_matrix(np.ones(HOURS_PER_YEAR + 1), 30)
+    assert np.count_nonzero(~np.isnan(matrix)) == 30
+    assert matrix[5, 1] == 1 and np.isnan(matrix[6, 1])
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from src.simulation.historian_statistics import (
+    HistorianStatisticsCache, compute_percentiles, compute_run_metrics, compute_series_statistics
+)
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 100, 8761])
+def test_percentiles_match_numpy(size):
+    values = np.random.default_rng(size).normal(size=size)
+    result = compute_percentiles(values, [0, 10, 50, 90, 99, 100])
+    for percentile, value in result.items():
+        assert value == pytest.approx(np.percentile(values, percentile))
+
+
+def test_percentiles_of_nothing_are_zero():
+    assert compute_percentiles(np.empty(0), [50, 90]) == {50: 0.0, 90: 0.0}
+
+
+def test_series_statistics():
+    values = [3.0, 1.0, 2.0, 5.0]
+    statistics = compute_series_statistics(values, bins=4)
+    np.testing.assert_array_equal(statistics['duration_curve'], [5, 3, 2, 1])
+    assert statistics['histogram'][0].sum() == 4
+    assert (statistics['mean'], statistics['min'], statistics['max']) == (2.75, 1.0, 5.0)
+
+
+def test_run_metrics():
+    historian = {
+        'system_instability': [0.0, 0.5, 2.0, 3.0, 9.0],
+        'grid_import': [1.0, 4.0, 2.0, 0.0, 99.0],
+        'grid_export': [0.0, 0.0, 1.0, 1.0, 99.0],
+        'total_load': [10.0, 12.0, 11.0, 9.0, 99.0],
+        'Generator_123456': [50.0, 100.0, 0.0, 50.0, 99.0],
+    }
+    # The fifth hour hasn't been simulated
+    metrics = compute_run_metrics(historian, 4, {'Generator_123456': 100.0, 'Generator_654321': 100.0}, 1.0)
+    assert metrics['instability_hours'] == 2
+    assert metrics['peak_import'] == 4.0
+    assert metrics['peak_load'] == 12.0
+    assert metrics['total_import'] == 7.0
+    assert metrics['total_export'] == 2.0
+    assert metrics['capacity_factors'] == {'Generator_123456': 0.5}
+
+
+def test_cache_recomputes_when_more_hours_are_simulated():
+    cache = HistorianStatisticsCache()
+    values = np.arange(10, dtype=float)
+    first = cache.get_series('total_load', values, 5)
+    assert cache.get_series('total_load', values, 5) is first
+    assert cache.get_series('total_load', values, 10)['max'] == 9.0
+
+    cache.invalidate()
+    assert cache.get_series('total_load', values, 5) is not first
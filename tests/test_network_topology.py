@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+
+from src.simulation.network_topology import NetworkTopology
+
+
+class Network:
+    """Stand-in for the main window's component and connection lists"""
+
+    def __init__(self, size):
+        self.components = []
+        self.connections = []
+        self.network_topology = NetworkTopology(self)
+        for _ in range(size):
+            self.add()
+
+    def add(self):
+        component = object()
+        self.components.append(component)
+        self.network_topology.component_added(component)
+        return component
+
+    def connect(self, a, b):
+        connection = SimpleNamespace(source=self.components[a], target=self.components[b])
+        self.connections.append(connection)
+        self.network_topology.connection_added(connection)
+        return connection
+
+    def disconnect(self, connection):
+        self.connections.remove(connection)
+        self.network_topology.connection_removed(connection)
+
+    def delete(self, index):
+        component = self.components[index]
+        for connection in [c for c in self.connections if component in (c.source, c.target)]:
+            self.disconnect(connection)
+        self.components.remove(component)
+        self.network_topology.component_removed(component)
+
+    def island_sizes(self):
+        return [len(island) for island in self.network_topology.islands()]
+
+
+def test_connections_merge_islands():
+    network = Network(5)
+    topology = network.network_topology
+    assert network.island_sizes() == [1] * 5
+    network.connect(0, 1)
+    network.connect(2, 3)
+    assert network.island_sizes() == [2, 2, 1]
+    network.connect(1, 2)
+    network.connect(3, 4)
+    assert network.island_sizes() == [5]
+    assert topology.is_connected()
+    assert topology.island_of(network.components[4]) == 0
+
+
+def test_disconnect_splits_islands():
+    network = Network(4)
+    topology = network.network_topology
+    network.connect(0, 1)
+    middle = network.connect(1, 2)
+    network.connect(2, 3)
+    network.disconnect(middle)
+    assert network.island_sizes() == [2, 2]
+    assert not topology.is_connected()
+    assert topology.island_of(network.components[0]) != topology.island_of(network.components[3])
+    assert len(topology.disconnected_components()) == 2
+
+
+def test_unconnected_components_follow_every_edit():
+    network = Network(3)
+    topology = network.network_topology
+    first = network.connect(0, 1)
+    assert topology.unconnected_components() == [network.components[2]]
+
+    network.connect(1, 2)
+    assert not topology.has_unconnected_components()
+
+    # Disconnecting the first link leaves component 0 on its own
+    network.disconnect(first)
+    assert topology.unconnected_components() == [network.components[0]]
+
+    # Deleting it leaves a connected network again
+    network.delete(0)
+    assert not topology.has_unconnected_components()
+    assert network.island_sizes() == [2]
+
+    # A single component counts as connected
+    network.delete(0)
+    assert network.island_sizes() == [1]
+    assert not topology.has_unconnected_components()
+
+
+def test_deletion_keeps_the_check_incremental():
+    network = Network(3)
+    topology = network.network_topology
+    network.connect(0, 1)
+    network.connect(1, 2)
+    topology.islands()
+    network.delete(2)
+    # The count is kept up to date; only the islands wait for a rebuild
+    assert not topology.stale and topology.islands_stale
+    assert not topology.has_unconnected_components()
+    assert network.island_sizes() == [2]
+
+
+def test_invalidate_rebuilds_from_the_lists():
+    network = Network(4)
+    topology = network.network_topology
+    network.connect(0, 1)
+    # Lists replaced behind the topology's back (e.g. a scenario load) and reported
+    network.connections = [SimpleNamespace(source=network.components[2], target=network.components[3])]
+    topology.invalidate()
+    assert network.island_sizes() == [2, 1, 1]
+    assert topology.unconnected_components() == network.components[:2]
@@ -0,0 +1,35 @@
+from src.simulation.optimizer import pareto_front
+
+
+def record(name, capex, irr, unstable_hours):
+    return {'name': name, 'kpis': {'capex': capex, 'irr_36_month': irr, 'unstable_hours': unstable_hours}}
+
+
+def names(records):
+    return [record['name'] for record in records]
+
+
+def test_known_front():
+    records = [
+        record('cheap', 100, 0.05, 50),
+        record('balanced', 200, 0.10, 10),
+        record('stable', 400, 0.08, 0),
+        record('dominated', 300, 0.07, 20),  # beaten by 'balanced' on every objective
+        record('duplicate', 200, 0.10, 10),  # ties don't dominate each other
+        record('worse_irr', 100, 0.04, 50),  # beaten by 'cheap' on IRR only
+    ]
+    assert names(pareto_front(records)) == ['cheap', 'balanced', 'duplicate', 'stable']
+
+
+def test_undefined_irr_counts_as_worst():
+    records = [record('no_irr', 100, None, 10), record('irr', 100, -0.5, 10)]
+    assert names(pareto_front(records)) == ['irr']
+
+
+def test_front_is_sorted_by_capex():
+    records = [record('c', 300, 0.3, 0), record('a', 100, 0.1, 0), record('b', 200, 0.2, 0)]
+    assert names(pareto_front(records)) == ['a', 'b', 'c']
+
+
+def test_no_records():
+    assert pareto_front([]) == []
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.simulation.result_cache import scenario_fingerprint
+
+
+@pytest.fixture
+def scenario(qapp):
+    """Build a generator, a bus and a load wired in a line"""
+    from src.components.bus import BusComponent
+    from src.components.generator import GeneratorComponent
+    from src.components.load import LoadComponent
+
+    def build(generator_capacity=1000, bus_name='Bus', offset=0):
+        generator = GeneratorComponent(offset, 0)
+        generator.capacity = generator_capacity
+        bus = BusComponent(offset + 400, 0)
+        bus.name = bus_name
+        load = LoadComponent(offset + 800, 0)
+        components = [generator, bus, load]
+        connections = [SimpleNamespace(source=generator, target=bus), SimpleNamespace(source=bus, target=load)]
+        return components, connections
+
+    return build
+
+
+def test_fingerprint_ignores_position_and_name(scenario):
+    key, _ = scenario_fingerprint(*scenario(), seed=1)
+    moved, _ = scenario_fingerprint(*scenario(offset=5000), seed=1)
+    renamed, _ = scenario_fingerprint(*scenario(bus_name='Main bus'), seed=1)
+    assert key == moved == renamed
+
+
+def test_fingerprint_ignores_component_order(scenario):
+    components, connections = scenario()
+    key, ordered = scenario_fingerprint(components, connections, seed=1)
+    reversed_key, reversed_ordered = scenario_fingerprint(components[::-1], connections[::-1], seed=1)
+    assert key == reversed_key
+    assert ordered == reversed_ordered
+
+
+def test_fingerprint_changes_with_capacity_seed_and_wiring(scenario):
+    components, connections = scenario()
+    key, _ = scenario_fingerprint(components, connections, seed=1)
+    assert scenario_fingerprint(*scenario(generator_capacity=2000), seed=1)[0] != key
+    assert scenario_fingerprint(components, connections, seed=2)[0] != key
+    assert scenario_fingerprint(components, connections[:1], seed=1)[0] != key
@@ -0,0 +1,51 @@
+import math
+import random
+
+import pytest
+
+from src.utils.spatial_grid import SpatialGrid
+
+
+def brute_force_distance(points, x, y, accept=None):
+    distances = [math.hypot(px - x, py - y) for item, px, py in points if accept is None or accept(item)]
+    return min(distances) if distances else None
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_nearest_matches_brute_force(seed):
+    rng = random.Random(seed)
+    grid = SpatialGrid()
+    points = [(index, rng.uniform(-20000, 20000), rng.uniform(-20000, 20000)) for index in range(300)]
+    for item, x, y in points:
+        grid.insert(item, x, y)
+
+    for _ in range(200):
+        x, y = rng.uniform(-30000, 30000), rng.uniform(-30000, 30000)
+        item, distance = grid.nearest(x, y)
+        assert distance == pytest.approx(brute_force_distance(points, x, y))
+        assert distance == pytest.approx(math.hypot(points[item][1] - x, points[item][2] - y))
+
+
+def test_accept_filter():
+    rng = random.Random(1)
+    grid = SpatialGrid(cell_size=100)
+    points = [(index, rng.uniform(0, 5000), rng.uniform(0, 5000)) for index in range(200)]
+    for item, x, y in points:
+        grid.insert(item, x, y)
+
+    def accept(item):
+        return item % 7 == 0
+
+    for _ in range(50):
+        x, y = rng.uniform(0, 5000), rng.uniform(0, 5000)
+        item, distance = grid.nearest(x, y, accept)
+        assert accept(item)
+        assert distance == pytest.approx(brute_force_distance(points, x, y, accept))
+
+
+def test_nothing_to_find():
+    grid = SpatialGrid()
+    assert grid.nearest(0, 0) == (None, None)
+    grid.insert('a', 10, 10)
+    assert grid.nearest(0, 0, accept=lambda item: False) == (None, None)
+    assert grid.nearest(0, 0) == ('a', pytest.approx(math.hypot(10, 10)))